@@ -1,28 +1,11 @@
+import importlib
 import logging
 import shlex
 import sys
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 import click
 
-from sbkube.commands import (
-    apply,
-    build,
-    check_updates,
-    delete,
-    deploy,
-    doctor,
-    history,
-    init,
-    migrate,
-    prepare,
-    rollback,
-    status,
-    template,
-    upgrade,
-    validate,
-    version,
-)
 from sbkube.exceptions import (
     CliToolExecutionError,
     CliToolNotFoundError,
@@ -35,9 +18,60 @@ from sbkube.utils.cli_check import (
 )
 from sbkube.utils.logger import LogLevel, logger
 
+if TYPE_CHECKING:
+    from click.shell_completion import CompletionItem
+
 
 class SbkubeGroup(click.Group):
-    """SBKube CLI 그룹 with categorized help display."""
+    """SBKube CLI 그룹 with categorized help display.
+
+    명령어 모듈은 실행되는 명령어만 import합니다 (lazy loading). `sbkube version`
+    이나 `--help`가 SQLAlchemy, GitPython, Jinja2 등을 불러오지 않도록 하기 위함입니다.
+    """
+
+    # 명령어 이름 → (모듈 경로, --help 요약). 요약은 각 명령어 docstring 첫 줄과 동일해야 함
+    LAZY_COMMANDS: ClassVar[dict[str, tuple[str, str]]] = {
+        "prepare": ("sbkube.commands.prepare", "SBKube prepare 명령어."),
+        "build": ("sbkube.commands.build", "SBKube build 명령어."),
+        "template": ("sbkube.commands.template", "SBKube template 명령어."),
+        "deploy": ("sbkube.commands.deploy", "SBKube deploy 명령어."),
+        "apply": ("sbkube.commands.apply", "SBKube apply 명령어."),
+        "status": ("sbkube.commands.status", "Display application and cluster status."),
+        "history": (
+            "sbkube.commands.history",
+            "Display deployment history with LLM-friendly output.",
+        ),
+        "rollback": (
+            "sbkube.commands.rollback",
+            "Rollback a deployment to a previous state.",
+        ),
+        "init": ("sbkube.commands.init", "새 프로젝트를 초기화합니다."),
+        "upgrade": (
+            "sbkube.commands.upgrade",
+            "config.yaml/toml에 정의된 Helm 애플리케이션을 업그레이드하거나 새로 설치합니다 "
+            "(helm 타입 대상).",
+        ),
+        "delete": (
+            "sbkube.commands.delete",
+            "config.yaml/toml에 정의된 애플리케이션을 삭제합니다 (Helm 릴리스, Kubectl 리소스 등).",
+        ),
+        "check-updates": (
+            "sbkube.commands.check_updates",
+            "Check for available Helm chart updates.",
+        ),
+        "validate": (
+            "sbkube.commands.validate",
+            "config.yaml/toml 또는 sources.yaml/toml 파일을 JSON 스키마 및 데이터 모델로 "
+            "검증합니다.",
+        ),
+        "version": ("sbkube.commands.version", "현재 sbkube 버전을 출력합니다."),
+        "doctor": ("sbkube.commands.doctor", "SBKube 시스템 종합 진단."),
+        "migrate": ("sbkube.commands.migrate", "Helm 3→4 SSA 필드 관리자 마이그레이션."),
+        "cache": (
+            "sbkube.commands.cache",
+            "전역 chart cache 관리 (list, info, prune, clear).",
+        ),
+    }
 
     # 명령어 카테고리 정의
     COMMAND_CATEGORIES: ClassVar[dict[str, list[str]]] = {
@@ -45,7 +79,7 @@ class SbkubeGroup(click.Group):
         "통합 명령어": ["apply"],
         "상태 관리": ["status", "history", "rollback"],
         "업그레이드/삭제": ["upgrade", "delete", "check-updates"],
-        "유틸리티": ["init", "validate", "doctor", "migrate", "version"],
+        "유틸리티": ["init", "validate", "doctor", "migrate", "cache", "version"],
     }
 
     # 카테고리별 이모지
@@ -57,12 +91,49 @@ class SbkubeGroup(click.Group):
         "유틸리티": "🛠️",
     }
 
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Registered and lazily loadable command names."""
+        return sorted(set(super().list_commands(ctx)) | set(self.LAZY_COMMANDS))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return a command, importing its module on first use."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.LAZY_COMMANDS:
+            module = importlib.import_module(self.LAZY_COMMANDS[cmd_name][0])
+            command = module.cmd
+            self.add_command(command, cmd_name)
+        return command
+
+    def shell_complete(
+        self, ctx: click.Context, incomplete: str
+    ) -> list["CompletionItem"]:
+        """Complete subcommand names without importing unloaded command modules."""
+        from click.shell_completion import CompletionItem
+
+        results = []
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+            if name in self.LAZY_COMMANDS and name not in self.commands:
+                results.append(CompletionItem(name, help=self.LAZY_COMMANDS[name][1]))
+                continue
+            command = self.get_command(ctx, name)
+            if command is not None and not command.hidden:
+                results.append(CompletionItem(name, help=command.get_short_help_str()))
+        # 옵션 완성 (click.Group은 건너뛰고 Command 구현 사용)
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
     def format_commands(
         self, ctx: click.Context, formatter: click.HelpFormatter
     ) -> None:
         """Format commands by category."""
         commands = []
         for subcommand in self.list_commands(ctx):
+            if subcommand in self.LAZY_COMMANDS and subcommand not in self.commands:
+                # 로드되지 않은 명령어는 import 없이 정적 요약 사용
+                commands.append((subcommand, self.LAZY_COMMANDS[subcommand][1]))
+                continue
             cmd = self.get_command(ctx, subcommand)
             if cmd is None:
                 continue
@@ -261,29 +332,6 @@ def main(
         logger.set_level(LogLevel.INFO)
 
 
-# 핵심 워크플로우 명령어
-main.add_command(prepare.cmd)
-main.add_command(build.cmd)
-main.add_command(template.cmd)
-main.add_command(deploy.cmd)
-main.add_command(apply.cmd)
-
-# 상태 및 히스토리 명령어 (NEW)
-main.add_command(status.cmd)
-main.add_command(history.cmd)
-main.add_command(rollback.cmd)
-
-# 기타 명령어
-main.add_command(init.cmd)
-main.add_command(upgrade.cmd)
-main.add_command(delete.cmd)
-main.add_command(check_updates.cmd)
-main.add_command(validate.cmd)
-main.add_command(version.cmd)
-main.add_command(doctor.cmd)
-main.add_command(migrate.cmd)
-
-
 def main_with_exception_handling() -> None:
     """Main entry point with global exception handling."""
     try:
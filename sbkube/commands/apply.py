@@ -6,15 +6,21 @@
 Supports unified sbkube.yaml format only.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import click
 
 from sbkube.models.config_model import SBKubeConfig
+from sbkube.state.perf_history import record_perf_run
 from sbkube.utils.app_dir_resolver import resolve_app_dirs
+from sbkube.utils.async_runner import get_command_runner
 from sbkube.utils.deployment_checker import DeploymentChecker
 from sbkube.utils.error_formatter import format_deployment_error
+from sbkube.utils.execution_context import ExecutionContext
 from sbkube.utils.file_loader import (
     ConfigType,
     DetectedConfig,
@@ -23,6 +29,7 @@ from sbkube.utils.file_loader import (
 )
 from sbkube.utils.hook_executor import HookExecutor
 from sbkube.utils.global_options import global_options
+from sbkube.utils.logger import logger
 from sbkube.utils.output_manager import OutputManager
 from sbkube.utils.perf import perf_timer
 from sbkube.utils.progress_tracker import ProgressTracker
@@ -51,6 +58,7 @@ class ApplyCommand:
         skip_build: bool = False,
         inherited_settings: dict | None = None,
         format_type: str = "human",
+        max_workers: int = 4,
     ) -> None:
         """Initialize ApplyCommand.
 
@@ -61,12 +69,13 @@ class ApplyCommand:
             source: Source file name (sbkube.yaml or sources.yaml)
             dry_run: Dry run mode
             force: Force deployment
-            parallel: Parallel deployment
+            parallel: Deploy independent apps concurrently (depends_on DAG)
             skip_prepare: Skip prepare step
             skip_build: Skip build step
             inherited_settings: Settings inherited from parent workspace/phase
                 (helm_repos, oci_registries, git_repos)
             format_type: Output format (human, llm, json, yaml)
+            max_workers: Maximum number of apps deployed concurrently
 
         """
         self.config_file = config_file
@@ -80,6 +89,7 @@ class ApplyCommand:
         self.skip_build = skip_build
         self.inherited_settings = inherited_settings or {}
         self.format_type = format_type
+        self.max_workers = max_workers
 
     def execute(self) -> bool:
         """Execute apply command.
@@ -88,6 +98,14 @@ class ApplyCommand:
             bool: True if successful
 
         """
+        with perf_timer(
+            "app_group.apply",
+            app_group=self.app_config_dir or self.config_file or self.base_dir,
+        ):
+            return self._execute()
+
+    def _execute(self) -> bool:
+        """Body of execute(), run inside the app group perf span."""
         from sbkube.models.unified_config_model import UnifiedConfig
 
         output = OutputManager(format_type=self.format_type)
@@ -107,9 +125,11 @@ class ApplyCommand:
             console.print(f"[red]❌ Config file not found: {config_path}[/red]")
             return False
 
+        exec_ctx = ExecutionContext()
+
         # Load config
         try:
-            data = load_config_file(str(config_path))
+            data = exec_ctx.load_raw(config_path)
             if data is None:
                 console.print(f"[red]❌ Empty config file: {config_path}[/red]")
                 return False
@@ -187,6 +207,7 @@ class ApplyCommand:
         ctx = click.Context(click.Command("apply"))
         ctx.obj = {
             "format": self.format_type,
+            "execution_context": exec_ctx,
             "kubeconfig": merged_kubeconfig,
             "context": merged_kubeconfig_context,
             "inherited_settings": {
@@ -199,29 +220,62 @@ class ApplyCommand:
         }
 
         try:
-            success = _execute_apps_deployment(
-                ctx=ctx,
-                config=config,
-                base_dir=base_dir,
-                app_config_dir=app_config_dir,
-                current_app_dir=current_app_dir,
-                config_file_name=config_path.name,
-                sources_file_name=config_path.name,  # Use same file for sources
-                app_name=None,
-                dry_run=self.dry_run,
-                skip_prepare=self.skip_prepare,
-                skip_build=self.skip_build,
-                skip_deps_check=self.force,
-                strict_deps=False,
-                no_progress=False,
-                output=output,
-            )
+            with record_perf_run(str(app_config_dir), enabled=not self.dry_run):
+                success = _execute_apps_deployment(
+                    ctx=ctx,
+                    config=config,
+                    base_dir=base_dir,
+                    app_config_dir=app_config_dir,
+                    current_app_dir=current_app_dir,
+                    config_file_name=config_path.name,
+                    sources_file_name=config_path.name,  # Use same file for sources
+                    app_name=None,
+                    dry_run=self.dry_run,
+                    skip_prepare=self.skip_prepare,
+                    skip_build=self.skip_build,
+                    skip_deps_check=self.force,
+                    strict_deps=False,
+                    no_progress=False,
+                    output=output,
+                    parallel_apps=self.parallel,
+                    max_workers=self.max_workers,
+                )
             return success
         except Exception as e:
             console.print(f"[red]❌ Deployment failed: {e}[/red]")
             return False
 
 
+@contextmanager
+def _live_status(
+    ctx: click.Context, progress_tracker: ProgressTracker | None, task_id
+) -> Iterator[None]:
+    """배포 중 helm 출력을 진행 표시줄 상태 줄로 전달 (ctx.obj["live_output"])."""
+    if progress_tracker is None or task_id is None:
+        yield
+        return
+    ctx.obj["live_output"] = partial(progress_tracker.set_status, task_id)
+    try:
+        yield
+    finally:
+        ctx.obj.pop("live_output", None)
+        progress_tracker.set_status(task_id, "")
+
+
+def _share_helm_repo_apps(
+    ctx: click.Context, config_file_path: Path, apps_to_apply: list[str]
+) -> None:
+    """prepare가 Helm 저장소를 모을 앱 목록을 ctx.obj["helm_repo_apps"]에 등록.
+
+    apply는 앱마다 prepare를 app_name과 함께 호출하므로, 그대로 두면 저장소도
+    앱마다 따로 갱신됩니다. 등록해 두면 첫 prepare가 전체 앱의 저장소를
+    `helm repo update r1 r2 ...` 한 번으로 갱신합니다.
+    """
+    ctx.obj.setdefault("helm_repo_apps", {})[str(config_file_path.resolve())] = list(
+        apps_to_apply
+    )
+
+
 def _execute_apps_deployment(
     ctx: click.Context,
     config: SBKubeConfig,
@@ -239,6 +293,8 @@ def _execute_apps_deployment(
     no_progress: bool,
     output: OutputManager,
     prune_disabled: bool = False,
+    parallel_apps: bool = False,
+    max_workers: int = 4,
 ) -> bool:
     """Execute app deployment for unified config without phases.
 
@@ -259,6 +315,8 @@ def _execute_apps_deployment(
         no_progress: Disable progress tracking
         output: Output manager
         prune_disabled: Auto-delete disabled apps from cluster
+        parallel_apps: Run independent apps concurrently (depends_on DAG)
+        max_workers: Maximum number of apps deployed at the same time
 
     Returns:
         bool: True if deployment succeeded
@@ -394,6 +452,10 @@ def _execute_apps_deployment(
                 dry_run=dry_run,
             )
 
+    # 앱별 prepare의 첫 호출이 전체 앱의 Helm 저장소를 한 번에 갱신
+    if not skip_prepare:
+        _share_helm_repo_apps(ctx, config_file_path, apps_to_apply)
+
     # Progress tracking setup (disable in non-human modes to suppress spinner/bar)
     console = output.get_console()
     progress_tracker = ProgressTracker(
@@ -402,6 +464,24 @@ def _execute_apps_deployment(
 
     failed = False
     try:
+        if parallel_apps and len(apps_to_apply) > 1:
+            if not _deploy_apps_parallel(
+                ctx=ctx,
+                config=config,
+                apps_to_apply=apps_to_apply,
+                app_config_dir=APP_CONFIG_DIR,
+                config_file_path=config_file_path,
+                dry_run=dry_run,
+                skip_prepare=skip_prepare,
+                skip_build=skip_build,
+                max_workers=max_workers,
+                output=output,
+                progress_tracker=progress_tracker,
+            ):
+                msg = "one or more apps failed"
+                raise RuntimeError(msg)
+            apps_to_apply = []
+
         for app_name_iter in apps_to_apply:
             app_config = config.apps[app_name_iter]
 
@@ -427,7 +507,7 @@ def _execute_apps_deployment(
 
             use_progress = not no_progress and not dry_run
 
-            with progress_tracker.track_task(
+            with perf_timer("app", app=app_name_iter), progress_tracker.track_task(
                 f"Deploying {app_name_iter}", total=total_steps
             ) as task_id:
                 # Step 1: Prepare
@@ -501,7 +581,9 @@ def _execute_apps_deployment(
 
                 deploy_ctx = click.Context(deploy_cmd, parent=ctx)
                 deploy_ctx.obj = ctx.obj
-                with perf_timer("stage.deploy", app=app_name_iter):
+                with perf_timer("stage.deploy", app=app_name_iter), _live_status(
+                    ctx, progress_tracker if use_progress else None, task_id
+                ):
                     deploy_ctx.invoke(
                         deploy_cmd,
                         target=str(APP_CONFIG_DIR),
@@ -549,6 +631,11 @@ def _execute_apps_deployment(
             )
             hook_executor.execute_command_hooks(apply_hooks, "on_failure", "apply")
 
+    if ctx.obj.get("skip_unchanged") and not dry_run:
+        from sbkube.commands.deploy import print_skip_summary
+
+        print_skip_summary(output, ExecutionContext.from_click(ctx).desired_state)
+
     if failed:
         overall_success = False
     else:
@@ -559,6 +646,177 @@ def _execute_apps_deployment(
     return overall_success
 
 
+def _deploy_apps_parallel(
+    ctx: click.Context,
+    config: SBKubeConfig,
+    apps_to_apply: list[str],
+    app_config_dir: Path,
+    config_file_path: Path,
+    dry_run: bool,
+    skip_prepare: bool,
+    skip_build: bool,
+    max_workers: int,
+    output: OutputManager,
+    progress_tracker: ProgressTracker,
+) -> bool:
+    """Deploy apps concurrently following the depends_on DAG.
+
+    각 앱은 선행 앱이 모두 성공하면 즉시 시작됩니다. 실패한 앱의 후속 앱은
+    건너뛰고, 독립적인 앱은 계속 배포합니다. 앱별 출력은 버퍼에 모았다가
+    앱이 끝날 때 한 번에 출력합니다.
+
+    Args:
+        ctx: Click context
+        config: SBKubeConfig with apps
+        apps_to_apply: Apps to deploy (deployment order)
+        app_config_dir: App config directory
+        config_file_path: Config file path
+        dry_run: Dry run mode
+        skip_prepare: Skip prepare step
+        skip_build: Skip build step
+        max_workers: Maximum number of concurrent apps
+        output: Output manager
+        progress_tracker: Progress tracker for the overall app count
+
+    Returns:
+        bool: True if every app was deployed
+
+    """
+    from sbkube.commands.build import cmd as build_cmd
+    from sbkube.commands.deploy import cmd as deploy_cmd
+    from sbkube.commands.prepare import cmd as prepare_cmd
+    from sbkube.utils.app_scheduler import AppScheduler, AppTaskStatus
+
+    enabled_apps: list[str] = []
+    for name in apps_to_apply:
+        app_config = config.apps[name]
+        if app_config.enabled:
+            enabled_apps.append(name)
+            continue
+        output.print(
+            f"[yellow]⏭️  Skipping disabled app: {name}[/yellow]",
+            level="info",
+        )
+        output.add_deployment(
+            name=name,
+            namespace=getattr(app_config, "namespace", "default"),
+            status="skipped",
+        )
+
+    scheduler = AppScheduler(
+        dependencies={
+            name: list(getattr(config.apps[name], "depends_on", []) or [])
+            for name in enabled_apps
+        },
+        max_workers=max_workers,
+        order=enabled_apps,
+    )
+    # 기본 helm/kubectl 동시 실행 상한이 워커 수보다 작으면 올림
+    get_command_runner().ensure_capacity(max_workers)
+    output.print(
+        f"\n[magenta]⚡ Parallel app deployment: {len(enabled_apps)} apps, "
+        f"max {max_workers} workers[/magenta]",
+        level="info",
+    )
+
+    buffers: dict[str, OutputManager] = {
+        name: output.create_buffer() for name in enabled_apps
+    }
+
+    def show_live_output(name: str, line: str) -> None:
+        progress_tracker.set_status(task_id, f"{name}: {line.strip()}")
+
+    def run_stage(stage_cmd: click.Command, stage: str, name: str, **kwargs) -> None:
+        stage_ctx = click.Context(stage_cmd, parent=ctx)
+        # 앱마다 자신의 버퍼와 진행 상태 콜백 사용 (공유 ctx.obj 키를 쓰지 않음)
+        stage_ctx.obj = {**ctx.obj, "output": buffers[name]}
+        stage_ctx.obj.pop("live_output", None)
+        if stage == "deploy" and task_id is not None:
+            stage_ctx.obj["live_output"] = partial(show_live_output, name)
+        with perf_timer(f"stage.{stage}", app=name):
+            stage_ctx.invoke(
+                stage_cmd,
+                target=str(app_config_dir),
+                config_file=str(config_file_path),
+                app_name=name,
+                dry_run=dry_run,
+                **kwargs,
+            )
+
+    def deploy_one(name: str) -> None:
+        app_config = config.apps[name]
+        app_output = buffers[name]
+        app_output.print_section(f"{name} ({app_config.type})")
+        # logger/HookExecutor 등 공용 헬퍼의 출력도 이 앱의 버퍼로 모음
+        with perf_timer("app", app=name), logger.use_console(app_output.get_console()):
+            if not skip_prepare:
+                app_output.print(f"[cyan]📦 Prepare {name}[/cyan]", level="info")
+                run_stage(prepare_cmd, "prepare", name, force=False)
+            if not skip_build:
+                app_output.print(f"[cyan]🔨 Build {name}[/cyan]", level="info")
+                run_stage(build_cmd, "build", name)
+            app_output.print(f"[cyan]🚀 Deploy {name}[/cyan]", level="info")
+            run_stage(deploy_cmd, "deploy", name)
+
+    with progress_tracker.track_task(
+        f"Deploying {len(enabled_apps)} apps", total=len(enabled_apps)
+    ) as task_id:
+
+        def on_complete(task_result) -> None:
+            name = task_result.app_name
+            app_config = config.apps[name]
+            namespace = getattr(app_config, "namespace", "default")
+            app_output = buffers.pop(name)
+            if task_result.status == AppTaskStatus.SUCCESS:
+                app_output.print_success(
+                    f"{name} deployed successfully "
+                    f"({task_result.duration_seconds:.1f}s)"
+                )
+                app_output.add_deployment(
+                    name=name,
+                    namespace=namespace,
+                    status="deployed",
+                    version=getattr(app_config, "version", None),
+                )
+            elif task_result.status == AppTaskStatus.FAILED:
+                app_output.print_error(
+                    f"{name} failed: {task_result.error}",
+                    app_name=name,
+                )
+                app_output.add_deployment(
+                    name=name,
+                    namespace=namespace,
+                    status="failed",
+                    error=task_result.error,
+                )
+            else:
+                app_output.print_warning(
+                    f"Skipping {name}: dependency '{task_result.blocked_by}' failed",
+                    app_name=name,
+                )
+                app_output.add_deployment(
+                    name=name,
+                    namespace=namespace,
+                    status="skipped",
+                    notes=f"dependency '{task_result.blocked_by}' failed",
+                )
+            output.flush_buffer(app_output)
+            if task_id is not None:
+                progress_tracker.update(task_id, advance=1)
+
+        schedule_result = scheduler.run(deploy_one, on_complete=on_complete)
+        if task_id is not None:
+            progress_tracker.set_status(task_id, "")
+
+    if not schedule_result.success:
+        output.print_error(
+            f"{len(schedule_result.failed)} app(s) failed, "
+            f"{len(schedule_result.skipped)} skipped: "
+            f"{', '.join(schedule_result.failed + schedule_result.skipped)}",
+        )
+    return schedule_result.success
+
+
 def _extract_inherited_settings_from_config(config_data: dict) -> dict:
     """Extract inheritable settings from a loaded config dict.
 
@@ -749,6 +1007,15 @@ def _match_phase_by_scope(config_data: dict, scope_path: str) -> str | None:
     return best_match[1] if best_match else None
 
 
+def _warn_isolation_ignored(output: OutputManager, isolation: str) -> None:
+    """--isolation은 workspace (phases) 모드에서만 적용되므로 그 외에는 경고."""
+    if isolation != "thread":
+        output.print_warning(
+            f"--isolation {isolation} is only supported in workspace (phases) mode; "
+            "app groups run in this process"
+        )
+
+
 @click.command(name="apply")
 @click.argument(
     "target",
@@ -838,13 +1105,27 @@ def _match_phase_by_scope(config_data: dict, scope_path: str) -> str | None:
 @click.option(
     "--parallel-apps/--no-parallel-apps",
     default=None,
-    help="Phase 내 app group 병렬 실행 (멀티-페이즈 모드에서만 적용)",
+    help="병렬 실행: 멀티-페이즈 모드에서는 Phase 내 app group, 단일 앱 그룹에서는 depends_on 기반 앱 병렬 배포",
 )
 @click.option(
     "--max-workers",
     type=int,
     default=4,
-    help="최대 병렬 워커 수 (멀티-페이즈 모드, 기본: 4)",
+    help="최대 병렬 워커 수 (기본: 4). helm/kubectl 동시 실행 상한도 최소 이 값으로 올림 "
+    "(SBKUBE_TOOL_LIMITS/SBKUBE_CLUSTER_LIMIT로 고정 가능)",
+)
+@click.option(
+    "--isolation",
+    type=click.Choice(["thread", "process"]),
+    default="thread",
+    show_default=True,
+    help="Workspace app group 실행 격리 방식 (process: app group별 별도 프로세스)",
+)
+@click.option(
+    "--skip-unchanged",
+    is_flag=True,
+    default=False,
+    help="마지막 성공 배포와 desired state가 같은 Helm/YAML 앱은 배포 건너뛰기",
 )
 @global_options
 @click.pass_context
@@ -866,6 +1147,8 @@ def cmd(
     parallel: bool | None,
     parallel_apps: bool | None,
     max_workers: int,
+    isolation: str,
+    skip_unchanged: bool,
 ) -> None:
     """SBKube apply 명령어.
 
@@ -890,6 +1173,11 @@ def cmd(
     output = OutputManager(format_type=output_format)
     ctx.obj["output"] = output
 
+    # 설정 파일은 실행 동안 한 번만 파싱 (prepare/build/deploy 단계가 공유)
+    exec_ctx = ExecutionContext.from_click(ctx)
+    # deploy 단계는 ctx.obj에서 읽음
+    ctx.obj["skip_unchanged"] = skip_unchanged
+
     output.print("[bold blue]✨ SBKube `apply` 시작 ✨[/bold blue]", level="info")
 
     if dry_run:
@@ -940,8 +1228,13 @@ def cmd(
             level="info",
         )
         # Load config to check if it has phases (workspace mode)
-        config_data = load_config_file(str(detected.primary_file))
+        config_data = exec_ctx.load_raw(detected.primary_file)
         if "phases" in config_data and config_data["phases"]:
+            if skip_unchanged:
+                output.print_warning(
+                    "--skip-unchanged is not supported in workspace (phases) mode; "
+                    "all apps will be deployed"
+                )
             if app_config_dir_name:
                 # TARGET scope specified: redirect to app group's own sbkube.yaml
                 # Extract root settings for inheritance to child configs
@@ -969,6 +1262,7 @@ def cmd(
                             parallel=parallel,
                             parallel_apps=parallel_apps,
                             max_workers=max_workers,
+                            isolation=isolation,
                             inherited_settings=root_inherited,
                             output=output,
                         )
@@ -1003,7 +1297,7 @@ def cmd(
                     f"[cyan]📦 Redirecting to app group: {app_config_dir_name}[/cyan]",
                     level="info",
                 )
-                config_data = load_config_file(str(app_config_file))
+                config_data = exec_ctx.load_raw(app_config_file)
                 if "phases" in config_data and config_data["phases"]:
                     # app-dir itself has phases: deploy as sub-workspace
                     output.print(
@@ -1021,6 +1315,7 @@ def cmd(
                         parallel=parallel,
                         parallel_apps=parallel_apps,
                         max_workers=max_workers,
+                        isolation=isolation,
                         inherited_settings=target_inherited,
                         output=output,
                     )
@@ -1062,6 +1357,7 @@ def cmd(
                     parallel=parallel,
                     parallel_apps=parallel_apps,
                     max_workers=max_workers,
+                    isolation=isolation,
                     inherited_settings=parent_inherited or None,
                     output=output,
                 )
@@ -1077,6 +1373,7 @@ def cmd(
             "[cyan]📦 Single app group mode (no phases)[/cyan]",
             level="info",
         )
+        _warn_isolation_ignored(output, isolation)
         # Load apps from unified config and deploy directly
         from sbkube.models.unified_config_model import UnifiedConfig
 
@@ -1099,24 +1396,27 @@ def cmd(
         APP_CONFIG_DIR = detected.primary_file.parent
         current_app_dir = APP_CONFIG_DIR.name
 
-        overall_success = _execute_apps_deployment(
-            ctx=ctx,
-            config=config,
-            base_dir=str(APP_CONFIG_DIR.parent),
-            app_config_dir=APP_CONFIG_DIR,
-            current_app_dir=current_app_dir,
-            config_file_name="sbkube.yaml",
-            sources_file_name="sbkube.yaml",
-            app_name=app_name,
-            dry_run=dry_run,
-            skip_prepare=skip_prepare,
-            skip_build=skip_build,
-            prune_disabled=prune_disabled,
-            skip_deps_check=skip_deps_check,
-            strict_deps=strict_deps,
-            no_progress=no_progress,
-            output=output,
-        )
+        with record_perf_run(str(APP_CONFIG_DIR), enabled=not dry_run):
+            overall_success = _execute_apps_deployment(
+                ctx=ctx,
+                config=config,
+                base_dir=str(APP_CONFIG_DIR.parent),
+                app_config_dir=APP_CONFIG_DIR,
+                current_app_dir=current_app_dir,
+                config_file_name="sbkube.yaml",
+                sources_file_name="sbkube.yaml",
+                app_name=app_name,
+                dry_run=dry_run,
+                skip_prepare=skip_prepare,
+                skip_build=skip_build,
+                prune_disabled=prune_disabled,
+                skip_deps_check=skip_deps_check,
+                strict_deps=strict_deps,
+                no_progress=no_progress,
+                output=output,
+                parallel_apps=bool(parallel_apps),
+                max_workers=max_workers,
+            )
 
         if not overall_success:
             output.print(
@@ -1144,6 +1444,8 @@ def cmd(
         )
         raise click.Abort
 
+    _warn_isolation_ignored(output, isolation)
+
     # 앱 그룹 디렉토리 결정 (공통 유틸리티 사용)
     try:
         app_config_dirs = resolve_app_dirs(
@@ -1174,7 +1476,7 @@ def cmd(
         output.print(
             f"[cyan]📄 Loading config: {config_file_path}[/cyan]", level="info"
         )
-        config_data = load_config_file(config_file_path)
+        config_data = exec_ctx.load_raw(config_file_path)
 
         try:
             config = SBKubeConfig(**config_data)
@@ -1337,6 +1639,10 @@ def cmd(
                     dry_run=dry_run,
                 )
 
+        # 앱별 prepare의 첫 호출이 전체 앱의 Helm 저장소를 한 번에 갱신
+        if not skip_prepare:
+            _share_helm_repo_apps(ctx, config_file_path, apps_to_apply)
+
         # Import commands
         from sbkube.commands.build import cmd as build_cmd
         from sbkube.commands.deploy import cmd as deploy_cmd
@@ -1486,13 +1792,16 @@ def cmd(
                         # Create new context with parent's obj for kubeconfig/context/sources_file
                         deploy_ctx = click.Context(deploy_cmd, parent=ctx)
                         deploy_ctx.obj = ctx.obj  # Pass parent context object
-                        deploy_ctx.invoke(
-                            deploy_cmd,
-                            target=str(APP_CONFIG_DIR),
-                            config_file=str(config_file_path),
-                            app_name=app_name_iter,  # 현재 처리 중인 앱
-                            dry_run=dry_run,
-                        )
+                        with _live_status(
+                            ctx, progress_tracker if use_progress else None, task_id
+                        ):
+                            deploy_ctx.invoke(
+                                deploy_cmd,
+                                target=str(APP_CONFIG_DIR),
+                                config_file=str(config_file_path),
+                                app_name=app_name_iter,  # 현재 처리 중인 앱
+                                dry_run=dry_run,
+                            )
                         if use_progress:
                             progress_tracker.update(task_id, advance=1)
                             progress_tracker.console_print(
@@ -1576,6 +1885,11 @@ def cmd(
                 app_group=APP_CONFIG_DIR.name,
             )
 
+    if skip_unchanged and not dry_run:
+        from sbkube.commands.deploy import print_skip_summary
+
+        print_skip_summary(output, exec_ctx.desired_state)
+
     # 전체 결과
     if not overall_success:
         output.print(
@@ -5,6 +5,7 @@
 - Local chart: app_dir 기준 경로 → build/ 복사
 - Overrides 적용: overrides/<app-name>/* → build/<app-name>/*
 - Removes 적용: build/<app-name>/<remove-pattern> 삭제
+- Incremental: 원본/overrides/removes가 그대로면 건너뛰고, 바뀐 파일만 다시 복사
 """
 
 import shutil
@@ -12,14 +13,23 @@ from pathlib import Path
 
 import click
 
-from sbkube.models.config_model import HelmApp, HookApp, HttpApp, SBKubeConfig
+from sbkube.models.config_model import HelmApp, HookApp, HttpApp
 from sbkube.utils.app_dir_resolver import resolve_app_dirs
+from sbkube.utils.build_manifest import (
+    BuildManifest,
+    BuildPlan,
+    compute_file_states,
+    compute_fingerprint,
+    compute_output_fingerprint,
+    scan_chart_files,
+    sync_build_tree,
+)
 from sbkube.utils.chart_path_resolver import (
     resolve_local_chart_path,
     resolve_remote_chart_path,
 )
 from sbkube.utils.common_options import resolve_command_paths, target_options
-from sbkube.utils.file_loader import load_config_file
+from sbkube.utils.execution_context import ExecutionContext
 from sbkube.utils.global_options import global_options
 from sbkube.utils.hook_helpers import (
     create_hook_executor,
@@ -29,6 +39,7 @@ from sbkube.utils.hook_helpers import (
     execute_global_pre_hook,
 )
 from sbkube.utils.output_manager import OutputManager
+from sbkube.utils.perf import perf_timer
 from sbkube.utils.workspace_resolver import resolve_sbkube_directories
 
 
@@ -41,9 +52,13 @@ def build_helm_app(
     app_config_dir: Path,
     output: OutputManager,
     dry_run: bool = False,
+    incremental: bool = True,
 ) -> bool:
     """Helm 앱 빌드 + 커스터마이징.
 
+    incremental 모드에서는 `.sbkube/build/.<app>.build.json`의 fingerprint가 같으면
+    빌드를 건너뛰고, 다르면 변경된 파일만 다시 복사합니다 (차트 파일은 hardlink).
+
     Args:
         app_name: 앱 이름
         app: HelmApp 설정
@@ -53,6 +68,7 @@ def build_helm_app(
         app_config_dir: 앱 설정 디렉토리
         output: OutputManager instance
         dry_run: dry-run 모드 (실제 파일 복사/수정하지 않음)
+        incremental: False이면 항상 전체 다시 빌드 (hardlink 없이 복사)
 
     Returns:
         성공 여부
@@ -74,8 +90,9 @@ def build_helm_app(
             return False
         source_path = chart_result.chart_path
 
-    # 2. 빌드 디렉토리로 복사
+    # 2. 빌드 디렉토리 및 build manifest 경로
     dest_path = build_dir / app_name
+    manifest_path = BuildManifest.path_for(build_dir, app_name)
 
     if dry_run:
         output.print(
@@ -84,19 +101,14 @@ def build_helm_app(
         )
         if dest_path.exists():
             output.print(
-                "[yellow]🔍 [DRY-RUN] Would remove existing build directory[/yellow]",
+                "[yellow]🔍 [DRY-RUN] Would update existing build directory[/yellow]",
                 level="info",
             )
-    else:
-        # 기존 디렉토리 삭제
-        if dest_path.exists():
-            output.print(
-                f"  Removing existing build directory: {dest_path}", level="info"
-            )
-            shutil.rmtree(dest_path)
 
-        output.print(f"  Copying chart: {source_path} → {dest_path}", level="info")
-        shutil.copytree(source_path, dest_path)
+    # 빌드 결과 계획 (원본 차트 파일 + overrides - removes)
+    plan = BuildPlan(source_path=source_path)
+    if not dry_run:
+        plan.files = scan_chart_files(source_path)
 
     # 3. Check for override directory and warn if not configured
     overrides_base = app_config_dir / "overrides" / app_name
@@ -183,17 +195,14 @@ def build_helm_app(
                         if src_file.is_file():
                             # Calculate relative path from overrides_base
                             override_rel_path = src_file.relative_to(overrides_base)
-                            dst_file = dest_path / override_rel_path
 
-                            # Create destination directory
                             if dry_run:
                                 output.print(
                                     f"[yellow]      🔍 [DRY-RUN] Would override: {override_rel_path}[/yellow]",
                                     level="info",
                                 )
                             else:
-                                dst_file.parent.mkdir(parents=True, exist_ok=True)
-                                shutil.copy2(src_file, dst_file)
+                                plan.add_override(override_rel_path.as_posix(), src_file)
                                 output.print(
                                     f"      ✓ {override_rel_path}", level="info"
                                 )
@@ -201,7 +210,6 @@ def build_helm_app(
                 else:
                     # Exact file path - existing behavior
                     src_file = overrides_base / override_pattern
-                    dst_file = dest_path / override_pattern
 
                     if src_file.exists() and src_file.is_file():
                         if dry_run:
@@ -210,9 +218,9 @@ def build_helm_app(
                                 level="info",
                             )
                         else:
-                            # 대상 디렉토리 생성
-                            dst_file.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.copy2(src_file, dst_file)
+                            plan.add_override(
+                                Path(override_pattern).as_posix(), src_file
+                            )
                             output.print(
                                 f"    ✓ Override: {override_pattern}", level="info"
                             )
@@ -229,9 +237,8 @@ def build_helm_app(
     if app.removes:
         output.print(f"  Removing {len(app.removes)} patterns...", level="info")
         for remove_pattern in app.removes:
-            remove_target = dest_path / remove_pattern
-
             if dry_run:
+                remove_target = dest_path / remove_pattern
                 if remove_target.exists():
                     if remove_target.is_dir():
                         output.print(
@@ -247,18 +254,75 @@ def build_helm_app(
                     output.print_warning(
                         f"    Remove target not found: {remove_pattern}"
                     )
-            elif remove_target.exists():
-                if remove_target.is_dir():
-                    shutil.rmtree(remove_target)
-                    output.print(
-                        f"    ✓ Removed directory: {remove_pattern}", level="info"
-                    )
-                elif remove_target.is_file():
-                    remove_target.unlink()
-                    output.print(f"    ✓ Removed file: {remove_pattern}", level="info")
+                continue
+
+            removed = plan.apply_remove(remove_pattern)
+            if removed == "directory":
+                output.print(
+                    f"    ✓ Removed directory: {remove_pattern}", level="info"
+                )
+            elif removed == "file":
+                output.print(f"    ✓ Removed file: {remove_pattern}", level="info")
             else:
                 output.print_warning(f"    Remove target not found: {remove_pattern}")
 
+    # 5. 빌드 디렉토리 동기화 (변경 없으면 건너뜀, 변경된 파일만 다시 복사)
+    if not dry_run:
+        states = compute_file_states(plan)
+        fingerprint = compute_fingerprint(plan, states)
+        previous = (
+            BuildManifest.load(manifest_path)
+            if incremental and dest_path.is_dir()
+            else None
+        )
+
+        if previous is not None and previous.fingerprint == fingerprint:
+            if previous.output_fingerprint == compute_output_fingerprint(dest_path):
+                output.print(
+                    f"  Build is up to date, skipping copy: {dest_path}", level="info"
+                )
+                output.print_success(f"Helm app built: {app_name}")
+                return True
+            # 빌드 파일이 직접 수정/삭제됨 → 제자리 수정은 파일 상태로 구분할 수 없으므로 전체 빌드
+            output.print(
+                f"  Build output changed since last build: {dest_path}", level="info"
+            )
+            previous = None
+
+        if previous is None:
+            # 기존 디렉토리 삭제 후 전체 빌드
+            if dest_path.exists():
+                output.print(
+                    f"  Removing existing build directory: {dest_path}", level="info"
+                )
+                shutil.rmtree(dest_path)
+            output.print(f"  Copying chart: {source_path} → {dest_path}", level="info")
+        else:
+            output.print(
+                f"  Updating changed files: {source_path} → {dest_path}", level="info"
+            )
+
+        manifest_path.unlink(missing_ok=True)
+        dest_path.mkdir(parents=True, exist_ok=True)
+        with perf_timer("build.sync", app=app_name):
+            stats = sync_build_tree(
+                plan, states, dest_path, previous, use_links=incremental
+            )
+        if previous is not None:
+            output.print(
+                f"  Files updated: {stats['copied']}, removed: {stats['removed']}, "
+                f"unchanged: {stats['unchanged']}",
+                level="info",
+            )
+
+        if incremental:
+            BuildManifest(
+                fingerprint=fingerprint,
+                files=states,
+                override_files=sorted(plan.override_files),
+                output_fingerprint=compute_output_fingerprint(dest_path),
+            ).save(manifest_path)
+
     output.print_success(f"Helm app built: {app_name}")
     return True
 
@@ -331,6 +395,12 @@ def build_http_app(
     default=False,
     help="Dry-run 모드 (실제 파일 복사/수정하지 않음)",
 )
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="변경 여부와 관계없이 전체 다시 빌드",
+)
 @global_options
 @click.pass_context
 def cmd(
@@ -339,6 +409,7 @@ def cmd(
     config_file: str | None,
     app_name: str | None,
     dry_run: bool,
+    force: bool,
 ) -> None:
     """SBKube build 명령어.
 
@@ -346,6 +417,7 @@ def cmd(
     - Remote chart를 charts/에서 build/로 복사
     - Overrides 적용 (overrides/<app-name>/* → build/<app-name>/*)
     - Removes 적용 (불필요한 파일/디렉토리 삭제)
+    - 변경 없는 앱은 건너뜀 (--force로 전체 다시 빌드)
     """
     # Use shared OutputManager from parent command, or create own if standalone
     shared_output = ctx.obj.get("output")
@@ -392,6 +464,9 @@ def cmd(
     # 작업 디렉토리 생성
     sbkube_dirs.ensure_directories()
 
+    # 설정 파싱/검증 결과 공유 (apply에서 호출 시 앱/단계 간 재사용)
+    exec_ctx = ExecutionContext.from_click(ctx)
+
     # 각 앱 그룹 처리
     overall_success = True
     for APP_CONFIG_DIR in app_config_dirs:
@@ -411,7 +486,7 @@ def cmd(
         output.print(
             f"[cyan]📄 Loading config: {config_file_path}[/cyan]", level="info"
         )
-        raw_data = load_config_file(config_file_path)
+        raw_data = exec_ctx.load_raw(config_file_path)
 
         # 통합 sbkube.yaml 포맷 감지 (apiVersion이 sbkube/로 시작)
         api_version = raw_data.get("apiVersion", "") if raw_data else ""
@@ -423,40 +498,14 @@ def cmd(
                 continue
 
             # namespace 상속 처리 (parent → current)
-            merged_namespace = "default"
-            current_dir = config_file_path.parent
-            parent_configs = []
-            for _ in range(5):
-                parent_dir = current_dir.parent
-                if parent_dir == current_dir:
-                    break
-                parent_config = parent_dir / "sbkube.yaml"
-                if parent_config.exists():
-                    parent_configs.append(parent_config)
-                current_dir = parent_dir
-
-            for parent_config in reversed(parent_configs):
-                try:
-                    parent_data = load_config_file(parent_config)
-                    if parent_data and parent_data.get("apiVersion", "").startswith("sbkube/"):
-                        parent_ns = parent_data.get("settings", {}).get("namespace")
-                        if parent_ns:
-                            merged_namespace = parent_ns
-                except Exception:
-                    pass
-
-            # 현재 config의 namespace로 오버라이드
-            current_namespace = raw_data.get("settings", {}).get("namespace")
-            if current_namespace:
-                merged_namespace = current_namespace
-
+            merged_namespace = exec_ctx.resolve_namespace(config_file_path, raw_data)
             config_data = {"apps": apps_data, "namespace": merged_namespace}
         else:
             # 레거시 포맷: 전체 데이터가 SBKubeConfig
             config_data = raw_data
 
         try:
-            config = SBKubeConfig(**config_data)
+            config = exec_ctx.get_sbkube_config(config_file_path, config_data)
         except Exception as e:
             output.print_error(f"Invalid config file: {e}", error=str(e))
             overall_success = False
@@ -481,6 +530,7 @@ def cmd(
             base_dir=BASE_DIR,
             work_dir=APP_CONFIG_DIR,
             dry_run=dry_run,
+            console=output.get_console(),
         )
 
         # ========== 전역 pre-build 훅 실행 ==========
@@ -488,6 +538,9 @@ def cmd(
             overall_success = False
             continue
 
+        # build 훅은 빌드 결과를 직접 수정할 수 있으므로 항상 전체 다시 빌드
+        group_build_hooks = bool(config.hooks and config.hooks.get("build"))
+
         # 앱 빌드
         success_count = 0
         total_count = len(apps_to_build)
@@ -520,6 +573,9 @@ def cmd(
             elif isinstance(app, HelmApp):
                 # Helm 앱만 빌드 (커스터마이징 필요)
                 if app.overrides or app.removes or app.is_remote_chart():
+                    app_build_hooks = bool(
+                        app.hooks and (app.hooks.pre_build or app.hooks.post_build)
+                    )
                     success = build_helm_app(
                         app_name_iter,
                         app,
@@ -529,6 +585,9 @@ def cmd(
                         APP_CONFIG_DIR,
                         output,
                         dry_run,
+                        incremental=not (
+                            force or group_build_hooks or app_build_hooks
+                        ),
                     )
                 else:
                     output.print(
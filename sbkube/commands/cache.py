@@ -0,0 +1,185 @@
+"""Cache 명령어 구현.
+
+전역 chart cache(~/.sbkube/cache/charts)를 조회하고 정리합니다.
+"""
+
+from datetime import datetime
+
+import click
+
+from sbkube.utils.chart_cache import ChartCache, format_size, parse_size
+from sbkube.utils.global_options import global_options
+from sbkube.utils.output_manager import OutputManager
+
+
+def _format_time(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+@click.group(name="cache")
+def cmd() -> None:
+    """전역 chart cache 관리 (list, info, prune, clear)."""
+
+
+@cmd.command(name="list")
+@global_options
+@click.pass_context
+def list_cmd(ctx: click.Context) -> None:
+    """캐시된 차트 목록을 출력합니다 (최근 사용 순).
+
+    Examples:
+        sbkube cache list
+
+    """
+    output = OutputManager(format_type=ctx.obj.get("format", "human"))
+    chart_cache = ChartCache()
+    entries = chart_cache.list_entries()
+
+    if not entries:
+        output.print(f"Chart cache is empty: {chart_cache.root}", level="info")
+    else:
+        output.print_table(
+            headers=["Chart", "Version", "Repository", "Size", "Last Used"],
+            rows=[
+                [
+                    entry.chart,
+                    entry.version,
+                    entry.repo_url,
+                    format_size(entry.size_bytes),
+                    _format_time(entry.last_used_at),
+                ]
+                for entry in entries
+            ],
+            title=f"Chart cache ({chart_cache.root})",
+        )
+
+    output.finalize(
+        status="success",
+        summary={
+            "cache_dir": str(chart_cache.root),
+            "entries": [
+                {
+                    "chart": entry.chart,
+                    "version": entry.version,
+                    "repo_url": entry.repo_url,
+                    "digest": entry.digest,
+                    "size_bytes": entry.size_bytes,
+                    "last_used_at": entry.last_used_at,
+                }
+                for entry in entries
+            ],
+        },
+    )
+
+
+@cmd.command(name="info")
+@global_options
+@click.pass_context
+def info_cmd(ctx: click.Context) -> None:
+    """캐시 위치와 사용량을 출력합니다.
+
+    Examples:
+        sbkube cache info
+
+    """
+    output = OutputManager(format_type=ctx.obj.get("format", "human"))
+    chart_cache = ChartCache()
+    entries = chart_cache.list_entries()
+    total_bytes = sum(entry.size_bytes for entry in entries)
+
+    output.print(f"Cache directory: {chart_cache.root}", level="info")
+    output.print(f"Entries: {len(entries)}", level="info")
+    output.print(
+        f"Size: {format_size(total_bytes)} / {format_size(chart_cache.max_bytes)}",
+        level="info",
+    )
+    output.finalize(
+        status="success",
+        summary={
+            "cache_dir": str(chart_cache.root),
+            "entries": len(entries),
+            "size_bytes": total_bytes,
+            "max_bytes": chart_cache.max_bytes,
+        },
+    )
+
+
+@cmd.command(name="prune")
+@click.option(
+    "--max-size",
+    type=str,
+    default=None,
+    help="캐시 크기를 이 값 이하로 줄임 (예: 1G, 500M, 기본: 설정된 최대 크기)",
+)
+@click.option(
+    "--older-than",
+    type=int,
+    default=None,
+    help="이 일수 동안 사용하지 않은 차트 삭제",
+)
+@global_options
+@click.pass_context
+def prune_cmd(ctx: click.Context, max_size: str | None, older_than: int | None) -> None:
+    """오래 사용하지 않은 차트를 삭제합니다 (LRU).
+
+    Examples:
+        # 설정된 최대 크기 기준으로 정리
+        sbkube cache prune
+
+        # 1GiB 이하로 정리
+        sbkube cache prune --max-size 1G
+
+        # 30일 이상 사용하지 않은 차트 삭제
+        sbkube cache prune --older-than 30
+
+    """
+    output = OutputManager(format_type=ctx.obj.get("format", "human"))
+    chart_cache = ChartCache()
+
+    try:
+        max_bytes = parse_size(max_size) if max_size else None
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--max-size") from e
+    if max_bytes is None and older_than is None:
+        max_bytes = chart_cache.max_bytes
+
+    removed = chart_cache.prune(
+        max_bytes=max_bytes,
+        older_than_seconds=older_than * 86400 if older_than is not None else None,
+    )
+    freed = sum(entry.size_bytes for entry in removed)
+
+    for entry in removed:
+        output.print(f"  Removed: {entry.display_name} ({entry.repo_url})", level="info")
+    output.print_success(
+        f"Pruned {len(removed)} chart(s), freed {format_size(freed)}"
+    )
+    output.finalize(
+        status="success",
+        summary={"removed": len(removed), "freed_bytes": freed},
+    )
+
+
+@cmd.command(name="clear")
+@click.option("--yes", is_flag=True, help="확인 없이 삭제")
+@global_options
+@click.pass_context
+def clear_cmd(ctx: click.Context, yes: bool) -> None:
+    """캐시된 차트를 모두 삭제합니다.
+
+    Examples:
+        sbkube cache clear --yes
+
+    """
+    output = OutputManager(format_type=ctx.obj.get("format", "human"))
+    chart_cache = ChartCache()
+
+    if not yes and not click.confirm(
+        f"Remove all cached charts in {chart_cache.root}?", default=False
+    ):
+        output.print("Cancelled", level="info")
+        return
+
+    removed = chart_cache.clear()
+    output.print_success(f"Removed {len(removed)} cached chart(s)")
+    output.finalize(status="success", summary={"removed": len(removed)})
@@ -16,12 +16,9 @@ from packaging.version import InvalidVersion
 from rich.table import Table
 
 from sbkube.models.config_manager import ConfigManager
-from sbkube.utils.helm_util import (
-    get_all_helm_releases,
-    get_latest_chart_version,
-    search_helm_chart,
-)
 from sbkube.utils.global_options import global_options
+from sbkube.utils.helm_index import DEFAULT_INDEX_MAX_AGE_SECONDS, HelmIndex
+from sbkube.utils.helm_util import get_all_helm_releases
 from sbkube.utils.output_manager import OutputManager
 from sbkube.utils.version_compare import (
     VersionComparison,
@@ -64,6 +61,11 @@ class ChartUpdate:
     is_flag=True,
     help="Update config.yaml with latest versions (prompts for confirmation)",
 )
+@click.option(
+    "--refresh-index",
+    is_flag=True,
+    help="Run 'helm repo update' first for repository indexes older than 24h",
+)
 @global_options
 @click.pass_context
 def cmd(
@@ -71,16 +73,22 @@ def cmd(
     base_dir: str,
     check_all: bool,
     update_config: bool,
+    refresh_index: bool,
 ) -> None:
     """Check for available Helm chart updates.
 
     By default, checks only sbkube-managed applications defined in config.yaml.
     Use --all to check all Helm releases in the cluster.
 
+    Latest versions are read from Helm's local repository index cache (the
+    same data `helm search repo` uses); --refresh-index updates stale indexes
+    first.
+
     Examples:
         sbkube check-updates
         sbkube check-updates --all
         sbkube check-updates --update-config
+        sbkube check-updates --refresh-index
     """
     output_format = ctx.obj.get("format", "human")
     kubeconfig = ctx.obj.get("kubeconfig")
@@ -103,11 +111,14 @@ def cmd(
 
         # Get Helm repositories
         helm_repos = sources.helm_repos or {}
+        index = HelmIndex()
+        if refresh_index:
+            _refresh_stale_indexes(index, helm_repos, kubeconfig, context, output)
 
         if check_all:
             output.print_section("Checking All Cluster Helm Releases")
             updates = _check_all_releases(
-                helm_repos, kubeconfig, context, output, output_format
+                helm_repos, kubeconfig, context, output, output_format, index=index
             )
         else:
             output.print_section("Checking SBKube-Managed Applications")
@@ -118,7 +129,13 @@ def cmd(
                 return
 
             updates = _check_sbkube_apps(
-                config.apps, helm_repos, kubeconfig, context, output, output_format
+                config.apps,
+                helm_repos,
+                kubeconfig,
+                context,
+                output,
+                output_format,
+                index=index,
             )
 
         # Display results
@@ -143,15 +160,41 @@ def cmd(
         output.finalize(status="error", summary={"error": str(e)})
 
 
+def _refresh_stale_indexes(
+    index: HelmIndex,
+    helm_repos: dict,
+    kubeconfig: str | None,
+    context: str | None,
+    output: OutputManager,
+) -> None:
+    """Add/update repositories whose cached index is missing or stale."""
+    from sbkube.commands.prepare import get_helm_repo_url, refresh_helm_repos
+
+    stale = index.stale_repos(helm_repos.keys(), DEFAULT_INDEX_MAX_AGE_SECONDS)
+    repos = {
+        name: url for name in stale if (url := get_helm_repo_url(helm_repos[name]))
+    }
+    if not repos:
+        return
+
+    output.print(f"Refreshing {len(repos)} Helm repository indexes...")
+    _, failed = refresh_helm_repos(repos, output, kubeconfig, context)
+    if failed:
+        output.print_warning(f"Failed to refresh: {', '.join(failed)}")
+    index.invalidate(repos)
+
+
 def _check_all_releases(
     helm_repos: dict,
     kubeconfig: str | None,
     context: str | None,
     output: OutputManager,
     output_format: str,
+    index: HelmIndex | None = None,
 ) -> list[ChartUpdate]:
     """Check all Helm releases in the cluster."""
     updates: list[ChartUpdate] = []
+    index = index or HelmIndex()
 
     try:
         releases = get_all_helm_releases(context=context, kubeconfig=kubeconfig)
@@ -174,7 +217,7 @@ def _check_all_releases(
         chart_name, current_version = chart_info
 
         # Try to find chart in known repositories
-        repo_name = _find_chart_repo(chart_name, helm_repos)
+        repo_name = _find_chart_repo(chart_name, helm_repos, index)
         if not repo_name:
             if output_format == "human":
                 output.print(
@@ -184,7 +227,7 @@ def _check_all_releases(
 
         # Check for updates
         update_info = _check_chart_update(
-            name, namespace, repo_name, chart_name, current_version
+            name, namespace, repo_name, chart_name, current_version, index
         )
         if update_info:
             updates.append(update_info)
@@ -201,9 +244,11 @@ def _check_sbkube_apps(
     context: str | None,
     output: OutputManager,
     output_format: str,
+    index: HelmIndex | None = None,
 ) -> list[ChartUpdate]:
     """Check sbkube-managed applications."""
     updates: list[ChartUpdate] = []
+    index = index or HelmIndex()
 
     # Get deployed releases for comparison
     try:
@@ -250,7 +295,7 @@ def _check_sbkube_apps(
 
         # Check for updates
         update_info = _check_chart_update(
-            app_name, namespace, repo_name, chart_name, current_version
+            app_name, namespace, repo_name, chart_name, current_version, index
         )
         if update_info:
             updates.append(update_info)
@@ -270,16 +315,11 @@ def _parse_chart_string(chart: str) -> tuple[str, str] | None:
     return None
 
 
-def _find_chart_repo(chart_name: str, helm_repos: dict) -> str | None:
-    """Find repository name for a chart by searching."""
-    for repo_name in helm_repos.keys():
-        try:
-            results = search_helm_chart(repo_name, chart_name)
-            if results:
-                return repo_name
-        except Exception:
-            continue
-    return None
+def _find_chart_repo(
+    chart_name: str, helm_repos: dict, index: HelmIndex
+) -> str | None:
+    """Find repository name for a chart in the cached repository indexes."""
+    return index.find_repo(chart_name, helm_repos.keys())
 
 
 def _check_chart_update(
@@ -288,10 +328,11 @@ def _check_chart_update(
     repo_name: str,
     chart_name: str,
     current_version: str,
+    index: HelmIndex,
 ) -> ChartUpdate | None:
     """Check if an update is available for a chart."""
     try:
-        latest_version = get_latest_chart_version(repo_name, chart_name)
+        latest_version = index.latest_version(repo_name, chart_name)
         if not latest_version:
             return None
 
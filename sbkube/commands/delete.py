@@ -5,6 +5,8 @@ from pydantic import ValidationError as PydanticValidationError
 from rich.console import Console
 
 from sbkube.models.config_model import ActionApp, SBKubeConfig, YamlApp
+from sbkube.utils.app_scheduler import AppScheduler, AppTaskResult, AppTaskStatus
+from sbkube.utils.async_runner import get_command_runner
 from sbkube.utils.cli_check import (
     check_helm_installed_or_exit,
     check_kubectl_installed_or_exit,
@@ -14,13 +16,339 @@ from sbkube.utils.common import find_sources_file, run_command
 from sbkube.utils.common_options import resolve_command_paths, target_options
 from sbkube.utils.global_options import global_options
 from sbkube.utils.file_loader import load_config_file
-from sbkube.utils.helm_util import get_installed_charts
-
+from sbkube.utils.helm_util import get_all_helm_releases, get_installed_charts
 from sbkube.utils.logger import logger
+from sbkube.utils.output_manager import OutputManager
 
 # Use logger's console so it respects --format (quiet in non-human modes)
 console = logger.console
 
+# 자동 삭제를 지원하는 앱 타입
+DELETABLE_APP_TYPES = ("helm", "yaml", "action")
+
+# 앱 삭제 결과
+_SUCCESS = "success"
+_SKIPPED = "skipped"
+_FAILED = "failed"
+
+# (context, kubeconfig) → {(namespace, release name)}; 조회 실패 시 None
+HelmReleaseSnapshots = dict[tuple[str | None, str | None], set[tuple[str, str]] | None]
+
+
+def _teardown_dependencies(
+    config: SBKubeConfig, app_names: list[str]
+) -> dict[str, list[str]]:
+    """삭제 순서용 의존성 그래프 (depends_on의 역방향).
+
+    앱은 자신에게 (전이적으로) 의존하는 앱이 모두 삭제된 뒤에 삭제합니다.
+    삭제 대상이 아닌 앱(git, http 등)을 거치는 의존 관계도 따라갑니다.
+
+    Args:
+        config: SBKubeConfig
+        app_names: 삭제 대상 앱 이름 리스트
+
+    Returns:
+        앱 이름 → 먼저 삭제되어야 하는 앱 이름 리스트
+
+    """
+    dependents: dict[str, set[str]] = {name: set() for name in config.apps}
+    for name, app_config in config.apps.items():
+        for dep in getattr(app_config, "depends_on", None) or []:
+            if dep in dependents:
+                dependents[dep].add(name)
+
+    graph: dict[str, list[str]] = {}
+    for name in app_names:
+        seen: set[str] = set()
+        stack = list(dependents.get(name, ()))
+        while stack:
+            current = stack.pop()
+            if current in seen or current == name:
+                continue
+            seen.add(current)
+            stack.extend(dependents[current])
+        graph[name] = [other for other in app_names if other in seen]
+    return graph
+
+
+def _resolve_app_target(
+    app_config,
+    cli_namespace: str | None,
+    global_namespace: str | None,
+    context: str | None,
+    kubeconfig: str | None,
+) -> tuple[str | None, str | None, str | None]:
+    """앱의 (namespace, context, kubeconfig) 결정.
+
+    Namespace 우선순위: App > CLI > Global (helm은 최종 기본값 'default').
+
+    Context Priority Resolution:
+    1. app.context (app-level): Highest priority - specified in config.yaml per app
+    2. sources.yaml context: Middle priority - project-level default
+    3. Current kubectl context: Lowest priority - system default
+
+    Note: When using app.context, we don't use sources.yaml's kubeconfig
+    because app.context might refer to a context in the default kubeconfig (~/.kube/config)
+    or another kubeconfig file that the user has already configured in their environment.
+    """
+    namespace = None
+    app_namespace = getattr(app_config, "namespace", None)
+    if app_namespace and app_namespace not in ["!ignore", "!none", "!false", ""]:
+        namespace = app_namespace
+    elif cli_namespace:
+        namespace = cli_namespace
+    elif global_namespace:
+        namespace = global_namespace
+    elif app_config.type == "helm":
+        namespace = "default"
+
+    app_context = getattr(app_config, "context", None)
+    effective_context = app_context or context
+    effective_kubeconfig = kubeconfig if not app_context else None
+    return namespace, effective_context, effective_kubeconfig
+
+
+def _snapshot_helm_releases(
+    clusters: list[tuple[str | None, str | None]],
+) -> HelmReleaseSnapshots:
+    """클러스터별로 `helm list -A` 한 번으로 설치된 release 목록 조회.
+
+    Args:
+        clusters: (context, kubeconfig) 리스트
+
+    Returns:
+        (context, kubeconfig) → {(namespace, release name)}. 조회에 실패한
+        클러스터(예: cluster-wide list 권한 없음)는 None이며, 이 경우 앱별
+        namespace 조회로 대체합니다.
+
+    """
+    snapshots: HelmReleaseSnapshots = {}
+    for cluster in clusters:
+        if cluster in snapshots:
+            continue
+        context, kubeconfig = cluster
+        try:
+            releases = get_all_helm_releases(context=context, kubeconfig=kubeconfig)
+            snapshots[cluster] = {
+                (release.get("namespace"), release.get("name")) for release in releases
+            }
+        except Exception as e:
+            logger.verbose(f"Helm release 일괄 조회 실패, namespace별 조회로 대체: {e}")
+            snapshots[cluster] = None
+    return snapshots
+
+
+def _delete_helm_app(
+    app_name: str,
+    app_config,
+    out: Console,
+    namespace: str | None,
+    context: str | None,
+    kubeconfig: str | None,
+    helm_releases: HelmReleaseSnapshots,
+    skip_not_found: bool,
+    dry_run: bool,
+) -> str:
+    release_name = getattr(app_config, "release_name", None) or app_name
+
+    snapshot = helm_releases.get((context, kubeconfig))
+    if snapshot is not None:
+        installed = (namespace, release_name) in snapshot
+    else:
+        installed = release_name in get_installed_charts(
+            namespace,
+            context=context,
+            kubeconfig=kubeconfig,
+        )
+    if not installed:
+        out.print(
+            f"[yellow]⚠️ Helm 릴리스 '{release_name}'(네임스페이스: {namespace or '-'})가 설치되어 있지 않습니다.[/yellow]",
+        )
+        if skip_not_found:
+            out.print(
+                "    [grey]L `--skip-not-found` 옵션으로 건너뜁니다.[/grey]",
+            )
+        return _SKIPPED
+
+    helm_cmd = ["helm", "uninstall", release_name]
+    if namespace:
+        helm_cmd.extend(["--namespace", namespace])
+    if kubeconfig:
+        helm_cmd.extend(["--kubeconfig", kubeconfig])
+    if context:
+        helm_cmd.extend(["--kube-context", context])
+    if dry_run:
+        helm_cmd.append("--dry-run")
+
+    out.print(f"    [cyan]$ {' '.join(helm_cmd)}[/cyan]")
+    return_code, stdout, stderr = run_command(
+        helm_cmd,
+        check=False,
+        timeout=300,
+    )
+    if return_code != 0:
+        out.print(
+            f"[red]❌ Helm 릴리스 '{release_name}' 삭제 실패:[/red]",
+        )
+        if stdout:
+            out.print(f"    [blue]STDOUT:[/blue] {stdout.strip()}")
+        if stderr:
+            out.print(f"    [red]STDERR:[/red] {stderr.strip()}")
+        return _FAILED
+
+    if dry_run:
+        out.print(
+            f"[yellow]🔍 [DRY-RUN] Helm 릴리스 '{release_name}' 삭제 예정.[/yellow]",
+        )
+    else:
+        out.print(
+            f"[green]✅ Helm 릴리스 '{release_name}' 삭제 완료.[/green]",
+        )
+    if stdout:
+        out.print(f"    [grey]Helm STDOUT: {stdout.strip()}[/grey]")
+    return _SUCCESS
+
+
+def _delete_yaml_app(
+    app_name: str,
+    app_config: YamlApp,
+    out: Console,
+    namespace: str | None,
+    context: str | None,
+    kubeconfig: str | None,
+    app_config_dir: Path,
+    skip_not_found: bool,
+    dry_run: bool,
+) -> str:
+    if not app_config.manifests:
+        out.print(
+            f"[yellow]⚠️ 앱 '{app_name}': 삭제할 YAML 파일이 지정되지 않았습니다. 건너뜁니다.[/yellow]",
+        )
+        return _SKIPPED
+
+    # manifests를 역순으로 하나의 kubectl delete에 모아서 삭제
+    manifest_paths: list[Path] = []
+    missing_files = 0
+    for file_rel_path in reversed(app_config.manifests):
+        abs_yaml_path = Path(file_rel_path)
+        if not abs_yaml_path.is_absolute():
+            abs_yaml_path = app_config_dir / abs_yaml_path
+
+        if not abs_yaml_path.exists() or not abs_yaml_path.is_file():
+            out.print(
+                f"    [yellow]⚠️ YAML 삭제 대상 파일을 찾을 수 없음 (건너뜀): {abs_yaml_path}[/yellow]",
+            )
+            missing_files += 1
+            continue
+        manifest_paths.append(abs_yaml_path)
+
+    if not manifest_paths:
+        out.print(
+            f"    [grey]YAML 삭제 요약 (파일 기준): 성공 0, 실패 {missing_files}[/grey]",
+        )
+        if skip_not_found:
+            out.print(
+                f"    [yellow]ℹ️ 앱 '{app_name}': 모든 YAML 리소스가 이미 삭제되었거나 대상이 없었습니다 (skip-not-found).[/yellow]",
+            )
+            return _SUCCESS
+        return _FAILED
+
+    kubectl_cmd = ["kubectl", "delete"]
+    for manifest_path in manifest_paths:
+        kubectl_cmd.extend(["-f", str(manifest_path)])
+    if namespace:
+        kubectl_cmd.extend(["--namespace", namespace])
+    if kubeconfig:
+        kubectl_cmd.extend(["--kubeconfig", kubeconfig])
+    if context:
+        kubectl_cmd.extend(["--context", context])
+    if skip_not_found:
+        kubectl_cmd.append("--ignore-not-found=true")
+    if dry_run:
+        kubectl_cmd.append("--dry-run=client")
+
+    file_names = ", ".join(path.name for path in manifest_paths)
+    out.print(f"    [cyan]$ {' '.join(kubectl_cmd)}[/cyan]")
+    return_code, stdout, stderr = run_command(
+        kubectl_cmd,
+        check=False,
+        timeout=120,
+    )
+    if return_code == 0:
+        if dry_run:
+            out.print(
+                f"[yellow]    🔍 [DRY-RUN] YAML '{file_names}' 삭제 예정.[/yellow]",
+            )
+        else:
+            out.print(
+                f"[green]    ✅ YAML '{file_names}' 삭제 요청 성공.[/green]",
+            )
+        if stdout:
+            out.print(
+                f"        [grey]Kubectl STDOUT: {stdout.strip()}[/grey]",
+            )
+        deleted_files, failed_files = len(manifest_paths), missing_files
+    else:
+        out.print(
+            f"[red]    ❌ YAML '{file_names}' 삭제 실패:[/red]",
+        )
+        if stdout:
+            out.print(f"        [blue]STDOUT:[/blue] {stdout.strip()}")
+        if stderr:
+            out.print(f"        [red]STDERR:[/red] {stderr.strip()}")
+        deleted_files, failed_files = 0, len(manifest_paths) + missing_files
+
+    out.print(
+        f"    [grey]YAML 삭제 요약 (파일 기준): 성공 {deleted_files}, 실패 {failed_files}[/grey]",
+    )
+    return _SUCCESS if failed_files == 0 else _FAILED
+
+
+def _delete_action_app(
+    app_name: str,
+    app_config: ActionApp,
+    out: Console,
+    base_dir: Path,
+    dry_run: bool,
+) -> str:
+    if not app_config.uninstall or not app_config.uninstall.script:
+        out.print(
+            f"[yellow]⚠️ 앱 '{app_name}' (타입: action): `uninstall.script`가 정의되지 않아 자동으로 삭제할 수 없습니다. 건너뜁니다.[/yellow]",
+        )
+        return _SKIPPED
+
+    if dry_run:
+        out.print(
+            f"[yellow]⚠️ [DRY-RUN] 앱 '{app_name}' (타입: action): uninstall 스크립트는 dry-run에서 실행되지 않습니다.[/yellow]",
+        )
+        out.print(
+            f"    [grey]스크립트 내용: {app_config.uninstall.script}[/grey]",
+        )
+        return _SUCCESS
+
+    for raw_cmd_str in app_config.uninstall.script:
+        out.print(f"    [cyan]$ {raw_cmd_str}[/cyan]")
+        return_code, stdout, stderr = run_command(
+            raw_cmd_str,
+            check=False,
+            cwd=base_dir,
+        )
+        if return_code != 0:
+            out.print(
+                f"[red]❌ 앱 '{app_name}': uninstall 스크립트 실행 실패 ('{raw_cmd_str}'):[/red]",
+            )
+            if stdout:
+                out.print(f"    [blue]STDOUT:[/blue] {stdout.strip()}")
+            if stderr:
+                out.print(f"    [red]STDERR:[/red] {stderr.strip()}")
+            return _FAILED
+        if stdout:
+            out.print(f"    [grey]STDOUT:[/grey] {stdout.strip()}")
+        out.print(
+            f"[green]✅ 앱 '{app_name}': uninstall 스크립트 실행 완료 ('{raw_cmd_str}')[/green]",
+        )
+    return _SUCCESS
+
 
 @click.command(name="delete")
 @target_options
@@ -40,6 +368,13 @@ console = logger.console
     is_flag=True,
     help="실제로 삭제하지 않고 삭제될 리소스를 미리 확인합니다.",
 )
+@click.option(
+    "--max-workers",
+    type=int,
+    default=4,
+    help="동시에 삭제할 최대 앱 수 (기본: 4, 1이면 순차 삭제). helm/kubectl 동시 실행 "
+    "상한도 최소 이 값으로 올림",
+)
 @global_options
 @click.pass_context
 def cmd(
@@ -49,6 +384,7 @@ def cmd(
     target_app_name: str | None,
     skip_not_found: bool,
     dry_run: bool,
+    max_workers: int,
 ) -> None:
     """config.yaml/toml에 정의된 애플리케이션을 삭제합니다 (Helm 릴리스, Kubectl 리소스 등)."""
     app_config_dir_name: str | None = None
@@ -178,10 +514,6 @@ def cmd(
 
     global_namespace_from_config = config.namespace
 
-    delete_total_apps = 0
-    delete_success_apps = 0
-    delete_skipped_apps = 0
-
     # apps는 dict (key=name, value=AppConfig)
     apps_to_process = []
     if target_app_name:
@@ -203,289 +535,131 @@ def cmd(
         )
         return
 
-    # (app_name, app_config) 튜플
-    for app_name, app_config in apps_to_process:
-        # 타입은 'helm', 'yaml', 'action' 등으로 단순화됨
-        # Legacy 'install-helm' → 'helm'
-        # Legacy 'install-yaml' → 'yaml'
-        # Legacy 'install-action' → 'action'
-
-        if app_config.type not in ["helm", "yaml", "action"]:
-            continue
-
-        delete_total_apps += 1
-        app_type = app_config.type
+    # 타입은 'helm', 'yaml', 'action' 등으로 단순화됨
+    # Legacy 'install-helm' → 'helm', 'install-yaml' → 'yaml', 'install-action' → 'action'
+    apps_to_delete = {
+        app_name: app_config
+        for app_name, app_config in apps_to_process
+        if app_config.type in DELETABLE_APP_TYPES
+    }
+    targets = {
+        app_name: _resolve_app_target(
+            app_config,
+            cli_namespace,
+            global_namespace_from_config,
+            context,
+            kubeconfig,
+        )
+        for app_name, app_config in apps_to_delete.items()
+    }
+
+    helm_apps = [name for name, app in apps_to_delete.items() if app.type == "helm"]
+    if helm_apps:
+        check_helm_installed_or_exit()
+    if any(app.type == "yaml" for app in apps_to_delete.values()):
+        check_kubectl_installed_or_exit()
+
+    # 존재 여부 확인은 클러스터당 `helm list -A` 한 번으로 처리
+    helm_releases = _snapshot_helm_releases(
+        [(targets[name][1], targets[name][2]) for name in helm_apps]
+    )
+
+    # 의존하는 앱(dependents)을 먼저 삭제하고, 독립적인 브랜치는 병렬로 삭제
+    app_names = list(apps_to_delete)
+    try:
+        scheduler = AppScheduler(
+            dependencies=_teardown_dependencies(config, app_names),
+            max_workers=max_workers,
+            order=list(reversed(app_names)),
+        )
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        raise click.Abort from e
+    get_command_runner().ensure_capacity(max_workers)
+
+    # 앱 단위 출력 버퍼 (병렬 삭제 중 앱 출력이 섞이지 않도록)
+    output = ctx.obj.get("output") or OutputManager(
+        format_type=ctx.obj.get("format", "human")
+    )
+    buffers = {name: output.create_buffer() for name in app_names}
+    outcomes: dict[str, str] = {}
+
+    def delete_one(app_name: str) -> bool:
+        out = buffers[app_name].get_console()
+        with logger.use_console(out):
+            return _delete_one(app_name, out)
+
+    def _delete_one(app_name: str, out: Console) -> bool:
+        app_config = apps_to_delete[app_name]
+        namespace, app_context, app_kubeconfig = targets[app_name]
         app_release_name = getattr(app_config, "release_name", None) or app_name
 
-        console.print(
-            f"[magenta]➡️  앱 '{app_name}' (타입: {app_type}, 릴리스명: '{app_release_name}') 삭제 시도...[/magenta]",
+        out.print(
+            f"[magenta]➡️  앱 '{app_name}' (타입: {app_config.type}, 릴리스명: '{app_release_name}') 삭제 시도...[/magenta]",
         )
-
-        # Namespace 우선순위: CLI > App > Global
-        current_namespace = None
-        app_namespace = getattr(app_config, "namespace", None)
-        if app_namespace and app_namespace not in ["!ignore", "!none", "!false", ""]:
-            current_namespace = app_namespace
-        elif cli_namespace:
-            current_namespace = cli_namespace
-        elif global_namespace_from_config:
-            current_namespace = global_namespace_from_config
-        elif app_type == "helm":
-            current_namespace = "default"
-
-        if current_namespace:
-            console.print(f"    [grey]ℹ️ 네임스페이스 사용: {current_namespace}[/grey]")
+        if namespace:
+            out.print(f"    [grey]ℹ️ 네임스페이스 사용: {namespace}[/grey]")
         else:
-            console.print(
+            out.print(
                 "    [grey]ℹ️ 네임스페이스 미지정 (현재 컨텍스트의 기본값 사용 또는 리소스에 따라 다름)[/grey]",
             )
 
-        delete_command_executed = False
-        delete_successful_for_app = False
-
-        if app_type == "helm":
-            check_helm_installed_or_exit()
-
-            # Context Priority Resolution:
-            # 1. app.context (app-level): Highest priority - specified in config.yaml per app
-            # 2. sources.yaml context: Middle priority - project-level default
-            # 3. Current kubectl context: Lowest priority - system default
-            #
-            # Note: When using app.context, we don't use sources.yaml's kubeconfig
-            # because app.context might refer to a context in the default kubeconfig (~/.kube/config)
-            # or another kubeconfig file that the user has already configured in their environment.
-            app_context = getattr(app_config, "context", None)
-            effective_context = app_context or context
-            effective_kubeconfig = kubeconfig if not app_context else None
-
-            installed_charts = get_installed_charts(
-                current_namespace,
-                context=effective_context,
-                kubeconfig=effective_kubeconfig,
+        if app_config.type == "helm":
+            outcome = _delete_helm_app(
+                app_name,
+                app_config,
+                out,
+                namespace,
+                app_context,
+                app_kubeconfig,
+                helm_releases,
+                skip_not_found,
+                dry_run,
             )
-            if app_release_name not in installed_charts:
-                console.print(
-                    f"[yellow]⚠️ Helm 릴리스 '{app_release_name}'(네임스페이스: {current_namespace or '-'})가 설치되어 있지 않습니다.[/yellow]",
-                )
-                if skip_not_found:
-                    console.print(
-                        "    [grey]L `--skip-not-found` 옵션으로 건너뜁니다.[/grey]",
-                    )
-                    delete_skipped_apps += 1
-                    console.print("")
-                    continue
-                delete_skipped_apps += 1
-                console.print("")
-                continue
-
-            helm_cmd = ["helm", "uninstall", app_release_name]
-            if current_namespace:
-                helm_cmd.extend(["--namespace", current_namespace])
-            if effective_kubeconfig:
-                helm_cmd.extend(["--kubeconfig", effective_kubeconfig])
-            if effective_context:
-                helm_cmd.extend(["--kube-context", effective_context])
-            if dry_run:
-                helm_cmd.append("--dry-run")
-
-            console.print(f"    [cyan]$ {' '.join(helm_cmd)}[/cyan]")
-            return_code, stdout, stderr = run_command(
-                helm_cmd,
-                check=False,
-                timeout=300,
+        elif not isinstance(app_config, (YamlApp, ActionApp)):
+            model_name = "YamlApp" if app_config.type == "yaml" else "ActionApp"
+            out.print(
+                f"[red]❌ 앱 '{app_name}': 타입이 '{app_config.type}'이나 {model_name} 모델이 아님[/red]",
             )
-            if return_code == 0:
-                if dry_run:
-                    console.print(
-                        f"[yellow]🔍 [DRY-RUN] Helm 릴리스 '{app_release_name}' 삭제 예정.[/yellow]",
-                    )
-                else:
-                    console.print(
-                        f"[green]✅ Helm 릴리스 '{app_release_name}' 삭제 완료.[/green]",
-                    )
-                if stdout:
-                    console.print(f"    [grey]Helm STDOUT: {stdout.strip()}[/grey]")
-                delete_successful_for_app = True
-                delete_command_executed = True
-            else:
-                console.print(
-                    f"[red]❌ Helm 릴리스 '{app_release_name}' 삭제 실패:[/red]",
-                )
-                if stdout:
-                    console.print(f"    [blue]STDOUT:[/blue] {stdout.strip()}")
-                if stderr:
-                    console.print(f"    [red]STDERR:[/red] {stderr.strip()}")
-
-        elif app_type == "yaml":
-            check_kubectl_installed_or_exit()
-
-            # YamlApp은 files 리스트를 직접 가짐
-            if not isinstance(app_config, YamlApp):
-                console.print(
-                    f"[red]❌ 앱 '{app_name}': 타입이 'yaml'이나 YamlApp 모델이 아님[/red]",
-                )
-                delete_skipped_apps += 1
-                console.print("")
-                continue
-
-            # Context Priority Resolution (same as helm):
-            # 1. app.context > 2. sources.yaml context > 3. current kubectl context
-            app_context = getattr(app_config, "context", None)
-            effective_context = app_context or context
-            effective_kubeconfig = kubeconfig if not app_context else None
-
-            if not app_config.manifests:
-                console.print(
-                    f"[yellow]⚠️ 앱 '{app_name}': 삭제할 YAML 파일이 지정되지 않았습니다. 건너뜁니다.[/yellow]",
-                )
-                delete_skipped_apps += 1
-                console.print("")
-                continue
-
-            yaml_delete_successful_files = 0
-            yaml_delete_failed_files = 0
-
-            # manifests를 역순으로 삭제
-            for file_rel_path in reversed(app_config.manifests):
-                file_path = Path(file_rel_path)
-                abs_yaml_path = file_path
-                if not abs_yaml_path.is_absolute():
-                    abs_yaml_path = APP_CONFIG_DIR / file_path
-
-                if not abs_yaml_path.exists() or not abs_yaml_path.is_file():
-                    console.print(
-                        f"    [yellow]⚠️ YAML 삭제 대상 파일을 찾을 수 없음 (건너뜀): {abs_yaml_path}[/yellow]",
-                    )
-                    yaml_delete_failed_files += 1
-                    continue
-
-                kubectl_cmd = ["kubectl", "delete", "-f", str(abs_yaml_path)]
-                if current_namespace:
-                    kubectl_cmd.extend(["--namespace", current_namespace])
-                if effective_kubeconfig:
-                    kubectl_cmd.extend(["--kubeconfig", effective_kubeconfig])
-                if effective_context:
-                    kubectl_cmd.extend(["--context", effective_context])
-                if skip_not_found:
-                    kubectl_cmd.append("--ignore-not-found=true")
-                if dry_run:
-                    kubectl_cmd.append("--dry-run=client")
-
-                console.print(f"    [cyan]$ {' '.join(kubectl_cmd)}[/cyan]")
-                return_code, stdout, stderr = run_command(
-                    kubectl_cmd,
-                    check=False,
-                    timeout=120,
-                )
-                if return_code == 0:
-                    if dry_run:
-                        console.print(
-                            f"[yellow]    🔍 [DRY-RUN] YAML '{abs_yaml_path.name}' 삭제 예정.[/yellow]",
-                        )
-                    else:
-                        console.print(
-                            f"[green]    ✅ YAML '{abs_yaml_path.name}' 삭제 요청 성공.[/green]",
-                        )
-                    if stdout:
-                        console.print(
-                            f"        [grey]Kubectl STDOUT: {stdout.strip()}[/grey]",
-                        )
-                    yaml_delete_successful_files += 1
-                    delete_command_executed = True
-                else:
-                    console.print(
-                        f"[red]    ❌ YAML '{abs_yaml_path.name}' 삭제 실패:[/red]",
-                    )
-                    if stdout:
-                        console.print(f"        [blue]STDOUT:[/blue] {stdout.strip()}")
-                    if stderr:
-                        console.print(f"        [red]STDERR:[/red] {stderr.strip()}")
-                    yaml_delete_failed_files += 1
-
-            if yaml_delete_failed_files == 0 and yaml_delete_successful_files > 0:
-                delete_successful_for_app = True
-            elif (
-                yaml_delete_failed_files == 0
-                and yaml_delete_successful_files == 0
-                and not delete_command_executed
-            ):
-                if skip_not_found:
-                    delete_successful_for_app = True
-                    console.print(
-                        f"    [yellow]ℹ️ 앱 '{app_name}': 모든 YAML 리소스가 이미 삭제되었거나 대상이 없었습니다 (skip-not-found).[/yellow]",
-                    )
-
-            console.print(
-                f"    [grey]YAML 삭제 요약 (파일 기준): 성공 {yaml_delete_successful_files}, 실패 {yaml_delete_failed_files}[/grey]",
+            outcome = _SKIPPED
+        elif isinstance(app_config, YamlApp):
+            outcome = _delete_yaml_app(
+                app_name,
+                app_config,
+                out,
+                namespace,
+                app_context,
+                app_kubeconfig,
+                APP_CONFIG_DIR,
+                skip_not_found,
+                dry_run,
             )
-
-        elif app_type == "action":
-            # ActionApp
-            if not isinstance(app_config, ActionApp):
-                console.print(
-                    f"[red]❌ 앱 '{app_name}': 타입이 'action'이나 ActionApp 모델이 아님[/red]",
-                )
-                delete_skipped_apps += 1
-                console.print("")
-                continue
-
-            if not app_config.uninstall or not app_config.uninstall.script:
-                console.print(
-                    f"[yellow]⚠️ 앱 '{app_name}' (타입: {app_type}): `uninstall.script`가 정의되지 않아 자동으로 삭제할 수 없습니다. 건너뜁니다.[/yellow]",
-                )
-                delete_skipped_apps += 1
-                console.print("")
-                continue
-
-            if dry_run:
-                console.print(
-                    f"[yellow]⚠️ [DRY-RUN] 앱 '{app_name}' (타입: action): uninstall 스크립트는 dry-run에서 실행되지 않습니다.[/yellow]",
-                )
-                console.print(
-                    f"    [grey]스크립트 내용: {app_config.uninstall.script}[/grey]",
-                )
-                delete_successful_for_app = True
-                delete_command_executed = True
-            else:
-                for raw_cmd_str in app_config.uninstall.script:
-                    console.print(f"    [cyan]$ {raw_cmd_str}[/cyan]")
-                    return_code, stdout, stderr = run_command(
-                        raw_cmd_str,
-                        check=False,
-                        cwd=BASE_DIR,
-                    )
-                    if return_code != 0:
-                        console.print(
-                            f"[red]❌ 앱 '{app_name}': uninstall 스크립트 실행 실패 ('{raw_cmd_str}'):[/red]",
-                        )
-                        if stdout:
-                            console.print(f"    [blue]STDOUT:[/blue] {stdout.strip()}")
-                        if stderr:
-                            console.print(f"    [red]STDERR:[/red] {stderr.strip()}")
-                        delete_successful_for_app = False
-                        break
-                    if stdout:
-                        console.print(f"    [grey]STDOUT:[/grey] {stdout.strip()}")
-                    console.print(
-                        f"[green]✅ 앱 '{app_name}': uninstall 스크립트 실행 완료 ('{raw_cmd_str}')[/green]",
-                    )
-                    delete_successful_for_app = True
-                delete_command_executed = True
-
         else:
-            console.print(
-                f"[yellow]⚠️ 앱 '{app_name}' (타입: {app_type}): 이 타입에 대한 자동 삭제 로직이 아직 정의되지 않았습니다. 건너뜁니다.[/yellow]",
+            outcome = _delete_action_app(app_name, app_config, out, BASE_DIR, dry_run)
+
+        outcomes[app_name] = outcome
+        return outcome != _FAILED
+
+    def on_complete(task_result: AppTaskResult) -> None:
+        name = task_result.app_name
+        buffer = buffers.pop(name)
+        out = buffer.get_console()
+        if task_result.status == AppTaskStatus.SKIPPED:
+            outcomes[name] = _SKIPPED
+            out.print(
+                f"[yellow]⏭️  앱 '{name}': 의존하는 앱 '{task_result.blocked_by}' 삭제 실패로 건너뜁니다.[/yellow]",
             )
-            delete_skipped_apps += 1
-            console.print("")
-            continue
+        elif task_result.status == AppTaskStatus.FAILED and name not in outcomes:
+            outcomes[name] = _FAILED
+            out.print(f"[red]❌ 앱 '{name}' 삭제 중 오류: {task_result.error}[/red]")
+        output.flush_buffer(buffer)
+        console.print("")
 
-        if delete_successful_for_app or (
-            not delete_command_executed and skip_not_found
-        ):
-            delete_success_apps += 1
+    scheduler.run(delete_one, on_complete=on_complete)
 
-        console.print("")
+    delete_total_apps = len(app_names)
+    delete_success_apps = sum(1 for o in outcomes.values() if o == _SUCCESS)
+    delete_skipped_apps = sum(1 for o in outcomes.values() if o == _SKIPPED)
 
     console.print("[bold blue]✨ `delete` 작업 요약 ✨[/bold blue]")
     if delete_total_apps > 0:
@@ -494,14 +668,12 @@ def cmd(
         )
         if delete_skipped_apps > 0:
             console.print(
-                f"[yellow]    {delete_skipped_apps}개 앱 건너뜀 (지원되지 않는 타입, 설정 오류, 리소스 없음 등).[/yellow]",
+                f"[yellow]    {delete_skipped_apps}개 앱 건너뜀 (지원되지 않는 타입, 설정 오류, 리소스 없음, 선행 삭제 실패 등).[/yellow]",
             )
         if (delete_total_apps - delete_success_apps - delete_skipped_apps) > 0:
             console.print(
                 f"[red]    {delete_total_apps - delete_success_apps - delete_skipped_apps}개 앱 삭제 실패.[/red]",
             )
-    elif target_app_name and not apps_to_process:
-        pass
     else:
         console.print("[yellow]    삭제할 대상으로 지정된 앱이 없었습니다.[/yellow]")
     console.print("[bold blue]✨ `delete` 작업 완료 ✨[/bold blue]")
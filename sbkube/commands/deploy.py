@@ -8,8 +8,11 @@
 - kustomize 타입: kubectl apply -k
 """
 
+import re
+import time
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 
@@ -22,9 +25,15 @@ from sbkube.models.config_model import (
     HookApp,
     KustomizeApp,
     NoopApp,
-    SBKubeConfig,
     YamlApp,
 )
+from sbkube.state.desired_state import (
+    AppDesiredState,
+    DesiredStateStore,
+    compute_helm_digest,
+    compute_yaml_digest,
+    parse_helm_revision,
+)
 from sbkube.utils.app_dir_resolver import resolve_app_dirs
 from sbkube.utils.app_labels import (
     build_helm_set_annotations,
@@ -48,18 +57,22 @@ from sbkube.utils.cluster_config import (
 )
 from sbkube.utils.common import find_sources_file, run_command
 from sbkube.utils.common_options import resolve_command_paths, target_options
+from sbkube.utils.execution_context import ExecutionContext
 from sbkube.utils.global_options import global_options
-from sbkube.utils.file_loader import load_config_file
 from sbkube.utils.helm_command_builder import (
     HelmCommand,
     HelmCommandBuilder,
 )
 from sbkube.utils.hook_executor import HookExecutor
 from sbkube.utils.logger import LogLevel, logger
+from sbkube.utils.namespace_registry import NamespaceRegistry
 from sbkube.utils.output_manager import OutputManager
 from sbkube.utils.security import is_exec_allowed
 from sbkube.utils.workspace_resolver import resolve_sbkube_directories
 
+if TYPE_CHECKING:
+    from sbkube.state.tracker import DeploymentTracker
+
 _SSA_CONFLICT_KEYWORDS: tuple[str, ...] = (
     "conflicts with",
     "apply failed with",
@@ -78,8 +91,6 @@ def _parse_ssa_conflict_info(stderr: str) -> tuple[str | None, list[str]]:
         (conflicting_manager, conflicting_fields) 튜플
 
     """
-    import re
-
     # field manager 이름 추출 (예: "kubectl-client-side-apply")
     manager_match = re.search(r'conflicts with "([^"]+)"', stderr)
     manager = manager_match.group(1) if manager_match else None
@@ -135,6 +146,117 @@ def _get_connection_error_reason(stdout: str, stderr: str) -> str | None:
     return None
 
 
+# kubectl apply 출력 (예: "deployment.apps/nginx created", "service/web unchanged (dry run)")
+_KUBECTL_APPLY_RESULT_RE = re.compile(
+    r"^(?P<resource>[^\s/]+)/(?P<name>\S+) (?P<action>[a-z-]+)(?: \(.+\))?$"
+)
+
+
+def _parse_kubectl_apply_output(stdout: str) -> list[tuple[str, str, str]]:
+    """kubectl apply 출력에서 리소스별 결과 추출.
+
+    Args:
+        stdout: kubectl apply 표준 출력
+
+    Returns:
+        (resource, name, action) 목록 (예: ("deployment.apps", "nginx", "created"))
+
+    """
+    results = []
+    for line in stdout.splitlines():
+        match = _KUBECTL_APPLY_RESULT_RE.match(line.strip())
+        if match:
+            results.append((match["resource"], match["name"], match["action"]))
+    return results
+
+
+def _track_applied_resources(
+    tracker: "DeploymentTracker",
+    documents: list[tuple[str, str]],
+    results: list[tuple[str, str, str]],
+) -> None:
+    """kubectl apply 결과를 원본 manifest와 매칭하여 DeploymentTracker에 기록.
+
+    Args:
+        tracker: DeploymentTracker 인스턴스
+        documents: (원본 파일, YAML 내용) 목록
+        results: _parse_kubectl_apply_output() 결과
+
+    """
+    import yaml
+
+    from sbkube.models.deployment_state import ResourceAction
+
+    actions = {"created": ResourceAction.CREATE, "configured": ResourceAction.UPDATE}
+
+    # (kind, name) → [(manifest, source_file)] (같은 이름은 문서 순서대로 매칭)
+    manifests: dict[tuple[str, str], list[tuple[dict, str]]] = {}
+    for source_file, content in documents:
+        for doc in yaml.safe_load_all(content):
+            if isinstance(doc, dict) and doc.get("kind"):
+                key = (doc["kind"].lower(), doc.get("metadata", {}).get("name", ""))
+                manifests.setdefault(key, []).append((doc, source_file))
+
+    for resource, name, action in results:
+        candidates = manifests.get((resource.split(".")[0], name))
+        if not candidates:
+            continue
+        manifest, source_file = candidates.pop(0)
+        tracker.track_resource(
+            manifest,
+            actions.get(action, ResourceAction.APPLY),
+            source_file=source_file,
+        )
+
+
+def _applied_resource_refs(
+    applied_results: list[tuple[list[tuple[str, str]], list[tuple[str, str, str]]]],
+    namespace: str | None,
+) -> list[list[str | None]]:
+    """kubectl apply가 보고한 리소스를 `[namespace, "resource/name"]` 목록으로 변환.
+
+    --skip-unchanged가 건너뛰기 전에 리소스가 아직 있는지 확인하는 데 사용합니다.
+
+    Args:
+        applied_results: (문서 목록, _parse_kubectl_apply_output() 결과) 목록
+        namespace: manifest에 namespace가 없을 때 사용할 앱 namespace
+
+    Returns:
+        리소스 참조 목록
+
+    """
+    import yaml
+
+    # (kind, name) → manifest의 namespace
+    namespaces: dict[tuple[str, str], str | None] = {}
+    for documents, _ in applied_results:
+        for _, content in documents:
+            for doc in yaml.safe_load_all(content):
+                if isinstance(doc, dict) and doc.get("kind"):
+                    metadata = doc.get("metadata") or {}
+                    key = (doc["kind"].lower(), metadata.get("name", ""))
+                    namespaces.setdefault(key, metadata.get("namespace"))
+
+    return [
+        [namespaces.get((resource.split(".")[0], name)) or namespace, f"{resource}/{name}"]
+        for _, results in applied_results
+        for resource, name, _ in results
+    ]
+
+
+def print_skip_summary(output: OutputManager, desired_state: DesiredStateStore) -> None:
+    """--skip-unchanged로 건너뛴 앱 수와 절약한 시간 출력."""
+    if not desired_state.skipped:
+        output.print("[dim]No unchanged apps were skipped[/dim]", level="info")
+        return
+    output.print(
+        f"[green]⏭️  Skipped {len(desired_state.skipped)} unchanged app(s), "
+        f"saved ~{desired_state.time_saved:.1f}s[/green] "
+        f"[dim]({', '.join(desired_state.skipped)})[/dim]",
+        level="info",
+    )
+
+
 def deploy_helm_app(
     app_name: str,
     app: HelmApp,
@@ -152,6 +274,10 @@ def deploy_helm_app(
     cluster_global_values: dict | None = None,
     incompatible_charts: list[str] | None = None,
     force_label_injection: list[str] | None = None,
+    namespace_registry: NamespaceRegistry | None = None,
+    desired_state: DesiredStateStore | None = None,
+    skip_unchanged: bool = False,
+    live_output: Callable[[str], None] | None = None,
 ) -> bool:
     """Helm 앱 배포 (install/upgrade).
 
@@ -172,11 +298,18 @@ def deploy_helm_app(
         cluster_global_values: 클러스터 전역 values (선택, v0.7.0+)
         incompatible_charts: 추가 비호환 chart 목록 (sources.yaml에서)
         force_label_injection: 강제 호환 chart 목록 (sources.yaml에서)
+        namespace_registry: 실행 단위 namespace 캐시 (None이면 이 앱 전용으로 생성)
+        desired_state: 지정하면 배포 결과를 desired state digest와 함께 기록
+        skip_unchanged: desired state가 마지막 성공 배포와 같으면 건너뜀
+            (--skip-unchanged, desired_state 필요)
+        live_output: helm 출력 줄을 실행 중에 받을 콜백 (예: apply의 진행 표시줄
+            상태). None이면 verbose 모드에서 콘솔에 출력
 
     Returns:
         성공 여부
 
     """
+    started = time.monotonic()
     console = output.get_console()
     # Progress tracking setup
     current_step = 0
@@ -311,17 +444,12 @@ def deploy_helm_app(
 
     _update_progress("Checking namespace")
 
-    if namespace:
+    if namespace and not app.create_namespace:
         # Ensure namespace exists unless helm will create it
-        namespace_missing = False
-        check_cmd = ["kubectl", "get", "namespace", namespace]
-        check_cmd = apply_cluster_config_to_command(check_cmd, kubeconfig, context)
-        check_return_code, _, _ = run_command(check_cmd)
-
-        if check_return_code != 0:
-            namespace_missing = True
-
-        if namespace_missing and not app.create_namespace:
+        registry = namespace_registry or NamespaceRegistry(list_all=False)
+        if not registry.exists(
+            namespace, kubeconfig=kubeconfig, context=context, runner=run_command
+        ):
             if dry_run:
                 if not progress_tracker:
                     console.print(
@@ -336,12 +464,10 @@ def deploy_helm_app(
                     _info_print(console,
                         f"[yellow]ℹ️  Namespace '{namespace}' not found. Creating...[/yellow]"
                     )
-                create_cmd = ["kubectl", "create", "namespace", namespace]
-                create_cmd = apply_cluster_config_to_command(
-                    create_cmd, kubeconfig, context
+                created, create_stderr = registry.create(
+                    namespace, kubeconfig=kubeconfig, context=context, runner=run_command
                 )
-                create_return_code, _, create_stderr = run_command(create_cmd)
-                if create_return_code != 0:
+                if not created:
                     output.print_error(
                         f"Failed to create namespace '{namespace}'", error=create_stderr
                     )
@@ -380,6 +506,7 @@ def deploy_helm_app(
             effective_label_injection = False
 
     # Check if automatic label injection is enabled
+    annotation_args: list[str] = []
     if effective_label_injection:
         if app_group:
             # Build labels
@@ -398,7 +525,6 @@ def deploy_helm_app(
                 operator=operator,
             )
             annotation_args = build_helm_set_annotations(annotations)
-            cmd.extend(annotation_args)
         else:
             _verbose_print(console,
                 f"  [yellow]⚠️ Could not detect app-group from path: {app_config_dir}[/yellow]"
@@ -421,6 +547,30 @@ def deploy_helm_app(
                 f"  [dim]App tracking will use State DB and name pattern (app-group={app_group})[/dim]"
             )
 
+    # deployed-at annotation은 매번 바뀌므로 digest에서 제외
+    desired = None
+    if desired_state is not None and not dry_run:
+        desired = AppDesiredState(
+            app_name=app_name,
+            app_type="helm",
+            app_config_dir=app_config_dir,
+            digest=compute_helm_digest(cmd, chart_path),
+            namespace=namespace,
+            kubeconfig=kubeconfig,
+            context=context,
+            release_name=release_name,
+        )
+        if skip_unchanged and desired_state.is_unchanged(desired):
+            helm_result.cleanup()
+            message = f"⏭️  Unchanged, skipped: {app_name} (release: {release_name})"
+            if progress_tracker:
+                progress_tracker.console_print(f"[dim]{message}[/dim]")
+            else:
+                output.print(f"[dim]{message}[/dim]", level="info")
+            return True
+
+    cmd.extend(annotation_args)
+
     if dry_run:
         cmd.append("--dry-run")
         output.print("[yellow]🔍 Dry-run mode enabled[/yellow]", level="warning")
@@ -435,8 +585,42 @@ def deploy_helm_app(
     # 실행
     _update_progress("Installing/Upgrading Helm release")
 
+    # helm 출력은 스트리밍: 진행 상황을 바로 보여주고 메모리에는 끝부분만 유지
+    helm_revision: int | None = None
+
+    def _show_line(line: str) -> None:
+        if not line.strip():
+            return
+        if live_output is not None:
+            live_output(line)
+        else:
+            _verbose_print(console, f"  {line}", markup=False, highlight=False)
+
+    def _on_stdout_line(line: str) -> None:
+        nonlocal helm_revision
+        if helm_revision is None:
+            helm_revision = parse_helm_revision(line)
+        _show_line(line)
+
     try:
-        return_code, stdout, stderr = run_command(cmd, timeout=300)
+        return_code, stdout, stderr = run_command(
+            cmd,
+            timeout=300,
+            on_stdout_line=_on_stdout_line,
+            on_stderr_line=_show_line,
+        )
+        if helm_revision is None:
+            helm_revision = parse_helm_revision(stdout)
+
+        if desired is not None:
+            desired_state.record(
+                desired,
+                success=return_code == 0,
+                duration=time.monotonic() - started,
+                app_config=app.model_dump(mode="json"),
+                helm_revision=helm_revision,
+                error_message=stderr if return_code != 0 else None,
+            )
 
         if return_code != 0:
             # Timeout detection
@@ -532,6 +716,11 @@ def deploy_helm_app(
             output.print_error("Failed to deploy", error=stderr)
             return False
 
+        if namespace and app.create_namespace and namespace_registry and not dry_run:
+            namespace_registry.mark_created(
+                namespace, kubeconfig=kubeconfig, context=context
+            )
+
         if progress_tracker:
             progress_tracker.console_print(
                 f"[green]✅ {app_name} deployed (release: {release_name})[/green]"
@@ -567,9 +756,16 @@ def deploy_yaml_app(
     apps_config: dict | None = None,
     sbkube_work_dir: Path | None = None,
     config_namespace: str | None = None,
+    desired_state: DesiredStateStore | None = None,
+    skip_unchanged: bool = False,
 ) -> bool:
     """YAML 앱 배포 (kubectl apply).
 
+    기본은 파일별 `kubectl apply -f <file>`이며, app.batch_apply가 켜져 있으면
+    모든 문서를 하나의 stream으로 합쳐 `kubectl apply -f -` 한 번으로 적용합니다.
+    desired_state가 앱 배포 기록을 남기면, kubectl이 보고한 리소스별 결과도
+    DeploymentTracker로 그 기록에 함께 저장합니다.
+
     Args:
         app_name: 앱 이름
         app: YamlApp 설정
@@ -582,6 +778,10 @@ def deploy_yaml_app(
         apps_config: 전체 앱 설정 (변수 확장용)
         sbkube_work_dir: .sbkube 작업 디렉토리 경로
         config_namespace: config.yaml의 전역 namespace (fallback용)
+        desired_state: 지정하면 배포 결과를 desired state digest 및 적용된 리소스와
+            함께 기록
+        skip_unchanged: desired state가 마지막 성공 배포와 같고 기록된 리소스가
+            모두 남아 있으면 건너뜀 (--skip-unchanged, desired_state 필요)
 
     Returns:
         성공 여부
@@ -590,6 +790,7 @@ def deploy_yaml_app(
     # 순환 import 방지를 위해 함수 내부에서 import
     from sbkube.utils.path_resolver import expand_repo_variables
 
+    started = time.monotonic()
     console = output.get_console()
     output.print(f"[cyan]🚀 Deploying YAML app: {app_name}[/cyan]", level="info")
 
@@ -626,6 +827,15 @@ def deploy_yaml_app(
             "  [dim]Labels will not be injected (use app_XXX_category naming)[/dim]"
         )
 
+    # 1. manifest 읽기 + 라벨 주입 (적용 전에 모든 파일을 먼저 검증)
+    documents: list[tuple[str, str]] = []
+    # digest용: deployed-at annotation을 제외하고 주입한 manifest
+    desired_documents: list[tuple[str, str]] = []
+    stable_annotations = {
+        key: value
+        for key, value in (annotations or {}).items()
+        if key != "sbkube.io/deployed-at"
+    }
     for yaml_file in app.manifests:
         # ${repos.app-name} 변수 확장
         expanded_file = yaml_file
@@ -660,23 +870,122 @@ def deploy_yaml_app(
         # Read and inject labels dynamically
         try:
             with yaml_path.open("r", encoding="utf-8") as f:
-                yaml_content = f.read()
+                raw_content = f.read()
 
             # Inject labels if app-group detected
+            yaml_content = desired_content = raw_content
             if labels and annotations:
-                yaml_content = inject_labels_to_yaml(yaml_content, labels, annotations)
+                yaml_content = inject_labels_to_yaml(raw_content, labels, annotations)
+                if desired_state is not None:
+                    desired_content = inject_labels_to_yaml(
+                        raw_content, labels, stable_annotations
+                    )
         except Exception as e:
             output.print_error(
                 f"Failed to process YAML file: {yaml_path}", error=str(e)
             )
             return False
 
-        # Create temporary file with injected labels
-        import tempfile
+        documents.append((yaml_file, yaml_content))
+        desired_documents.append((yaml_file, desired_content))
 
-        temp_dir = base_dir / ".sbkube" / "temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
+    def build_apply_cmd(source: str) -> list[str]:
+        cmd = ["kubectl", "apply", "-f", source]
 
+        if namespace:
+            cmd.extend(["--namespace", namespace])
+
+        if dry_run:
+            # --dry-run=client는 --server-side와 함께 쓸 수 없음
+            cmd.append("--dry-run=client")
+            cmd.append("--validate=false")
+        elif app.server_side:
+            cmd.append("--server-side")
+
+        # Apply cluster configuration
+        return apply_cluster_config_to_command(cmd, kubeconfig, context)
+
+    # (원본 문서, kubectl 결과) 목록 - 배포 기록에 리소스로 저장
+    applied_results: list[tuple[list[tuple[str, str]], list[tuple[str, str, str]]]] = []
+
+    def handle_apply_result(
+        return_code: int,
+        stdout: str,
+        stderr: str,
+        applied: list[tuple[str, str]],
+    ) -> bool:
+        if return_code != 0:
+            reason = _get_connection_error_reason(stdout, stderr)
+            if reason:
+                raise KubernetesConnectionError(reason=reason)
+            output.print_error("Failed to apply", error=stderr)
+            return False
+
+        results = _parse_kubectl_apply_output(stdout)
+        for resource, name, action in results:
+            _verbose_print(console, f"    [dim]{resource}/{name} {action}[/dim]")
+        if not dry_run:
+            applied_results.append((applied, results))
+        return True
+
+    desired = None
+    if desired_state is not None and not dry_run:
+        desired = AppDesiredState(
+            app_name=app_name,
+            app_type="yaml",
+            app_config_dir=app_config_dir,
+            digest=compute_yaml_digest(desired_documents, build_apply_cmd("-")),
+            namespace=namespace,
+            kubeconfig=kubeconfig,
+            context=context,
+        )
+        if skip_unchanged and desired_state.is_unchanged(desired):
+            output.print(f"[dim]⏭️  Unchanged, skipped: {app_name}[/dim]", level="info")
+            return True
+
+    def finish(success: bool, error: str | None = None) -> bool:
+        if desired is not None:
+            app_deployment_id = desired_state.record(
+                desired,
+                success=success,
+                duration=time.monotonic() - started,
+                app_config=app.model_dump(mode="json"),
+                error_message=error,
+                resources=_applied_resource_refs(applied_results, namespace),
+            )
+            if app_deployment_id is not None and applied_results:
+                tracker = desired_state.resource_tracker(app_deployment_id)
+                for applied, results in applied_results:
+                    _track_applied_resources(tracker, applied, results)
+        return success
+
+    # 2-a. 단일 stream으로 한 번에 적용 (kubectl apply -f -)
+    if app.batch_apply:
+        stream = "\n---\n".join(content.strip("\n") for _, content in documents)
+        _info_print(
+            console, f"  Applying {len(documents)} manifests in one batch"
+        )
+        try:
+            return_code, stdout, stderr = run_command(
+                build_apply_cmd("-"), input=stream + "\n"
+            )
+            if not handle_apply_result(return_code, stdout, stderr, documents):
+                return finish(False, stderr)
+        except Exception as e:
+            output.print_error(f"Failed to deploy YAML: {app_name}", error=str(e))
+            return finish(False, str(e))
+
+        output.print_success(f"YAML app deployed: {app_name}")
+        return finish(True)
+
+    # 2-b. 파일별 적용 (임시 파일 → kubectl apply -f <tmp>)
+    import tempfile
+
+    temp_dir = base_dir / ".sbkube" / "temp"
+    temp_dir.mkdir(parents=True, exist_ok=True)
+
+    for yaml_file, yaml_content in documents:
+        # Create temporary file with injected labels
         try:
             with tempfile.NamedTemporaryFile(
                 mode="w",
@@ -688,17 +997,7 @@ def deploy_yaml_app(
                 temp_file.write(yaml_content)
                 temp_yaml_path = Path(temp_file.name)
 
-            cmd = ["kubectl", "apply", "-f", str(temp_yaml_path)]
-
-            if namespace:
-                cmd.extend(["--namespace", namespace])
-
-            if dry_run:
-                cmd.append("--dry-run=client")
-                cmd.append("--validate=false")
-
-            # Apply cluster configuration
-            cmd = apply_cluster_config_to_command(cmd, kubeconfig, context)
+            cmd = build_apply_cmd(str(temp_yaml_path))
 
             _info_print(console, f"  Applying: {yaml_file}")
             return_code, stdout, stderr = run_command(cmd)
@@ -709,19 +1008,17 @@ def deploy_yaml_app(
             except Exception:
                 pass  # Ignore cleanup errors
 
-            if return_code != 0:
-                reason = _get_connection_error_reason(stdout, stderr)
-                if reason:
-                    raise KubernetesConnectionError(reason=reason)
-                output.print_error("Failed to apply", error=stderr)
-                return False
+            if not handle_apply_result(
+                return_code, stdout, stderr, [(yaml_file, yaml_content)]
+            ):
+                return finish(False, stderr)
 
         except Exception as e:
             output.print_error(f"Failed to deploy YAML: {yaml_file}", error=str(e))
-            return False
+            return finish(False, str(e))
 
     output.print_success(f"YAML app deployed: {app_name}")
-    return True
+    return finish(True)
 
 
 def deploy_action_app(
@@ -1127,6 +1424,7 @@ def deploy_hook_app(
         kubeconfig=kubeconfig,
         context=context,
         namespace=target_namespace,
+        console=console,
     )
 
     # Hook Context 준비
@@ -1167,6 +1465,12 @@ def deploy_hook_app(
     default=False,
     help="Dry-run 모드 (실제 배포하지 않음)",
 )
+@click.option(
+    "--skip-unchanged",
+    is_flag=True,
+    default=False,
+    help="마지막 성공 배포와 desired state가 같은 Helm/YAML 앱은 건너뛰기",
+)
 @global_options
 @click.pass_context
 def cmd(
@@ -1175,6 +1479,7 @@ def cmd(
     config_file: str | None,
     app_name: str | None,
     dry_run: bool,
+    skip_unchanged: bool,
 ) -> None:
     """SBKube deploy 명령어.
 
@@ -1231,6 +1536,14 @@ def cmd(
     CHARTS_DIR = sbkube_dirs.charts_dir
     BUILD_DIR = sbkube_dirs.build_dir
 
+    # 설정 파싱/검증 결과 공유 (apply에서 호출 시 앱/단계 간 재사용)
+    exec_ctx = ExecutionContext.from_click(ctx)
+
+    # apply --skip-unchanged는 ctx.obj로 전달
+    skip_unchanged = skip_unchanged or bool(ctx.obj.get("skip_unchanged"))
+    # 건너뛰기와 무관하게 모든 실제 배포의 desired state를 기록
+    desired_state = exec_ctx.desired_state if not dry_run else None
+
     # 각 앱 그룹 처리
     overall_success = True
     for APP_CONFIG_DIR in app_config_dirs:
@@ -1249,9 +1562,7 @@ def cmd(
         if sources_file_path and sources_file_path.exists():
             output.print(f"[cyan]📄 Loading sources: {sources_file_path}[/cyan]", level="info")
             try:
-                from sbkube.models.sources_model import SourceScheme
-
-                sources_data = load_config_file(sources_file_path)
+                sources_data = exec_ctx.load_raw(sources_file_path)
 
                 # 통합 sbkube.yaml 포맷 감지 (apiVersion이 sbkube/로 시작)
                 api_version = sources_data.get("apiVersion", "") if sources_data else ""
@@ -1270,28 +1581,12 @@ def cmd(
 
                     # 상위 디렉토리의 sbkube.yaml에서 설정 상속 (cluster settings)
                     merged_settings: dict = {}
-                    current_dir = sources_file_path.parent
-                    parent_configs = []
-
-                    for _ in range(5):
-                        parent_dir = current_dir.parent
-                        if parent_dir == current_dir:
-                            break
-                        parent_config = parent_dir / "sbkube.yaml"
-                        if parent_config.exists():
-                            parent_configs.append(parent_config)
-                        current_dir = parent_dir
-
-                    for parent_config in reversed(parent_configs):
-                        try:
-                            parent_data = load_config_file(parent_config)
-                            if parent_data and parent_data.get("apiVersion", "").startswith("sbkube/"):
-                                parent_settings = parent_data.get("settings", {})
-                                for k, v in parent_settings.items():
-                                    if k in source_scheme_fields:
-                                        merged_settings[k] = v
-                        except Exception:
-                            pass
+                    for parent_settings in exec_ctx.load_parent_settings(
+                        sources_file_path.parent
+                    ):
+                        for k, v in parent_settings.items():
+                            if k in source_scheme_fields:
+                                merged_settings[k] = v
 
                     for k, v in full_settings.items():
                         if k in source_scheme_fields:
@@ -1301,7 +1596,7 @@ def cmd(
                 else:
                     settings_data = sources_data
 
-                sources = SourceScheme(**settings_data)
+                sources = exec_ctx.get_sources(sources_file_path, settings_data)
 
                 # Load cluster global values (v0.7.0+)
                 cluster_global_values = sources.get_merged_global_values(
@@ -1342,7 +1637,7 @@ def cmd(
             continue
 
         output.print(f"[cyan]📄 Loading config: {config_file_path}[/cyan]", level="info")
-        raw_data = load_config_file(config_file_path)
+        raw_data = exec_ctx.load_raw(config_file_path)
 
         # 통합 sbkube.yaml 포맷 감지 (apiVersion이 sbkube/로 시작)
         api_version = raw_data.get("apiVersion", "") if raw_data else ""
@@ -1354,45 +1649,24 @@ def cmd(
                 continue
 
             # namespace 상속 처리 (parent → current)
-            merged_namespace = "default"
-            current_dir = config_file_path.parent
-            parent_configs = []
-            for _ in range(5):
-                parent_dir = current_dir.parent
-                if parent_dir == current_dir:
-                    break
-                parent_config = parent_dir / "sbkube.yaml"
-                if parent_config.exists():
-                    parent_configs.append(parent_config)
-                current_dir = parent_dir
-
-            for parent_config in reversed(parent_configs):
-                try:
-                    parent_data = load_config_file(parent_config)
-                    if parent_data and parent_data.get("apiVersion", "").startswith("sbkube/"):
-                        parent_ns = parent_data.get("settings", {}).get("namespace")
-                        if parent_ns:
-                            merged_namespace = parent_ns
-                except Exception:
-                    pass
-
-            # 현재 config의 namespace로 오버라이드
-            current_namespace = raw_data.get("settings", {}).get("namespace")
-            if current_namespace:
-                merged_namespace = current_namespace
-
+            merged_namespace = exec_ctx.resolve_namespace(config_file_path, raw_data)
             config_data = {"apps": apps_data, "namespace": merged_namespace}
         else:
             # 레거시 포맷: 전체 데이터가 SBKubeConfig
             config_data = raw_data
 
         try:
-            config = SBKubeConfig(**config_data)
+            config = exec_ctx.get_sbkube_config(config_file_path, config_data)
         except Exception as e:
             output.print_error(f"Invalid config file: {e}")
             overall_success = False
             continue
 
+        if desired_state is not None:
+            desired_state.register_app_group(
+                APP_CONFIG_DIR, config_file_path, config_data
+            )
+
         # 배포 순서 얻기 (의존성 고려)
         deployment_order = config.get_deployment_order()
 
@@ -1415,6 +1689,7 @@ def cmd(
             kubeconfig=kubeconfig,
             context=context,
             namespace=config.namespace,  # config에서 namespace 가져옴
+            console=output.get_console(),
         )
 
         # ========== 전역 pre-deploy 훅 실행 ==========
@@ -1479,6 +1754,8 @@ def cmd(
                     continue
 
             success = False
+            # 앱 훅이 있으면 배포를 건너뛸 수 없음 (pre-deploy 훅은 이미 실행됨)
+            app_skip_unchanged = skip_unchanged and not getattr(app, "hooks", None)
 
             try:
                 if isinstance(app, HelmApp):
@@ -1497,6 +1774,10 @@ def cmd(
                         cluster_global_values=cluster_global_values,
                         incompatible_charts=sources.incompatible_charts if sources else None,
                         force_label_injection=sources.force_label_injection if sources else None,
+                        namespace_registry=exec_ctx.namespaces,
+                        desired_state=desired_state,
+                        skip_unchanged=app_skip_unchanged,
+                        live_output=ctx.obj.get("live_output"),
                     )
                 elif isinstance(app, YamlApp):
                     # apps_config를 딕셔너리로 변환 (Pydantic 모델 → dict)
@@ -1516,6 +1797,8 @@ def cmd(
                         apps_config=apps_config_dict,
                         sbkube_work_dir=SBKUBE_WORK_DIR,
                         config_namespace=config.namespace,
+                        desired_state=desired_state,
+                        skip_unchanged=app_skip_unchanged,
                     )
                 elif isinstance(app, ActionApp):
                     success = deploy_action_app(
@@ -1652,6 +1935,9 @@ def cmd(
         if success_count < total_count:
             overall_success = False
 
+    if _is_standalone and skip_unchanged and desired_state is not None:
+        print_skip_summary(output, desired_state)
+
     # 전체 결과
     if not overall_success:
         if _is_standalone:
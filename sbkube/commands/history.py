@@ -16,7 +16,15 @@ from sbkube.models.deployment_state import (
     DeploymentStatus,
     DeploymentSummary,
 )
+from sbkube.state.compaction import DEFAULT_KEEP_PER_GROUP, StateCompactor
 from sbkube.state.database import DeploymentDatabase
+from sbkube.state.perf_history import (
+    DEFAULT_LAST_RUNS,
+    DEFAULT_REGRESSION_THRESHOLD,
+    PerfStat,
+    analyze_perf_history,
+)
+from sbkube.utils.chart_cache import format_size
 from sbkube.utils.global_options import global_options
 from sbkube.utils.output_manager import OutputManager
 
@@ -70,6 +78,46 @@ STATUS_ICONS = {
     "values_diff_ids",
     help="Compare Helm values between two deployments (format: ID1,ID2)",
 )
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Apply retention and compact the state database (dedupe snapshots, VACUUM)",
+)
+@click.option(
+    "--keep",
+    "keep_per_group",
+    type=click.IntRange(min=0),
+    default=DEFAULT_KEEP_PER_GROUP,
+    show_default=True,
+    help="With --compact: newest deployments to keep per app group",
+)
+@click.option(
+    "--compress",
+    is_flag=True,
+    help="With --compact: compress large state snapshots (zstd, zlib fallback)",
+)
+@click.option(
+    "--perf",
+    "show_perf",
+    is_flag=True,
+    help="Show p50/p95 timings per app and stage from SBKUBE_PERF=1 runs",
+)
+@click.option(
+    "--runs",
+    "perf_runs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_LAST_RUNS,
+    show_default=True,
+    help="With --perf: number of most recent runs to analyze",
+)
+@click.option(
+    "--threshold",
+    "perf_threshold",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_REGRESSION_THRESHOLD,
+    show_default=True,
+    help="With --perf: relative slowdown (0.2 = 20%) flagged as a regression",
+)
 @click.argument("app_group", required=False)
 @global_options
 @click.pass_context
@@ -82,6 +130,12 @@ def cmd(
     deployment_id: str | None,
     diff_ids: str | None,
     values_diff_ids: str | None,
+    compact: bool,
+    keep_per_group: int,
+    compress: bool,
+    show_perf: bool,
+    perf_runs: int,
+    perf_threshold: float,
     app_group: str | None,
 ) -> None:
     """Display deployment history with LLM-friendly output."""
@@ -106,6 +160,20 @@ def cmd(
         raise click.Abort
 
     try:
+        if compact:
+            _handle_compact(output, db, keep_per_group=keep_per_group, compress=compress)
+            return
+
+        if show_perf:
+            _handle_perf(
+                output,
+                db,
+                app_group=app_group,
+                last_runs=perf_runs,
+                threshold=perf_threshold,
+            )
+            return
+
         if values_diff_ids:
             _handle_values_diff(output, db, values_diff_ids)
             return
@@ -303,6 +371,91 @@ def _handle_values_diff(
     )
 
 
+def _handle_compact(
+    output: OutputManager,
+    db: DeploymentDatabase,
+    keep_per_group: int,
+    compress: bool,
+) -> None:
+    """Apply retention and compact the deployment state database."""
+    report = StateCompactor(db, keep_per_group=keep_per_group, compress=compress).run()
+    result = report.to_dict()
+
+    if output.format_type == "human":
+        output.print_success(
+            f"State database compacted: {format_size(report.bytes_before)} → "
+            f"{format_size(report.bytes_after)} "
+            f"({format_size(report.bytes_reclaimed)} reclaimed)"
+        )
+        output.print(
+            f"  Deployments deleted: {report.deployments_deleted} "
+            f"(keeping {keep_per_group} per app group)",
+            level="info",
+        )
+        output.print(
+            f"  Snapshots compacted: {report.snapshots_compacted}, "
+            f"blobs created: {report.blobs_created}, "
+            f"blobs deleted: {report.blobs_deleted}, "
+            f"blobs compressed: {report.blobs_compressed}",
+            level="info",
+        )
+
+    output.finalize_history(
+        status="success",
+        summary={
+            "view": "compact",
+            "db_path": str(db.db_path),
+            "keep_per_group": keep_per_group,
+            "compress": compress,
+            **result,
+        },
+        history=[],
+    )
+
+
+def _handle_perf(
+    output: OutputManager,
+    db: DeploymentDatabase,
+    app_group: str | None,
+    last_runs: int,
+    threshold: float,
+) -> None:
+    """Render perf history (p50/p95 per app and stage, regressions)."""
+    samples = db.get_perf_samples(app_group=app_group, last_runs=last_runs)
+    stats = analyze_perf_history(samples, threshold=threshold)
+    entries = [stat.to_dict() for stat in stats]
+    regressions = [stat for stat in stats if stat.regressed]
+    run_count = len({sample.run_id for sample in samples})
+
+    if not samples:
+        output.print_warning(
+            "No perf history found (run apply with SBKUBE_PERF=1)",
+            reason="empty_perf_history",
+        )
+    elif output.format_type == "human":
+        _print_perf_table(output, stats, run_count)
+        for stat in regressions:
+            output.print_warning(
+                f"{stat.app_name} {stat.name} regressed: "
+                f"{stat.baseline_p50:.2f}s → {stat.recent_p50:.2f}s "
+                f"(+{stat.change * 100:.0f}%)",
+                reason="perf_regression",
+            )
+
+    output.finalize_history(
+        status="warning" if regressions else "success",
+        summary={
+            "view": "perf",
+            "runs": run_count,
+            "last_runs": last_runs,
+            "threshold": threshold,
+            "regressions": len(regressions),
+            "filters": {"app_group": app_group or "any"},
+        },
+        history=entries,
+    )
+
+
 # --------------------------------------------------------------------------- #
 # Serialization helpers
 # --------------------------------------------------------------------------- #
@@ -478,6 +631,37 @@ def _print_history_table(output: OutputManager, entries: list[dict[str, Any]]) -
     console.print(table)
 
 
+def _print_perf_table(
+    output: OutputManager, stats: list[PerfStat], run_count: int
+) -> None:
+    console = output.get_console()
+    table = Table(title=f"Perf History (last {run_count} runs)", expand=True)
+    table.add_column("App", style="cyan")
+    table.add_column("Stage / Tool", style="magenta")
+    table.add_column("Runs", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Latest", justify="right")
+    table.add_column("Change", justify="right")
+
+    for stat in stats:
+        label = stat.name if stat.category == "stage" else f"{stat.category}:{stat.name}"
+        change = "-" if stat.change is None else f"{stat.change * 100:+.0f}%"
+        if stat.regressed:
+            change = f"[red]{change} ⚠️[/red]"
+        table.add_row(
+            stat.app_name or "(all)",
+            label,
+            str(stat.runs),
+            f"{stat.p50:.2f}s",
+            f"{stat.p95:.2f}s",
+            f"{stat.latest:.2f}s",
+            change,
+        )
+
+    console.print(table)
+
+
 def _print_deployment_detail(output: OutputManager, detail: dict[str, Any]) -> None:
     console = output.get_console()
     console.print(f"[bold cyan]Deployment:[/bold cyan] {detail['deployment_id']}")
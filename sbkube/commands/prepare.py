@@ -5,15 +5,18 @@
 - git 타입: 리포지토리 clone
 """
 
+import json
 import shutil
+import threading
 import uuid
 from pathlib import Path
 
 import click
 
 from sbkube.models.config_model import GitApp, HelmApp, HookApp, HttpApp, SBKubeConfig
-from sbkube.models.sources_model import GitRepoScheme, HelmRepoScheme, OciRepoScheme, SourceScheme
+from sbkube.models.sources_model import GitRepoScheme, HelmRepoScheme, OciRepoScheme
 from sbkube.utils.app_dir_resolver import resolve_app_dirs
+from sbkube.utils.chart_cache import get_chart_cache, is_pinned_version
 from sbkube.utils.cli_check import check_helm_installed_or_exit
 from sbkube.utils.cluster_config import (
     ClusterConfigError,
@@ -22,13 +25,220 @@ from sbkube.utils.cluster_config import (
 )
 from sbkube.utils.common import find_sources_file, run_command
 from sbkube.utils.common_options import resolve_command_paths, target_options
+from sbkube.utils.execution_context import ExecutionContext
 from sbkube.utils.file_loader import load_config_file
 from sbkube.utils.global_options import global_options
 from sbkube.utils.hook_executor import HookExecutor
 from sbkube.utils.output_manager import OutputManager
+from sbkube.utils.perf import perf_timer
 from sbkube.utils.workspace_resolver import SbkubeDirectories
 
 
+class HelmRepoMemo:
+    """프로세스 단위 Helm 저장소 refresh 기록.
+
+    같은 프로세스 안에서 이미 add/update한 저장소는 index를 다시 내려받지 않습니다.
+    workspace 배포처럼 여러 app group이 같은 저장소를 쓰는 경우에도 공유됩니다.
+    refresh_lock은 병렬 prepare가 같은 저장소를 동시에 갱신하지 않도록 검증/갱신
+    구간을 직렬화합니다 (먼저 들어온 쪽이 갱신하고, 나머지는 기록만 확인).
+    """
+
+    def __init__(self) -> None:
+        """HelmRepoMemo 초기화."""
+        self._lock = threading.Lock()
+        self._refreshed: set[tuple[str, str]] = set()
+        self.refresh_lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, url: str) -> tuple[str, str]:
+        return (name, url.rstrip("/"))
+
+    def is_refreshed(self, name: str, url: str) -> bool:
+        """저장소가 이번 프로세스에서 이미 refresh 되었는지 확인."""
+        with self._lock:
+            return self._key(name, url) in self._refreshed
+
+    def mark_refreshed(self, name: str, url: str) -> None:
+        """저장소를 refresh 완료로 기록."""
+        with self._lock:
+            self._refreshed.add(self._key(name, url))
+
+    def reset(self) -> None:
+        """기록 초기화."""
+        with self._lock:
+            self._refreshed.clear()
+
+
+helm_repo_memo = HelmRepoMemo()
+
+
+def get_helm_repo_url(repo_config) -> str | None:
+    """helm_repos 항목에서 URL 추출.
+
+    Args:
+        repo_config: HelmRepoScheme, dict({url: ...}) 또는 URL 문자열
+
+    Returns:
+        저장소 URL (없으면 None)
+
+    """
+    if isinstance(repo_config, dict):
+        return repo_config.get("url")
+    if hasattr(repo_config, "url"):
+        return repo_config.url
+    return str(repo_config) if repo_config else None
+
+
+def collect_required_helm_repos(
+    config: SBKubeConfig,
+    apps_to_prepare: list[str],
+    helm_sources: dict,
+    oci_sources: dict | None = None,
+    skip_cached: bool = False,
+) -> dict[str, str]:
+    """선택된 앱들이 사용하는 Helm 저장소 목록 (중복 제거).
+
+    로컬 차트, OCI 레지스트리, sources에 정의되지 않은 저장소는 제외합니다
+    (정의되지 않은 저장소는 prepare_helm_app이 에러를 보고).
+
+    Args:
+        config: SBKubeConfig 인스턴스
+        apps_to_prepare: 준비할 앱 이름 목록
+        helm_sources: sources의 helm_repos
+        oci_sources: sources의 oci_registries
+        skip_cached: 전역 chart cache에 있는 차트의 저장소는 제외
+
+    Returns:
+        저장소 이름 → URL (첫 사용 순서)
+
+    """
+    oci_sources = oci_sources or {}
+    chart_cache = get_chart_cache() if skip_cached else None
+    repos: dict[str, str] = {}
+    for app_name in apps_to_prepare:
+        app = config.apps.get(app_name)
+        if not isinstance(app, HelmApp) or not app.enabled:
+            continue
+        if not app.is_remote_chart() or app.is_oci_chart():
+            continue
+        repo_name = app.get_repo_name()
+        if repo_name in repos or repo_name in oci_sources:
+            continue
+        if repo_name not in helm_sources:
+            continue
+        repo_url = get_helm_repo_url(helm_sources[repo_name])
+        if (
+            repo_url
+            and chart_cache is not None
+            and is_pinned_version(app.version)
+            and chart_cache.contains(repo_url, app.get_chart_name(), app.version)
+        ):
+            continue
+        if repo_url:
+            repos[repo_name] = repo_url
+    return repos
+
+
+def list_local_helm_repos(
+    kubeconfig: str | None = None,
+    context: str | None = None,
+) -> dict[str, str]:
+    """로컬에 등록된 Helm 저장소 (`helm repo list -o json`).
+
+    Args:
+        kubeconfig: kubeconfig 경로
+        context: kubectl context
+
+    Returns:
+        저장소 이름 → URL (조회 실패 시 빈 dict)
+
+    """
+    cmd = apply_cluster_config_to_command(
+        ["helm", "repo", "list", "-o", "json"], kubeconfig, context
+    )
+    return_code, stdout, _ = run_command(cmd)
+    if return_code != 0 or not stdout:
+        return {}
+    try:
+        return {r.get("name", ""): r.get("url", "") for r in json.loads(stdout)}
+    except (json.JSONDecodeError, TypeError, AttributeError):
+        return {}
+
+
+def refresh_helm_repos(
+    repos: dict[str, str],
+    output: OutputManager,
+    kubeconfig: str | None = None,
+    context: str | None = None,
+    local_repos: dict[str, str] | None = None,
+) -> tuple[bool, list[str]]:
+    """Helm 저장소를 한 번에 add/update.
+
+    이미 이번 프로세스에서 refresh한 저장소는 건너뛰고, 로컬에 없는 저장소만
+    `helm repo add` 한 뒤 나머지를 `helm repo update r1 r2 ...` 한 번으로 갱신합니다.
+
+    Args:
+        repos: 저장소 이름 → URL
+        output: OutputManager 인스턴스
+        kubeconfig: kubeconfig 경로
+        context: kubectl context
+        local_repos: 이미 조회한 로컬 저장소 목록 (None이면 `helm repo list`로 조회)
+
+    Returns:
+        (success, failed_repos): 전체 성공 여부와 실패한 저장소 목록
+
+    """
+    pending = {
+        name: url
+        for name, url in repos.items()
+        if not helm_repo_memo.is_refreshed(name, url)
+    }
+    if not pending:
+        return True, []
+
+    if local_repos is None:
+        local_repos = list_local_helm_repos(kubeconfig, context)
+
+    failed: list[str] = []
+    to_update: list[str] = []
+    for name, url in pending.items():
+        if local_repos.get(name, "").rstrip("/") == url.rstrip("/"):
+            to_update.append(name)
+            continue
+
+        # helm repo add는 index를 내려받으므로 별도 update가 필요 없음
+        output.print(f"  Adding Helm repo: {name} ({url})", level="info")
+        cmd = apply_cluster_config_to_command(
+            ["helm", "repo", "add", name, url], kubeconfig, context
+        )
+        return_code, _, stderr = run_command(cmd)
+        if return_code == 0:
+            helm_repo_memo.mark_refreshed(name, url)
+        elif "already exists" in stderr.lower():
+            to_update.append(name)
+        else:
+            output.print_error(f"Failed to add repo '{name}': {stderr}")
+            failed.append(name)
+
+    if to_update:
+        output.print(
+            f"  Updating Helm repos: {', '.join(to_update)}", level="info"
+        )
+        cmd = apply_cluster_config_to_command(
+            ["helm", "repo", "update", *to_update], kubeconfig, context
+        )
+        with perf_timer("helm.repo_update", repos=len(to_update)):
+            return_code, _, stderr = run_command(cmd)
+        if return_code == 0:
+            for name in to_update:
+                helm_repo_memo.mark_refreshed(name, pending[name])
+        else:
+            output.print_error(f"Failed to update repos: {stderr}")
+            failed.extend(to_update)
+
+    return not failed, failed
+
+
 def parse_helm_chart(chart: str) -> tuple[str, str]:
     """'repo/chart' 형식을 파싱.
 
@@ -51,6 +261,7 @@ def preflight_check_helm_repos(
     helm_sources: dict,
     output: OutputManager,
     apps_to_prepare: list[str] | None = None,
+    local_repos: dict[str, str] | None = None,
 ) -> tuple[bool, list[str]]:
     """배포 전 Helm 저장소 사전 검증.
 
@@ -62,6 +273,8 @@ def preflight_check_helm_repos(
         helm_sources: sources의 helm_repos 딕셔너리
         output: OutputManager 인스턴스
         apps_to_prepare: 준비할 앱 목록 (None이면 모든 활성 앱)
+        local_repos: 이미 조회한 로컬 저장소 목록 (None이면 `helm repo list`로 조회).
+            자동 등록한 저장소가 추가되므로 refresh_helm_repos에 그대로 넘길 수 있음
 
     Returns:
         (success, issues): 검증 성공 여부와 발견된 문제 목록
@@ -105,15 +318,8 @@ def preflight_check_helm_repos(
             )
 
     # 3. 로컬 helm repo 목록 확인
-    return_code, stdout, stderr = run_command(["helm", "repo", "list", "-o", "json"])
-    local_repos: set[str] = set()
-    if return_code == 0 and stdout:
-        try:
-            import json
-            repo_list = json.loads(stdout)
-            local_repos = {r.get("name", "") for r in repo_list}
-        except (json.JSONDecodeError, TypeError):
-            pass
+    if local_repos is None:
+        local_repos = list_local_helm_repos()
 
     missing_locally: list[str] = []
     for repo_name in required_repos:
@@ -139,6 +345,10 @@ def preflight_check_helm_repos(
                 output.print_error(f"  자동 등록 실패: {stderr}")
                 auto_register_failed.append(repo)
             else:
+                if rc == 0:
+                    # 신규 등록 시 index를 함께 내려받음
+                    helm_repo_memo.mark_refreshed(repo, url)
+                    local_repos[repo] = url
                 output.print(f"  ✅ '{repo}' 등록 완료", level="info")
 
     # 5. 결과 출력
@@ -160,6 +370,69 @@ def preflight_check_helm_repos(
     return True, []
 
 
+def restore_cached_chart(
+    repo_url: str,
+    chart_name: str,
+    version: str | None,
+    chart_dir: Path,
+    output: OutputManager,
+) -> bool:
+    """전역 chart cache에서 차트를 복원.
+
+    고정 버전 차트가 캐시에 있으면 네트워크 없이 chart_dir을 reflink/copy로 채웁니다.
+
+    Args:
+        repo_url: Helm 저장소 또는 OCI 레지스트리 URL
+        chart_name: 차트 이름
+        version: 차트 버전
+        chart_dir: 채울 차트 디렉토리
+        output: OutputManager 인스턴스
+
+    Returns:
+        캐시에서 복원했으면 True
+
+    """
+    chart_cache = get_chart_cache() if is_pinned_version(version) else None
+    if chart_cache is None:
+        return False
+
+    entry = chart_cache.lookup(repo_url, chart_name, version)
+    if entry is None:
+        return False
+
+    try:
+        with perf_timer("chart_cache.restore", chart=chart_name):
+            chart_cache.materialize(entry, chart_dir)
+    except OSError as e:
+        output.print_warning(f"Failed to restore chart from cache: {e}")
+        return False
+
+    output.print(f"  Using cached chart: {entry.display_name}", level="info")
+    return True
+
+
+def store_chart_in_cache(
+    repo_url: str,
+    chart_name: str,
+    version: str | None,
+    chart_dir: Path,
+) -> None:
+    """pull한 차트를 전역 chart cache에 저장 (고정 버전만).
+
+    Args:
+        repo_url: Helm 저장소 또는 OCI 레지스트리 URL
+        chart_name: 차트 이름
+        version: 차트 버전
+        chart_dir: pull이 완료된 차트 디렉토리
+
+    """
+    chart_cache = get_chart_cache() if is_pinned_version(version) else None
+    if chart_cache is None:
+        return
+    with perf_timer("chart_cache.store", chart=chart_name):
+        chart_cache.store(repo_url, chart_name, version, chart_dir)
+
+
 def prepare_oci_chart(
     app_name: str,
     app: HelmApp,
@@ -239,6 +512,12 @@ def prepare_oci_chart(
         output.print("    Use --force to re-download", level="warning")
         return True
 
+    if not dry_run and not force and restore_cached_chart(
+        registry_url, chart_name, app.version, chart_dir, output
+    ):
+        output.print_success(f"OCI chart prepared: {app_name}")
+        return True
+
     if dry_run:
         output.print(
             f"[yellow]🔍 [DRY-RUN] Would pull OCI chart: {oci_chart_url} → {chart_dir}[/yellow]", level="warning"
@@ -315,6 +594,8 @@ def prepare_oci_chart(
         if temp_extract_dir.exists():
             shutil.rmtree(temp_extract_dir)
 
+        store_chart_in_cache(registry_url, chart_name, app.version, chart_dir)
+
     output.print_success(f"OCI chart prepared: {app_name}")
     return True
 
@@ -438,6 +719,18 @@ def prepare_helm_app(
         # 구버전 호환: 단순 URL string
         repo_url = str(repo_config)
 
+    # 전역 chart cache 확인 (hit이면 repo add/update와 pull 모두 생략)
+    chart_dir = app.get_chart_path(charts_dir)
+    chart_yaml = chart_dir / "Chart.yaml"
+    if (
+        not dry_run
+        and not force
+        and not chart_yaml.exists()
+        and restore_cached_chart(repo_url, chart_name, app.version, chart_dir, output)
+    ):
+        output.print_success(f"Helm app prepared: {app_name}")
+        return True
+
     if dry_run:
         output.print(
             f"[yellow]🔍 [DRY-RUN] Would add Helm repo: {repo_name} ({repo_url})[/yellow]", level="warning"
@@ -445,6 +738,10 @@ def prepare_helm_app(
         output.print(
             f"[yellow]🔍 [DRY-RUN] Would update Helm repo: {repo_name}[/yellow]", level="warning"
         )
+    elif helm_repo_memo.is_refreshed(repo_name, repo_url):
+        output.print(
+            f"  Helm repo already refreshed in this run: {repo_name}", level="verbose"
+        )
     else:
         # Helm repo 추가
         output.print(f"  Adding Helm repo: {repo_name} ({repo_url})", level="info")
@@ -469,10 +766,7 @@ def prepare_helm_app(
         if return_code != 0:
             output.print_error(f"Failed to update repo: {stderr}")
             return False
-
-    # Chart pull (repo/chart-version 구조)
-    chart_dir = app.get_chart_path(charts_dir)
-    chart_yaml = chart_dir / "Chart.yaml"
+        helm_repo_memo.mark_refreshed(repo_name, repo_url)
 
     # Check if chart already exists (skip if not --force)
     if chart_yaml.exists() and not force:
@@ -557,6 +851,8 @@ def prepare_helm_app(
         if temp_extract_dir.exists():
             shutil.rmtree(temp_extract_dir)
 
+        store_chart_in_cache(repo_url, chart_name, app.version, chart_dir)
+
     output.print_success(f"Helm app prepared: {app_name}")
     return True
 
@@ -815,6 +1111,9 @@ def cmd(
     except ValueError:
         raise click.Abort
 
+    # 설정 파싱/검증 결과 공유 (apply에서 호출 시 앱/단계 간 재사용)
+    exec_ctx = ExecutionContext.from_click(ctx)
+
     # 각 앱 그룹 처리
     overall_success = True
     for APP_CONFIG_DIR in app_config_dirs:
@@ -841,7 +1140,7 @@ def cmd(
         output.print(f"[cyan]📄 Using sources file: {sources_file_path}[/cyan]", level="info")
 
         # sources.yaml 로드 및 클러스터 설정 해석
-        sources_data = load_config_file(sources_file_path)
+        sources_data = exec_ctx.load_raw(sources_file_path)
 
         # 통합 sbkube.yaml 포맷 감지 (apiVersion이 sbkube/로 시작)
         api_version = sources_data.get("apiVersion", "")
@@ -895,7 +1194,7 @@ def cmd(
             settings_data = sources_data
 
         try:
-            sources = SourceScheme(**settings_data)
+            sources = exec_ctx.get_sources(sources_file_path, settings_data)
         except Exception as e:
             output.print_error(f"Invalid sources file: {e}")
             overall_success = False
@@ -942,33 +1241,7 @@ def cmd(
                 continue
 
             # namespace 상속 처리 (parent → current)
-            merged_namespace = "default"
-            current_dir = sources_file_path.parent
-            parent_configs = []
-            for _ in range(5):
-                parent_dir = current_dir.parent
-                if parent_dir == current_dir:
-                    break
-                parent_config = parent_dir / "sbkube.yaml"
-                if parent_config.exists():
-                    parent_configs.append(parent_config)
-                current_dir = parent_dir
-
-            for parent_config in reversed(parent_configs):
-                try:
-                    parent_data = load_config_file(parent_config)
-                    if parent_data.get("apiVersion", "").startswith("sbkube/"):
-                        parent_ns = parent_data.get("settings", {}).get("namespace")
-                        if parent_ns:
-                            merged_namespace = parent_ns
-                except Exception:
-                    pass
-
-            # 현재 config의 namespace로 오버라이드
-            current_namespace = sources_data.get("settings", {}).get("namespace")
-            if current_namespace:
-                merged_namespace = current_namespace
-
+            merged_namespace = exec_ctx.resolve_namespace(sources_file_path, sources_data)
             config_data = {"apps": apps_data, "namespace": merged_namespace}
             output.print(f"[cyan]📄 Loading apps from unified config: {sources_file_path}[/cyan]", level="info")
         else:
@@ -979,10 +1252,10 @@ def cmd(
                 continue
 
             output.print(f"[cyan]📄 Loading config: {config_file_path}[/cyan]", level="info")
-            config_data = load_config_file(config_file_path)
+            config_data = exec_ctx.load_raw(config_file_path)
 
         try:
-            config = SBKubeConfig(**config_data)
+            config = exec_ctx.get_sbkube_config(config_file_path, config_data)
         except Exception as e:
             output.print_error(f"Invalid config file: {e}")
             overall_success = False
@@ -1002,26 +1275,76 @@ def cmd(
             # 모든 앱 준비 (의존성 순서대로)
             apps_to_prepare = deployment_order
 
-        # ========== Preflight: Helm 저장소 사전 검증 ==========
-        if skip_preflight:
-            output.print("ℹ️  Helm 저장소 사전 검증 건너뜀 (--skip-preflight)", level="info")
-        else:
-            preflight_ok, preflight_issues = preflight_check_helm_repos(
+        # apply는 앱마다 prepare를 호출하므로, 적용할 전체 앱 목록을 넘겨받아
+        # 첫 호출에서 저장소를 한 번에 갱신 (이후 호출은 memo로 건너뜀).
+        # 사전 검증 실패는 지금 준비하는 앱에만 적용
+
+        repo_apps = [
+            name
+            for name in ctx.obj.get("helm_repo_apps", {}).get(
+                str(config_file_path.resolve()), apps_to_prepare
+            )
+            if name in config.apps
+        ]
+
+        with helm_repo_memo.refresh_lock:
+            # 이번 프로세스에서 이미 refresh한 저장소만 쓰면 `helm repo list` 생략
+            used_helm_repos = collect_required_helm_repos(
                 config=config,
+                apps_to_prepare=repo_apps,
                 helm_sources=sources.helm_repos,
-                output=output,
-                apps_to_prepare=apps_to_prepare,
+                oci_sources=sources.oci_registries,
             )
-            if not preflight_ok:
-                output.print_error("Helm 저장소 사전 검증 실패. 위 안내에 따라 저장소를 추가하세요.")
-                overall_success = False
-                continue
+            local_repos: dict[str, str] | None = None
+            if all(
+                helm_repo_memo.is_refreshed(name, url)
+                for name, url in used_helm_repos.items()
+            ):
+                local_repos = dict(used_helm_repos)
+
+            # ========== Preflight: Helm 저장소 사전 검증 ==========
+            if skip_preflight:
+                output.print("ℹ️  Helm 저장소 사전 검증 건너뜀 (--skip-preflight)", level="info")
+            else:
+                if local_repos is None:
+                    local_repos = list_local_helm_repos(kubeconfig, context)
+                preflight_ok, preflight_issues = preflight_check_helm_repos(
+                    config=config,
+                    helm_sources=sources.helm_repos,
+                    output=output,
+                    apps_to_prepare=apps_to_prepare,
+                    local_repos=local_repos,
+                )
+                if not preflight_ok:
+                    output.print_error("Helm 저장소 사전 검증 실패. 위 안내에 따라 저장소를 추가하세요.")
+                    overall_success = False
+                    continue
+
+            # ========== Helm 저장소 일괄 refresh ==========
+            # 선택된 앱들의 저장소를 모아 한 번에 갱신 (실패 시 앱별 prepare에서 재시도)
+            required_helm_repos = collect_required_helm_repos(
+                config=config,
+                apps_to_prepare=repo_apps,
+                helm_sources=sources.helm_repos,
+                oci_sources=sources.oci_registries,
+                skip_cached=not force,
+            )
+            if required_helm_repos and not dry_run:
+                refresh_ok, failed_repos = refresh_helm_repos(
+                    required_helm_repos, output, kubeconfig, context, local_repos
+                )
+                if not refresh_ok:
+                    output.print_warning(
+                        f"Helm repo refresh failed: {', '.join(failed_repos)} "
+                        "(retrying per app)"
+                    )
 
         # Hook executor 초기화
         hook_executor = HookExecutor(
             base_dir=BASE_DIR,
             work_dir=APP_CONFIG_DIR,  # 훅은 APP_CONFIG_DIR에서 실행
             dry_run=dry_run,
+            console=output.get_console(),
         )
 
         # ========== 전역 pre-prepare 훅 실행 ==========
@@ -67,6 +67,12 @@ RollbackScope = Literal["app", "phase", "all"]
 @click.option(
     "--limit", default=10, help="Maximum rollback points to show (for --list)"
 )
+@click.option(
+    "--max-workers",
+    type=int,
+    default=4,
+    help="Maximum apps rolled back concurrently (1 = sequential)",
+)
 @global_options
 def cmd(
     deployment_id: str | None,
@@ -82,12 +88,16 @@ def cmd(
     cluster: str | None,
     namespace: str | None,
     limit: int,
+    max_workers: int,
 ) -> None:
     r"""Rollback a deployment to a previous state.
 
     This command allows you to roll back applications to a previous deployment
     state, either completely or for specific apps only.
 
+    Apps are rolled back in reverse dependency order (dependents first);
+    independent apps are rolled back concurrently (--max-workers).
+
     \b
     Scope options (v0.11.0+):
         app   - Rollback specific app(s) only (default)
@@ -121,7 +131,11 @@ def cmd(
         sbkube rollback dep_20250131_143022 --force
     """
     try:
-        rollback_manager = RollbackManager()
+        if max_workers < 1:
+            logger.error("--max-workers must be >= 1")
+            raise click.Abort
+
+        rollback_manager = RollbackManager(max_workers=max_workers)
 
         # List rollback points
         if list_points:
@@ -291,6 +305,11 @@ def _print_rollback_simulation(result, scope: RollbackScope = "app") -> None:
     click.echo(f"Current: {result['current_deployment']}")
     click.echo(f"Target: {result['target_deployment']}")
     click.echo(f"Scope: {scope}")
+    waves = result.get("waves") or []
+    if len(waves) > 1:
+        click.echo("\nRollback Order (apps in the same step run concurrently):")
+        for index, wave in enumerate(waves, 1):
+            click.echo(f"  {index}. {', '.join(wave)}")
     click.echo(f"\nPlanned Actions ({len(result['actions'])} total):")
 
     for action in result["actions"]:
@@ -332,11 +351,15 @@ def _print_rollback_result(result, scope: RollbackScope = "app") -> None:
     click.echo(f"\nRollback Summary (scope={scope}):")
     click.echo(f"  Successful: {len(result['rollbacks'])}")
     click.echo(f"  Failed: {len(result['errors'])}")
+    if "duration_seconds" in result:
+        click.echo(f"  Duration: {result['duration_seconds']:.1f}s")
 
     if result["rollbacks"]:
         click.echo("\nSuccessful Rollbacks:")
         for rollback in result["rollbacks"]:
-            click.echo(f"  ✅ {rollback['app']} ({rollback['type']})")
+            click.echo(
+                f"  ✅ {rollback['app']} ({rollback['type']}){_format_timing(rollback)}"
+            )
             for action in rollback.get("actions", []):
                 click.echo(
                     f"     - {action['type']}: {action.get('resource', action.get('release', ''))}"
@@ -345,4 +368,15 @@ def _print_rollback_result(result, scope: RollbackScope = "app") -> None:
     if result["errors"]:
         click.echo("\nFailed Rollbacks:")
         for error in result["errors"]:
-            click.echo(f"  ❌ {error['app']}: {error['error']}")
+            click.echo(f"  ❌ {error['app']}: {error['error']}{_format_timing(error)}")
+
+
+def _format_timing(entry: dict) -> str:
+    """Per-app rollback timing suffix (e.g. " [3.2s: helm_rollback 3.1s]")."""
+    if "duration_seconds" not in entry:
+        return ""
+    steps = ", ".join(
+        f"{step} {seconds:.1f}s"
+        for step, seconds in (entry.get("step_durations") or {}).items()
+    )
+    return f" [{entry['duration_seconds']:.1f}s{': ' + steps if steps else ''}]"
@@ -15,17 +15,27 @@ from rich.tree import Tree
 
 from sbkube.models.config_manager import ConfigManager
 from sbkube.state.database import DeploymentDatabase
-from sbkube.utils.cluster_cache import ClusterCache
+from sbkube.utils.cluster_cache import DEFAULT_SECTION_TTL_SECONDS, ClusterCache
 from sbkube.utils.cluster_grouping import (
     filter_by_app_group,
     get_app_group_summary,
     group_releases_by_app_group,
+    load_release_app_groups,
+    resolve_app_group,
 )
 from sbkube.utils.cluster_status import ClusterStatusCollector
+from sbkube.utils.cluster_watch import (
+    ClusterWatcher,
+    ClusterWatchModel,
+    RowChange,
+    row_status,
+)
 from sbkube.utils.global_options import global_options
+from sbkube.utils.logger import logger
 from sbkube.utils.output_manager import OutputManager
 
 DEFAULT_CACHE_TTL_SECONDS = 300
+WATCH_RENDER_INTERVAL_SECONDS = 0.5  # watch 이벤트를 모아서 출력하는 주기
 
 
 @click.command(name="status")
@@ -64,7 +74,7 @@ DEFAULT_CACHE_TTL_SECONDS = 300
 @click.option(
     "--watch",
     is_flag=True,
-    help="Auto-refresh status every 10 seconds (Ctrl+C to stop)",
+    help="Follow status changes via kubectl watch streams (Ctrl+C to stop)",
 )
 @click.option(
     "--deps",
@@ -86,6 +96,13 @@ DEFAULT_CACHE_TTL_SECONDS = 300
     is_flag=True,
     help="Check for available Helm chart updates",
 )
+@click.option(
+    "--revalidate",
+    "revalidate_sections",
+    hidden=True,
+    default=None,
+    help="Internal: refresh the given comma-separated cache sections and exit",
+)
 @click.argument("app_group", required=False)
 @global_options
 @click.pass_context
@@ -102,12 +119,15 @@ def cmd(
     health_check: bool,
     show_notes: bool,
     check_updates: bool,
+    revalidate_sections: str | None,
     app_group: str | None,
 ) -> None:
     r"""Display application and cluster status.
 
     This command shows the current state of deployed applications and cluster
-    resources. Data is cached locally with a 5-minute TTL for faster queries.
+    resources. Data is cached locally with per-section TTLs (releases and pods
+    expire quickly, nodes rarely); expired sections are shown from cache and
+    refreshed in the background.
 
     \b
     Examples:
@@ -138,7 +158,7 @@ def cmd(
         # Force refresh cache
         sbkube status --refresh
 
-        # Watch mode (auto-refresh every 10s)
+        # Watch mode (follow changes via kubectl watch streams)
         sbkube status --watch
     """
     # Get output format from context
@@ -181,12 +201,18 @@ def cmd(
         cluster=sources.cluster or "unknown",
         by_group=by_group,
         app_group=app_group,
+        section_ttls=DEFAULT_SECTION_TTL_SECONDS,
     )
     collector = ClusterStatusCollector(
         kubeconfig=sources.kubeconfig,
         context=sources.kubeconfig_context,
     )
 
+    # Background refresh spawned by a previous `sbkube status`
+    if revalidate_sections is not None:
+        _revalidate_sections(collector, cache, revalidate_sections.split(","))
+        return
+
     # Phase 6: Handle --deps mode
     if deps:
         _display_dependency_tree(base_path, app_group, output)
@@ -195,36 +221,30 @@ def cmd(
 
     # Handle watch mode
     if watch:
-        import time
-
-        output.print("[cyan]Watching status (updates every 10 seconds)[/cyan]")
-        output.print("[dim]Press Ctrl+C to stop[/dim]\n")
-        try:
-            while True:
-                _collect_and_cache(collector, cache, output, force_refresh=True)
-                _display_status(
-                    cache,
-                    output,
-                    base_path=base_path,
-                    by_group=by_group,
-                    managed=managed,
-                    show_all=show_all,
-                    unhealthy=unhealthy,
-                    app_group=app_group,
-                    show_cache_info=False,
-                    health_check=health_check,
-                    show_notes=show_notes,
-                )
-                output.print("\n[dim]Next update in 10 seconds...[/dim]")
-                time.sleep(10)
-        except KeyboardInterrupt:
-            output.print("\n[yellow]Stopped watching.[/yellow]")
-            output.finalize()
-            sys.exit(0)
+        _watch_status(
+            collector,
+            cache,
+            output,
+            base_path=base_path,
+            by_group=by_group,
+            managed=managed,
+            show_all=show_all,
+            unhealthy=unhealthy,
+            app_group=app_group,
+            health_check=health_check,
+            show_notes=show_notes,
+        )
 
     # Normal mode: check cache or refresh
-    if refresh or not cache.is_valid():
+    if refresh or not cache.is_valid(allow_stale=True):
         _collect_and_cache(collector, cache, output, force_refresh=refresh)
+    elif stale := sorted(cache.stale_sections()):
+        # Stale-while-revalidate: show cached data now, refresh in background
+        _start_background_revalidate(base_path, stale)
+        output.print(
+            f"[dim]Using cached data (collected {_format_age(cache.get_age_seconds())} ago, "
+            f"refreshing {', '.join(stale)} in background)[/dim]\n"
+        )
     else:
         output.print(
             f"[dim]Using cached data (collected {_format_age(cache.get_age_seconds())} ago)[/dim]\n"
@@ -256,18 +276,203 @@ def cmd(
     output.finalize()
 
 
+def _watch_status(
+    collector: ClusterStatusCollector,
+    cache: ClusterCache,
+    output: OutputManager,
+    **display_options,
+) -> None:
+    """Watch mode: show the full status once, then only rows that change.
+
+    The watch model is seeded from the initial collect_all() snapshot and
+    nodes/pods are followed from the resourceVersion of those lists, so the
+    cluster is not listed a second time. Changes are filtered with the same
+    --app-group/--managed/--unhealthy options as the initial view; the cache
+    is written once on exit instead of on every tick.
+    """
+    import time
+
+    status_data = _collect_and_cache(collector, cache, output, force_refresh=True)
+    _display_status(cache, output, show_cache_info=False, **display_options)
+
+    if status_data is not None:
+        model = ClusterWatchModel.from_snapshot(status_data)
+        resource_versions = dict(collector.resource_versions)
+    else:
+        # 수집 실패 후 캐시로 대체한 경우: 모든 종류를 list부터 시작
+        model = ClusterWatchModel.from_snapshot(cache.load())
+        resource_versions = {}
+
+    app_group = display_options.get("app_group")
+    managed = display_options.get("managed", False)
+    app_group_mapping: dict[str, str] = {}
+    if app_group or managed:
+        try:
+            app_group_mapping = load_release_app_groups(DeploymentDatabase())
+        except Exception:
+            output.print_warning(
+                "Could not connect to State DB, grouping may be incomplete"
+            )
+
+    watcher = ClusterWatcher(collector, model, resource_versions=resource_versions)
+    watcher.start()
+    output.print("\n[cyan]Watching for changes (kubectl watch streams)[/cyan]")
+    output.print("[dim]Press Ctrl+C to stop[/dim]\n")
+
+    try:
+        while True:
+            changes = watcher.poll()
+            if changes:
+                _print_watch_changes(
+                    changes,
+                    model,
+                    output,
+                    app_group_mapping=app_group_mapping,
+                    app_group=app_group,
+                    managed=managed,
+                    unhealthy=display_options.get("unhealthy", False),
+                )
+            time.sleep(WATCH_RENDER_INTERVAL_SECONDS)
+    except KeyboardInterrupt:
+        watcher.stop()
+        cache.save(_prepare_cache_data(model.snapshot(), cache))
+        output.print("\n[yellow]Stopped watching.[/yellow]")
+        output.finalize()
+        sys.exit(0)
+
+
+def _is_unhealthy_row(kind: str, row: dict) -> bool:
+    """Whether a watch row is unhealthy (same rules as the static views)."""
+    if kind == "nodes":
+        return row.get("status") != "Ready"
+    if kind == "pods":
+        return _get_pod_health_status(row) not in ("Healthy", "Completed")
+    return row.get("status") not in ("deployed", "superseded")
+
+
+def _print_watch_changes(
+    changes: list[RowChange],
+    model: ClusterWatchModel,
+    output: OutputManager,
+    app_group_mapping: dict[str, str] | None = None,
+    app_group: str | None = None,
+    managed: bool = False,
+    unhealthy: bool = False,
+) -> None:
+    """Print changed rows followed by a one-line cluster summary.
+
+    With --app-group/--managed only releases of the selected (managed)
+    app-groups and pods in their namespaces are shown; nodes are not part of
+    those views. With --unhealthy a change is shown when the row is unhealthy
+    before or after it, so recoveries are reported too.
+    """
+    from datetime import datetime
+
+    scoped = bool(app_group or managed)
+    mapping = app_group_mapping or {}
+
+    def release_in_scope(release: dict) -> bool:
+        group = resolve_app_group(release, mapping)
+        return group == app_group if app_group else group is not None
+
+    snapshot = model.snapshot()
+    nodes = snapshot["nodes"]
+    pods = snapshot["pods"]
+    releases = snapshot["helm_releases"]
+    if scoped:
+        changed_releases = [
+            row
+            for change in changes
+            if change.kind == "helm_releases"
+            for row in (change.before, change.after)
+            if row is not None
+        ]
+        namespaces = {
+            release.get("namespace")
+            for release in releases + changed_releases
+            if release_in_scope(release)
+        }
+        releases = [release for release in releases if release_in_scope(release)]
+        pods = [pod for pod in pods if pod.get("namespace") in namespaces]
+
+    def visible(change: RowChange) -> bool:
+        row = change.after or change.before
+        if scoped:
+            if change.kind == "nodes":
+                return False
+            if change.kind == "pods" and row.get("namespace") not in namespaces:
+                return False
+            if change.kind == "helm_releases" and not release_in_scope(row):
+                return False
+        if unhealthy:
+            return any(
+                _is_unhealthy_row(change.kind, state)
+                for state in (change.before, change.after)
+                if state is not None
+            )
+        return True
+
+    changes = [change for change in changes if visible(change)]
+    if not changes:
+        return
+
+    stamp = datetime.now().strftime("%H:%M:%S")
+    symbols = {
+        "added": "[green]+[/green]",
+        "removed": "[red]-[/red]",
+        "changed": "[yellow]~[/yellow]",
+    }
+    labels = {"nodes": "node", "pods": "pod", "helm_releases": "release"}
+    for change in changes:
+        name = "/".join(change.key)
+        row = change.after or change.before
+        if change.action == "changed":
+            detail = (
+                f"{row_status(change.kind, change.before)} → "
+                f"{row_status(change.kind, change.after)}"
+            )
+        else:
+            detail = row_status(change.kind, row)
+        output.print(
+            f"[dim]{stamp}[/dim] {symbols[change.action]} {labels[change.kind]} {name}  {detail}",
+            level="info",
+            kind=change.kind,
+            name=name,
+            action=change.action,
+        )
+
+    not_ready_pods = sum(
+        1
+        for pod in pods
+        if pod.get("phase") != "Succeeded"
+        and pod.get("ready_containers", 0) < pod.get("total_containers", 0)
+    )
+    deployed = sum(1 for release in releases if release.get("status") == "deployed")
+    summary = (
+        f"Pods {len(pods)} ({not_ready_pods} not ready) · "
+        f"Releases {deployed}/{len(releases)} deployed"
+    )
+    if not scoped:
+        ready_nodes = sum(1 for node in nodes if node.get("status") == "Ready")
+        summary = f"Nodes {ready_nodes}/{len(nodes)} Ready · {summary}"
+    output.print(f"[dim]  {summary}[/dim]", level="info")
+
+
 def _collect_and_cache(
     collector: ClusterStatusCollector,
     cache: ClusterCache,
     output: OutputManager,
     force_refresh: bool = False,
-) -> None:
+) -> dict | None:
     """Collect cluster status and save to cache.
 
     Saves data appropriate for the view type:
     - Standard view (no options): Full cluster status
     - By-group view: Helm releases grouped by app-group
     - Specific app-group: Releases for that app-group only
+
+    Returns:
+        The collected status data, or None if the existing cache was kept
     """
     import subprocess
 
@@ -282,6 +487,7 @@ def _collect_and_cache(
 
         cache.save(cache_data)
         output.print_success("Status collected successfully")
+        return status_data
     except subprocess.TimeoutExpired:
         output.print_warning("⏱️ Command timeout - kubectl/helm took too long")
         if cache.exists():
@@ -305,6 +511,56 @@ def _collect_and_cache(
             sys.exit(1)
 
 
+def _start_background_revalidate(base_path: Path, sections: list[str]) -> None:
+    """Spawn a detached `sbkube status --revalidate` for the stale sections.
+
+    The child outlives this command; its output is discarded and a refresh
+    lock in the cache directory keeps concurrent refreshes from piling up.
+    """
+    import subprocess
+
+    try:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "sbkube.cli",
+                "status",
+                "--base-dir",
+                str(base_path),
+                "--revalidate",
+                ",".join(sections),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        logger.verbose(f"Failed to start background cache refresh: {e}")
+
+
+def _revalidate_sections(
+    collector: ClusterStatusCollector, cache: ClusterCache, sections: list[str]
+) -> None:
+    """Refresh only the given cache sections (background refresh entry point)."""
+    with cache.refresh_lock() as acquired:
+        if not acquired:
+            return  # 다른 프로세스가 이미 갱신 중
+        # 대기하는 동안 다른 명령이 갱신했을 수 있음
+        stale = [section for section in sections if section in cache.stale_sections()]
+        if not stale:
+            return
+        status_data = collector.collect_all(sections=stale)
+        failed = {
+            key
+            for key, timing in status_data["collection"]["sources"].items()
+            if timing.get("error")
+        }
+        # 실패한 section은 이전 값을 유지 (빈 값으로 덮어쓰지 않음)
+        cache.update({key: value for key, value in status_data.items() if key not in failed})
+
+
 def _prepare_cache_data(status_data: dict, cache: ClusterCache) -> dict:
     """Prepare cache data.
 
@@ -717,6 +973,22 @@ def _display_cache_info(cache: ClusterCache, output: OutputManager, show: bool)
     if remaining_ttl := cache.get_remaining_ttl():
         console.print(f"[dim]Cache expires in: {_format_duration(remaining_ttl)}[/dim]")
 
+    data = cache.load()
+    collection = data.get("collection") if isinstance(data, dict) else None
+    if isinstance(collection, dict) and (sources := collection.get("sources")):
+        breakdown = ", ".join(
+            f"{name} {timing.get('duration_seconds', 0):.1f}s"
+            + (" (failed)" if timing.get("error") else "")
+            for name, timing in sorted(
+                sources.items(),
+                key=lambda item: item[1].get("duration_seconds", 0),
+                reverse=True,
+            )
+        )
+        console.print(
+            f"[dim]Collected in {collection.get('total_seconds', 0):.1f}s: {breakdown}[/dim]"
+        )
+
 
 def _format_age(seconds: float | None) -> str:
     """Format age in seconds to human-readable string."""
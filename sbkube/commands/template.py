@@ -19,8 +19,12 @@ from sbkube.utils.file_loader import load_config_file
 from sbkube.utils.global_options import global_options
 from sbkube.utils.helm_command_builder import build_helm_template_command
 from sbkube.utils.hook_executor import HookExecutor
-from sbkube.utils.manifest_cleaner import clean_manifest_metadata
+from sbkube.utils.manifest_cleaner import (
+    clean_manifest_metadata,
+    clean_manifest_stream,
+)
 from sbkube.utils.output_manager import OutputManager
+from sbkube.utils.render_cache import RenderCache, compute_render_key
 from sbkube.utils.workspace_resolver import resolve_sbkube_directories
 
 
@@ -35,9 +39,13 @@ def template_helm_app(
     output: OutputManager,
     cluster_global_values: dict | None = None,
     cleanup_metadata: bool = True,
+    use_cache: bool = True,
 ) -> bool:
     """Helm 앱을 YAML로 렌더링 (helm template).
 
+    입력(차트, values, set_values, cluster global values, 앱 설정, helm 버전)이
+    이전 렌더링과 같으면 helm template을 건너뛰고 기존 결과를 재사용합니다.
+
     Args:
         app_name: 앱 이름
         app: HelmApp 설정
@@ -49,6 +57,7 @@ def template_helm_app(
         output: OutputManager instance
         cluster_global_values: 클러스터 전역 values (선택, v0.7.0+)
         cleanup_metadata: 서버 관리 메타데이터 자동 제거 여부 (기본: True, v0.7.0+)
+        use_cache: render cache 사용 여부 (기본: True)
 
     Returns:
         성공 여부
@@ -120,11 +129,30 @@ def template_helm_app(
         for key, value in app.set_values.items():
             output.print(f"    ✓ {key}={value}", level="info")
 
-    # 3. helm template 실행
-    output.print(f"  $ {' '.join(helm_result.command)}", level="info")
+    output_file = rendered_dir / f"{app_name}.yaml"
+    # helm template stdout은 메모리에 모으지 않고 이 파일로 바로 기록
+    raw_file = rendered_dir / f".{app_name}.yaml.raw"
+    render_cache = RenderCache(rendered_dir)
+
     try:
+        # 3. Render cache 확인 (입력이 같으면 helm template 생략)
+        render_key = None
+        if use_cache:
+            render_key = compute_render_key(
+                helm_result.command,
+                chart_path,
+                app.model_dump(mode="json"),
+                cleanup_metadata,
+            )
+            if render_cache.is_fresh(app_name, render_key, output_file):
+                output.print("  ♻️  Inputs unchanged, reusing rendered YAML", level="info")
+                output.print_success(f"Rendered YAML (cached): {output_file}")
+                return True
+
+        # 4. helm template 실행
+        output.print(f"  $ {' '.join(helm_result.command)}", level="info")
         return_code, stdout, stderr = run_command(
-            helm_result.command, check=False, timeout=60
+            helm_result.command, check=False, timeout=60, stdout_file=raw_file
         )
 
         if return_code != 0:
@@ -138,17 +166,19 @@ def template_helm_app(
                 output.print(f"  [red]STDERR:[/red] {stderr.strip()}", level="error")
             return False
 
-        # 4. 렌더링된 YAML 정리 (managedFields 등 제거)
+        # 5. 렌더링된 YAML 정리 (managedFields 등 제거) 후 저장
         if cleanup_metadata:
-            cleaned_yaml = clean_manifest_metadata(stdout)
+            clean_manifest_stream(raw_file, output_file)
             output.print("  🧹 Cleaned server-managed metadata fields", level="info")
         else:
-            cleaned_yaml = stdout
+            raw_file.replace(output_file)
             output.print("  ⏭️  Skipped metadata cleanup (disabled)", level="info")
 
-        # 5. 렌더링된 YAML 저장
-        output_file = rendered_dir / f"{app_name}.yaml"
-        output_file.write_text(cleaned_yaml, encoding="utf-8")
+        # 6. render cache 갱신
+        if render_key:
+            render_cache.record(app_name, render_key, output_file)
+        else:
+            render_cache.invalidate(app_name)
         output.print_success(f"Rendered YAML saved: {output_file}")
         return True
 
@@ -161,6 +191,7 @@ def template_helm_app(
     finally:
         # 임시 파일 정리 (HelmCommandBuilder가 생성한 temp 파일)
         helm_result.cleanup()
+        raw_file.unlink(missing_ok=True)
 
 
 def template_yaml_app(
@@ -367,6 +398,12 @@ def template_http_app(
     default=False,
     help="Dry-run 모드 (훅 실행 시뮬레이션)",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="render cache를 사용하지 않고 항상 helm template 실행",
+)
 @global_options
 @click.pass_context
 def cmd(
@@ -376,12 +413,14 @@ def cmd(
     output_dir_name: str,
     app_name: str | None,
     dry_run: bool,
+    no_cache: bool,
 ) -> None:
     """SBKube template 명령어.
 
     빌드된 차트를 YAML로 렌더링:
     - .sbkube/build/ 디렉토리의 차트를 helm template으로 렌더링
     - 렌더링된 YAML을 .sbkube/rendered/ 디렉토리에 저장
+    - 입력이 바뀌지 않은 Helm 앱은 기존 결과 재사용 (--no-cache로 비활성화)
     - 배포 전 미리보기 및 CI/CD 검증용
     """
     # Initialize OutputManager
@@ -630,6 +669,7 @@ def cmd(
                         output,
                         cluster_global_values=cluster_global_values,
                         cleanup_metadata=cleanup_metadata,
+                        use_cache=not no_cache,
                     )
                 elif isinstance(app, YamlApp):
                     success = template_yaml_app(
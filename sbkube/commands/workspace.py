@@ -1,7 +1,6 @@
 """Workspace 명령어 구현."""
 
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
@@ -20,10 +19,14 @@ from sbkube.models.workspace_state import (
 )
 from sbkube.state.database import DeploymentDatabase
 from sbkube.state.workspace_tracker import WorkspaceStateTracker
+from sbkube.utils.app_group_worker import AppGroupJob, AppGroupProcessPool
+from sbkube.utils.app_scheduler import AppScheduler, AppTaskResult, AppTaskStatus
+from sbkube.utils.async_runner import get_command_runner
 from sbkube.utils.file_loader import load_config_file
 from sbkube.utils.global_options import global_options
 from sbkube.utils.logger import LogLevel, logger
 from sbkube.utils.output_manager import OutputManager
+from sbkube.utils.perf import perf_timer
 
 
 # SBKube version for tracking
@@ -550,8 +553,11 @@ class WorkspaceDeployCommand:
         parallel: bool | None = None,
         parallel_apps: bool | None = None,
         max_workers: int = 4,
+        isolation: str = "thread",
         inherited_settings: dict | None = None,
         output: OutputManager | None = None,
+        worker_slots: threading.BoundedSemaphore | None = None,
+        process_pool: AppGroupProcessPool | None = None,
     ) -> None:
         """Initialize workspace deploy command.
 
@@ -564,8 +570,13 @@ class WorkspaceDeployCommand:
             parallel: 병렬 실행 모드 (None=workspace 설정 사용)
             parallel_apps: App group 병렬 실행 모드 (None=workspace 설정 사용)
             max_workers: 최대 병렬 워커 수 (기본: 4)
+            isolation: App group 실행 격리 방식 ("thread" 또는 "process")
             inherited_settings: Settings inherited from parent workspace
             output: OutputManager instance (None이면 human format으로 생성)
+            worker_slots: 부모 workspace와 공유할 app group 배포 슬롯
+                (None이면 max_workers 크기로 생성)
+            process_pool: 부모 workspace와 공유할 worker process pool
+                (공유된 pool은 이 인스턴스가 종료하지 않음)
 
         """
         self.workspace_file = Path(workspace_file)
@@ -579,11 +590,20 @@ class WorkspaceDeployCommand:
         self.parallel = parallel if parallel is not None else True
         self.parallel_apps = parallel_apps if parallel_apps is not None else True
         self.max_workers = max_workers
+        self.isolation = isolation
         self.inherited_settings = inherited_settings or {}
         self.output = output or OutputManager(format_type="human")
         self.console = self.output.get_console()
         self.phase_results: dict[str, dict[str, Any]] = {}
         self._results_lock = threading.Lock()
+        # 모든 Phase가 공유하는 app group 배포 슬롯 (max_workers 전역 제한)
+        self._worker_slots = worker_slots or threading.BoundedSemaphore(max_workers)
+        # 기본 helm/kubectl 동시 실행 상한이 워커 수보다 작으면 올림
+        get_command_runner().ensure_capacity(max_workers)
+        # isolation="process"일 때 첫 app group 배포 시 생성 (nested workspace는 공유)
+        self._process_pool: AppGroupProcessPool | None = process_pool
+        self._owns_process_pool = process_pool is None
+        self._process_pool_lock = threading.Lock()
 
         # State tracking
         self.db = DeploymentDatabase()
@@ -650,10 +670,14 @@ class WorkspaceDeployCommand:
 
         # 4. 배포 실행
         try:
-            if self.parallel and len(phase_order) > 1:
-                success = self._execute_phases_parallel(workspace, phase_order)
-            else:
-                success = self._execute_phases(workspace, phase_order)
+            with perf_timer("workspace.deploy", workspace=self.workspace_file):
+                try:
+                    if self.parallel and len(phase_order) > 1:
+                        success = self._execute_phases_parallel(workspace, phase_order)
+                    else:
+                        success = self._execute_phases(workspace, phase_order)
+                finally:
+                    self._close_process_pool()
 
             # 5. State tracking 완료
             self._complete_deployment_tracking(success)
@@ -922,7 +946,10 @@ class WorkspaceDeployCommand:
                 self._info_print("  App Groups: (auto-discovering...)")
 
             # Phase 배포 실행
-            success, deployed_app_groups = self._deploy_phase(phase_name, phase_config, workspace)
+            with perf_timer("workspace.phase", phase=phase_name):
+                success, deployed_app_groups = self._deploy_phase(
+                    phase_name, phase_config, workspace
+                )
 
             # 결과 저장
             self.phase_results[phase_name] = {
@@ -954,10 +981,14 @@ class WorkspaceDeployCommand:
     def _execute_phases_parallel(
         self, workspace: UnifiedConfig, phase_order: list[str]
     ) -> bool:
-        """Execute phases in parallel where possible.
+        """Execute phases as soon as their own dependencies finish.
 
-        Phases with satisfied dependencies run concurrently.
-        Uses topological levels for parallel execution.
+        Ready-queue scheduling over the phase DAG (no level barriers): a slow
+        phase only delays the phases that depend on it. Ready phases are
+        started longest-remaining-path first, using median phase durations
+        from previous deployments. Phases depending on a failed phase are not
+        run unless the failed phase uses on_failure=continue; on_failure=stop
+        (or rollback) stops starting new phases.
 
         Args:
             workspace: Workspace configuration
@@ -970,117 +1001,73 @@ class WorkspaceDeployCommand:
         if logger.get_level() <= LogLevel.INFO:
             self.output.print_section(f"Parallel Deploying {len(phase_order)} Phase(s)")
 
-        # 1. Build dependency graph and calculate levels
-        levels = self._calculate_parallel_levels(workspace, phase_order)
-
-        self._info_print(f"Parallel execution levels: {len(levels)}")
-        for i, level in enumerate(levels):
-            self._info_print(f"  Level {i + 1}: {', '.join(level)}")
-        self._info_print("")
-
-        all_success = True
         global_on_failure = workspace.settings.on_failure
-        completed_phases: set[str] = set()
-        failed_phases: set[str] = set()
-
-        # 2. Execute level by level
-        for level_idx, level_phases in enumerate(levels, 1):
-            if logger.get_level() <= LogLevel.INFO:
-                self.output.print_section(
-                    f"Level {level_idx}/{len(levels)} ({len(level_phases)} phase(s))"
-                )
-
-            if len(level_phases) == 1:
-                # Single phase - execute sequentially
-                phase_name = level_phases[0]
-                success = self._execute_single_phase(
-                    phase_name, workspace, global_on_failure
-                )
-                if success:
-                    completed_phases.add(phase_name)
-                else:
-                    failed_phases.add(phase_name)
-                    all_success = False
-                    phase_on_failure = workspace.phases[phase_name].get_on_failure(
-                        global_on_failure
-                    )
-                    if phase_on_failure == "stop":
-                        logger.warning("on_failure=stop: 배포를 중단합니다.")
-                        break
-            else:
-                # Multiple phases - execute in parallel
-                level_results = self._execute_level_parallel(
-                    level_phases, workspace, global_on_failure
-                )
+        scheduler = AppScheduler(
+            dependencies={
+                name: list(workspace.phases[name].depends_on) for name in phase_order
+            },
+            max_workers=self.max_workers,
+            order=phase_order,
+            weights=self._phase_duration_estimates(workspace),
+            release_on_failure=[
+                name
+                for name in phase_order
+                if workspace.phases[name].get_on_failure(global_on_failure) == "continue"
+            ],
+        )
 
-                for phase_name, success in level_results.items():
-                    if success:
-                        completed_phases.add(phase_name)
-                    else:
-                        failed_phases.add(phase_name)
-                        all_success = False
+        self._info_print(
+            f"Ready-queue scheduling: {len(phase_order)} phases, "
+            f"max {self.max_workers} workers"
+        )
+        self._info_print(f"Start priority: {', '.join(scheduler.order)}\n")
 
-                # Check if any failed phase requires stop
-                should_stop = any(
-                    workspace.phases[pn].get_on_failure(global_on_failure) == "stop"
-                    for pn in failed_phases
+        def on_complete(task_result: AppTaskResult) -> None:
+            phase_name = task_result.app_name
+            if task_result.status == AppTaskStatus.SKIPPED:
+                self._info_print(
+                    f"[yellow]⏭️  Phase '{phase_name}' not run "
+                    f"(blocked by {task_result.blocked_by})[/yellow]"
                 )
-                if should_stop:
-                    logger.warning("on_failure=stop: 배포를 중단합니다.")
-                    break
-
-            self._info_print("")
-
-        return all_success
-
-    def _calculate_parallel_levels(
-        self, workspace: UnifiedConfig, phase_order: list[str]
-    ) -> list[list[str]]:
-        """Calculate parallel execution levels.
-
-        Phases in the same level have no dependencies on each other
-        and can be executed in parallel.
-
-        Args:
-            workspace: Workspace configuration
-            phase_order: Topologically sorted phase order
-
-        Returns:
-            List of levels, each containing phases that can run in parallel
-
-        """
-        levels: list[list[str]] = []
-        assigned: set[str] = set()
-
-        # Calculate in-degree for each phase
-        remaining = set(phase_order)
+                return
+            if task_result.status == AppTaskStatus.SUCCESS:
+                return
+
+            if task_result.payload is None:
+                # _execute_single_phase에서 예외 발생 (결과 미기록)
+                logger.error(f"Phase '{phase_name}' 실행 중 오류: {task_result.error}")
+                with self._results_lock:
+                    self.phase_results[phase_name] = {
+                        "success": False,
+                        "app_groups": workspace.phases[phase_name].app_groups,
+                        "error": task_result.error,
+                    }
 
-        while remaining:
-            # Find phases with all dependencies satisfied
-            current_level = []
-            for phase_name in phase_order:
-                if phase_name not in remaining:
-                    continue
+            on_failure = workspace.phases[phase_name].get_on_failure(global_on_failure)
+            if on_failure in ("stop", "rollback"):
+                logger.warning(f"on_failure={on_failure}: 새 Phase 시작을 중단합니다.")
+                scheduler.stop(phase_name)
+            elif on_failure == "continue":
+                logger.warning("on_failure=continue: 다음 Phase를 계속 진행합니다.")
+
+        result = scheduler.run(
+            lambda phase_name: self._execute_single_phase(
+                phase_name, workspace, global_on_failure
+            ),
+            on_complete=on_complete,
+        )
+        return result.success
 
-                phase_config = workspace.phases[phase_name]
-                deps_satisfied = all(
-                    dep in assigned for dep in phase_config.depends_on
+    def _phase_duration_estimates(self, workspace: UnifiedConfig) -> dict[str, float]:
+        """Median past durations per phase (empty if no usable history)."""
+        try:
+            with self.db.get_session() as session:
+                return WorkspaceStateTracker(session).get_phase_duration_estimates(
+                    workspace.metadata.get("name", "unnamed")
                 )
-
-                if deps_satisfied:
-                    current_level.append(phase_name)
-
-            if not current_level:
-                # Should not happen with valid topological sort
-                logger.warning("Could not find phases with satisfied dependencies")
-                break
-
-            levels.append(current_level)
-            for phase in current_level:
-                assigned.add(phase)
-                remaining.discard(phase)
-
-        return levels
+        except Exception as e:  # noqa: BLE001 - history only tunes priority
+            logger.verbose(f"Phase duration history unavailable: {e}")
+            return {}
 
     def _execute_single_phase(
         self,
@@ -1121,7 +1108,10 @@ class WorkspaceDeployCommand:
         else:
             self._info_print("  App Groups: (auto-discovering...)")
 
-        success, deployed_app_groups = self._deploy_phase(phase_name, phase_config, workspace)
+        with perf_timer("workspace.phase", phase=phase_name):
+            success, deployed_app_groups = self._deploy_phase(
+                phase_name, phase_config, workspace
+            )
 
         with self._results_lock:
             self.phase_results[phase_name] = {
@@ -1136,95 +1126,6 @@ class WorkspaceDeployCommand:
 
         return success
 
-    def _execute_level_parallel(
-        self,
-        phases: list[str],
-        workspace: UnifiedConfig,
-        global_on_failure: str,
-    ) -> dict[str, bool]:
-        """Execute multiple phases in parallel.
-
-        Args:
-            phases: List of phase names to execute
-            workspace: Workspace configuration
-            global_on_failure: Global failure behavior
-
-        Returns:
-            Dict mapping phase name to success status
-
-        """
-        results: dict[str, bool] = {}
-
-        self.output.print(
-            f"[cyan]Executing {len(phases)} phases in parallel: "
-            f"{', '.join(phases)}[/cyan]",
-            level="info",
-        )
-
-        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(phases))) as executor:
-            # Submit all phases
-            futures = {
-                executor.submit(
-                    self._deploy_phase_thread_safe,
-                    phase_name,
-                    workspace.phases[phase_name],
-                    workspace,
-                ): phase_name
-                for phase_name in phases
-            }
-
-            # Collect results
-            for future in as_completed(futures):
-                phase_name = futures[future]
-                try:
-                    success, deployed_app_groups = future.result()
-                    results[phase_name] = success
-
-                    with self._results_lock:
-                        self.phase_results[phase_name] = {
-                            "success": success,
-                            "app_groups": deployed_app_groups,
-                        }
-
-                    if success:
-                        logger.success(f"Phase '{phase_name}' 배포 완료 (parallel)")
-                    else:
-                        logger.error(f"Phase '{phase_name}' 배포 실패 (parallel)")
-
-                except Exception as e:
-                    logger.error(f"Phase '{phase_name}' 실행 중 오류: {e}")
-                    results[phase_name] = False
-
-                    with self._results_lock:
-                        self.phase_results[phase_name] = {
-                            "success": False,
-                            "app_groups": workspace.phases[phase_name].app_groups,
-                            "error": str(e),
-                        }
-
-        return results
-
-    def _deploy_phase_thread_safe(
-        self,
-        phase_name: str,
-        phase_config: PhaseReference,
-        workspace: UnifiedConfig,
-    ) -> tuple[bool, list[str]]:
-        """Thread-safe wrapper for _deploy_phase.
-
-        Args:
-            phase_name: Phase name
-            phase_config: Phase configuration
-            workspace: Workspace configuration
-
-        Returns:
-            tuple[bool, list[str]]: (배포 성공 여부, 배포된 app_groups)
-
-        """
-        # Note: Console output may interleave in parallel mode
-        # dry-run도 _deploy_phase를 통과시켜 검증 수행 (실제 배포만 건너뜀)
-        return self._deploy_phase(phase_name, phase_config, workspace)
-
     def _deploy_phase(
         self,
         phase_name: str,
@@ -1309,7 +1210,14 @@ class WorkspaceDeployCommand:
                         force=self.force,
                         skip_validation=True,  # Already validated parent
                         inherited_settings=nested_inherited_settings,
+                        isolation=self.isolation,
                         output=self.output,
+                        worker_slots=self._worker_slots,
+                        process_pool=(
+                            self._get_process_pool()
+                            if self.isolation == "process"
+                            else None
+                        ),
                     )
 
                     # Execute nested workspace
@@ -1389,10 +1297,12 @@ class WorkspaceDeployCommand:
                             dry_run=self.dry_run,
                             force=self.force,
                             parallel=self.parallel_apps,
+                            max_workers=self.max_workers,
                             inherited_settings=inherited_settings,
                             format_type=self.output.format_type,
                         )
-                        success = apply_cmd.execute()
+                        with self._worker_slots:
+                            success = apply_cmd.execute()
                         self._complete_phase_tracking(
                             phase_name,
                             success,
@@ -1470,68 +1380,39 @@ class WorkspaceDeployCommand:
         try:
             from sbkube.commands.apply import ApplyCommand
 
-            # Parallel apps mode: execute app_groups in parallel within each level
+            # Parallel apps mode: ready-queue over app_group_deps
             if self.parallel_apps:
-                # Use phase_config.get_app_group_order() if app_groups were specified,
-                # otherwise use auto-discovered app_groups as a single level
-                if phase_config.app_groups:
-                    app_group_levels = phase_config.get_app_group_order()
-                else:
-                    # Auto-discovered: no deps info, treat as single parallel level
-                    app_group_levels = [app_groups] if app_groups else []
-
-                self._info_print(
-                    f"  [magenta]Parallel mode: {len(app_group_levels)} levels[/magenta]"
+                dependencies = {
+                    group: list(phase_config.app_group_deps.get(group, []))
+                    for group in app_groups
+                }
+                success, completed_app_groups = self._deploy_app_groups_parallel(
+                    app_groups,
+                    base_dir,
+                    source_path,
+                    inherited_settings,
+                    dependencies=dependencies,
                 )
-
-                for level_idx, level_groups in enumerate(app_group_levels):
-                    if len(level_groups) > 1:
-                        self._info_print(
-                            f"  [cyan]Level {level_idx + 1}: "
-                            f"Deploying {len(level_groups)} app groups in parallel[/cyan]"
-                        )
-                        success, completed = self._deploy_app_groups_parallel(
-                            level_groups, base_dir, source_path, inherited_settings
-                        )
-                        completed_app_groups += completed
-                        if not success:
-                            error_msg = f"Level {level_idx + 1} deployment failed"
-                            self._complete_phase_tracking(
-                                phase_name, False, error_msg, completed_app_groups
-                            )
-                            return (False, app_groups)
-                    else:
-                        # Single app group - execute sequentially
-                        app_group = level_groups[0]
-                        self._info_print(f"  Deploying app group: {app_group}")
-                        if not self._deploy_single_app_group(app_group, base_dir, source_path, inherited_settings):
-                            error_msg = f"App group '{app_group}' 배포 실패"
-                            self._complete_phase_tracking(
-                                phase_name, False, error_msg, completed_app_groups
-                            )
-                            return (False, app_groups)
-                        completed_app_groups += 1
+                self._print_process_report(app_groups)
+                if not success:
+                    error_msg = (
+                        f"App group deployment failed "
+                        f"({completed_app_groups}/{len(app_groups)} completed)"
+                    )
+                    self._complete_phase_tracking(
+                        phase_name, False, error_msg, completed_app_groups
+                    )
+                    return (False, app_groups)
             else:
-                # Sequential mode: ApplyCommand 생성 및 실행
+                # Sequential mode: ApplyCommand 순차 실행
                 for app_group in app_groups:
                     self._info_print(f"  Deploying app group: {app_group}")
 
-                    apply_cmd = ApplyCommand(
-                        base_dir=str(base_dir),
-                        app_config_dir=app_group,
-                        source=source_path.name,
-                        dry_run=False,
-                        force=self.force,
-                        skip_prepare=False,
-                        skip_build=False,
-                        inherited_settings=inherited_settings,
-                        format_type=self.output.format_type,
+                    deployed = self._deploy_single_app_group(
+                        app_group, base_dir, source_path, inherited_settings
                     )
-
-                    # Apply 실행
-                    result = apply_cmd.execute()
-
-                    if not result:
+                    self._print_process_report([app_group])
+                    if not deployed:
                         error_msg = f"App group '{app_group}' 배포 실패"
                         logger.error(error_msg)
                         self._complete_phase_tracking(
@@ -1574,6 +1455,10 @@ class WorkspaceDeployCommand:
     ) -> bool:
         """Deploy a single app group.
 
+        Holds one of the workspace-wide worker slots while the app group is
+        applied, so max_workers bounds concurrent deployments across all
+        phases, not per phase.
+
         Args:
             app_group: App group name
             base_dir: Base directory for deployment
@@ -1584,6 +1469,18 @@ class WorkspaceDeployCommand:
             bool: True if successful
 
         """
+        if self.isolation == "process":
+            job = AppGroupJob(
+                base_dir=str(base_dir),
+                app_group=app_group,
+                source=source_path.name,
+                force=self.force,
+                inherited_settings=inherited_settings or {},
+                format_type=self.output.format_type,
+            )
+            with self._worker_slots:
+                return self._get_process_pool().apply(job).success
+
         from sbkube.commands.apply import ApplyCommand
 
         apply_cmd = ApplyCommand(
@@ -1598,7 +1495,28 @@ class WorkspaceDeployCommand:
             format_type=self.output.format_type,
         )
 
-        return apply_cmd.execute()
+        with self._worker_slots:
+            return apply_cmd.execute()
+
+    def _get_process_pool(self) -> AppGroupProcessPool:
+        """Worker process pool for isolation="process" (created on first use)."""
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                self._process_pool = AppGroupProcessPool(
+                    max_workers=self.max_workers, output=self.output
+                )
+            return self._process_pool
+
+    def _print_process_report(self, app_groups: list[str]) -> None:
+        """Print captured worker output of app groups run in worker processes."""
+        if self._process_pool is not None:
+            self._process_pool.print_report(app_groups)
+
+    def _close_process_pool(self) -> None:
+        """Shut down worker processes and store their perf history."""
+        if self._process_pool is not None and self._owns_process_pool:
+            self._process_pool.close()
+            self._process_pool = None
 
     def _deploy_app_groups_parallel(
         self,
@@ -1606,50 +1524,68 @@ class WorkspaceDeployCommand:
         base_dir: Path,
         source_path: Path,
         inherited_settings: dict | None = None,
+        dependencies: dict[str, list[str]] | None = None,
     ) -> tuple[bool, int]:
-        """Deploy multiple app groups in parallel.
+        """Deploy app groups concurrently, each as soon as its deps succeed.
+
+        Ready app groups are started longest-remaining-path first, using
+        recorded perf run durations (SBKUBE_PERF=1) when available. After the
+        first failure no new app groups are started.
 
         Args:
             app_groups: List of app group names
             base_dir: Base directory for deployment
             source_path: Path to sources.yaml
             inherited_settings: Settings inherited from parent workspace
+            dependencies: app_group_deps (app group → prerequisite app groups)
 
         Returns:
             Tuple of (all_success, completed_count)
 
         """
-        results: dict[str, bool] = {}
-        completed_count = 0
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_group = {
-                executor.submit(
-                    self._deploy_single_app_group,
-                    app_group,
-                    base_dir,
-                    source_path,
-                    inherited_settings,
-                ): app_group
-                for app_group in app_groups
-            }
+        if not app_groups:
+            return True, 0
+
+        dependencies = dependencies or {}
+        scheduler = AppScheduler(
+            dependencies={group: dependencies.get(group, []) for group in app_groups},
+            max_workers=self.max_workers,
+            order=app_groups,
+            weights=self._app_group_duration_estimates(app_groups),
+        )
 
-            for future in as_completed(future_to_group):
-                app_group = future_to_group[future]
-                try:
-                    result = future.result()
-                    results[app_group] = result
-                    if result:
-                        completed_count += 1
-                        logger.success(f"App group '{app_group}' 배포 완료 (parallel)")
-                    else:
-                        logger.error(f"App group '{app_group}' 배포 실패 (parallel)")
-                except Exception as e:
-                    results[app_group] = False
-                    logger.error(f"App group '{app_group}' 오류: {e}")
+        def on_complete(task_result: AppTaskResult) -> None:
+            app_group = task_result.app_name
+            if task_result.status == AppTaskStatus.SUCCESS:
+                logger.success(f"App group '{app_group}' 배포 완료 (parallel)")
+            elif task_result.status == AppTaskStatus.FAILED:
+                if task_result.error:
+                    logger.error(f"App group '{app_group}' 오류: {task_result.error}")
+                else:
+                    logger.error(f"App group '{app_group}' 배포 실패 (parallel)")
+                scheduler.stop(app_group)
+            else:
+                self._info_print(
+                    f"  [yellow]⏭️  App group '{app_group}' not run "
+                    f"(blocked by {task_result.blocked_by})[/yellow]"
+                )
+
+        def deploy(app_group: str) -> bool:
+            self._info_print(f"  Deploying app group: {app_group}")
+            return self._deploy_single_app_group(
+                app_group, base_dir, source_path, inherited_settings
+            )
 
-        all_success = all(results.values())
-        return all_success, completed_count
+        result = scheduler.run(deploy, on_complete=on_complete)
+        return result.success, len(result.succeeded)
+
+    def _app_group_duration_estimates(self, app_groups: list[str]) -> dict[str, float]:
+        """Median recorded apply durations per app group (empty without history)."""
+        try:
+            return self.db.get_app_group_duration_estimates(app_groups)
+        except Exception as e:  # noqa: BLE001 - history only tunes priority
+            logger.verbose(f"App group duration history unavailable: {e}")
+            return {}
 
     def _start_phase_tracking(self, phase_name: str) -> None:
         """Start tracking for a phase.
@@ -1987,6 +1923,13 @@ class WorkspaceStatusCommand:
     default=4,
     help="최대 병렬 워커 수 (기본: 4)",
 )
+@click.option(
+    "--isolation",
+    type=click.Choice(["thread", "process"]),
+    default="thread",
+    show_default=True,
+    help="App group 실행 격리 방식 (process: app group별 별도 프로세스)",
+)
 @global_options
 @click.pass_context
 def deploy_cmd(
@@ -1999,6 +1942,7 @@ def deploy_cmd(
     parallel: bool | None,
     parallel_apps: bool | None,
     max_workers: int,
+    isolation: str,
 ) -> None:
     """Deprecated alias for `sbkube apply` workspace deployment."""
     ctx.ensure_object(dict)
@@ -2030,6 +1974,7 @@ def deploy_cmd(
         parallel=parallel,
         parallel_apps=parallel_apps,
         max_workers=max_workers,
+        isolation=isolation,
     )
 
 
@@ -6,6 +6,7 @@ from pathlib import Path
 import requests
 import yaml
 
+from sbkube.utils.async_runner import run_async
 from sbkube.utils.diagnostic_system import (
     DiagnosticCheck,
     DiagnosticLevel,
@@ -33,7 +34,7 @@ class KubernetesConnectivityCheck(DiagnosticCheck):
                 )
 
             # 클러스터 연결 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "cluster-info"],
                 check=False,
                 capture_output=True,
@@ -51,7 +52,7 @@ class KubernetesConnectivityCheck(DiagnosticCheck):
                 )
 
             # 클러스터 버전 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "version", "--short"],
                 check=False,
                 capture_output=True,
@@ -105,7 +106,7 @@ class HelmInstallationCheck(DiagnosticCheck):
                 )
 
             # Helm 버전 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["helm", "version", "--short"],
                 check=False,
                 capture_output=True,
@@ -342,7 +343,7 @@ class PermissionsCheck(DiagnosticCheck):
 
             for action, resource in permissions_to_check:
                 try:
-                    result = subprocess.run(
+                    result = await run_async(
                         ["kubectl", "auth", "can-i", action, resource],
                         check=False,
                         capture_output=True,
@@ -394,7 +395,7 @@ class ResourceAvailabilityCheck(DiagnosticCheck):
     async def run(self) -> DiagnosticResult:
         try:
             # 노드 상태 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "nodes", "--no-headers"],
                 check=False,
                 capture_output=True,
@@ -472,7 +473,7 @@ class HelmFieldManagerCheck(DiagnosticCheck):
                 )
 
             # 전체 helm release 조회
-            result = subprocess.run(
+            result = await run_async(
                 ["helm", "list", "-A", "--output", "json"],
                 check=False,
                 capture_output=True,
@@ -505,7 +506,7 @@ class HelmFieldManagerCheck(DiagnosticCheck):
                 # failed 상태 release의 description에서 conflict 확인
                 if status == "failed":
                     # helm list 출력에는 상세 description이 없으므로 history 조회
-                    history_result = subprocess.run(
+                    history_result = await run_async(
                         ["helm", "history", name, "-n", namespace, "--output", "json"],
                         check=False,
                         capture_output=True,
@@ -526,7 +527,7 @@ class HelmFieldManagerCheck(DiagnosticCheck):
 
                 # deployed 상태 release의 과거 충돌 이력 확인
                 if status == "deployed":
-                    history_result = subprocess.run(
+                    history_result = await run_async(
                         ["helm", "history", name, "-n", namespace, "--output", "json"],
                         check=False,
                         capture_output=True,
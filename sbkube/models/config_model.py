@@ -905,6 +905,14 @@ class YamlApp(ConfigBaseModel):
             - service.yaml
           namespace: custom-ns
 
+    Batched apply (manifest 수가 많은 앱):
+        my-app:
+          type: yaml
+          manifests:
+            - manifests/*.yaml
+          batch_apply: true   # 한 번의 `kubectl apply -f -`로 적용
+          server_side: true   # kubectl apply --server-side
+
     Legacy format (deprecated):
         my-app:
           type: yaml
@@ -929,6 +937,15 @@ class YamlApp(ConfigBaseModel):
     depends_on: list[str] = Field(default_factory=list)
     enabled: bool = True
     hooks: AppHooks | None = None
+    batch_apply: bool = Field(
+        default=False,
+        description="Apply all manifests as one multi-document stream with a single "
+        "`kubectl apply -f -` instead of one kubectl process per file.",
+    )
+    server_side: bool = Field(
+        default=False,
+        description="Use `kubectl apply --server-side`.",
+    )
 
     # 문서화
     notes: str | None = Field(
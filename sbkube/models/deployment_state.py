@@ -4,8 +4,12 @@ This module provides SQLAlchemy models and Pydantic schemas for tracking
 deployment states and enabling rollback operations.
 """
 
+import hashlib
+import json
+import zlib
 from datetime import datetime
 from enum import Enum
+from pathlib import PurePath
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict
@@ -14,9 +18,11 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -25,6 +31,11 @@ from sqlalchemy.orm import declarative_base, relationship
 
 from sbkube.utils.datetime_utils import utc_now
 
+try:  # Python 3.14+
+    from compression import zstd
+except ImportError:  # pragma: no cover - older interpreters fall back to zlib
+    zstd = None
+
 Base = declarative_base()
 
 
@@ -52,6 +63,16 @@ class ResourceAction(str, Enum):
 # SQLAlchemy Models
 
 
+def app_config_dir_name(app_config_dir: str) -> str:
+    """Normalized directory name of an app config dir (last path component)."""
+    return PurePath(app_config_dir.rstrip("/\\")).name
+
+
+def _app_config_dir_name_default(context) -> str | None:
+    app_config_dir = context.get_current_parameters().get("app_config_dir")
+    return app_config_dir_name(app_config_dir) if app_config_dir else None
+
+
 class Deployment(Base):
     """Main deployment record."""
 
@@ -65,6 +86,10 @@ class Deployment(Base):
     cluster = Column(String(255), nullable=False)
     namespace = Column(String(255), nullable=False)
     app_config_dir = Column(String(1024), nullable=False)
+    # app_config_dir의 마지막 경로 요소 (경로가 바뀐 기록을 디렉토리 이름으로 찾기 위함)
+    app_config_dir_name = Column(
+        String(255), nullable=True, default=_app_config_dir_name_default
+    )
     config_file_path = Column(String(1024), nullable=False)
 
     # Command context
@@ -94,6 +119,18 @@ class Deployment(Base):
     __table_args__ = (
         Index("idx_deployment_timestamp", "timestamp"),
         Index("idx_deployment_cluster_namespace", "cluster", "namespace"),
+        Index(
+            "idx_deployment_cluster_config_dir",
+            "cluster",
+            "app_config_dir",
+            "timestamp",
+        ),
+        Index(
+            "idx_deployment_cluster_config_dir_name",
+            "cluster",
+            "app_config_dir_name",
+            "timestamp",
+        ),
     )
 
 
@@ -131,8 +168,14 @@ class AppDeployment(Base):
         back_populates="app_deployment",
         cascade="all, delete-orphan",
     )
+    helm_releases = relationship(
+        "HelmRelease",
+        back_populates="app_deployment",
+        cascade="all, delete-orphan",
+    )
 
     __table_args__ = (
+        Index("idx_app_deployment_deployment_id", "deployment_id"),
         Index("idx_app_deployment_name", "app_name"),
         Index("idx_app_deployment_type", "app_type"),
         Index("idx_app_deployment_group", "app_group"),  # Phase 2: app-group index
@@ -166,6 +209,13 @@ class DeployedResource(Base):
         nullable=True,
     )  # Previous resource state (for rollback)
     current_state = Column(JSON, nullable=True)  # Current resource state
+    # Compacted snapshots (inline state moved to state_blobs by `history --compact`)
+    previous_state_checksum = Column(
+        String(64), ForeignKey("state_blobs.checksum"), nullable=True
+    )
+    current_state_checksum = Column(
+        String(64), ForeignKey("state_blobs.checksum"), nullable=True
+    )
 
     # Metadata
     checksum = Column(String(64), nullable=True)  # SHA256 of resource
@@ -173,6 +223,26 @@ class DeployedResource(Base):
 
     # Relationships
     app_deployment = relationship("AppDeployment", back_populates="resources")
+    previous_state_blob = relationship(
+        "StateBlob", foreign_keys=[previous_state_checksum], lazy="joined"
+    )
+    current_state_blob = relationship(
+        "StateBlob", foreign_keys=[current_state_checksum], lazy="joined"
+    )
+
+    @property
+    def previous_state_data(self) -> dict[str, Any] | None:
+        """Previous state, whether stored inline or compacted."""
+        if self.previous_state is not None:
+            return self.previous_state
+        return self.previous_state_blob.load() if self.previous_state_blob else None
+
+    @property
+    def current_state_data(self) -> dict[str, Any] | None:
+        """Current state, whether stored inline or compacted."""
+        if self.current_state is not None:
+            return self.current_state
+        return self.current_state_blob.load() if self.current_state_blob else None
 
     __table_args__ = (
         UniqueConstraint(
@@ -209,13 +279,114 @@ class HelmRelease(Base):
     # Helm state
     revision = Column(Integer, nullable=False)
     values = Column(JSON, nullable=True)  # Values used for deployment
+    values_checksum = Column(
+        String(64), ForeignKey("state_blobs.checksum"), nullable=True
+    )  # Compacted values
 
     # Status
     status = Column(String(50), nullable=False)  # deployed, failed, etc.
 
+    # Relationships
+    app_deployment = relationship("AppDeployment", back_populates="helm_releases")
+    values_blob = relationship("StateBlob", lazy="joined")
+
     __table_args__ = (
         UniqueConstraint("release_name", "namespace", name="uq_helm_release"),
         Index("idx_helm_release_name", "release_name"),
+        Index("idx_helm_release_app_deployment", "app_deployment_id"),
+    )
+
+    @property
+    def values_data(self) -> dict[str, Any] | None:
+        """Helm values, whether stored inline or compacted."""
+        if self.values is not None:
+            return self.values
+        return self.values_blob.load() if self.values_blob else None
+
+
+class StateBlob(Base):
+    """Deduplicated JSON snapshot shared by resources and Helm releases.
+
+    Keyed by the SHA256 of the canonical JSON, so identical manifests or
+    values recorded by many deployments are stored once.
+    """
+
+    __tablename__ = "state_blobs"
+
+    checksum = Column(String(64), primary_key=True)
+    encoding = Column(String(10), nullable=False)  # json, zstd, zlib
+    data = Column(LargeBinary, nullable=False)
+    raw_size = Column(Integer, nullable=False)  # Size of the canonical JSON
+
+    @staticmethod
+    def canonical_json(value: Any) -> bytes:
+        """Canonical JSON bytes used for checksums and storage."""
+        return json.dumps(
+            value, sort_keys=True, separators=(",", ":"), default=str
+        ).encode()
+
+    @classmethod
+    def from_value(cls, value: Any, compress_threshold: int | None = None) -> "StateBlob":
+        """Create a blob, compressing JSON larger than compress_threshold bytes.
+
+        zstd is used when available (Python 3.14+), otherwise zlib.
+        """
+        raw = cls.canonical_json(value)
+        encoding, data = "json", raw
+        if compress_threshold is not None and len(raw) > compress_threshold:
+            if zstd is not None:
+                encoding, data = "zstd", zstd.compress(raw)
+            else:
+                encoding, data = "zlib", zlib.compress(raw)
+        return cls(
+            checksum=hashlib.sha256(raw).hexdigest(),
+            encoding=encoding,
+            data=data,
+            raw_size=len(raw),
+        )
+
+    def load(self) -> Any:
+        """Decode the stored JSON value."""
+        data = self.data
+        if self.encoding == "zstd":
+            if zstd is None:
+                msg = "State blob is zstd-compressed but zstd is not available"
+                raise RuntimeError(msg)
+            data = zstd.decompress(data)
+        elif self.encoding == "zlib":
+            data = zlib.decompress(data)
+        return json.loads(data)
+
+
+class PerfSample(Base):
+    """Aggregated timing of one app/stage/tool within a perf-recorded run.
+
+    Written when SBKUBE_PERF=1. One run (``run_id``) is one app group apply;
+    ``deployment_id`` links it to the Deployment recorded during that run,
+    if any.
+    """
+
+    __tablename__ = "perf_samples"
+
+    id = Column(Integer, primary_key=True)
+    run_id = Column(String(64), nullable=False, index=True)
+    deployment_id = Column(Integer, ForeignKey("deployments.id"), nullable=True)
+    timestamp = Column(DateTime, default=utc_now, nullable=False)
+    command = Column(String(50), nullable=False)
+    app_config_dir = Column(String(1024), nullable=False)
+    app_config_dir_name = Column(
+        String(255), nullable=True, default=_app_config_dir_name_default
+    )
+
+    app_name = Column(String(255), nullable=True)  # None: run-level sample
+    category = Column(String(20), nullable=False)  # run, stage, tool
+    name = Column(String(255), nullable=False)  # prepare, deploy, helm, ...
+    duration_seconds = Column(Float, nullable=False)
+    calls = Column(Integer, default=1, nullable=False)
+
+    __table_args__ = (
+        Index("idx_perf_sample_dir_name_timestamp", "app_config_dir_name", "timestamp"),
+        Index("idx_perf_sample_deployment_id", "deployment_id"),
     )
 
 
@@ -311,6 +482,32 @@ class DeploymentDetail(BaseModel):
     helm_releases: list[HelmReleaseInfo] = []
 
 
+class DeploymentStatusInfo(BaseModel):
+    """Schema for a status-only deployment lookup (dependency checks)."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    app_config_dir: str
+    status: DeploymentStatus
+    timestamp: datetime
+    namespace: str
+
+
+class PerfSampleInfo(BaseModel):
+    """Schema for a stored perf sample."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    run_id: str
+    timestamp: datetime
+    app_config_dir: str
+    app_name: str | None = None
+    category: str
+    name: str
+    duration_seconds: float
+    calls: int = 1
+
+
 class RollbackRequest(BaseModel):
     """Schema for rollback request."""
 
@@ -0,0 +1,219 @@
+"""Retention and compaction for the deployment state database.
+
+Every deployment stores full JSON snapshots (resource previous/current state,
+Helm values), so ``~/.sbkube/deployments.db`` grows without bound. The
+compactor:
+
+- keeps only the newest N deployments per app group
+- moves inline snapshots into the shared ``state_blobs`` table, deduplicated
+  by checksum (optionally compressed)
+- deletes blobs no longer referenced
+- checkpoints the WAL and runs VACUUM to give the space back to the filesystem
+"""
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import bindparam, delete, func, null, select, union, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from sbkube.models.deployment_state import DeployedResource, HelmRelease, StateBlob
+from sbkube.state.database import DeploymentDatabase
+from sbkube.utils.logger import get_logger
+
+logger = get_logger()
+
+DEFAULT_KEEP_PER_GROUP = 10
+DEFAULT_COMPRESS_THRESHOLD = 4096  # bytes of canonical JSON
+
+# (table, inline JSON column, blob checksum column)
+_STATE_COLUMNS = (
+    (
+        DeployedResource.__table__,
+        DeployedResource.previous_state,
+        DeployedResource.previous_state_checksum,
+    ),
+    (
+        DeployedResource.__table__,
+        DeployedResource.current_state,
+        DeployedResource.current_state_checksum,
+    ),
+    (HelmRelease.__table__, HelmRelease.values, HelmRelease.values_checksum),
+)
+
+
+@dataclass
+class CompactionReport:
+    """Result of a compaction run."""
+
+    deployments_deleted: int = 0
+    snapshots_compacted: int = 0
+    blobs_created: int = 0
+    blobs_deleted: int = 0
+    blobs_compressed: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return max(0, self.bytes_before - self.bytes_after)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "bytes_reclaimed": self.bytes_reclaimed}
+
+
+class StateCompactor:
+    """Applies retention and blob deduplication to a DeploymentDatabase."""
+
+    def __init__(
+        self,
+        db: DeploymentDatabase,
+        keep_per_group: int | None = DEFAULT_KEEP_PER_GROUP,
+        compress: bool = False,
+        compress_threshold: int = DEFAULT_COMPRESS_THRESHOLD,
+        batch_size: int = 500,
+    ) -> None:
+        """Initialize StateCompactor.
+
+        Args:
+            db: Deployment database to compact
+            keep_per_group: Newest deployments to keep per app group (None = keep all)
+            compress: Compress snapshots larger than compress_threshold
+            compress_threshold: Canonical JSON size (bytes) above which to compress
+            batch_size: Rows processed per batch
+
+        """
+        self.db = db
+        self.keep_per_group = keep_per_group
+        self.compress_threshold = compress_threshold if compress else None
+        self.batch_size = batch_size
+
+    def run(self, vacuum: bool = True) -> CompactionReport:
+        """Run retention, deduplication and (optionally) VACUUM.
+
+        Returns:
+            CompactionReport with counts and bytes reclaimed
+
+        """
+        report = CompactionReport(bytes_before=self.database_size())
+        blobs_before = self._count_blobs()
+
+        if self.keep_per_group is not None:
+            report.deployments_deleted = self.db.prune_deployments(
+                keep_per_group=self.keep_per_group
+            )
+        for table, inline_column, checksum_column in _STATE_COLUMNS:
+            report.snapshots_compacted += self._compact_column(
+                table, inline_column, checksum_column
+            )
+        if self.compress_threshold is not None:
+            report.blobs_compressed = self._compress_existing_blobs()
+        report.blobs_deleted = self._delete_orphan_blobs()
+        report.blobs_created = self._count_blobs() - blobs_before + report.blobs_deleted
+
+        if vacuum:
+            self.vacuum()
+        report.bytes_after = self.database_size()
+        logger.verbose(f"State database compacted: {report.to_dict()}")
+        return report
+
+    def database_size(self) -> int:
+        """Size of the database file plus its WAL."""
+        db_path = Path(self.db.db_path)
+        return sum(
+            path.stat().st_size
+            for path in (db_path, db_path.with_name(f"{db_path.name}-wal"))
+            if path.exists()
+        )
+
+    def vacuum(self) -> None:
+        """Checkpoint the WAL and rebuild the database file."""
+        with self.db.engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.exec_driver_sql("VACUUM")
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _count_blobs(self) -> int:
+        with self.db.get_session() as session:
+            return session.scalar(select(func.count()).select_from(StateBlob))
+
+    def _compact_column(self, table, inline_column, checksum_column) -> int:
+        """Move inline JSON of one column into state_blobs, batch by batch."""
+        inline = table.c[inline_column.key]
+        clear_stmt = (
+            update(table)
+            .where(table.c.id == bindparam("row_id"))
+            .values({inline: null(), checksum_column.key: bindparam("blob_checksum")})
+        )
+        insert_stmt = sqlite_insert(StateBlob).on_conflict_do_nothing(
+            index_elements=["checksum"]
+        )
+
+        compacted = 0
+        last_id = 0
+        while True:
+            with self.db.get_session() as session:
+                rows = session.execute(
+                    select(table.c.id, inline)
+                    .where(inline.is_not(None), table.c.id > last_id)
+                    .order_by(table.c.id)
+                    .limit(self.batch_size)
+                ).all()
+                if not rows:
+                    return compacted
+
+                blobs: dict[str, dict[str, Any]] = {}
+                updates = []
+                for row_id, value in rows:
+                    checksum = None
+                    if value is not None:  # JSON 'null' is cleared without a blob
+                        blob = StateBlob.from_value(value, self.compress_threshold)
+                        checksum = blob.checksum
+                        blobs.setdefault(
+                            checksum,
+                            {
+                                "checksum": checksum,
+                                "encoding": blob.encoding,
+                                "data": blob.data,
+                                "raw_size": blob.raw_size,
+                            },
+                        )
+                        compacted += 1
+                    updates.append({"row_id": row_id, "blob_checksum": checksum})
+
+                if blobs:
+                    session.execute(insert_stmt, list(blobs.values()))
+                session.connection().execute(clear_stmt, updates)
+                last_id = rows[-1][0]
+
+    def _compress_existing_blobs(self) -> int:
+        """Compress uncompressed blobs stored by an earlier run."""
+        compressed = 0
+        with self.db.get_session() as session:
+            blobs = session.scalars(
+                select(StateBlob).where(
+                    StateBlob.encoding == "json",
+                    StateBlob.raw_size > self.compress_threshold,
+                )
+            )
+            for blob in blobs:
+                packed = StateBlob.from_value(blob.load(), self.compress_threshold)
+                blob.encoding, blob.data = packed.encoding, packed.data
+                compressed += 1
+        return compressed
+
+    def _delete_orphan_blobs(self) -> int:
+        referenced = union(
+            *(
+                select(checksum_column).where(checksum_column.is_not(None))
+                for _, _, checksum_column in _STATE_COLUMNS
+            )
+        )
+        with self.db.get_session() as session:
+            result = session.execute(
+                delete(StateBlob).where(StateBlob.checksum.not_in(referenced))
+            )
+            return result.rowcount
@@ -6,12 +6,25 @@ for the deployment state tracking system.
 
 import hashlib
 import json
+import statistics
 from contextlib import contextmanager
+from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import create_engine, event, text
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import (
+    case,
+    create_engine,
+    delete,
+    event,
+    func,
+    inspect,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.orm import Session, selectinload, sessionmaker
 from sqlalchemy.pool import NullPool
 
 from sbkube.models.deployment_state import (
@@ -23,20 +36,28 @@ from sbkube.models.deployment_state import (
     DeploymentCreate,
     DeploymentDetail,
     DeploymentStatus,
+    DeploymentStatusInfo,
     DeploymentSummary,
     HelmRelease,
     HelmReleaseInfo,
+    PerfSample,
+    PerfSampleInfo,
     ResourceAction,
     ResourceInfo,
+    app_config_dir_name,
 )
 from sbkube.models.workspace_state import (  # noqa: F401
     PhaseDeployment,
     WorkspaceDeployment,
 )
+from sbkube.utils.datetime_utils import utc_now
 from sbkube.utils.logger import get_logger
 
 logger = get_logger()
 
+# Delete in batches to stay under SQLite's bound-parameter limit
+_DELETE_BATCH_SIZE = 500
+
 
 class DeploymentDatabase:
     """Manager for deployment state database.
@@ -91,11 +112,56 @@ class DeploymentDatabase:
         """Initialize database schema."""
         try:
             Base.metadata.create_all(bind=self.engine)
+            self._migrate_columns()
+            # create_all은 기존 테이블에 새 인덱스를 추가하지 않으므로 개별 확인
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=self.engine, checkfirst=True)
             logger.verbose(f"Database initialized at: {self.db_path}")
         except Exception as e:
             logger.exception(f"Failed to initialize database: {e}")
             raise
 
+    def _migrate_columns(self) -> None:
+        """Add columns introduced after a table was created (SQLite ALTER TABLE).
+
+        New columns are always nullable, so they can be added in place.
+        """
+        inspector = inspect(self.engine)
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                existing = {c["name"] for c in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in existing:
+                        continue
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    conn.execute(
+                        text(
+                            f"ALTER TABLE {table.name} "
+                            f"ADD COLUMN {column.name} {column_type}"
+                        )
+                    )
+                    logger.verbose(f"Migrated column: {table.name}.{column.name}")
+                    if (table.name, column.name) == (
+                        "deployments",
+                        "app_config_dir_name",
+                    ):
+                        self._backfill_app_config_dir_name(conn)
+
+    @staticmethod
+    def _backfill_app_config_dir_name(conn) -> None:
+        rows = conn.execute(text("SELECT id, app_config_dir FROM deployments"))
+        updates = [
+            {"id": row_id, "name": app_config_dir_name(config_dir)}
+            for row_id, config_dir in rows
+            if config_dir
+        ]
+        if updates:
+            conn.execute(
+                text("UPDATE deployments SET app_config_dir_name = :name WHERE id = :id"),
+                updates,
+            )
+
     @contextmanager
     def get_session(self) -> Session:
         """Get a database session with automatic cleanup.
@@ -326,6 +392,83 @@ class DeploymentDatabase:
                 if rollback_info:
                     app_deployment.rollback_info = rollback_info
 
+    @staticmethod
+    def _detail_query(session: Session):
+        """Deployment query with app deployments, resources and Helm releases eager-loaded.
+
+        selectinload로 관계별 한 번씩만 조회하므로 앱 수와 관계없이 쿼리 수가 고정됩니다.
+        """
+        apps = selectinload(Deployment.app_deployments)
+        return session.query(Deployment).options(
+            apps.selectinload(AppDeployment.resources),
+            apps.selectinload(AppDeployment.helm_releases),
+        )
+
+    @staticmethod
+    def _build_detail(deployment: Deployment) -> DeploymentDetail:
+        """Convert an eager-loaded Deployment into DeploymentDetail."""
+        detail = DeploymentDetail(
+            deployment_id=deployment.deployment_id,
+            timestamp=deployment.timestamp,
+            cluster=deployment.cluster,
+            namespace=deployment.namespace,
+            app_config_dir=deployment.app_config_dir,
+            status=DeploymentStatus(deployment.status),
+            error_message=deployment.error_message,
+            config_snapshot=deployment.config_snapshot,
+            apps=[],
+            resources=[],
+            helm_releases=[],
+        )
+
+        # Add app deployments and their resources
+        for app_dep in sorted(deployment.app_deployments, key=lambda a: a.id):
+            app_info = {
+                "id": app_dep.id,
+                "name": app_dep.app_name,
+                "type": app_dep.app_type,
+                "namespace": app_dep.namespace,
+                "status": app_dep.status,
+                "error_message": app_dep.error_message,
+                "config": app_dep.app_config,
+                "deployment_metadata": app_dep.deployment_metadata,
+                "rollback_info": app_dep.rollback_info,
+            }
+            detail.apps.append(app_info)
+
+            # Add resources
+            for resource in sorted(app_dep.resources, key=lambda r: r.id):
+                detail.resources.append(
+                    ResourceInfo(
+                        api_version=resource.api_version,
+                        kind=resource.kind,
+                        name=resource.name,
+                        namespace=resource.namespace,
+                        action=ResourceAction(resource.action),
+                        previous_state=resource.previous_state_data,
+                        current_state=resource.current_state_data,
+                        checksum=resource.checksum,
+                        source_file=resource.source_file,
+                    ),
+                )
+
+            # Add Helm releases
+            for release in sorted(app_dep.helm_releases, key=lambda r: r.id):
+                detail.helm_releases.append(
+                    HelmReleaseInfo(
+                        release_name=release.release_name,
+                        namespace=release.namespace,
+                        chart=release.chart,
+                        chart_version=release.chart_version,
+                        app_version=release.app_version,
+                        revision=release.revision,
+                        values=release.values_data,
+                        status=release.status,
+                    ),
+                )
+
+        return detail
+
     def get_deployment(self, deployment_id: str) -> DeploymentDetail | None:
         """Get detailed deployment information.
 
@@ -338,80 +481,15 @@ class DeploymentDatabase:
         """
         with self.get_session() as session:
             deployment = (
-                session.query(Deployment).filter_by(deployment_id=deployment_id).first()
+                self._detail_query(session)
+                .filter_by(deployment_id=deployment_id)
+                .first()
             )
 
             if not deployment:
                 return None
 
-            # Build deployment detail
-            detail = DeploymentDetail(
-                deployment_id=deployment.deployment_id,
-                timestamp=deployment.timestamp,
-                cluster=deployment.cluster,
-                namespace=deployment.namespace,
-                app_config_dir=deployment.app_config_dir,
-                status=DeploymentStatus(deployment.status),
-                error_message=deployment.error_message,
-                config_snapshot=deployment.config_snapshot,
-                apps=[],
-                resources=[],
-                helm_releases=[],
-            )
-
-            # Add app deployments and their resources
-            for app_dep in deployment.app_deployments:
-                app_info = {
-                    "id": app_dep.id,
-                    "name": app_dep.app_name,
-                    "type": app_dep.app_type,
-                    "namespace": app_dep.namespace,
-                    "status": app_dep.status,
-                    "error_message": app_dep.error_message,
-                    "config": app_dep.app_config,
-                    "deployment_metadata": app_dep.deployment_metadata,
-                    "rollback_info": app_dep.rollback_info,
-                }
-                detail.apps.append(app_info)
-
-                # Add resources
-                for resource in app_dep.resources:
-                    detail.resources.append(
-                        ResourceInfo(
-                            api_version=resource.api_version,
-                            kind=resource.kind,
-                            name=resource.name,
-                            namespace=resource.namespace,
-                            action=ResourceAction(resource.action),
-                            previous_state=resource.previous_state,
-                            current_state=resource.current_state,
-                            checksum=resource.checksum,
-                            source_file=resource.source_file,
-                        ),
-                    )
-
-                # Add Helm releases
-                helm_releases = (
-                    session.query(HelmRelease)
-                    .filter_by(app_deployment_id=app_dep.id)
-                    .all()
-                )
-
-                for release in helm_releases:
-                    detail.helm_releases.append(
-                        HelmReleaseInfo(
-                            release_name=release.release_name,
-                            namespace=release.namespace,
-                            chart=release.chart,
-                            chart_version=release.chart_version,
-                            app_version=release.app_version,
-                            revision=release.revision,
-                            values=release.values,
-                            status=release.status,
-                        ),
-                    )
-
-            return detail
+            return self._build_detail(deployment)
 
     def list_deployments(
         self,
@@ -435,56 +513,75 @@ class DeploymentDatabase:
 
         """
         with self.get_session() as session:
-            query = session.query(Deployment)
+            # 앱 상태 집계 (COUNT ... GROUP BY deployment_id)
+            app_counts = (
+                select(
+                    AppDeployment.deployment_id.label("deployment_id"),
+                    func.count().label("app_count"),
+                    func.sum(
+                        case(
+                            (AppDeployment.status == DeploymentStatus.SUCCESS.value, 1),
+                            else_=0,
+                        )
+                    ).label("success_count"),
+                    func.sum(
+                        case(
+                            (
+                                AppDeployment.status.in_(
+                                    [
+                                        DeploymentStatus.FAILED.value,
+                                        DeploymentStatus.PARTIALLY_FAILED.value,
+                                    ]
+                                ),
+                                1,
+                            ),
+                            else_=0,
+                        )
+                    ).label("failed_count"),
+                )
+                .group_by(AppDeployment.deployment_id)
+                .subquery()
+            )
+
+            query = session.query(
+                Deployment,
+                func.coalesce(app_counts.c.app_count, 0),
+                func.coalesce(app_counts.c.success_count, 0),
+                func.coalesce(app_counts.c.failed_count, 0),
+            ).outerjoin(app_counts, app_counts.c.deployment_id == Deployment.id)
 
             if cluster:
-                query = query.filter_by(cluster=cluster)
+                query = query.filter(Deployment.cluster == cluster)
             if namespace:
-                query = query.filter_by(namespace=namespace)
+                query = query.filter(Deployment.namespace == namespace)
 
             # Phase 5: Filter by app-group
             if app_group:
-                query = query.join(AppDeployment).filter(
-                    AppDeployment.app_group == app_group
+                query = query.filter(
+                    Deployment.id.in_(
+                        select(AppDeployment.deployment_id).where(
+                            AppDeployment.app_group == app_group
+                        )
+                    )
                 )
 
             query = query.order_by(Deployment.timestamp.desc())
             query = query.limit(limit).offset(offset)
 
-            summaries = []
-            for deployment in query:
-                # Count app statuses
-                total_apps = len(deployment.app_deployments)
-                success_apps = sum(
-                    1
-                    for app in deployment.app_deployments
-                    if app.status == DeploymentStatus.SUCCESS.value
-                )
-                failed_apps = sum(
-                    1
-                    for app in deployment.app_deployments
-                    if app.status
-                    in [
-                        DeploymentStatus.FAILED.value,
-                        DeploymentStatus.PARTIALLY_FAILED.value,
-                    ]
+            return [
+                DeploymentSummary(
+                    deployment_id=deployment.deployment_id,
+                    timestamp=deployment.timestamp,
+                    cluster=deployment.cluster,
+                    namespace=deployment.namespace,
+                    status=DeploymentStatus(deployment.status),
+                    app_count=total_apps,
+                    success_count=success_apps,
+                    failed_count=failed_apps,
+                    error_message=deployment.error_message,
                 )
-
-                summaries.append(
-                    DeploymentSummary(
-                        deployment_id=deployment.deployment_id,
-                        timestamp=deployment.timestamp,
-                        cluster=deployment.cluster,
-                        namespace=deployment.namespace,
-                        status=DeploymentStatus(deployment.status),
-                        app_count=total_apps,
-                        success_count=success_apps,
-                        failed_count=failed_apps,
-                        error_message=deployment.error_message,
-                    ),
-                )
-
-            return summaries
+                for deployment, total_apps, success_apps, failed_apps in query
+            ]
 
     def get_latest_deployment(
         self,
@@ -505,7 +602,7 @@ class DeploymentDatabase:
         """
         with self.get_session() as session:
             deployment = (
-                session.query(Deployment)
+                self._detail_query(session)
                 .filter_by(
                     cluster=cluster,
                     namespace=namespace,
@@ -516,7 +613,7 @@ class DeploymentDatabase:
             )
 
             if deployment:
-                return self.get_deployment(deployment.deployment_id)
+                return self._build_detail(deployment)
 
             return None
 
@@ -540,7 +637,7 @@ class DeploymentDatabase:
         """
         with self.get_session() as session:
             deployment = (
-                session.query(Deployment)
+                self._detail_query(session)
                 .filter_by(
                     cluster=cluster,
                     app_config_dir=app_config_dir,
@@ -550,10 +647,152 @@ class DeploymentDatabase:
             )
 
             if deployment:
-                return self.get_deployment(deployment.deployment_id)
+                return self._build_detail(deployment)
 
             return None
 
+    def get_latest_statuses(
+        self,
+        cluster: str,
+        app_config_dirs: list[str],
+        namespace: str | None = None,
+    ) -> dict[str, DeploymentStatusInfo]:
+        """Get status of the latest deployment for each app config dir.
+
+        Status-only lookup for dependency checks: resources, helm releases
+        and config snapshots are not loaded, and all directories are
+        resolved in a single query.
+
+        Args:
+            cluster: Cluster name
+            app_config_dirs: Application configuration directories (absolute paths)
+            namespace: Restrict to this namespace (None = any namespace)
+
+        Returns:
+            Mapping of app_config_dir to its latest status (missing if never deployed)
+
+        """
+        return self._latest_statuses(
+            Deployment.app_config_dir, cluster, app_config_dirs, namespace
+        )
+
+    def get_latest_statuses_by_dir_name(
+        self,
+        cluster: str,
+        dir_names: list[str],
+        namespace: str | None = None,
+    ) -> dict[str, DeploymentStatusInfo]:
+        """Get status of the latest deployment for each app config dir name.
+
+        Fallback for records whose app_config_dir path differs from the
+        current one (e.g. the project was moved), matched by the last path
+        component only.
+
+        Args:
+            cluster: Cluster name
+            dir_names: App-group directory names (e.g. "a000_infra_network")
+            namespace: Restrict to this namespace (None = any namespace)
+
+        Returns:
+            Mapping of dir name to its latest status (missing if never deployed)
+
+        """
+        return self._latest_statuses(
+            Deployment.app_config_dir_name, cluster, dir_names, namespace
+        )
+
+    def _latest_statuses(
+        self,
+        key_column,
+        cluster: str,
+        keys: list[str],
+        namespace: str | None,
+    ) -> dict[str, DeploymentStatusInfo]:
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        conditions = [Deployment.cluster == cluster, key_column.in_(keys)]
+        if namespace:
+            conditions.append(Deployment.namespace == namespace)
+
+        ranked = (
+            select(
+                key_column.label("key"),
+                Deployment.app_config_dir,
+                Deployment.status,
+                Deployment.timestamp,
+                Deployment.namespace,
+                func.row_number()
+                .over(
+                    partition_by=key_column,
+                    order_by=(Deployment.timestamp.desc(), Deployment.id.desc()),
+                )
+                .label("rank"),
+            )
+            .where(*conditions)
+            .subquery()
+        )
+
+        with self.get_session() as session:
+            rows = session.execute(select(ranked).where(ranked.c.rank == 1))
+            return {
+                row.key: DeploymentStatusInfo(
+                    app_config_dir=row.app_config_dir,
+                    status=DeploymentStatus(row.status),
+                    timestamp=row.timestamp,
+                    namespace=row.namespace,
+                )
+                for row in rows
+            }
+
+    def get_latest_app_metadata(
+        self,
+        cluster: str,
+        app_config_dir: str,
+    ) -> dict[str, dict[str, Any]]:
+        """Get deployment metadata of each app's latest successful deployment.
+
+        Only apps whose most recent (non dry-run) app deployment succeeded
+        are returned, so a later failed attempt hides an older success.
+
+        Args:
+            cluster: Cluster name
+            app_config_dir: Application configuration directory (absolute path)
+
+        Returns:
+            Mapping of app name to its deployment_metadata (empty dict if none)
+
+        """
+        ranked = (
+            select(
+                AppDeployment.app_name,
+                AppDeployment.status,
+                AppDeployment.deployment_metadata,
+                func.row_number()
+                .over(
+                    partition_by=AppDeployment.app_name,
+                    order_by=(Deployment.timestamp.desc(), AppDeployment.id.desc()),
+                )
+                .label("rank"),
+            )
+            .join(Deployment, AppDeployment.deployment_id == Deployment.id)
+            .where(
+                Deployment.cluster == cluster,
+                Deployment.app_config_dir == app_config_dir,
+                Deployment.dry_run.is_(False),
+            )
+            .subquery()
+        )
+
+        with self.get_session() as session:
+            rows = session.execute(select(ranked).where(ranked.c.rank == 1))
+            return {
+                row.app_name: row.deployment_metadata or {}
+                for row in rows
+                if row.status == DeploymentStatus.SUCCESS.value
+            }
+
     def cleanup_old_deployments(
         self,
         days_to_keep: int = 30,
@@ -569,25 +808,240 @@ class DeploymentDatabase:
             Number of deployments deleted
 
         """
+        return self.prune_deployments(
+            keep_per_group=max_deployments_per_app,
+            older_than_days=days_to_keep,
+        )
+
+    def prune_deployments(
+        self,
+        keep_per_group: int | None = None,
+        older_than_days: int | None = None,
+    ) -> int:
+        """Delete deployments beyond the retention policy.
+
+        A deployment is deleted when it is not among the newest
+        ``keep_per_group`` deployments of its app group (same cluster,
+        namespace and app_config_dir), or when it is older than
+        ``older_than_days``.
+
+        Args:
+            keep_per_group: Number of newest deployments to keep per app group
+            older_than_days: Delete deployments older than this many days
+
+        Returns:
+            Number of deployments deleted
+
+        """
+        conditions = []
+        if keep_per_group is not None:
+            ranked = select(
+                Deployment.id,
+                func.row_number()
+                .over(
+                    partition_by=(
+                        Deployment.cluster,
+                        Deployment.namespace,
+                        Deployment.app_config_dir,
+                    ),
+                    order_by=(Deployment.timestamp.desc(), Deployment.id.desc()),
+                )
+                .label("rank"),
+            ).subquery()
+            conditions.append(
+                Deployment.id.in_(
+                    select(ranked.c.id).where(ranked.c.rank > keep_per_group)
+                )
+            )
+        if older_than_days is not None:
+            cutoff = utc_now() - timedelta(days=older_than_days)
+            conditions.append(Deployment.timestamp < cutoff)
+        if not conditions:
+            return 0
+
+        with self.get_session() as session:
+            doomed = list(
+                session.scalars(select(Deployment.id).where(or_(*conditions)))
+            )
+            for start in range(0, len(doomed), _DELETE_BATCH_SIZE):
+                batch = doomed[start : start + _DELETE_BATCH_SIZE]
+                app_ids = select(AppDeployment.id).where(
+                    AppDeployment.deployment_id.in_(batch)
+                )
+                session.execute(
+                    delete(DeployedResource).where(
+                        DeployedResource.app_deployment_id.in_(app_ids)
+                    )
+                )
+                session.execute(
+                    delete(HelmRelease).where(HelmRelease.app_deployment_id.in_(app_ids))
+                )
+                session.execute(
+                    delete(AppDeployment).where(AppDeployment.deployment_id.in_(batch))
+                )
+                # perf history outlives the deployment it was linked to
+                session.execute(
+                    update(PerfSample)
+                    .where(PerfSample.deployment_id.in_(batch))
+                    .values(deployment_id=None)
+                )
+                session.execute(delete(Deployment).where(Deployment.id.in_(batch)))
+
+            return len(doomed)
+
+    def add_perf_samples(
+        self,
+        run_id: str,
+        command: str,
+        app_config_dir: str,
+        samples: list[dict[str, Any]],
+        started_at: Any | None = None,
+    ) -> int:
+        """Store the perf samples of one run.
+
+        Args:
+            run_id: Unique run identifier
+            command: Command that produced the run (apply, ...)
+            app_config_dir: App config directory of the run
+            samples: Dicts with app_name, category, name, duration_seconds, calls
+            started_at: Run start time; the newest deployment of the same
+                app_config_dir created since then is linked to the samples
+
+        Returns:
+            Number of samples stored
+
+        """
+        return self.add_perf_runs(
+            [
+                {
+                    "run_id": run_id,
+                    "command": command,
+                    "app_config_dir": app_config_dir,
+                    "samples": samples,
+                    "started_at": started_at,
+                }
+            ]
+        )
+
+    def add_perf_runs(self, runs: list[dict[str, Any]]) -> int:
+        """Store the perf samples of several runs in a single transaction.
+
+        Args:
+            runs: Dicts with the arguments of :meth:`add_perf_samples`
+                (run_id, command, app_config_dir, samples, started_at)
+
+        Returns:
+            Number of samples stored
+
+        """
+        runs = [run for run in runs if run.get("samples")]
+        if not runs:
+            return 0
+
+        stored = 0
         with self.get_session() as session:
-            # Delete deployments older than specified days
-            cutoff_date = text(f"datetime('now', '-{days_to_keep} days')")
+            for run in runs:
+                app_config_dir = run["app_config_dir"]
+                started_at = run.get("started_at")
+                deployment_id = None
+                if started_at is not None:
+                    deployment_id = session.scalar(
+                        select(Deployment.id)
+                        .where(
+                            Deployment.app_config_dir == app_config_dir,
+                            Deployment.timestamp >= started_at,
+                        )
+                        .order_by(Deployment.timestamp.desc())
+                        .limit(1)
+                    )
+                session.add_all(
+                    PerfSample(
+                        run_id=run["run_id"],
+                        deployment_id=deployment_id,
+                        command=run["command"],
+                        app_config_dir=app_config_dir,
+                        **sample,
+                    )
+                    for sample in run["samples"]
+                )
+                stored += len(run["samples"])
+            return stored
 
-            old_deployments = (
-                session.query(Deployment)
-                .filter(Deployment.timestamp < cutoff_date)
-                .all()
+    def get_perf_samples(
+        self,
+        app_group: str | None = None,
+        command: str = "apply",
+        last_runs: int = 20,
+    ) -> list[PerfSampleInfo]:
+        """Get perf samples of the most recent runs, oldest run first.
+
+        Args:
+            app_group: Filter by app config directory name
+            command: Command whose runs are returned
+            last_runs: Number of most recent runs to include
+
+        Returns:
+            List of perf samples
+
+        """
+        with self.get_session() as session:
+            # 샘플 ID는 삽입 순서이므로 run의 첫 ID로 실행 순서를 정함
+            runs = (
+                select(PerfSample.run_id, func.min(PerfSample.id).label("first_id"))
+                .where(PerfSample.command == command)
+                .group_by(PerfSample.run_id)
+            )
+            if app_group:
+                runs = runs.where(
+                    PerfSample.app_config_dir_name == app_config_dir_name(app_group)
+                )
+            recent = (
+                runs.order_by(func.min(PerfSample.id).desc())
+                .limit(last_runs)
+                .subquery()
+            )
+            rows = session.scalars(
+                select(PerfSample)
+                .join(recent, recent.c.run_id == PerfSample.run_id)
+                .order_by(recent.c.first_id, PerfSample.id)
             )
+            return [PerfSampleInfo.model_validate(row) for row in rows]
 
-            deleted_count = len(old_deployments)
+    def get_app_group_duration_estimates(
+        self, app_groups: list[str], last_runs: int = 10
+    ) -> dict[str, float]:
+        """Estimate app group apply durations from recorded perf runs.
 
-            for deployment in old_deployments:
-                session.delete(deployment)
+        Args:
+            app_groups: App config directory names
+            last_runs: Most recent runs considered per app group
+
+        Returns:
+            Dict mapping app group name to median run duration in seconds
+            (app groups without perf history are omitted)
+
+        """
+        if not app_groups:
+            return {}
 
-            # max_deployments_per_app cleanup is handled by the query above
-            # (ORDER BY timestamp DESC + OFFSET logic)
+        with self.get_session() as session:
+            rows = session.execute(
+                select(PerfSample.app_config_dir_name, PerfSample.duration_seconds)
+                .where(
+                    PerfSample.category == "run",
+                    PerfSample.app_config_dir_name.in_(app_groups),
+                )
+                .order_by(PerfSample.id.desc())
+            )
+            durations: dict[str, list[float]] = {}
+            for name, duration in rows:
+                samples = durations.setdefault(name, [])
+                if len(samples) < last_runs:
+                    samples.append(duration)
 
-            return deleted_count
+        return {
+            name: statistics.median(samples) for name, samples in durations.items()
+        }
 
     @staticmethod
     def compute_resource_checksum(resource_data: dict[str, Any]) -> str:
@@ -0,0 +1,425 @@
+"""Desired-state digests for ``deploy --skip-unchanged``.
+
+Each Helm/YAML app deploy computes a digest of everything that determines
+what ends up in the cluster:
+
+- Helm: chart tree digest, values files (content digest, including the
+  temporary cluster global values file), ``--set`` values, injected labels
+  and the helm flags (namespace, wait, atomic, timeout, ...)
+- YAML: the manifests after label injection and the ``kubectl apply`` flags
+
+The ``sbkube.io/deployed-at`` annotation changes on every run, so it is left
+out of the digest (it is metadata about the deploy, not desired state).
+
+Every non-dry-run deploy stores the digest in the ``AppDeployment`` record's
+``deployment_metadata`` (YAML apps also store the resources kubectl applied).
+With ``--skip-unchanged`` an app is skipped when its digest equals the one of
+its latest successful deployment and the cluster still holds what that deploy
+produced: for Helm apps the live release is ``deployed`` at the recorded
+revision (so a manual ``helm upgrade``/``rollback`` forces a redeploy), for
+YAML apps every recorded resource still exists (so ``sbkube delete`` or a
+manual ``kubectl delete`` forces a redeploy).
+"""
+
+import hashlib
+import json
+import re
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from sbkube import __version__
+from sbkube.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from sbkube.state.tracker import DeploymentTracker
+
+logger = get_logger()
+
+DIGEST_FORMAT_VERSION = 1
+METADATA_KEY = "desired_state"
+
+_HELM_REVISION_PATTERN = re.compile(r"^REVISION:\s*(\d+)", re.MULTILINE)
+
+# (kubeconfig, context)
+ClusterKey = tuple[str | None, str | None]
+
+
+def _digest(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return f"sha256:{hashlib.sha256(raw.encode()).hexdigest()}"
+
+
+def compute_helm_digest(command: list[str], chart_path: Path) -> str:
+    """Desired-state digest of a Helm app.
+
+    Args:
+        command: ``helm upgrade --install`` command with values files,
+            ``--set`` values and labels (without annotations, dry-run flag
+            and cluster options)
+        chart_path: Chart directory that will be installed
+
+    Returns:
+        sha256 digest
+
+    """
+    from sbkube.utils.render_cache import get_helm_version, helm_input_args
+
+    return _digest(
+        {
+            "version": DIGEST_FORMAT_VERSION,
+            "sbkube": __version__,
+            "helm": get_helm_version(),
+            "type": "helm",
+            "command": helm_input_args(command, chart_path),
+        }
+    )
+
+
+def compute_yaml_digest(documents: list[tuple[str, str]], command: list[str]) -> str:
+    """Desired-state digest of a YAML app.
+
+    Args:
+        documents: (manifest file, content after label injection) pairs
+        command: ``kubectl apply`` command without the ``-f`` source
+
+    Returns:
+        sha256 digest
+
+    """
+    return _digest(
+        {
+            "version": DIGEST_FORMAT_VERSION,
+            "sbkube": __version__,
+            "type": "yaml",
+            "command": command,
+            "documents": [
+                [name, hashlib.sha256(content.encode()).hexdigest()]
+                for name, content in documents
+            ],
+        }
+    )
+
+
+def parse_helm_revision(stdout: str) -> int | None:
+    """Release revision from ``helm upgrade --install`` output."""
+    match = _HELM_REVISION_PATTERN.search(stdout)
+    return int(match.group(1)) if match else None
+
+
+@dataclass
+class AppDesiredState:
+    """Desired state of one app in one deploy."""
+
+    app_name: str
+    app_type: str
+    app_config_dir: Path
+    digest: str
+    namespace: str | None = None
+    kubeconfig: str | None = None
+    context: str | None = None
+    release_name: str | None = None
+
+
+@dataclass
+class _AppGroupRecord:
+    deployment_id: str
+    record_id: int
+    succeeded: int = 0
+    failed: int = 0
+
+
+def _generate_deployment_id() -> str:
+    # DeploymentTracker와 같은 형식
+    timestamp = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
+    return f"dep-{timestamp}-{str(uuid.uuid4())[:8]}"
+
+
+class DesiredStateStore:
+    """Per-run view of stored digests plus recording of new ones.
+
+    Previous digests and live Helm releases are looked up once per app group
+    and cluster; parallel app deploys share the store. Database errors never
+    fail a deploy: lookups then report "changed" and recording is skipped.
+    """
+
+    def __init__(self, db_path: str | Path | None = None) -> None:
+        """DesiredStateStore 초기화.
+
+        Args:
+            db_path: State DB 경로 (None이면 기본 경로)
+
+        """
+        self._db_path = db_path
+        self._db = None
+        self._lock = threading.RLock()
+        self._clusters: dict[ClusterKey, str] = {}
+        self._previous: dict[tuple[str, str], dict[str, dict[str, Any]]] = {}
+        self._releases: dict[ClusterKey, dict[tuple[str, str], dict] | None] = {}
+        # app_config_dir → (config file, config snapshot)
+        self._group_configs: dict[str, tuple[str, dict[str, Any]]] = {}
+        # (cluster, app_config_dir) → 이번 실행의 deployment record
+        self._groups: dict[tuple[str, str], _AppGroupRecord] = {}
+        self.skipped: list[str] = []
+        self.time_saved = 0.0
+
+    @property
+    def db(self):
+        """Lazily opened DeploymentDatabase."""
+        with self._lock:
+            if self._db is None:
+                from sbkube.state.database import DeploymentDatabase
+
+                self._db = DeploymentDatabase(self._db_path)
+            return self._db
+
+    def cluster_name(self, kubeconfig: str | None, context: str | None) -> str:
+        """Cluster identifier used for state records (kubectl context name)."""
+        key = (kubeconfig, context)
+        with self._lock:
+            if key not in self._clusters:
+                if context:
+                    self._clusters[key] = context
+                else:
+                    from sbkube.utils.deployment_checker import get_current_cluster
+
+                    self._clusters[key] = get_current_cluster()
+            return self._clusters[key]
+
+    def register_app_group(
+        self,
+        app_config_dir: Path,
+        config_file_path: Path,
+        config_snapshot: dict[str, Any],
+    ) -> None:
+        """Remember config file and snapshot for the app group's deployment record."""
+        with self._lock:
+            self._group_configs[str(app_config_dir)] = (
+                str(config_file_path),
+                config_snapshot,
+            )
+
+    def _previous_metadata(self, state: AppDesiredState) -> dict[str, Any] | None:
+        cluster = self.cluster_name(state.kubeconfig, state.context)
+        key = (cluster, str(state.app_config_dir))
+        with self._lock:
+            if key not in self._previous:
+                try:
+                    self._previous[key] = self.db.get_latest_app_metadata(
+                        cluster, str(state.app_config_dir)
+                    )
+                except Exception as e:
+                    logger.verbose(f"Failed to read desired state history: {e}")
+                    self._previous[key] = {}
+            return self._previous[key].get(state.app_name, {}).get(METADATA_KEY)
+
+    def _live_release(self, state: AppDesiredState) -> dict | None:
+        cluster = (state.kubeconfig, state.context)
+        with self._lock:
+            if cluster not in self._releases:
+                from sbkube.utils.helm_util import get_all_helm_releases
+
+                try:
+                    releases = get_all_helm_releases(
+                        context=state.context, kubeconfig=state.kubeconfig
+                    )
+                    self._releases[cluster] = {
+                        (release.get("namespace"), release.get("name")): release
+                        for release in releases
+                    }
+                except Exception as e:
+                    logger.verbose(f"Failed to list Helm releases: {e}")
+                    self._releases[cluster] = None
+            releases = self._releases[cluster]
+        if releases is None:
+            return None
+        return releases.get((state.namespace or "default", state.release_name))
+
+    def _resources_exist(
+        self, state: AppDesiredState, resources: list[list[str | None]] | None
+    ) -> bool:
+        if resources is None:
+            # 리소스 목록 없이 기록된 배포는 검증할 수 없음
+            return False
+
+        from sbkube.utils.cluster_config import apply_cluster_config_to_command
+        from sbkube.utils.common import run_command
+
+        by_namespace: dict[str | None, set[str]] = {}
+        for namespace, resource in resources:
+            by_namespace.setdefault(namespace, set()).add(resource)
+
+        for namespace, names in by_namespace.items():
+            cmd = ["kubectl", "get", *sorted(names), "-o", "name", "--ignore-not-found"]
+            if namespace:
+                cmd.extend(["--namespace", namespace])
+            cmd = apply_cluster_config_to_command(cmd, state.kubeconfig, state.context)
+            try:
+                return_code, stdout, _ = run_command(cmd, timeout=60)
+            except Exception as e:
+                logger.verbose(f"Failed to check resources of {state.app_name}: {e}")
+                return False
+            if return_code != 0 or len(stdout.split()) < len(names):
+                return False
+        return True
+
+    def is_unchanged(self, state: AppDesiredState) -> bool:
+        """Whether the app's last successful deploy had the same desired state.
+
+        Args:
+            state: Desired state of the app in this deploy
+
+        Returns:
+            True if the deploy can be skipped
+
+        """
+        previous = self._previous_metadata(state)
+        if not previous or previous.get("digest") != state.digest:
+            return False
+
+        if state.app_type == "helm":
+            release = self._live_release(state)
+            if release is None or release.get("status") != "deployed":
+                return False
+            try:
+                live_revision = int(release.get("revision"))
+            except (TypeError, ValueError):
+                return False
+            if live_revision != previous.get("helm_revision"):
+                return False
+        elif state.app_type == "yaml":
+            if not self._resources_exist(state, previous.get("resources")):
+                return False
+
+        with self._lock:
+            self.skipped.append(state.app_name)
+            self.time_saved += float(previous.get("duration_seconds") or 0.0)
+        return True
+
+    def record(
+        self,
+        state: AppDesiredState,
+        success: bool,
+        duration: float,
+        app_config: dict[str, Any] | None = None,
+        helm_revision: int | None = None,
+        error_message: str | None = None,
+        resources: list[list[str | None]] | None = None,
+    ) -> int | None:
+        """Store the outcome of an app deploy (best-effort).
+
+        All apps of an app group deployed in this run share one deployment
+        record; its status reflects every app recorded so far.
+
+        Args:
+            state: Desired state that was deployed
+            success: Whether the deploy succeeded
+            duration: Deploy wall time in seconds
+            app_config: App configuration snapshot
+            helm_revision: Release revision produced by the deploy (Helm apps)
+            error_message: Failure reason
+            resources: ``[namespace, "resource/name"]`` pairs applied by
+                kubectl (YAML apps), checked before a later skip
+
+        Returns:
+            ID of the app deployment record, or None if recording failed
+
+        """
+        from sbkube.models.deployment_state import (
+            AppDeploymentCreate,
+            DeploymentCreate,
+            DeploymentStatus,
+        )
+
+        cluster = self.cluster_name(state.kubeconfig, state.context)
+        app_config_dir = str(state.app_config_dir)
+        metadata = {
+            METADATA_KEY: {
+                "digest": state.digest,
+                "duration_seconds": round(duration, 3),
+                "helm_revision": helm_revision,
+            }
+        }
+        if resources is not None:
+            metadata[METADATA_KEY]["resources"] = resources
+
+        try:
+            with self._lock:
+                group = self._groups.get((cluster, app_config_dir))
+                if group is None:
+                    config_file_path, config_snapshot = self._group_configs.get(
+                        app_config_dir, (app_config_dir, {})
+                    )
+                    deployment = self.db.create_deployment(
+                        DeploymentCreate(
+                            deployment_id=_generate_deployment_id(),
+                            cluster=cluster,
+                            namespace=state.namespace or "default",
+                            app_config_dir=app_config_dir,
+                            config_file_path=config_file_path,
+                            command="deploy",
+                            config_snapshot=config_snapshot,
+                            sbkube_version=__version__,
+                        )
+                    )
+                    group = _AppGroupRecord(deployment.deployment_id, deployment.id)
+                    self._groups[(cluster, app_config_dir)] = group
+                if success:
+                    group.succeeded += 1
+                else:
+                    group.failed += 1
+                if not group.failed:
+                    group_status = DeploymentStatus.SUCCESS
+                elif group.succeeded:
+                    group_status = DeploymentStatus.PARTIALLY_FAILED
+                else:
+                    group_status = DeploymentStatus.FAILED
+
+            app_deployment = self.db.add_app_deployment(
+                group.record_id,
+                AppDeploymentCreate(
+                    app_name=state.app_name,
+                    app_type=state.app_type,
+                    namespace=state.namespace,
+                    app_config=app_config or {},
+                    deployment_metadata=metadata,
+                ),
+            )
+            rollback_info = None
+            if state.app_type == "helm" and success and helm_revision is not None:
+                rollback_info = {
+                    "type": "helm",
+                    "release_name": state.release_name,
+                    "namespace": state.namespace,
+                    "revision": helm_revision,
+                }
+            self.db.update_app_deployment_status(
+                app_deployment.id,
+                DeploymentStatus.SUCCESS if success else DeploymentStatus.FAILED,
+                error_message=error_message,
+                rollback_info=rollback_info,
+            )
+            self.db.update_deployment_status(group.deployment_id, group_status)
+        except Exception as e:
+            logger.verbose(f"Failed to record desired state of {state.app_name}: {e}")
+            return None
+        return app_deployment.id
+
+    def resource_tracker(self, app_deployment_id: int) -> "DeploymentTracker":
+        """DeploymentTracker that records resources under an app deployment record.
+
+        Args:
+            app_deployment_id: ID returned by :meth:`record`
+
+        Returns:
+            Tracker sharing this store's database
+
+        """
+        from sbkube.state.tracker import DeploymentTracker
+
+        tracker = DeploymentTracker(db=self.db)
+        tracker.current_app_deployment_id = app_deployment_id
+        return tracker
@@ -0,0 +1,246 @@
+"""Persistent perf history and regression detection.
+
+With ``SBKUBE_PERF=1`` each app group apply is recorded as a run in the
+``perf_samples`` table: per-app stage timings (prepare/build/deploy),
+per-app subprocess time by tool (helm, kubectl, ...) and the run total.
+``sbkube history --perf`` summarizes the last N runs as p50/p95 per app and
+stage and flags stages whose recent runs are slower than their baseline.
+"""
+
+import uuid
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sbkube.models.deployment_state import PerfSampleInfo
+from sbkube.utils.datetime_utils import utc_now
+from sbkube.utils.logger import get_logger
+from sbkube.utils.perf import PerfEvent, current_span_id, get_perf_recorder, perf_timer
+
+logger = get_logger()
+
+DEFAULT_LAST_RUNS = 20
+DEFAULT_RECENT_RUNS = 3
+DEFAULT_REGRESSION_THRESHOLD = 0.2  # 20% slower than baseline p50
+REGRESSION_STAGES = ("prepare", "deploy")
+
+# deferred_perf_runs() 활성 시 DB 대신 여기에 run을 모음 (process worker용)
+_deferred_runs: list[dict[str, Any]] | None = None
+
+
+def collect_samples(events: list[PerfEvent], root_span_id: int) -> list[dict[str, Any]]:
+    """Aggregate the span tree under ``root_span_id`` into perf samples.
+
+    Stage spans (``stage.<name>``) become ``stage`` samples of their app,
+    subprocess events become ``tool`` samples attributed to the nearest
+    ancestor span with an ``app`` tag, and the root span is the ``run`` total.
+    """
+    by_id = {event.span_id: event for event in events}
+
+    def owning_app(event: PerfEvent) -> str | None:
+        current: PerfEvent | None = event
+        while current is not None:
+            app = current.tags.get("app")
+            if app:
+                return str(app)
+            current = by_id.get(current.parent_id) if current.parent_id else None
+        return None
+
+    totals: dict[tuple[str | None, str, str], list[float]] = {}
+    for event in events:
+        if event.span_id == root_span_id:
+            key = (None, "run", "total")
+        elif event.name.startswith("stage."):
+            key = (owning_app(event), "stage", event.name.split(".", 1)[1])
+        elif event.name == "subprocess":
+            key = (owning_app(event), "tool", str(event.tags.get("tool", "unknown")))
+        else:
+            continue
+        duration, calls = totals.get(key, [0.0, 0])
+        totals[key] = [duration + event.duration_seconds, calls + 1]
+
+    return [
+        {
+            "app_name": app_name,
+            "category": category,
+            "name": name,
+            "duration_seconds": duration,
+            "calls": int(calls),
+        }
+        for (app_name, category, name), (duration, calls) in totals.items()
+    ]
+
+
+@contextmanager
+def record_perf_run(
+    app_config_dir: str,
+    command: str = "apply",
+    enabled: bool = True,
+    db_path: Any | None = None,
+) -> Iterator[None]:
+    """Record the wrapped app group run into the state database.
+
+    No-op unless perf recording is enabled (and ``enabled``, which callers
+    clear for dry runs). Storage failures are logged and never fail the run.
+    """
+    recorder = get_perf_recorder()
+    if not enabled or not recorder.enabled:
+        yield
+        return
+
+    started_at = utc_now()
+    span_id = None
+    try:
+        with perf_timer(f"{command}.run", app_group=app_config_dir):
+            span_id = current_span_id()
+            yield
+    finally:
+        if span_id is not None:
+            _store_run(
+                collect_samples(recorder.subtree(span_id), span_id),
+                app_config_dir=app_config_dir,
+                command=command,
+                started_at=started_at,
+                db_path=db_path,
+            )
+
+
+def _store_run(
+    samples: list[dict[str, Any]],
+    app_config_dir: str,
+    command: str,
+    started_at: Any,
+    db_path: Any | None,
+) -> None:
+    run = {
+        "run_id": uuid.uuid4().hex,
+        "command": command,
+        "app_config_dir": app_config_dir,
+        "samples": samples,
+        "started_at": started_at,
+    }
+    if _deferred_runs is not None:
+        _deferred_runs.append(run)
+        return
+    store_perf_runs([run], db_path=db_path)
+
+
+@contextmanager
+def deferred_perf_runs() -> Iterator[list[dict[str, Any]]]:
+    """Collect runs recorded inside the block instead of writing them.
+
+    Used by app-group worker processes: the collected runs are returned to
+    the parent, which stores them with :func:`store_perf_runs`.
+    """
+    global _deferred_runs
+    previous = _deferred_runs
+    _deferred_runs = runs = []
+    try:
+        yield runs
+    finally:
+        _deferred_runs = previous
+
+
+def store_perf_runs(runs: list[dict[str, Any]], db_path: Any | None = None) -> None:
+    """Store perf runs in one transaction (best-effort)."""
+    try:
+        from sbkube.state.database import DeploymentDatabase
+
+        DeploymentDatabase(db_path).add_perf_runs(runs)
+    except Exception as e:  # noqa: BLE001 - perf history is best-effort
+        logger.verbose(f"Failed to store perf history: {e}")
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Percentile with linear interpolation between closest ranks."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@dataclass
+class PerfStat:
+    """Timing statistics of one app/stage (or app/tool) over recent runs."""
+
+    app_name: str | None
+    category: str
+    name: str
+    runs: int
+    p50: float
+    p95: float
+    latest: float
+    baseline_p50: float | None = None
+    recent_p50: float | None = None
+    regressed: bool = False
+
+    @property
+    def change(self) -> float | None:
+        """Relative change of recent p50 against baseline p50."""
+        if not self.baseline_p50 or self.recent_p50 is None:
+            return None
+        return (self.recent_p50 - self.baseline_p50) / self.baseline_p50
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "change": self.change}
+
+
+def analyze_perf_history(
+    samples: list[PerfSampleInfo],
+    recent_runs: int = DEFAULT_RECENT_RUNS,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    regression_stages: tuple[str, ...] = REGRESSION_STAGES,
+) -> list[PerfStat]:
+    """Compute p50/p95 per app and stage and flag regressions.
+
+    The last ``recent_runs`` runs of each series are compared against the
+    runs before them: a series in ``regression_stages`` is flagged when its
+    recent p50 exceeds the baseline p50 by more than ``threshold``.
+
+    Args:
+        samples: Perf samples ordered oldest run first
+        recent_runs: Number of newest runs compared against the baseline
+        threshold: Relative slowdown that counts as a regression
+        regression_stages: Stage names checked for regressions
+
+    Returns:
+        Statistics per (app, category, name), regressions first, then by p50
+
+    """
+    series: dict[tuple[str | None, str, str], list[float]] = defaultdict(list)
+    for sample in samples:
+        series[(sample.app_name, sample.category, sample.name)].append(
+            sample.duration_seconds
+        )
+
+    stats = []
+    for (app_name, category, name), durations in series.items():
+        stat = PerfStat(
+            app_name=app_name,
+            category=category,
+            name=name,
+            runs=len(durations),
+            p50=_percentile(durations, 50),
+            p95=_percentile(durations, 95),
+            latest=durations[-1],
+        )
+        baseline, recent = durations[:-recent_runs], durations[-recent_runs:]
+        if baseline:
+            stat.baseline_p50 = _percentile(baseline, 50)
+            stat.recent_p50 = _percentile(recent, 50)
+            change = stat.change
+            stat.regressed = (
+                category == "stage"
+                and name in regression_stages
+                and change is not None
+                and change > threshold
+            )
+        stats.append(stat)
+
+    stats.sort(key=lambda s: (not s.regressed, -s.p50))
+    return stats
@@ -2,9 +2,18 @@
 
 This module provides the rollback mechanism to restore previous
 deployment states using tracked deployment information.
+
+Apps are rolled back in reverse dependency order (an app is rolled back
+after every app that depends on it), independent apps concurrently with a
+bounded worker pool. All resources of a YAML/action app are restored with
+one multi-document ``kubectl apply`` and deleted with one ``kubectl delete``
+per namespace.
 """
 
 import subprocess
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -15,13 +24,117 @@ from sbkube.models.deployment_state import (
     DeploymentDetail,
     DeploymentStatus,
     ResourceAction,
+    ResourceInfo,
     RollbackRequest,
 )
 from sbkube.state.database import DeploymentDatabase
+from sbkube.utils.app_scheduler import AppScheduler, AppTaskResult, AppTaskStatus
+from sbkube.utils.async_runner import get_command_runner
+from sbkube.utils.common import run_command
 from sbkube.utils.logger import get_logger
+from sbkube.utils.perf import perf_timer
 
 logger = get_logger()
 
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class RollbackPlan:
+    """Apps to roll back and the order constraints between them."""
+
+    # 배포 기록 순서의 앱 정보 (DeploymentDetail.apps 항목)
+    apps: list[dict[str, Any]] = field(default_factory=list)
+    # 앱 이름 → 먼저 롤백해야 하는 앱 이름 (자신에게 의존하는 앱)
+    dependencies: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def app_names(self) -> list[str]:
+        """Names of the apps to roll back (deployment order)."""
+        return [app["name"] for app in self.apps]
+
+    @property
+    def waves(self) -> list[list[str]]:
+        """Apps grouped into waves that can be rolled back concurrently."""
+        remaining = {name: set(deps) for name, deps in self.dependencies.items()}
+        waves: list[list[str]] = []
+        while remaining:
+            wave = [name for name, deps in remaining.items() if not deps]
+            if not wave:  # 순환 의존성: 나머지는 한 번에
+                wave = list(remaining)
+            waves.append(wave)
+            for name in wave:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(wave)
+        return waves
+
+
+def _depends_on(deployment: DeploymentDetail) -> dict[str, list[str]]:
+    """App → depends_on from the recorded app configs and config snapshot."""
+    snapshot_apps = (deployment.config_snapshot or {}).get("apps") or {}
+    graph: dict[str, list[str]] = {}
+    if isinstance(snapshot_apps, dict):
+        for name, app_config in snapshot_apps.items():
+            if isinstance(app_config, dict):
+                graph[name] = list(app_config.get("depends_on") or [])
+    for app in deployment.apps:
+        depends_on = (app.get("config") or {}).get("depends_on")
+        if depends_on:
+            graph[app["name"]] = list(depends_on)
+    return graph
+
+
+def plan_rollback(
+    deployment: DeploymentDetail, app_names: list[str] | None = None
+) -> RollbackPlan:
+    """Plan the rollback of a deployment.
+
+    An app is rolled back only after every app that (transitively) depends on
+    it, following ``depends_on`` through apps that are not rolled back.
+
+    Args:
+        deployment: Deployment to roll back
+        app_names: Apps to roll back (None: all apps of the deployment)
+
+    Returns:
+        RollbackPlan
+
+    """
+    apps = [
+        app
+        for app in deployment.apps
+        if not app_names or app["name"] in app_names
+    ]
+    names = [app["name"] for app in apps]
+
+    dependents: dict[str, set[str]] = {}
+    for name, deps in _depends_on(deployment).items():
+        for dep in deps:
+            dependents.setdefault(dep, set()).add(name)
+
+    dependencies: dict[str, list[str]] = {}
+    for name in names:
+        seen: set[str] = set()
+        stack = list(dependents.get(name, ()))
+        while stack:
+            current = stack.pop()
+            if current in seen or current == name:
+                continue
+            seen.add(current)
+            stack.extend(dependents.get(current, ()))
+        dependencies[name] = [other for other in names if other in seen]
+    return RollbackPlan(apps=apps, dependencies=dependencies)
+
+
+def _resource_ref(resource: ResourceInfo) -> str:
+    """kubectl resource reference (``kind.version.group/name``)."""
+    kind = resource.kind.lower()
+    if "/" in resource.api_version:
+        group, version = resource.api_version.split("/", 1)
+        return f"{kind}.{version}.{group}/{resource.name}"
+    return f"{kind}/{resource.name}"
+
 
 class RollbackManager:
     """Manages rollback operations for deployments.
@@ -30,14 +143,18 @@ class RollbackManager:
     using tracked deployment information.
     """
 
-    def __init__(self, db_path: Path | None = None) -> None:
+    def __init__(
+        self, db_path: Path | None = None, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> None:
         """Initialize rollback manager.
 
         Args:
             db_path: Optional path to database file
+            max_workers: Maximum number of apps rolled back concurrently
 
         """
         self.db = DeploymentDatabase(db_path)
+        self.max_workers = max_workers
 
     def rollback_deployment(self, rollback_request: RollbackRequest) -> dict[str, Any]:
         """Rollback a deployment to a previous state.
@@ -160,6 +277,7 @@ class RollbackManager:
             "target_deployment": (
                 target_deployment.deployment_id if target_deployment else "previous"
             ),
+            "waves": plan_rollback(current_deployment, request.app_names).waves,
             "actions": [],
         }
 
@@ -252,22 +370,55 @@ class RollbackManager:
             "errors": [],
         }
 
-        # Process each app
-        for app in current_deployment.apps:
-            if request.app_names and app["name"] not in request.app_names:
-                continue
+        plan = plan_rollback(current_deployment, request.app_names)
+        apps = {app["name"]: app for app in plan.apps}
+        try:
+            scheduler = AppScheduler(
+                dependencies=plan.dependencies,
+                max_workers=self.max_workers,
+                order=list(reversed(plan.app_names)),
+            )
+        except ValueError as e:
+            raise RollbackError(str(e)) from e
+        get_command_runner().ensure_capacity(self.max_workers)
 
-            try:
-                app_result = self._rollback_app(app, current_deployment)
-                results["rollbacks"].append(app_result)
-            except Exception as e:
-                error_info = {"app": app["name"], "error": str(e)}
-                results["errors"].append(error_info)
-                results["success"] = False
+        def rollback_one(app_name: str) -> dict[str, Any]:
+            with perf_timer("rollback.app", app=app_name):
+                try:
+                    return self._rollback_app(apps[app_name], current_deployment)
+                except Exception as e:
+                    if not request.force:
+                        raise
+                    # --force: 실패해도 이 앱을 기다리는 앱은 계속 롤백
+                    return {"app": app_name, "error": str(e)}
+
+        def on_complete(task_result: AppTaskResult) -> None:
+            payload = task_result.payload or {}
+            duration = round(task_result.duration_seconds, 3)
+            if task_result.status == AppTaskStatus.SUCCESS and "error" not in payload:
+                payload["duration_seconds"] = duration
+                results["rollbacks"].append(payload)
+                return
+
+            if task_result.status == AppTaskStatus.SKIPPED:
+                error = f"skipped: rollback of {task_result.blocked_by} failed"
+            else:
+                error = payload.get("error") or task_result.error
+            results["errors"].append(
+                {"app": task_result.app_name, "error": error, "duration_seconds": duration}
+            )
+            results["success"] = False
+            if task_result.status == AppTaskStatus.FAILED:
+                scheduler.stop(task_result.app_name)
 
-                if not request.force:
-                    msg = f"Rollback failed for app {app['name']}: {e}"
-                    raise RollbackError(msg)
+        started = time.perf_counter()
+        scheduler.run(rollback_one, on_complete=on_complete)
+        results["duration_seconds"] = round(time.perf_counter() - started, 3)
+
+        if not request.force and results["errors"]:
+            error = results["errors"][0]
+            msg = f"Rollback failed for app {error['app']}: {error['error']}"
+            raise RollbackError(msg)
 
         return results
 
@@ -289,15 +440,25 @@ class RollbackManager:
         app_type = app["type"]
         rollback_info = app.get("rollback_info", {})
 
-        result = {"app": app["name"], "type": app_type, "success": True, "actions": []}
+        result = {
+            "app": app["name"],
+            "type": app_type,
+            "success": True,
+            "actions": [],
+            "step_durations": {},
+        }
 
         if app_type == "helm" and rollback_info.get("type") == "helm":
             # Rollback Helm release
+            started = time.perf_counter()
             self._rollback_helm_release(
                 rollback_info["release_name"],
                 rollback_info["namespace"],
                 rollback_info["revision"],
             )
+            result["step_durations"]["helm_rollback"] = round(
+                time.perf_counter() - started, 3
+            )
 
             result["actions"].append(
                 {
@@ -315,64 +476,34 @@ class RollbackManager:
                 if r.source_file and app["name"] in r.source_file
             ]
 
+            # 이전 상태 복원(수정/삭제된 리소스)은 kubectl apply 한 번,
+            # 생성된 리소스 삭제는 namespace별 kubectl delete 한 번
+            restores: list[tuple[str, ResourceInfo]] = []
+            deletes: list[ResourceInfo] = []
             for resource in app_resources:
-                try:
-                    if resource.action == ResourceAction.CREATE:
-                        # Delete created resources
-                        self._delete_resource(
-                            resource.api_version,
-                            resource.kind,
-                            resource.name,
-                            resource.namespace,
-                        )
-
-                        result["actions"].append(
-                            {
-                                "type": "delete",
-                                "resource": f"{resource.kind}/{resource.name}",
-                            },
-                        )
-
-                    elif (
-                        resource.action == ResourceAction.UPDATE
-                        and resource.previous_state
-                    ):
-                        # Restore previous state
-                        self._restore_resource(resource.previous_state)
-
-                        result["actions"].append(
-                            {
-                                "type": "restore",
-                                "resource": f"{resource.kind}/{resource.name}",
-                            },
-                        )
-
-                    elif (
-                        resource.action == ResourceAction.DELETE
-                        and resource.previous_state
-                    ):
-                        # Recreate deleted resources
-                        self._restore_resource(resource.previous_state)
-
-                        result["actions"].append(
-                            {
-                                "type": "recreate",
-                                "resource": f"{resource.kind}/{resource.name}",
-                            },
-                        )
-
-                except Exception as e:
-                    logger.exception(
-                        f"Failed to rollback resource {resource.kind}/{resource.name}: {e}",
-                    )
-                    result["success"] = False
-                    result["actions"].append(
-                        {
-                            "type": "error",
-                            "resource": f"{resource.kind}/{resource.name}",
-                            "error": str(e),
-                        },
-                    )
+                if resource.action == ResourceAction.CREATE:
+                    deletes.append(resource)
+                elif resource.action == ResourceAction.UPDATE and resource.previous_state:
+                    restores.append(("restore", resource))
+                elif resource.action == ResourceAction.DELETE and resource.previous_state:
+                    restores.append(("recreate", resource))
+
+            if restores:
+                self._run_batch(
+                    result,
+                    "restore",
+                    restores,
+                    lambda: self._restore_resources(
+                        [resource.previous_state for _, resource in restores]
+                    ),
+                )
+            if deletes:
+                self._run_batch(
+                    result,
+                    "delete",
+                    [("delete", resource) for resource in deletes],
+                    lambda: self._delete_resources(deletes),
+                )
 
         else:
             logger.warning(f"Rollback not supported for app type: {app_type}")
@@ -410,72 +541,100 @@ class RollbackManager:
             msg = f"Helm rollback failed: {e.stderr}"
             raise RollbackError(msg)
 
-    def _delete_resource(
+    def _run_batch(
         self,
-        api_version: str,
-        kind: str,
-        name: str,
-        namespace: str | None = None,
+        result: dict[str, Any],
+        step: str,
+        entries: list[tuple[str, ResourceInfo]],
+        run: Callable[[], None],
     ) -> None:
-        """Delete a Kubernetes resource.
+        """Run one batched kubectl step and record its actions and duration.
 
         Args:
-            api_version: API version
-            kind: Resource kind
-            name: Resource name
-            namespace: Resource namespace
+            result: App rollback result to update
+            step: Step name for ``step_durations``
+            entries: (action type, resource) pairs covered by the step
+            run: Callable performing the step (raises on failure)
 
         """
-        cmd = ["kubectl", "delete", f"{kind}.{api_version}", name]
-
-        if namespace:
-            cmd.extend(["-n", namespace])
-
-        logger.info(f"Deleting resource: {kind}/{name}")
-
+        started = time.perf_counter()
         try:
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
-            logger.success(f"Resource deleted: {kind}/{name}")
-        except subprocess.CalledProcessError as e:
-            if "NotFound" in e.stderr:
-                logger.warning(f"Resource not found: {kind}/{name}")
-            else:
-                msg = f"Failed to delete resource: {e.stderr}"
-                raise RollbackError(msg)
+            run()
+        except Exception as e:
+            logger.error(f"Failed to {step} resources of {result['app']}: {e}")
+            result["success"] = False
+            result["actions"].extend(
+                {
+                    "type": "error",
+                    "resource": f"{resource.kind}/{resource.name}",
+                    "error": str(e),
+                }
+                for _, resource in entries
+            )
+        else:
+            result["actions"].extend(
+                {"type": action, "resource": f"{resource.kind}/{resource.name}"}
+                for action, resource in entries
+            )
+        result["step_durations"][step] = round(time.perf_counter() - started, 3)
 
-    def _restore_resource(self, resource_state: dict[str, Any]) -> None:
-        """Restore a resource to its previous state.
+    def _delete_resources(self, resources: list[ResourceInfo]) -> None:
+        """Delete resources with one ``kubectl delete`` per namespace.
 
         Args:
-            resource_state: Previous resource state
+            resources: Resources to delete (already deleted ones are ignored)
+
+        Raises:
+            RollbackError: If kubectl fails
 
         """
-        # Write resource to temporary file
-        import tempfile
+        by_namespace: dict[str | None, list[ResourceInfo]] = {}
+        for resource in resources:
+            by_namespace.setdefault(resource.namespace, []).append(resource)
+
+        for namespace, group in by_namespace.items():
+            cmd = [
+                "kubectl",
+                "delete",
+                *(_resource_ref(resource) for resource in group),
+                "--ignore-not-found",
+            ]
+            if namespace:
+                cmd.extend(["-n", namespace])
+
+            names = ", ".join(f"{r.kind}/{r.name}" for r in group)
+            logger.info(f"Deleting resources: {names}")
+            return_code, _, stderr = run_command(cmd)
+            if return_code != 0:
+                msg = f"Failed to delete resources: {stderr}"
+                raise RollbackError(msg)
+            logger.success(f"Resources deleted: {names}")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(resource_state, f)
-            temp_file = f.name
+    def _restore_resources(self, resource_states: list[dict[str, Any]]) -> None:
+        """Restore resources to their previous state with one ``kubectl apply``.
 
-        try:
-            # Apply the resource
-            cmd = ["kubectl", "apply", "-f", temp_file]
-
-            metadata = resource_state.get("metadata", {})
-            kind = resource_state.get("kind", "Resource")
-            name = metadata.get("name", "unknown")
+        Args:
+            resource_states: Previous resource states
 
-            logger.info(f"Restoring resource: {kind}/{name}")
+        Raises:
+            RollbackError: If kubectl fails
 
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
-            logger.success(f"Resource restored: {kind}/{name}")
+        """
+        names = ", ".join(
+            f"{state.get('kind', 'Resource')}/"
+            f"{(state.get('metadata') or {}).get('name', 'unknown')}"
+            for state in resource_states
+        )
+        logger.info(f"Restoring resources: {names}")
 
-        except subprocess.CalledProcessError as e:
-            msg = f"Failed to restore resource: {e.stderr}"
+        return_code, _, stderr = run_command(
+            ["kubectl", "apply", "-f", "-"],
+            input=yaml.safe_dump_all(resource_states, sort_keys=False),
+        )
+        if return_code != 0:
+            msg = f"Failed to restore resources: {stderr}"
             raise RollbackError(msg)
-        finally:
-            # Clean up temporary file
-            Path(temp_file).unlink(missing_ok=True)
+        logger.success(f"Resources restored: {names}")
 
     def get_phase_apps(
         self,
@@ -36,14 +36,19 @@ class DeploymentTracker:
     before and after operations, enabling rollback capabilities.
     """
 
-    def __init__(self, db_path: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        db: DeploymentDatabase | None = None,
+    ) -> None:
         """Initialize deployment tracker.
 
         Args:
             db_path: Optional path to database file
+            db: Already opened database to share (db_path is ignored)
 
         """
-        self.db = DeploymentDatabase(db_path)
+        self.db = db if db is not None else DeploymentDatabase(db_path)
         self.current_deployment_id: str | None = None
         self.current_deployment_record_id: int | None = None
         self.current_app_deployment_id: int | None = None
@@ -5,6 +5,7 @@ This module provides state tracking for workspace multi-phase deployments.
 
 import hashlib
 import os
+import statistics
 from datetime import datetime
 
 from sqlalchemy.orm import Session
@@ -342,6 +343,45 @@ class WorkspaceStateTracker:
             for d in deployments
         ]
 
+    def get_phase_duration_estimates(
+        self, workspace_name: str, samples_per_phase: int = 10
+    ) -> dict[str, float]:
+        """Estimate phase durations from past successful deployments.
+
+        Used by the workspace scheduler to prioritise the critical path.
+
+        Args:
+            workspace_name: Workspace name
+            samples_per_phase: Most recent successful runs considered per phase
+
+        Returns:
+            Dict mapping phase name to median duration in seconds
+            (phases without history are omitted)
+
+        """
+        rows = (
+            self.session.query(PhaseDeployment.phase_name, PhaseDeployment.duration_seconds)
+            .join(WorkspaceDeployment)
+            .filter(
+                WorkspaceDeployment.workspace_name == workspace_name,
+                WorkspaceDeployment.dry_run.is_(False),
+                PhaseDeployment.status == PhaseDeploymentStatus.SUCCESS.value,
+                PhaseDeployment.duration_seconds.is_not(None),
+            )
+            .order_by(PhaseDeployment.completed_at.desc())
+        )
+
+        durations: dict[str, list[int]] = {}
+        for phase_name, duration in rows:
+            samples = durations.setdefault(phase_name, [])
+            if len(samples) < samples_per_phase:
+                samples.append(duration)
+
+        return {
+            phase_name: float(statistics.median(samples))
+            for phase_name, samples in durations.items()
+        }
+
     def get_workspace_deployment_detail(
         self, deployment_id: str
     ) -> WorkspaceDeploymentDetail | None:
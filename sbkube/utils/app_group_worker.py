@@ -0,0 +1,296 @@
+"""Process-pool execution of app-group applies for workspace deployments.
+
+In thread mode every app group shares the parent's logger, rich console and
+OutputManager, so output interleaves and the GIL serialises YAML parsing and
+pydantic validation. In process mode each app group is applied in its own
+interpreter:
+
+- workers stream structured events (started, output line, finished) back to
+  the parent over a multiprocessing queue
+- the parent prints live progress and, per app group, the captured output as
+  one contiguous block (no interleaving)
+- perf history produced by workers is returned to the parent and committed
+  in a single transaction. Desired-state deployment records are written by
+  the workers themselves (one short best-effort write per app; the state DB
+  runs in WAL mode)
+
+Usage:
+    with AppGroupProcessPool(max_workers=4, output=output) as pool:
+        report = pool.apply(AppGroupJob(base_dir=..., app_group="app_100", ...))
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from rich.text import Text
+
+from sbkube.utils.output_manager import OutputManager
+
+# Worker 프로세스 전역 이벤트 큐 (initializer에서 설정)
+_event_queue: Any = None
+
+
+@dataclass
+class AppGroupJob:
+    """Picklable description of one app-group apply."""
+
+    base_dir: str
+    app_group: str
+    source: str
+    force: bool = False
+    inherited_settings: dict[str, Any] = field(default_factory=dict)
+    format_type: str = "human"
+
+
+@dataclass
+class AppGroupReport:
+    """Result of one app-group apply in a worker process."""
+
+    app_group: str
+    success: bool
+    duration_seconds: float = 0.0
+    error: str | None = None
+    output_lines: list[str] = field(default_factory=list)
+    perf_runs: list[dict[str, Any]] = field(default_factory=list)
+    pid: int | None = None
+
+
+class _EventWriter(io.TextIOBase):
+    """Text stream that forwards complete lines as ``output`` events."""
+
+    def __init__(self, app_group: str, events: Any) -> None:
+        self.app_group = app_group
+        self.events = events
+        self._buffer = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        self._buffer += text
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            self.events.put(
+                {"app_group": self.app_group, "event": "output", "line": line}
+            )
+        return len(text)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.events.put(
+                {"app_group": self.app_group, "event": "output", "line": self._buffer}
+            )
+            self._buffer = ""
+
+
+def _init_worker(events: Any) -> None:
+    global _event_queue
+    _event_queue = events
+    from sbkube.utils.perf import enable_from_env
+
+    # 부모와 같은 SBKUBE_PERF 설정 (요약 출력은 부모가 담당)
+    enable_from_env(output_format="json")
+
+
+def run_app_group_job(job: AppGroupJob, events: Any = None) -> AppGroupReport:
+    """Apply one app group (worker side).
+
+    stdout/stderr are streamed to ``events`` line by line; perf history is
+    collected instead of written so the parent can store it in one
+    transaction.
+    """
+    from sbkube.commands.apply import ApplyCommand
+    from sbkube.state.perf_history import deferred_perf_runs
+
+    events = events if events is not None else _event_queue
+    pid = os.getpid()
+    events.put({"app_group": job.app_group, "event": "started", "pid": pid})
+
+    writer = _EventWriter(job.app_group, events)
+    start = time.perf_counter()
+    error = None
+    success = False
+    with deferred_perf_runs() as perf_runs:
+        try:
+            with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
+                success = bool(
+                    ApplyCommand(
+                        base_dir=job.base_dir,
+                        app_config_dir=job.app_group,
+                        source=job.source,
+                        dry_run=False,
+                        force=job.force,
+                        skip_prepare=False,
+                        skip_build=False,
+                        inherited_settings=job.inherited_settings,
+                        format_type=job.format_type,
+                    ).execute()
+                )
+        except (Exception, SystemExit) as e:  # noqa: BLE001 - reported to parent
+            error = str(e) or type(e).__name__
+        finally:
+            writer.flush()
+
+    duration = time.perf_counter() - start
+    events.put(
+        {
+            "app_group": job.app_group,
+            "event": "finished",
+            "success": success,
+            "duration_seconds": duration,
+            "error": error,
+        }
+    )
+    return AppGroupReport(
+        app_group=job.app_group,
+        success=success,
+        duration_seconds=duration,
+        error=error,
+        perf_runs=list(perf_runs),
+        pid=pid,
+    )
+
+
+class AppGroupProcessPool:
+    """Parent side: process pool plus an event pump merging worker output."""
+
+    def __init__(self, max_workers: int, output: OutputManager) -> None:
+        """AppGroupProcessPool 초기화.
+
+        Args:
+            max_workers: Worker process 수
+            output: 진행 상황 및 리포트를 출력할 OutputManager
+
+        """
+        self.max_workers = max_workers
+        self.output = output
+        self.reports: dict[str, AppGroupReport] = {}
+        self._lines: dict[str, list[str]] = {}
+        self._finished: set[str] = set()
+        self._cond = threading.Condition()
+        # fork는 부모의 스레드/락 상태를 복제하므로 spawn 사용
+        ctx = multiprocessing.get_context("spawn")
+        self._events = ctx.Queue()
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self._events,),
+        )
+        self._pump = threading.Thread(
+            target=self._pump_events, name="sbkube-worker-events", daemon=True
+        )
+        self._pump.start()
+
+    def __enter__(self) -> "AppGroupProcessPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _pump_events(self) -> None:
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            app_group = event["app_group"]
+            kind = event["event"]
+            if kind == "output":
+                with self._cond:
+                    self._lines.setdefault(app_group, []).append(event["line"])
+            elif kind == "started":
+                self.output.print(
+                    f"  [cyan]▶ {app_group}[/cyan] [dim](worker pid {event['pid']})[/dim]",
+                    level="info",
+                    app_group=app_group,
+                    pid=event["pid"],
+                )
+            elif kind == "finished":
+                icon = "[green]✓[/green]" if event["success"] else "[red]✗[/red]"
+                self.output.print(
+                    f"  {icon} {app_group} ({event['duration_seconds']:.1f}s)",
+                    level="info" if event["success"] else "error",
+                    app_group=app_group,
+                    success=event["success"],
+                    duration_seconds=event["duration_seconds"],
+                )
+                with self._cond:
+                    self._finished.add(app_group)
+                    self._cond.notify_all()
+
+    def apply(self, job: AppGroupJob) -> AppGroupReport:
+        """Run ``job`` in a worker process and wait for its report."""
+        try:
+            report = self._executor.submit(run_app_group_job, job).result()
+        except Exception as e:  # noqa: BLE001 - e.g. worker crashed
+            report = AppGroupReport(
+                app_group=job.app_group, success=False, error=str(e) or type(e).__name__
+            )
+            with self._cond:
+                self._finished.add(job.app_group)
+        with self._cond:
+            self.reports[job.app_group] = report
+        return report
+
+    def print_report(self, app_groups: list[str], timeout: float = 5.0) -> None:
+        """Print captured worker output, one contiguous block per app group.
+
+        Waits (up to ``timeout``) for each app group's ``finished`` event,
+        which the worker sends after its last output line.
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: all(
+                    group in self._finished
+                    for group in app_groups
+                    if group in self.reports
+                ),
+                timeout=timeout,
+            )
+
+        for app_group in app_groups:
+            report = self.reports.get(app_group)
+            if report is None:
+                continue
+            with self._cond:
+                report.output_lines = self._lines.pop(app_group, [])
+
+            if self.output.format_type == "human":
+                status = "[green]success[/green]" if report.success else "[red]failed[/red]"
+                console = self.output.get_console()
+                console.rule(f"{app_group} — {status}", style="dim")
+                for line in report.output_lines:
+                    console.print(Text.from_ansi(line), soft_wrap=True)
+            else:
+                for line in report.output_lines:
+                    self.output.print(line, level="info", app_group=app_group)
+            if report.error:
+                self.output.print_error(
+                    f"{app_group}: {report.error}", app_group=app_group
+                )
+
+    def collected_perf_runs(self) -> list[dict[str, Any]]:
+        """Perf runs recorded by all workers so far."""
+        with self._cond:
+            return [run for report in self.reports.values() for run in report.perf_runs]
+
+    def close(self) -> None:
+        """Shut down workers, stop the event pump and persist worker DB writes."""
+        self._executor.shutdown(wait=True)
+        self._events.put(None)
+        self._pump.join(timeout=5)
+        runs = self.collected_perf_runs()
+        if runs:
+            from sbkube.state.perf_history import store_perf_runs
+
+            store_perf_runs(runs)
@@ -0,0 +1,327 @@
+"""DAG-aware app scheduler for SBKube.
+
+앱 그룹 내부의 앱들을 `depends_on` 그래프에 따라 병렬 실행합니다.
+각 앱은 선행 앱이 모두 성공하는 즉시 시작되며, 실패한 앱의 후속 앱(전이적)은
+건너뛰고 독립적인 브랜치는 계속 실행합니다.
+
+Key Features:
+- Ready-queue 기반 스케줄링 (레벨 단위 배리어 없음)
+- max_workers로 제한된 ThreadPoolExecutor
+- 앱 단위 실패 격리 (dependents만 skip, release_on_failure로 지정한 작업은
+  실패해도 dependents를 계속 실행)
+- 완료 콜백은 스케줄러 스레드에서 순차 호출 (출력 버퍼 flush 용도)
+- weights(예상 소요 시간)가 주어지면 남은 critical path가 긴 노드부터 실행
+- stop()으로 새 작업 dispatch 중단 (실행 중인 작업은 완료까지 대기)
+
+Usage:
+    from sbkube.utils.app_scheduler import AppScheduler
+
+    scheduler = AppScheduler(
+        dependencies={"db": [], "api": ["db"], "web": ["api"]},
+        max_workers=4,
+    )
+    result = scheduler.run(deploy_one_app, on_complete=print_result)
+"""
+
+import time
+from collections.abc import Callable, Collection
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from sbkube.utils.perf import bind_span_context
+
+
+class AppTaskStatus(Enum):
+    """App task status enum."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class AppTaskResult:
+    """Result of a single scheduled app task."""
+
+    app_name: str
+    status: AppTaskStatus
+    duration_seconds: float = 0.0
+    error: str | None = None
+    blocked_by: str | None = None
+    payload: Any = None
+
+
+@dataclass
+class AppScheduleResult:
+    """Aggregated result of a scheduler run."""
+
+    results: dict[str, AppTaskResult] = field(default_factory=dict)
+    completion_order: list[str] = field(default_factory=list)
+
+    def _names_with(self, status: AppTaskStatus) -> list[str]:
+        return [
+            name
+            for name in self.completion_order
+            if self.results[name].status == status
+        ]
+
+    @property
+    def succeeded(self) -> list[str]:
+        """Apps that completed successfully (completion order)."""
+        return self._names_with(AppTaskStatus.SUCCESS)
+
+    @property
+    def failed(self) -> list[str]:
+        """Apps whose task failed (completion order)."""
+        return self._names_with(AppTaskStatus.FAILED)
+
+    @property
+    def skipped(self) -> list[str]:
+        """Apps skipped because a predecessor failed."""
+        return self._names_with(AppTaskStatus.SKIPPED)
+
+    @property
+    def success(self) -> bool:
+        """True if every app succeeded."""
+        return not self.failed and not self.skipped
+
+
+class AppScheduler:
+    """Ready-queue scheduler over a `depends_on` DAG.
+
+    의존성 중 스케줄 대상에 없는 앱은 이미 충족된 것으로 간주합니다
+    (비활성 앱, --app 필터로 제외된 앱 등).
+    """
+
+    def __init__(
+        self,
+        dependencies: dict[str, list[str]],
+        max_workers: int = 4,
+        order: list[str] | None = None,
+        weights: dict[str, float] | None = None,
+        release_on_failure: Collection[str] | None = None,
+    ) -> None:
+        """AppScheduler 초기화.
+
+        Args:
+            dependencies: 앱 이름 → 선행 앱 이름 리스트
+            max_workers: 동시에 실행할 최대 앱 수
+            order: 준비된 앱 간 우선순위 (기본: dependencies 키 순서)
+            weights: 앱별 예상 소요 시간(초). 주어지면 자신과 후속 앱들의
+                최장 경로(critical path)가 긴 앱을 먼저 실행하고, order는
+                동률일 때만 사용 (없는 앱은 1.0)
+            release_on_failure: 실패해도 후속 앱을 skip하지 않고 성공한 것처럼
+                풀어줄 앱 이름 (예: on_failure=continue Phase)
+
+        Raises:
+            ValueError: max_workers < 1 이거나 순환 의존성이 있는 경우
+
+        """
+        if max_workers < 1:
+            msg = f"max_workers must be >= 1, got {max_workers}"
+            raise ValueError(msg)
+
+        self.max_workers = max_workers
+        self.order = [name for name in (order or dependencies) if name in dependencies]
+        for name in dependencies:
+            if name not in self.order:
+                self.order.append(name)
+        self._priority = {name: idx for idx, name in enumerate(self.order)}
+
+        self.dependencies: dict[str, set[str]] = {
+            name: {dep for dep in deps if dep in dependencies and dep != name}
+            for name, deps in dependencies.items()
+        }
+        self.dependents: dict[str, set[str]] = {name: set() for name in dependencies}
+        for name, deps in self.dependencies.items():
+            for dep in deps:
+                self.dependents[dep].add(name)
+
+        self._check_acyclic()
+        self._stop_reason: str | None = None
+        self.release_on_failure = set(release_on_failure or ())
+
+        if weights is not None:
+            path = self.critical_path_lengths(weights)
+            self.order.sort(key=lambda name: -path[name])
+            self._priority = {name: idx for idx, name in enumerate(self.order)}
+
+    def critical_path_lengths(self, weights: dict[str, float]) -> dict[str, float]:
+        """앱별 남은 최장 경로 길이 (자신 + 가장 긴 후속 체인의 weight 합).
+
+        Args:
+            weights: 앱별 예상 소요 시간 (없는 앱은 1.0)
+
+        Returns:
+            앱 이름 → critical path 길이
+
+        """
+        lengths: dict[str, float] = {}
+
+        def visit(name: str) -> float:
+            if name not in lengths:
+                tail = max((visit(dep) for dep in self.dependents[name]), default=0.0)
+                lengths[name] = weights.get(name, 1.0) + tail
+            return lengths[name]
+
+        for name in self.order:
+            visit(name)
+        return lengths
+
+    def stop(self, reason: str | None = None) -> None:
+        """새 작업 dispatch 중단.
+
+        실행 중인 작업은 끝까지 기다리고, 아직 시작하지 않은 앱은 모두 SKIPPED
+        (blocked_by=reason) 처리됩니다. on_complete 콜백에서 호출하는 용도입니다.
+        """
+        if self._stop_reason is None:
+            self._stop_reason = reason or "stopped"
+
+    def _check_acyclic(self) -> None:
+        """순환 의존성 검사 (Kahn's algorithm)."""
+        in_degree = {name: len(deps) for name, deps in self.dependencies.items()}
+        queue = [name for name, degree in in_degree.items() if degree == 0]
+        visited = 0
+        while queue:
+            name = queue.pop()
+            visited += 1
+            for dependent in self.dependents[name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+        if visited != len(self.dependencies):
+            cyclic = sorted(name for name, degree in in_degree.items() if degree > 0)
+            msg = f"Circular dependency detected among apps: {', '.join(cyclic)}"
+            raise ValueError(msg)
+
+    def run(
+        self,
+        task: Callable[[str], Any],
+        on_complete: Callable[[AppTaskResult], None] | None = None,
+    ) -> AppScheduleResult:
+        """모든 앱을 의존성 순서에 맞춰 실행.
+
+        task가 예외를 발생시키거나 False를 반환하면 해당 앱은 실패로 처리되고,
+        그 앱에 (전이적으로) 의존하는 앱은 모두 SKIPPED 처리됩니다
+        (release_on_failure에 포함된 앱은 실패해도 후속 앱을 계속 실행).
+
+        Args:
+            task: 앱 이름을 받아 실행하는 함수 (반환값은 payload로 보존)
+            on_complete: 앱 완료/스킵 시 호출되는 콜백 (스케줄러 스레드에서 순차 호출)
+
+        Returns:
+            AppScheduleResult: 앱별 실행 결과
+
+        """
+        self._stop_reason = None
+        result = AppScheduleResult()
+        remaining = {name: set(deps) for name, deps in self.dependencies.items()}
+        ready = [name for name in self.order if not remaining[name]]
+        running: dict[Future, tuple[str, float]] = {}
+
+        def finish(task_result: AppTaskResult) -> None:
+            result.results[task_result.app_name] = task_result
+            result.completion_order.append(task_result.app_name)
+            if on_complete:
+                on_complete(task_result)
+
+        def release_dependents(done_name: str) -> None:
+            for dependent in self.dependents[done_name]:
+                deps = remaining.get(dependent)
+                if deps is None:
+                    continue
+                deps.discard(done_name)
+                if not deps and dependent not in ready:
+                    ready.append(dependent)
+            ready.sort(key=self._priority.__getitem__)
+
+        def skip_dependents(failed_name: str) -> None:
+            stack = [failed_name]
+            while stack:
+                current = stack.pop()
+                for dependent in sorted(
+                    self.dependents[current], key=self._priority.__getitem__
+                ):
+                    if dependent in result.results or dependent not in remaining:
+                        continue
+                    del remaining[dependent]
+                    finish(
+                        AppTaskResult(
+                            app_name=dependent,
+                            status=AppTaskStatus.SKIPPED,
+                            blocked_by=failed_name,
+                        )
+                    )
+                    stack.append(dependent)
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="sbkube-app"
+        )
+        try:
+            while ready or running:
+                if self._stop_reason is not None and remaining:
+                    for name in sorted(remaining, key=self._priority.__getitem__):
+                        finish(
+                            AppTaskResult(
+                                app_name=name,
+                                status=AppTaskStatus.SKIPPED,
+                                blocked_by=self._stop_reason,
+                            )
+                        )
+                    remaining.clear()
+                    ready.clear()
+                    if not running:
+                        break
+
+                while ready and len(running) < self.max_workers:
+                    name = ready.pop(0)
+                    del remaining[name]
+                    future = executor.submit(bind_span_context(task), name)
+                    running[future] = (name, time.perf_counter())
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(
+                    done, key=lambda f: self._priority[running[f][0]]
+                ):
+                    name, started = running.pop(future)
+                    duration = time.perf_counter() - started
+                    try:
+                        payload = future.result()
+                        error = None
+                    except (Exception, SystemExit) as e:  # noqa: BLE001 - isolate app failure
+                        payload = None
+                        error = str(e) or type(e).__name__
+
+                    if error is None and payload is not False:
+                        finish(
+                            AppTaskResult(
+                                app_name=name,
+                                status=AppTaskStatus.SUCCESS,
+                                duration_seconds=duration,
+                                payload=payload,
+                            )
+                        )
+                        release_dependents(name)
+                    else:
+                        finish(
+                            AppTaskResult(
+                                app_name=name,
+                                status=AppTaskStatus.FAILED,
+                                duration_seconds=duration,
+                                error=error,
+                                payload=payload,
+                            )
+                        )
+                        if name in self.release_on_failure:
+                            release_dependents(name)
+                        else:
+                            skip_dependents(name)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+        return result
@@ -0,0 +1,651 @@
+"""Asyncio-based runner for external commands (kubectl, helm, ...).
+
+Coroutines that shell out used to call blocking ``subprocess.run``, so
+validators and diagnostics declared ``async`` still ran one command at a
+time. ``run_async`` spawns the process with ``asyncio.create_subprocess_exec``
+and bounds concurrency with one semaphore per tool and one per cluster, so
+``ValidationEngine`` / ``DiagnosticEngine`` can run their checks concurrently
+without flooding a single API server. The semaphores are process-wide: the
+sync facade (``run_command``) runs a fresh event loop per call, and callers on
+scheduler threads share the same limits as coroutines on any other loop.
+
+The return value and exceptions mirror ``subprocess.run`` (CompletedProcess,
+TimeoutExpired, CalledProcessError, FileNotFoundError), so call sites convert
+by replacing ``subprocess.run(...)`` with ``await run_async(...)``.
+
+The default limits (helm 4, kubectl 8 and 8 per cluster) also cap parallel
+deploys: ``--max-workers`` raises the helm/kubectl and cluster limits to at
+least the worker count (:meth:`AsyncCommandRunner.ensure_capacity`), and the
+environment pins them explicitly::
+
+    SBKUBE_TOOL_LIMITS="helm=8,kubectl=16"   # per-tool limits
+    SBKUBE_CLUSTER_LIMIT=16                  # per-cluster limit
+
+Limits set through the environment are never raised by ``--max-workers``.
+
+``stream_async`` runs long commands (``helm upgrade --wait``, ``helm template``
+of large charts) without holding their output: lines go to callbacks as they
+arrive, stdout can be written straight to a file, and only a bounded tail of
+each stream is kept for error classification.
+
+Usage:
+    result = await run_async(["kubectl", "get", "nodes", "-o", "json"], timeout=30)
+    if result.returncode == 0:
+        nodes = json.loads(result.stdout)
+
+    result = await stream_async(cmd, on_stderr=print, stdout_file=rendered_file)
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import os
+import shlex
+import subprocess
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Sequence
+from pathlib import Path
+from typing import IO, Any
+
+from sbkube.utils.perf import _cmd_to_display, get_perf_recorder
+
+# Tool별 동시 실행 상한 (명시되지 않은 tool은 DEFAULT_TOOL_LIMIT)
+DEFAULT_TOOL_LIMITS: dict[str, int] = {"helm": 4, "kubectl": 8}
+DEFAULT_TOOL_LIMIT = 8
+# 같은 클러스터(context/kubeconfig)에 대한 동시 호출 상한
+DEFAULT_CLUSTER_LIMIT = 8
+# --max-workers가 상한을 올리는 tool (배포 워커마다 동시에 호출)
+WORKER_TOOLS = ("helm", "kubectl")
+TOOL_LIMITS_ENV = "SBKUBE_TOOL_LIMITS"
+CLUSTER_LIMIT_ENV = "SBKUBE_CLUSTER_LIMIT"
+
+_CLUSTER_FLAGS = ("--context", "--kube-context", "--kubeconfig")
+
+# stream_async: stdout/stderr별로 보관하는 마지막 줄 수
+DEFAULT_TAIL_LINES = 200
+# 한 번에 읽는 크기 / 줄바꿈 없이 이 길이를 넘으면 한 줄로 끊어서 전달
+STREAM_CHUNK_SIZE = 64 * 1024
+MAX_LINE_BYTES = 64 * 1024
+
+LineCallback = Callable[[str], None]
+
+
+def parse_tool_limits(value: str) -> dict[str, int]:
+    """Parse ``"helm=8,kubectl=16"`` into tool limits.
+
+    Raises:
+        ValueError: An entry is not ``tool=<positive int>``
+
+    """
+    limits: dict[str, int] = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        tool, sep, limit = entry.partition("=")
+        if not sep or not tool.strip() or not limit.strip().isdigit() or int(limit) < 1:
+            msg = f"Invalid tool limit {entry.strip()!r} (expected tool=<positive int>)"
+            raise ValueError(msg)
+        limits[tool.strip()] = int(limit)
+    return limits
+
+
+def command_tool(cmd: Sequence[str]) -> str:
+    """Tool name of a command (basename of argv[0])."""
+    return Path(cmd[0]).name if cmd else "unknown"
+
+
+def command_cluster(cmd: Sequence[str], env: dict[str, str] | None = None) -> str | None:
+    """Cluster key of a kubectl/helm command, None for other tools.
+
+    ``--context``/``--kube-context``/``--kubeconfig`` arguments identify the
+    cluster; without them the ``KUBECONFIG`` in effect (or ``default``) does.
+    """
+    if command_tool(cmd) not in ("kubectl", "helm"):
+        return None
+
+    parts: list[str] = []
+    args = list(cmd[1:])
+    for index, arg in enumerate(args):
+        for flag in _CLUSTER_FLAGS:
+            if arg == flag and index + 1 < len(args):
+                parts.append(f"{flag}={args[index + 1]}")
+            elif arg.startswith(f"{flag}="):
+                parts.append(arg)
+    if parts:
+        return " ".join(sorted(parts))
+
+    kubeconfig = (env if env is not None else os.environ).get("KUBECONFIG")
+    return f"KUBECONFIG={kubeconfig}" if kubeconfig else "default"
+
+
+class SharedSlots:
+    """Counting semaphore shared by every thread and event loop of the process.
+
+    ``asyncio.Semaphore`` is bound to one event loop, and ``run_command`` runs a
+    new loop per call, so per-loop semaphores never limit threaded callers.
+    Waiters are woken in FIFO order on their own loop.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """SharedSlots 초기화.
+
+        Args:
+            limit: 동시에 보유할 수 있는 slot 수
+
+        """
+        self.limit = limit
+        self._free = limit
+        self._lock = threading.Lock()
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._free > 0 and not self._waiters:
+                self._free -= 1
+                return
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, waiter))
+                    granted = False
+                except ValueError:
+                    # release()가 이미 slot을 넘겨줌
+                    granted = True
+            if granted:
+                self.release()
+            raise
+
+    def grow(self, limit: int) -> None:
+        """Raise the limit to ``limit`` (never lowers it), waking waiters."""
+        with self._lock:
+            extra = limit - self.limit
+            if extra <= 0:
+                return
+            self.limit = limit
+        for _ in range(extra):
+            self.release()
+
+    def release(self) -> None:
+        """Hand the slot to the oldest waiter, or return it to the pool."""
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._free += 1
+                    return
+                loop, waiter = self._waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+                return
+            except RuntimeError:
+                continue  # waiter의 loop가 이미 닫힘: 다음 waiter로
+
+    @contextlib.asynccontextmanager
+    async def hold(self) -> AsyncIterator[None]:
+        """``async with`` form of acquire/release."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AsyncCommandRunner:
+    """Runs external commands with per-tool and per-cluster concurrency limits.
+
+    Limits are :class:`SharedSlots`, so they hold across repeated
+    ``asyncio.run`` calls and worker threads with their own loops.
+    """
+
+    def __init__(
+        self,
+        tool_limits: dict[str, int] | None = None,
+        default_tool_limit: int = DEFAULT_TOOL_LIMIT,
+        cluster_limit: int = DEFAULT_CLUSTER_LIMIT,
+    ) -> None:
+        """AsyncCommandRunner 초기화.
+
+        Args:
+            tool_limits: Tool별 동시 실행 상한 (None이면 DEFAULT_TOOL_LIMITS)
+            default_tool_limit: tool_limits에 없는 tool의 상한
+            cluster_limit: 클러스터별 동시 실행 상한
+
+        """
+        self.tool_limits = dict(DEFAULT_TOOL_LIMITS if tool_limits is None else tool_limits)
+        self.default_tool_limit = default_tool_limit
+        self.cluster_limit = cluster_limit
+        # ensure_capacity()가 올리지 않는 상한 (tool 이름, 클러스터는 "cluster")
+        self.pinned: set[str] = set()
+        self._semaphores: dict[str, SharedSlots] = {}
+        self._semaphores_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, environ: dict[str, str] | None = None) -> "AsyncCommandRunner":
+        """Runner with limits from SBKUBE_TOOL_LIMITS / SBKUBE_CLUSTER_LIMIT.
+
+        Invalid values are ignored (the defaults apply).
+        """
+        environ = os.environ if environ is None else environ
+        tool_limits = dict(DEFAULT_TOOL_LIMITS)
+        pinned: set[str] = set()
+        try:
+            env_limits = parse_tool_limits(environ.get(TOOL_LIMITS_ENV, ""))
+        except ValueError:
+            env_limits = {}
+        tool_limits.update(env_limits)
+        pinned.update(env_limits)
+
+        cluster_limit = DEFAULT_CLUSTER_LIMIT
+        env_cluster = environ.get(CLUSTER_LIMIT_ENV, "").strip()
+        if env_cluster.isdigit() and int(env_cluster) > 0:
+            cluster_limit = int(env_cluster)
+            pinned.add("cluster")
+
+        runner = cls(tool_limits=tool_limits, cluster_limit=cluster_limit)
+        runner.pinned = pinned
+        return runner
+
+    def _limit(self, key: str) -> int:
+        kind, _, name = key.partition(":")
+        if kind == "cluster":
+            return self.cluster_limit
+        return self.tool_limits.get(name, self.default_tool_limit)
+
+    def _semaphore(self, key: str) -> SharedSlots:
+        with self._semaphores_lock:
+            if key not in self._semaphores:
+                self._semaphores[key] = SharedSlots(self._limit(key))
+            return self._semaphores[key]
+
+    def ensure_capacity(self, workers: int) -> None:
+        """Raise the helm/kubectl and cluster limits to at least ``workers``.
+
+        Called with ``--max-workers`` so N concurrent deploy workers are not
+        throttled by the default tool limits. Limits in :attr:`pinned` are kept.
+
+        Args:
+            workers: Number of workers that call helm/kubectl concurrently
+
+        """
+        with self._semaphores_lock:
+            for tool in WORKER_TOOLS:
+                if tool not in self.pinned:
+                    self.tool_limits[tool] = max(
+                        self.tool_limits.get(tool, self.default_tool_limit), workers
+                    )
+            if "cluster" not in self.pinned:
+                self.cluster_limit = max(self.cluster_limit, workers)
+            for key, slots in self._semaphores.items():
+                slots.grow(self._limit(key))
+
+    async def run(
+        self,
+        cmd: Sequence[str] | str,
+        *,
+        check: bool = False,
+        capture_output: bool = True,
+        text: bool = True,
+        timeout: float | None = None,
+        env: dict[str, str] | None = None,
+        cwd: str | Path | None = None,
+        input: str | bytes | None = None,  # noqa: A002 - mirrors subprocess.run
+    ) -> subprocess.CompletedProcess:
+        """Run ``cmd`` and wait for it (see :func:`run_async`)."""
+        args = _split(cmd)
+        async with self._slots(args, env):
+            return await self._execute(
+                args, command_tool(args), check, capture_output, text, timeout,
+                env, cwd, input,
+            )
+
+    @contextlib.asynccontextmanager
+    async def _slots(
+        self, args: list[str], env: dict[str, str] | None
+    ) -> AsyncIterator[None]:
+        """Acquire the tool slot and, for kubectl/helm, the cluster slot."""
+        tool = command_tool(args)
+        cluster = command_cluster(args, env)
+        async with self._semaphore(f"tool:{tool}").hold():
+            if cluster is None:
+                yield
+                return
+            async with self._semaphore(f"cluster:{cluster}").hold():
+                yield
+
+    async def stream(
+        self,
+        cmd: Sequence[str] | str,
+        *,
+        on_stdout: LineCallback | None = None,
+        on_stderr: LineCallback | None = None,
+        stdout_file: str | Path | None = None,
+        tail_lines: int = DEFAULT_TAIL_LINES,
+        timeout: float | None = None,
+        env: dict[str, str] | None = None,
+        cwd: str | Path | None = None,
+        input: str | bytes | None = None,  # noqa: A002 - mirrors subprocess.run
+    ) -> subprocess.CompletedProcess:
+        """Run ``cmd`` streaming its output (see :func:`stream_async`)."""
+        args = _split(cmd)
+        async with self._slots(args, env):
+            return await self._stream(
+                args, on_stdout, on_stderr, stdout_file, tail_lines, timeout,
+                env, cwd, input,
+            )
+
+    async def _stream(
+        self,
+        args: list[str],
+        on_stdout: LineCallback | None,
+        on_stderr: LineCallback | None,
+        stdout_file: str | Path | None,
+        tail_lines: int,
+        timeout: float | None,
+        env: dict[str, str] | None,
+        cwd: str | Path | None,
+        input: str | bytes | None,  # noqa: A002
+    ) -> subprocess.CompletedProcess:
+        if isinstance(input, str):
+            input = input.encode()
+        stdout_tail: deque[str] = deque(maxlen=tail_lines)
+        stderr_tail: deque[str] = deque(maxlen=tail_lines)
+
+        start = time.perf_counter()
+        returncode: int | None = None
+        error: str | None = None
+        try:
+            with contextlib.ExitStack() as stack:
+                sink = (
+                    stack.enter_context(Path(stdout_file).open("wb"))
+                    if stdout_file is not None
+                    else None
+                )
+                process = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdin=asyncio.subprocess.PIPE if input is not None else None,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env,
+                    cwd=cwd,
+                )
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(
+                            _feed_stdin(process, input),
+                            _pump_lines(process.stdout, stdout_tail, on_stdout, sink),
+                            _pump_lines(process.stderr, stderr_tail, on_stderr),
+                        ),
+                        timeout=timeout,
+                    )
+                    returncode = await process.wait()
+                except BaseException as e:
+                    # 타임아웃/취소/콜백 오류 시 자식 프로세스가 남지 않도록 종료
+                    if process.returncode is None:
+                        process.kill()
+                        await process.wait()
+                    if isinstance(e, TimeoutError):
+                        raise subprocess.TimeoutExpired(
+                            args,
+                            timeout,
+                            output="\n".join(stdout_tail),
+                            stderr="\n".join(stderr_tail),
+                        ) from None
+                    raise
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            get_perf_recorder().record(
+                "subprocess",
+                time.perf_counter() - start,
+                tool=command_tool(args),
+                cmd=_cmd_to_display(args),
+                **({"returncode": returncode} if error is None else {"error": error}),
+            )
+
+        stdout = "" if stdout_file is not None else "\n".join(stdout_tail)
+        return subprocess.CompletedProcess(
+            args, returncode, stdout, "\n".join(stderr_tail)
+        )
+
+    async def _execute(
+        self,
+        args: list[str],
+        tool: str,
+        check: bool,
+        capture_output: bool,
+        text: bool,
+        timeout: float | None,
+        env: dict[str, str] | None,
+        cwd: str | Path | None,
+        input: str | bytes | None,  # noqa: A002
+    ) -> subprocess.CompletedProcess:
+        pipe = asyncio.subprocess.PIPE if capture_output else None
+        if isinstance(input, str):
+            input = input.encode()
+
+        start = time.perf_counter()
+        returncode: int | None = None
+        error: str | None = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.PIPE if input is not None else None,
+                stdout=pipe,
+                stderr=pipe,
+                env=env,
+                cwd=cwd,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input), timeout=timeout
+                )
+            except (TimeoutError, asyncio.CancelledError) as e:
+                # 타임아웃/취소 시 자식 프로세스가 남지 않도록 종료
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                if isinstance(e, asyncio.CancelledError):
+                    raise
+                raise subprocess.TimeoutExpired(args, timeout) from None
+            returncode = process.returncode
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            get_perf_recorder().record(
+                "subprocess",
+                time.perf_counter() - start,
+                tool=tool,
+                cmd=_cmd_to_display(args),
+                **({"returncode": returncode} if error is None else {"error": error}),
+            )
+
+        if text:
+            stdout = stdout.decode(errors="replace") if stdout is not None else None
+            stderr = stderr.decode(errors="replace") if stderr is not None else None
+        if check and returncode:
+            raise subprocess.CalledProcessError(returncode, args, stdout, stderr)
+        return subprocess.CompletedProcess(args, returncode, stdout, stderr)
+
+
+def _split(cmd: Sequence[str] | str) -> list[str]:
+    return shlex.split(cmd) if isinstance(cmd, str) else [str(part) for part in cmd]
+
+
+async def _feed_stdin(
+    process: asyncio.subprocess.Process, data: bytes | None
+) -> None:
+    if process.stdin is None:
+        return
+    try:
+        if data:
+            process.stdin.write(data)
+            await process.stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass  # 프로세스가 입력을 다 읽기 전에 종료됨
+    finally:
+        process.stdin.close()
+
+
+async def _pump_lines(
+    stream: asyncio.StreamReader,
+    tail: deque[str],
+    on_line: LineCallback | None,
+    sink: IO[bytes] | None = None,
+) -> None:
+    """Read ``stream`` in chunks: raw bytes to ``sink``, decoded lines to ``tail``/``on_line``.
+
+    Memory stays bounded by the tail and one (capped) partial line.
+    """
+
+    def emit(raw: bytes) -> None:
+        line = raw.decode(errors="replace").rstrip("\r")
+        tail.append(line)
+        if on_line is not None:
+            on_line(line)
+
+    pending = bytearray()
+    while chunk := await stream.read(STREAM_CHUNK_SIZE):
+        if sink is not None:
+            sink.write(chunk)
+        pending += chunk
+        start = 0
+        while (end := pending.find(b"\n", start)) != -1:
+            emit(bytes(pending[start:end]))
+            start = end + 1
+        del pending[:start]
+        if len(pending) > MAX_LINE_BYTES:
+            emit(bytes(pending))
+            pending.clear()
+    if pending:
+        emit(bytes(pending))
+
+
+_default_runner = AsyncCommandRunner.from_env()
+
+
+def get_command_runner() -> AsyncCommandRunner:
+    """Process-wide runner shared by run_async and run_command."""
+    return _default_runner
+
+
+async def run_async(
+    cmd: Sequence[str] | str,
+    *,
+    check: bool = False,
+    capture_output: bool = True,
+    text: bool = True,
+    timeout: float | None = None,
+    env: dict[str, str] | None = None,
+    cwd: str | Path | None = None,
+    input: str | bytes | None = None,  # noqa: A002 - mirrors subprocess.run
+) -> subprocess.CompletedProcess:
+    """Run an external command without blocking the event loop.
+
+    Args:
+        cmd: 실행할 명령어 (리스트 또는 문자열)
+        check: 0이 아닌 종료 코드에서 CalledProcessError 발생
+        capture_output: stdout/stderr 캡처 여부
+        text: 출력을 str로 디코딩할지 여부
+        timeout: 타임아웃(초). 초과 시 프로세스를 종료하고 TimeoutExpired 발생
+        env: 환경 변수
+        cwd: 작업 디렉토리
+        input: stdin으로 전달할 데이터
+
+    Returns:
+        subprocess.CompletedProcess (subprocess.run과 동일한 형태)
+
+    Raises:
+        FileNotFoundError: 명령어를 찾을 수 없는 경우
+        subprocess.TimeoutExpired: 타임아웃 초과
+        subprocess.CalledProcessError: check=True이고 실패한 경우
+
+    """
+    return await _default_runner.run(
+        cmd,
+        check=check,
+        capture_output=capture_output,
+        text=text,
+        timeout=timeout,
+        env=env,
+        cwd=cwd,
+        input=input,
+    )
+
+
+async def stream_async(
+    cmd: Sequence[str] | str,
+    *,
+    on_stdout: LineCallback | None = None,
+    on_stderr: LineCallback | None = None,
+    stdout_file: str | Path | None = None,
+    tail_lines: int = DEFAULT_TAIL_LINES,
+    timeout: float | None = None,
+    env: dict[str, str] | None = None,
+    cwd: str | Path | None = None,
+    input: str | bytes | None = None,  # noqa: A002 - mirrors subprocess.run
+) -> subprocess.CompletedProcess:
+    """Run an external command, streaming its output instead of buffering it.
+
+    Args:
+        cmd: 실행할 명령어 (리스트 또는 문자열)
+        on_stdout: stdout 줄마다 호출 (줄바꿈 제외, 이벤트 루프 스레드에서 호출)
+        on_stderr: stderr 줄마다 호출
+        stdout_file: 지정하면 stdout을 그대로 이 파일에 기록
+        tail_lines: 반환값에 남길 stream별 마지막 줄 수
+        timeout: 타임아웃(초). 초과 시 프로세스를 종료하고 TimeoutExpired 발생
+        env: 환경 변수
+        cwd: 작업 디렉토리
+        input: stdin으로 전달할 데이터
+
+    Returns:
+        subprocess.CompletedProcess: stdout/stderr는 마지막 ``tail_lines`` 줄
+        (stdout_file을 지정하면 stdout은 빈 문자열)
+
+    Raises:
+        FileNotFoundError: 명령어를 찾을 수 없는 경우
+        subprocess.TimeoutExpired: 타임아웃 초과 (output/stderr에 tail 포함)
+
+    """
+    return await _default_runner.stream(
+        cmd,
+        on_stdout=on_stdout,
+        on_stderr=on_stderr,
+        stdout_file=stdout_file,
+        tail_lines=tail_lines,
+        timeout=timeout,
+        env=env,
+        cwd=cwd,
+        input=input,
+    )
+
+
+def run_sync(coro: Any) -> Any:
+    """Run a coroutine from synchronous code.
+
+    Uses ``asyncio.run`` unless this thread already runs an event loop, in
+    which case the coroutine is run on a short-lived helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(context.run, asyncio.run, coro).result()
@@ -0,0 +1,234 @@
+"""Incremental build support for `sbkube build`.
+
+build 결과(.sbkube/build/<app>)를 매번 rmtree + copytree 하지 않도록, 빌드에 사용된
+파일 목록과 fingerprint를 `.sbkube/build/.<app>.build.json`에 기록합니다.
+
+- fingerprint가 같고 빌드 결과 트리도 기록 당시와 같으면 빌드를 건너뜀
+- 다르면 변경된 파일만 다시 복사 (차트 파일은 hardlink, overrides는 copy)
+
+fingerprint는 원본 파일의 (경로, 크기, mtime_ns)와 overrides/removes 설정으로 계산하며,
+파일 내용을 읽지 않으므로 대형 차트에서도 stat 비용만 듭니다. 빌드 결과 트리의
+output fingerprint도 함께 기록하여, 빌드 파일이 수정/삭제/추가된 경우 다시 빌드합니다.
+
+Manifest 파일은 차트 디렉토리 밖에 두어 helm이 차트 파일로 인식하지 않게 합니다.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sbkube.utils.chart_cache import clone_file
+
+MANIFEST_VERSION = 2
+
+
+@dataclass
+class BuildPlan:
+    """빌드 결과 트리 계획 (상대 경로 → 원본 파일)."""
+
+    source_path: Path
+    files: dict[str, Path] = field(default_factory=dict)
+    override_files: set[str] = field(default_factory=set)
+    removes: list[str] = field(default_factory=list)
+
+    def add_override(self, rel_path: str, src_file: Path) -> None:
+        """override 파일을 계획에 추가 (같은 경로의 차트 파일을 대체)."""
+        self.files[rel_path] = src_file
+        self.override_files.add(rel_path)
+
+    def apply_remove(self, pattern: str) -> str | None:
+        """removes 패턴을 계획에 적용.
+
+        Args:
+            pattern: 차트 루트 기준 상대 경로 (파일 또는 디렉토리)
+
+        Returns:
+            "file", "directory" 또는 대상이 없으면 None
+
+        """
+        target = pattern.strip("/")
+        self.removes.append(pattern)
+        if target in self.files:
+            del self.files[target]
+            self.override_files.discard(target)
+            return "file"
+
+        prefix = f"{target}/"
+        matched = [rel for rel in self.files if rel.startswith(prefix)]
+        for rel in matched:
+            del self.files[rel]
+            self.override_files.discard(rel)
+        return "directory" if matched else None
+
+
+def scan_chart_files(source_path: Path) -> dict[str, Path]:
+    """차트 디렉토리의 파일 목록 (symlink는 따라감, copytree와 동일).
+
+    Args:
+        source_path: 차트 디렉토리
+
+    Returns:
+        상대 경로(posix) → 파일 경로
+
+    """
+    files: dict[str, Path] = {}
+    for root, _dirs, names in os.walk(source_path, followlinks=True):
+        root_path = Path(root)
+        for name in names:
+            file_path = root_path / name
+            files[file_path.relative_to(source_path).as_posix()] = file_path
+    return files
+
+
+def compute_file_states(plan: BuildPlan) -> dict[str, list]:
+    """계획된 각 파일의 상태 ([원본 경로, 크기, mtime_ns])."""
+    states: dict[str, list] = {}
+    for rel, src in sorted(plan.files.items()):
+        stat = src.stat()
+        states[rel] = [str(src), stat.st_size, stat.st_mtime_ns]
+    return states
+
+
+def compute_fingerprint(plan: BuildPlan, states: dict[str, list]) -> str:
+    """빌드 계획 fingerprint (원본 파일 상태 + overrides + removes)."""
+    hasher = hashlib.sha256()
+    hasher.update(f"v{MANIFEST_VERSION}\n{plan.source_path}\n".encode())
+    for rel, (src, size, mtime_ns) in states.items():
+        kind = "O" if rel in plan.override_files else "F"
+        hasher.update(f"{kind} {rel} {src} {size} {mtime_ns}\n".encode())
+    for pattern in plan.removes:
+        hasher.update(f"R {pattern}\n".encode())
+    return f"sha256:{hasher.hexdigest()}"
+
+
+def compute_output_fingerprint(dest_path: Path) -> str:
+    """빌드 결과 트리 fingerprint (각 파일의 경로, 크기, mtime_ns)."""
+    hasher = hashlib.sha256()
+    for rel, file_path in sorted(scan_chart_files(dest_path).items()):
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # 깨진 symlink 등
+            hasher.update(f"? {rel}\n".encode())
+            continue
+        hasher.update(f"{rel} {stat.st_size} {stat.st_mtime_ns}\n".encode())
+    return f"sha256:{hasher.hexdigest()}"
+
+
+@dataclass
+class BuildManifest:
+    """`.sbkube/build/.<app>.build.json` 내용."""
+
+    fingerprint: str
+    files: dict[str, list]
+    override_files: list[str] = field(default_factory=list)
+    output_fingerprint: str = ""
+    version: int = MANIFEST_VERSION
+
+    @staticmethod
+    def path_for(build_dir: Path, app_name: str) -> Path:
+        """앱의 build manifest 경로."""
+        return build_dir / f".{app_name}.build.json"
+
+    @classmethod
+    def load(cls, path: Path) -> "BuildManifest | None":
+        """manifest 로드 (없거나 형식이 다르면 None)."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            manifest = cls(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+        return manifest if manifest.version == MANIFEST_VERSION else None
+
+    def save(self, path: Path) -> None:
+        """manifest 저장 (임시 파일 후 교체)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "version": self.version,
+                    "fingerprint": self.fingerprint,
+                    "output_fingerprint": self.output_fingerprint,
+                    "override_files": self.override_files,
+                    "files": self.files,
+                }
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(path)
+
+
+def sync_build_tree(
+    plan: BuildPlan,
+    states: dict[str, list],
+    dest_path: Path,
+    previous: BuildManifest | None = None,
+    use_links: bool = True,
+) -> dict[str, int]:
+    """dest_path를 빌드 계획과 일치하도록 갱신.
+
+    previous가 있으면 상태가 달라진 파일만 다시 쓰고 사라진 파일은 삭제합니다.
+    기존 파일은 항상 unlink 후 새로 쓰므로, hardlink로 공유된 원본(charts/)이
+    덮어써지지 않습니다.
+
+    Args:
+        plan: 빌드 계획
+        states: compute_file_states() 결과
+        dest_path: 빌드 디렉토리 (.sbkube/build/<app>)
+        previous: 이전 빌드 manifest (None이면 전체 빌드)
+        use_links: 차트 파일에 hardlink/reflink 사용 여부
+
+    Returns:
+        {"copied": n, "removed": n, "unchanged": n}
+
+    """
+    stats = {"copied": 0, "removed": 0, "unchanged": 0}
+    old_states = previous.files if previous else {}
+    old_overrides = set(previous.override_files) if previous else set()
+
+    for rel in set(old_states) - set(states):
+        target = dest_path / rel
+        if target.is_file() or target.is_symlink():
+            target.unlink()
+            stats["removed"] += 1
+            _prune_empty_dirs(target.parent, dest_path)
+
+    for rel, state in states.items():
+        target = dest_path / rel
+        is_override = rel in plan.override_files
+        if (
+            old_states.get(rel) == state
+            and (rel in old_overrides) == is_override
+            and target.is_file()
+        ):
+            stats["unchanged"] += 1
+            continue
+
+        if target.is_dir() and not target.is_symlink():
+            shutil.rmtree(target)
+        elif target.exists() or target.is_symlink():
+            target.unlink()
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        src = plan.files[rel]
+        if is_override or not use_links:
+            shutil.copy2(src, target)
+        else:
+            clone_file(src, target)
+        stats["copied"] += 1
+
+    return stats
+
+
+def _prune_empty_dirs(directory: Path, stop: Path) -> None:
+    """stop 아래의 빈 디렉토리를 위로 올라가며 삭제."""
+    while directory != stop and directory.is_relative_to(stop):
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
@@ -0,0 +1,468 @@
+"""Global content-addressed Helm chart cache.
+
+같은 차트 버전을 app group/체크아웃마다 다시 내려받지 않도록, pull한 차트를
+`~/.sbkube/cache/charts`에 저장하고 이후에는 reflink(copy-on-write) 또는 copy로
+app group의 charts 디렉토리를 채웁니다. 캐시와 charts 디렉토리는 inode를 공유하지
+않으므로, pull한 차트를 제자리에서 수정해도 캐시나 다른 app group에 영향이 없습니다.
+
+Cache layout:
+    <root>/<key>/chart/...      # 압축 해제된 차트 트리
+    <root>/<key>/meta.json      # repo_url, chart, version, digest, stat_signature, ...
+
+key는 sha256(repo_url + chart + version)이며, 저장 시 차트 트리의 digest와
+stat signature(경로/크기/mtime)를 기록합니다. 조회 시에는 stat signature만 비교하고,
+달라진 경우에만 digest를 다시 계산해 일치하지 않으면 손상된 항목으로 보고 제거합니다.
+
+Environment:
+    SBKUBE_CACHE_DIR: 캐시 루트 (기본: ~/.sbkube/cache)
+    SBKUBE_CHART_CACHE: "0"/"false"이면 비활성화
+    SBKUBE_CHART_CACHE_MAX_SIZE: 최대 크기 (예: "2G", "500M", 기본: 2G)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from sbkube.utils.logger import logger
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+_FALSY = {"0", "false", "no", "off"}
+
+# Linux FICLONE ioctl (btrfs/xfs reflink)
+_FICLONE = 0x40049409
+
+
+def parse_size(text: str | int) -> int:
+    """크기 문자열을 바이트로 변환.
+
+    Args:
+        text: "2G", "500M", "1024K", "4096" 형식
+
+    Returns:
+        바이트 수
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+
+    """
+    if isinstance(text, int):
+        return text
+    value = text.strip().upper().removesuffix("IB").removesuffix("B")
+    unit = value[-1:] if value[-1:] in _SIZE_UNITS else ""
+    number = value[: -len(unit)] if unit else value
+    try:
+        return int(float(number) * _SIZE_UNITS[unit])
+    except ValueError:
+        msg = f"Invalid size: {text!r} (expected e.g. 2G, 500M)"
+        raise ValueError(msg) from None
+
+
+def is_pinned_version(version: str | None) -> bool:
+    """고정된 차트 버전인지 확인 (범위/와일드카드는 캐시하지 않음).
+
+    Args:
+        version: 차트 버전 (예: "1.2.3", "^1.2", ">=1.0")
+
+    Returns:
+        캐시 가능한 고정 버전이면 True
+
+    """
+    if not version or version == "latest":
+        return False
+    return not any(ch in version for ch in "^~*<>=|, ") and "x" not in version.lower().split(".")
+
+
+def format_size(num_bytes: int) -> str:
+    """바이트 수를 사람이 읽기 쉬운 문자열로 변환."""
+    size = float(num_bytes)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def compute_tree_digest(path: Path) -> tuple[str, int, int]:
+    """디렉토리 트리의 sha256 digest 계산.
+
+    상대 경로, 파일 내용, symlink 대상을 정렬된 순서로 해시합니다.
+
+    Args:
+        path: 디렉토리 경로
+
+    Returns:
+        (digest, total_bytes, file_count)
+
+    """
+    hasher = hashlib.sha256()
+    total_bytes = 0
+    file_count = 0
+    for file_path in sorted(p for p in path.rglob("*") if not p.is_dir() or p.is_symlink()):
+        rel = file_path.relative_to(path).as_posix()
+        if file_path.is_symlink():
+            hasher.update(f"L {rel} {os.readlink(file_path)}\n".encode())
+            continue
+        hasher.update(f"F {rel}\n".encode())
+        with file_path.open("rb") as fp:
+            for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        total_bytes += file_path.stat().st_size
+        file_count += 1
+    return f"sha256:{hasher.hexdigest()}", total_bytes, file_count
+
+
+def compute_tree_signature(path: Path) -> str:
+    """디렉토리 트리의 stat signature 계산 (파일 내용은 읽지 않음).
+
+    상대 경로, 크기, mtime_ns, symlink 대상만 해시하므로 digest보다 훨씬 저렴하며,
+    캐시 항목이 저장 이후 변경되었는지 빠르게 판별하는 데 사용합니다.
+
+    Args:
+        path: 디렉토리 경로
+
+    Returns:
+        signature 문자열
+
+    """
+    hasher = hashlib.sha256()
+    for file_path in sorted(p for p in path.rglob("*") if not p.is_dir() or p.is_symlink()):
+        rel = file_path.relative_to(path).as_posix()
+        if file_path.is_symlink():
+            hasher.update(f"L {rel} {os.readlink(file_path)}\n".encode())
+            continue
+        stat = file_path.stat()
+        hasher.update(f"F {rel} {stat.st_size} {stat.st_mtime_ns}\n".encode())
+    return f"sha256:{hasher.hexdigest()}"
+
+
+def clone_file(src: Path, dest: Path, hardlink: bool = True) -> str:
+    """파일을 hardlink → reflink → copy 순서로 복제.
+
+    Args:
+        src: 원본 파일
+        dest: 생성할 파일
+        hardlink: False이면 hardlink를 건너뛰고 reflink/copy만 사용
+            (dest를 제자리에서 수정해도 src가 바뀌지 않아야 하는 경우)
+
+    Returns:
+        사용한 방식 ("hardlink", "reflink", "copy")
+
+    """
+    if hardlink:
+        try:
+            os.link(src, dest)
+            return "hardlink"
+        except OSError:
+            pass
+
+    try:
+        import fcntl
+
+        with src.open("rb") as src_fp, dest.open("wb") as dest_fp:
+            fcntl.ioctl(dest_fp.fileno(), _FICLONE, src_fp.fileno())
+        shutil.copystat(src, dest)
+        return "reflink"
+    except (ImportError, OSError):
+        dest.unlink(missing_ok=True)
+
+    shutil.copy2(src, dest)
+    return "copy"
+
+
+def link_tree(src: Path, dest: Path, hardlink: bool = True) -> dict[str, int]:
+    """src 트리를 dest로 복제 (파일은 hardlink/reflink/copy).
+
+    Args:
+        src: 원본 디렉토리
+        dest: 생성할 디렉토리 (존재하지 않아야 함)
+        hardlink: False이면 reflink/copy만 사용 (clone_file 참고)
+
+    Returns:
+        방식별 파일 수 (예: {"hardlink": 120})
+
+    """
+    stats: dict[str, int] = {}
+    dest.mkdir(parents=True)
+    for root, dirs, files in os.walk(src):
+        root_path = Path(root)
+        target_root = dest / root_path.relative_to(src)
+        for name in dirs:
+            dir_path = root_path / name
+            if dir_path.is_symlink():
+                os.symlink(os.readlink(dir_path), target_root / name)
+            else:
+                (target_root / name).mkdir(exist_ok=True)
+        for name in files:
+            file_path = root_path / name
+            if file_path.is_symlink():
+                os.symlink(os.readlink(file_path), target_root / name)
+                continue
+            method = clone_file(file_path, target_root / name, hardlink=hardlink)
+            stats[method] = stats.get(method, 0) + 1
+    return stats
+
+
+@dataclass
+class ChartCacheEntry:
+    """Metadata of a cached chart."""
+
+    key: str
+    repo_url: str
+    chart: str
+    version: str
+    digest: str
+    size_bytes: int
+    file_count: int
+    created_at: float
+    last_used_at: float
+    stat_signature: str = ""
+
+    @property
+    def display_name(self) -> str:
+        """'chart-version' 형식 이름."""
+        return f"{self.chart}-{self.version}"
+
+
+class ChartCache:
+    """Content-addressed chart cache with LRU/size based eviction."""
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None) -> None:
+        """ChartCache 초기화.
+
+        Args:
+            root: 캐시 디렉토리 (기본: $SBKUBE_CACHE_DIR/charts 또는 ~/.sbkube/cache/charts)
+            max_bytes: 최대 캐시 크기 (기본: $SBKUBE_CHART_CACHE_MAX_SIZE 또는 2GiB)
+
+        """
+        if root is None:
+            base = os.getenv("SBKUBE_CACHE_DIR")
+            root = (Path(base) if base else Path.home() / ".sbkube" / "cache") / "charts"
+        if max_bytes is None:
+            env_size = os.getenv("SBKUBE_CHART_CACHE_MAX_SIZE")
+            max_bytes = parse_size(env_size) if env_size else DEFAULT_MAX_BYTES
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(repo_url: str, chart: str, version: str) -> str:
+        """캐시 키 생성 (repo URL + chart + version)."""
+        raw = f"{repo_url.rstrip('/')}\n{chart}\n{version}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def _read_meta(self, entry_dir: Path) -> ChartCacheEntry | None:
+        try:
+            data = json.loads((entry_dir / "meta.json").read_text(encoding="utf-8"))
+            return ChartCacheEntry(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write_meta(self, entry_dir: Path, entry: ChartCacheEntry) -> None:
+        tmp_path = entry_dir / f".meta-{uuid.uuid4().hex[:8]}.json"
+        tmp_path.write_text(json.dumps(asdict(entry), indent=2), encoding="utf-8")
+        tmp_path.replace(entry_dir / "meta.json")
+
+    def contains(self, repo_url: str, chart: str, version: str) -> bool:
+        """캐시 항목 존재 여부 (digest 검증 없이 메타데이터만 확인)."""
+        key = self.make_key(repo_url, chart, version)
+        return (self._entry_dir(key) / "meta.json").exists()
+
+    def lookup(self, repo_url: str, chart: str, version: str) -> ChartCacheEntry | None:
+        """캐시 조회 (무결성 검증 포함).
+
+        stat signature가 저장 시점과 같으면 digest 계산을 생략하고, 다르면 digest를
+        다시 계산해 내용이 바뀐 항목은 제거합니다.
+
+        Args:
+            repo_url: Helm 저장소 URL
+            chart: 차트 이름
+            version: 차트 버전
+
+        Returns:
+            유효한 캐시 항목 또는 None (없거나 손상된 경우)
+
+        """
+        key = self.make_key(repo_url, chart, version)
+        entry_dir = self._entry_dir(key)
+        entry = self._read_meta(entry_dir)
+        if entry is None or not (entry_dir / "chart").is_dir():
+            return None
+
+        chart_dir = entry_dir / "chart"
+        signature = compute_tree_signature(chart_dir)
+        if signature != entry.stat_signature:
+            digest, _, _ = compute_tree_digest(chart_dir)
+            if digest != entry.digest:
+                logger.warning(f"Chart cache entry corrupted, evicting: {entry.display_name}")
+                self.remove(key)
+                return None
+            # 내용은 같고 stat만 바뀐 경우 (예: touch, 이전 버전 메타데이터)
+            entry.stat_signature = signature
+
+        entry.last_used_at = time.time()
+        try:
+            self._write_meta(entry_dir, entry)
+        except OSError:
+            pass
+        return entry
+
+    def materialize(self, entry: ChartCacheEntry, dest: Path) -> dict[str, int]:
+        """캐시된 차트로 dest 디렉토리를 채움.
+
+        파일은 reflink(copy-on-write) 또는 copy로 복제하며 hardlink는 사용하지 않습니다.
+        dest는 사용자가 수정할 수 있는 작업 디렉토리이므로 캐시와 inode를 공유하면 안 됩니다.
+
+        Args:
+            entry: lookup()이 반환한 캐시 항목
+            dest: 생성할 차트 디렉토리 (존재하면 교체)
+
+        Returns:
+            방식별 파일 수
+
+        """
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dest = dest.parent / f"_cache_{dest.name}_{uuid.uuid4().hex[:8]}"
+        stats = link_tree(self._entry_dir(entry.key) / "chart", tmp_dest, hardlink=False)
+        if dest.exists():
+            shutil.rmtree(dest)
+        tmp_dest.rename(dest)
+        return stats
+
+    def store(
+        self, repo_url: str, chart: str, version: str, source_dir: Path
+    ) -> ChartCacheEntry | None:
+        """pull한 차트를 캐시에 저장.
+
+        Args:
+            repo_url: Helm 저장소 URL
+            chart: 차트 이름
+            version: 차트 버전
+            source_dir: 압축 해제된 차트 디렉토리
+
+        Returns:
+            저장된 캐시 항목 (실패 시 None)
+
+        """
+        key = self.make_key(repo_url, chart, version)
+        entry_dir = self._entry_dir(key)
+        tmp_dir = self.root / f".tmp-{uuid.uuid4().hex}"
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            # source_dir(charts/)와 inode를 공유하지 않도록 reflink/copy만 사용
+            link_tree(source_dir, tmp_dir / "chart", hardlink=False)
+            digest, size_bytes, file_count = compute_tree_digest(tmp_dir / "chart")
+            stat_signature = compute_tree_signature(tmp_dir / "chart")
+            now = time.time()
+            entry = ChartCacheEntry(
+                key=key,
+                repo_url=repo_url,
+                chart=chart,
+                version=version,
+                digest=digest,
+                size_bytes=size_bytes,
+                file_count=file_count,
+                created_at=now,
+                last_used_at=now,
+                stat_signature=stat_signature,
+            )
+            self._write_meta(tmp_dir, entry)
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir)
+            tmp_dir.rename(entry_dir)
+        except OSError as e:
+            logger.warning(f"Failed to store chart in cache: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return None
+
+        if self.max_bytes:
+            self.prune(max_bytes=self.max_bytes, keep={key})
+        return entry
+
+    def list_entries(self) -> list[ChartCacheEntry]:
+        """캐시 항목 목록 (최근 사용 순)."""
+        if not self.root.exists():
+            return []
+        entries = []
+        for entry_dir in self.root.iterdir():
+            if not entry_dir.is_dir() or entry_dir.name.startswith("."):
+                continue
+            entry = self._read_meta(entry_dir)
+            if entry is not None:
+                entries.append(entry)
+        return sorted(entries, key=lambda e: e.last_used_at, reverse=True)
+
+    def total_size(self) -> int:
+        """전체 캐시 크기 (바이트)."""
+        return sum(entry.size_bytes for entry in self.list_entries())
+
+    def remove(self, key: str) -> None:
+        """캐시 항목 제거."""
+        shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+
+    def prune(
+        self,
+        max_bytes: int | None = None,
+        older_than_seconds: float | None = None,
+        keep: set[str] | None = None,
+    ) -> list[ChartCacheEntry]:
+        """오래된 항목 제거 (LRU).
+
+        Args:
+            max_bytes: 전체 크기가 이 값 이하가 될 때까지 가장 오래 사용하지 않은 항목부터 제거
+            older_than_seconds: 마지막 사용 후 이 시간이 지난 항목 제거
+            keep: 제거하지 않을 키 목록
+
+        Returns:
+            제거된 항목 목록
+
+        """
+        keep = keep or set()
+        entries = self.list_entries()
+        removed: list[ChartCacheEntry] = []
+
+        if older_than_seconds is not None:
+            cutoff = time.time() - older_than_seconds
+            for entry in entries:
+                if entry.key not in keep and entry.last_used_at < cutoff:
+                    self.remove(entry.key)
+                    removed.append(entry)
+            entries = [e for e in entries if e not in removed]
+
+        if max_bytes is not None:
+            total = sum(e.size_bytes for e in entries)
+            for entry in reversed(entries):  # least recently used first
+                if total <= max_bytes:
+                    break
+                if entry.key in keep:
+                    continue
+                self.remove(entry.key)
+                removed.append(entry)
+                total -= entry.size_bytes
+
+        for tmp_dir in self.root.glob(".tmp-*") if self.root.exists() else []:
+            if time.time() - tmp_dir.stat().st_mtime > 3600:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        return removed
+
+    def clear(self) -> list[ChartCacheEntry]:
+        """모든 캐시 항목 제거."""
+        entries = self.list_entries()
+        for entry in entries:
+            self.remove(entry.key)
+        return entries
+
+
+def get_chart_cache() -> ChartCache | None:
+    """환경 설정에 따른 ChartCache 반환 (비활성화 시 None)."""
+    if os.getenv("SBKUBE_CHART_CACHE", "").strip().lower() in _FALSY:
+        return None
+    return ChartCache()
@@ -1,18 +1,53 @@
 """Cluster status cache manager.
 
 This module provides functionality to cache and retrieve Kubernetes cluster status
-information in YAML format with TTL (Time To Live) support.
+information with per-section TTL (Time To Live) support.
+
+The cache is stored as compact JSON (the stdlib C decoder is an order of
+magnitude faster than the pure-Python YAML loader on multi-MB snapshots).
+Each section (nodes, pods, Helm releases, ...) carries its own timestamp and
+TTL, so a stale section can be refreshed without re-collecting the rest.
+Writers hold an exclusive ``flock`` on a sidecar lock file and replace the
+cache atomically through a unique temp file.
 """
 
+import fcntl
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
 from rich.console import Console
 
 # Constants
 DEFAULT_CACHE_TTL_SECONDS = 300  # 5 minutes
+CACHE_FORMAT_VERSION = 2
+
+# Section별 TTL: 노드/네임스페이스는 거의 바뀌지 않고, release/pod는 자주 바뀜
+DEFAULT_SECTION_TTL_SECONDS: dict[str, int] = {
+    "cluster_info": 3600,
+    "nodes": 900,
+    "namespaces": 900,
+    "pods": 60,
+    "helm_releases": 120,
+}
+# TTL이 지난 section을 표시하면서 background 갱신을 허용하는 최대 나이
+MAX_STALE_SECONDS = 3600
+
+# section이 아닌 cache 메타데이터 key
+_METADATA_KEYS = {
+    "format_version",
+    "context",
+    "cluster_name",
+    "timestamp",
+    "ttl_seconds",
+    "sections",
+    "collection",
+}
 
 from sbkube.utils.logger import logger
 
@@ -20,22 +55,35 @@ from sbkube.utils.logger import logger
 console = logger.console
 
 
+def _parse_timestamp(value: Any) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    # Ensure timezone awareness for comparison
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
 class ClusterCache:
-    """Manages cluster status cache in YAML format.
+    """Manages cluster status cache in JSON format.
 
     Cache structure:
-    - Base cache file: {context}_{cluster}.yaml
+    - Base cache file: {context}_{cluster}.json
       Contains: Full cluster status with helm releases (including labels)
       Used by: All views (standard, by-group, specific group)
       Labels enable app-group classification: sbkube.io/app-group
+    - ``sections``: per-section timestamp and TTL
+      ({"nodes": {"timestamp": ..., "ttl_seconds": 900}, ...})
 
     Benefits:
     - Single source of truth for cluster data
     - All releases include label information for reliable grouping
     - Grouping is computed on-demand from cache
-    - Reduces storage overhead and ensures consistency
+    - Stale sections can be refreshed individually (stale-while-revalidate)
 
-    TTL: 5 minutes for all cached data
+    TTL: 5 minutes unless per-section TTLs are given on save
     """
 
     def __init__(
@@ -45,6 +93,7 @@ class ClusterCache:
         cluster: str,
         by_group: bool = False,
         app_group: str | None = None,
+        section_ttls: dict[str, int] | None = None,
     ) -> None:
         """Initialize cluster cache manager.
 
@@ -54,6 +103,8 @@ class ClusterCache:
             cluster: cluster identifier (from sources.yaml)
             by_group: Whether to group by app-group
             app_group: Specific app-group (if filtering)
+            section_ttls: Per-section TTL overrides (e.g. DEFAULT_SECTION_TTL_SECONDS);
+                sections not listed use the ttl_seconds given on save
 
         """
         self.cache_dir = Path(cache_dir)
@@ -61,71 +112,181 @@ class ClusterCache:
         self.cluster = cluster or "unknown"
         self.by_group = by_group
         self.app_group = app_group
+        self.section_ttls = dict(section_ttls or {})
         self.cache_file = self._generate_cache_filename()
+        self.lock_file = self.cache_file.with_suffix(".lock")
+        # (inode, mtime_ns, size) → 파싱 결과 (같은 명령에서 여러 번 load해도 한 번만 파싱)
+        self._memo: tuple[tuple[int, int, int], dict[str, Any]] | None = None
 
     def _generate_cache_filename(self) -> Path:
         """Generate cache filename based on options.
 
         Cache structure:
         - Base file: Contains all cluster data (helm releases with labels)
-        - Grouped file: Contains app-group classification (only if by_group or app_group)
+        - Grouped view is calculated from the base file
 
         Returns:
             Path object for cache file
 
         Examples:
-            Base: {context}_{cluster}.yaml (always)
-            Grouped: {context}_{cluster}_grouped.yaml (only if --by-group)
+            Base: {context}_{cluster}.json (always)
 
         """
         base_name = f"{self.context}_{self.cluster}"
 
         # Always use base file for caching raw cluster data
         # Grouped view is calculated from base file
-        filename = f"{base_name}.yaml"
+        filename = f"{base_name}.json"
 
         return self.cache_dir / filename
 
+    @contextmanager
+    def _flock(self, path: Path, blocking: bool) -> Iterator[bool]:
+        """Hold an exclusive flock on ``path`` (yields False if not acquired)."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with path.open("a") as lock_fp:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            try:
+                fcntl.flock(lock_fp.fileno(), flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_fp.fileno(), fcntl.LOCK_UN)
+
+    def refresh_lock(self) -> AbstractContextManager[bool]:
+        """Non-blocking lock for a background refresh.
+
+        Yields True if this process should refresh, False if another
+        refresh for the same cache is already running.
+        """
+        return self._flock(self.cache_file.with_suffix(".refresh.lock"), blocking=False)
+
+    def _write(self, cache_data: dict[str, Any]) -> None:
+        """Atomic write: unique temp file in the cache dir, then replace."""
+        fd, temp_name = tempfile.mkstemp(
+            dir=self.cache_dir, prefix=f".{self.cache_file.stem}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cache_data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp_name, self.cache_file)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+        # 이전 버전의 YAML cache 정리
+        self.cache_file.with_suffix(".yaml").unlink(missing_ok=True)
+
     def save(
-        self, data: dict[str, Any], ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS
+        self,
+        data: dict[str, Any],
+        ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
     ) -> None:
-        """Save cluster status data to cache file.
-
-        Uses atomic write (temp file + rename) to prevent corruption.
+        """Save cluster status data to cache file (replaces all sections).
 
         Args:
             data: Cluster status data to cache
-            ttl_seconds: Time to live in seconds (default: 300 = 5 minutes)
+            ttl_seconds: Default TTL in seconds (default: 300 = 5 minutes)
 
         """
-        # Ensure cache directory exists
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-
-        # Add metadata
+        now = datetime.now(UTC).isoformat()
         cache_data = {
+            "format_version": CACHE_FORMAT_VERSION,
             "context": self.context,
             "cluster_name": self.cluster,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": now,
             "ttl_seconds": ttl_seconds,
+            "sections": {
+                key: {
+                    "timestamp": now,
+                    "ttl_seconds": self.section_ttls.get(key, ttl_seconds),
+                }
+                for key in data
+                if key not in _METADATA_KEYS
+            },
             **data,
         }
 
-        # Atomic write: write to temp file, then rename
-        temp_file = self.cache_file.with_suffix(".tmp")
         try:
-            with temp_file.open("w", encoding="utf-8") as f:
-                yaml.safe_dump(
-                    cache_data,
-                    f,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                    sort_keys=False,
-                )
-            temp_file.rename(self.cache_file)
+            with self._flock(self.lock_file, blocking=True):
+                self._write(cache_data)
         except Exception as e:
             console.print(f"[yellow]Warning: Failed to save cache: {e}[/yellow]")
-            if temp_file.exists():
-                temp_file.unlink()
+
+    def update(
+        self,
+        data: dict[str, Any],
+        ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Replace only the sections present in ``data`` (keeps the others).
+
+        Read-modify-write runs under the cache lock, so concurrent refreshes
+        of different sections do not lose each other's results.
+
+        Args:
+            data: Freshly collected sections
+            ttl_seconds: Default TTL in seconds
+
+        """
+        try:
+            with self._flock(self.lock_file, blocking=True):
+                current = self._read()
+                if current is None:
+                    current = {}
+                    sections: dict[str, Any] = {}
+                else:
+                    sections = dict(current.get("sections") or {})
+
+                now = datetime.now(UTC).isoformat()
+                for key, value in data.items():
+                    if key in _METADATA_KEYS:
+                        continue
+                    current[key] = value
+                    sections[key] = {
+                        "timestamp": now,
+                        "ttl_seconds": self.section_ttls.get(key, ttl_seconds),
+                    }
+                if "collection" in data:
+                    collection = dict(current.get("collection") or {})
+                    collection["sources"] = {
+                        **(collection.get("sources") or {}),
+                        **data["collection"].get("sources", {}),
+                    }
+                    collection["total_seconds"] = data["collection"].get("total_seconds", 0)
+                    current["collection"] = collection
+
+                current.update(
+                    format_version=CACHE_FORMAT_VERSION,
+                    context=self.context,
+                    cluster_name=self.cluster,
+                    timestamp=now,
+                    ttl_seconds=current.get("ttl_seconds", ttl_seconds),
+                    sections=sections,
+                )
+                self._write(current)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Failed to update cache: {e}[/yellow]")
+
+    def _read(self) -> dict[str, Any] | None:
+        try:
+            stat = self.cache_file.stat()
+        except FileNotFoundError:
+            self._memo = None
+            return None
+
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if self._memo is not None and self._memo[0] == key:
+            return dict(self._memo[1])
+
+        with self.cache_file.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            return None
+        self._memo = (key, data)
+        return dict(data)
 
     def load(self) -> dict[str, Any] | None:
         """Load cluster status data from cache file.
@@ -134,25 +295,46 @@ class ClusterCache:
             Cached data if valid, None if cache doesn't exist or is invalid
 
         """
-        if not self.cache_file.exists():
-            return None
-
         try:
-            with self.cache_file.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            return data if isinstance(data, dict) else None
+            return self._read()
         except Exception as e:
             console.print(f"[yellow]Warning: Failed to load cache: {e}[/yellow]")
             return None
 
-    def is_valid(self, ttl_seconds: int | None = None) -> bool:
+    def _section_ages(
+        self, data: dict[str, Any], ttl_seconds: int | None = None
+    ) -> dict[str, tuple[float, float]]:
+        """Section → (age seconds, TTL seconds).
+
+        Caches written before per-section metadata fall back to the top-level
+        timestamp/TTL for every section.
+        """
+        now = datetime.now(UTC)
+        default_ttl = data.get("ttl_seconds", DEFAULT_CACHE_TTL_SECONDS)
+        sections = data.get("sections")
+        if not isinstance(sections, dict) or not sections:
+            sections = {"*": {"timestamp": data.get("timestamp"), "ttl_seconds": default_ttl}}
+
+        ages: dict[str, tuple[float, float]] = {}
+        for key, meta in sections.items():
+            cached_time = _parse_timestamp(meta.get("timestamp"))
+            if cached_time is None:
+                continue
+            # Use provided TTL or fall back to cached TTL
+            ttl = ttl_seconds if ttl_seconds is not None else meta.get("ttl_seconds", default_ttl)
+            ages[key] = ((now - cached_time).total_seconds(), ttl)
+        return ages
+
+    def is_valid(self, ttl_seconds: int | None = None, allow_stale: bool = False) -> bool:
         """Check if cached data is still valid based on TTL.
 
         Args:
             ttl_seconds: Override TTL from cache file (optional)
+            allow_stale: Also accept sections past their TTL but younger than
+                MAX_STALE_SECONDS (served while being revalidated)
 
         Returns:
-            True if cache exists and hasn't expired, False otherwise
+            True if cache exists and no section has expired, False otherwise
 
         """
         data = self.load()
@@ -160,31 +342,35 @@ class ClusterCache:
             return False
 
         try:
-            timestamp_str = data.get("timestamp")
-            if not timestamp_str:
+            ages = self._section_ages(data, ttl_seconds)
+            if not ages:
                 return False
-
-            cached_time = datetime.fromisoformat(timestamp_str)
-            # Ensure timezone awareness for comparison
-            if cached_time.tzinfo is None:
-                cached_time = cached_time.replace(tzinfo=UTC)
-            current_time = datetime.now(UTC)
-
-            # Use provided TTL or fall back to cached TTL
-            ttl = (
-                ttl_seconds
-                if ttl_seconds is not None
-                else data.get("ttl_seconds", DEFAULT_CACHE_TTL_SECONDS)
-            )
-
-            elapsed_seconds = (current_time - cached_time).total_seconds()
-            return elapsed_seconds < ttl
+            if allow_stale:
+                return all(age < max(ttl, MAX_STALE_SECONDS) for age, ttl in ages.values())
+            return all(age < ttl for age, ttl in ages.values())
         except Exception as e:
             console.print(f"[yellow]Warning: Failed to validate cache: {e}[/yellow]")
             return False
 
+    def stale_sections(self) -> list[str]:
+        """Sections whose TTL has expired (to be revalidated).
+
+        Returns:
+            Sorted section names; empty if everything is fresh or the cache
+            has no per-section metadata
+
+        """
+        data = self.load()
+        if not data:
+            return []
+        try:
+            ages = self._section_ages(data)
+        except Exception:
+            return []
+        return sorted(key for key, (age, ttl) in ages.items() if key != "*" and age >= ttl)
+
     def get_age_seconds(self) -> float | None:
-        """Get cache age in seconds.
+        """Get cache age in seconds (age of the oldest section).
 
         Returns:
             Age in seconds, or None if cache doesn't exist or is invalid
@@ -195,21 +381,13 @@ class ClusterCache:
             return None
 
         try:
-            timestamp_str = data.get("timestamp")
-            if not timestamp_str:
-                return None
-
-            cached_time = datetime.fromisoformat(timestamp_str)
-            # Ensure timezone awareness for comparison
-            if cached_time.tzinfo is None:
-                cached_time = cached_time.replace(tzinfo=UTC)
-            current_time = datetime.now(UTC)
-            return (current_time - cached_time).total_seconds()
+            ages = self._section_ages(data)
+            return max(age for age, _ in ages.values()) if ages else None
         except Exception:
             return None
 
     def get_remaining_ttl(self) -> float | None:
-        """Get remaining TTL in seconds.
+        """Get remaining TTL in seconds (until the first section expires).
 
         Returns:
             Remaining seconds until expiration, or None if expired/invalid
@@ -219,12 +397,14 @@ class ClusterCache:
         if not data:
             return None
 
-        age = self.get_age_seconds()
-        if age is None:
+        try:
+            ages = self._section_ages(data)
+        except Exception:
+            return None
+        if not ages:
             return None
 
-        ttl = data.get("ttl_seconds", 300)
-        remaining = ttl - age
+        remaining = min(ttl - age for age, ttl in ages.values())
         return remaining if remaining > 0 else None
 
     def delete(self) -> None:
@@ -232,6 +412,7 @@ class ClusterCache:
         if self.cache_file.exists():
             try:
                 self.cache_file.unlink()
+                self._memo = None
             except Exception as e:
                 console.print(f"[yellow]Warning: Failed to delete cache: {e}[/yellow]")
 
@@ -59,23 +59,7 @@ def group_releases_by_app_group(
     unmanaged = []
 
     # Get deployment history from State DB if available
-    state_db_mapping = {}
-    if db:
-        try:
-            # Query recent deployments
-            deployments = db.list_deployments(limit=1000)
-            for deployment in deployments:
-                # Build mapping: release_name -> app_group
-                for app in deployment.apps:
-                    if app.get("app_group"):
-                        # Extract release name from app metadata
-                        # This is a placeholder - actual implementation depends on app type
-                        release_name = app.get("release_name") or app.get("name")
-                        if release_name:
-                            state_db_mapping[release_name] = app.get("app_group")
-        except Exception:
-            # Gracefully handle DB errors
-            pass
+    state_db_mapping = load_release_app_groups(db)
 
     for release in helm_releases:
         release_name = release.get("name", "unknown")
@@ -83,26 +67,7 @@ def group_releases_by_app_group(
         status = release.get("status", "unknown")
         chart = release.get("chart", "unknown")
 
-        # Try to determine app-group (priority-based)
-        app_group = None
-
-        # Method 1 (Priority 1): Check sbkube.io/app-group label
-        # This is the most reliable way if label is set at deploy time
-        labels = release.get("labels", {})
-        if labels and isinstance(labels, dict):
-            app_group = labels.get("sbkube.io/app-group")
-
-        # Method 2 (Priority 2): Check State DB (deployment history)
-        if not app_group and release_name in state_db_mapping:
-            app_group = state_db_mapping[release_name]
-
-        # Method 3 (Priority 3): Extract from release name pattern
-        if not app_group:
-            app_group = extract_app_group_from_name(release_name)
-
-        # Method 4 (Priority 4): Try namespace pattern (least reliable)
-        if not app_group and namespace != "default":
-            app_group = extract_app_group_from_name(namespace)
+        app_group = resolve_app_group(release, state_db_mapping)
 
         if app_group:
             # Managed release - add to app-group
@@ -161,6 +126,77 @@ def group_releases_by_app_group(
     }
 
 
+def load_release_app_groups(db: DeploymentDatabase | None) -> dict[str, str]:
+    """Build a release name → app-group mapping from State DB history.
+
+    Args:
+        db: DeploymentDatabase instance (None returns an empty mapping)
+
+    Returns:
+        Mapping used by resolve_app_group() as the second classification source
+
+    """
+    state_db_mapping: dict[str, str] = {}
+    if not db:
+        return state_db_mapping
+    try:
+        # Query recent deployments
+        deployments = db.list_deployments(limit=1000)
+        for deployment in deployments:
+            # Build mapping: release_name -> app_group
+            for app in deployment.apps:
+                if app.get("app_group"):
+                    # Extract release name from app metadata
+                    # This is a placeholder - actual implementation depends on app type
+                    release_name = app.get("release_name") or app.get("name")
+                    if release_name:
+                        state_db_mapping[release_name] = app.get("app_group")
+    except Exception:
+        # Gracefully handle DB errors
+        pass
+    return state_db_mapping
+
+
+def resolve_app_group(
+    release: dict[str, Any], state_db_mapping: dict[str, str]
+) -> str | None:
+    """Determine the app-group of one Helm release (None if unmanaged).
+
+    Classification priority matches group_releases_by_app_group().
+
+    Args:
+        release: Helm release dict from cluster status
+        state_db_mapping: Result from load_release_app_groups()
+
+    Returns:
+        App-group name or None
+
+    """
+    release_name = release.get("name", "unknown")
+    namespace = release.get("namespace", "unknown")
+    app_group = None
+
+    # Method 1 (Priority 1): Check sbkube.io/app-group label
+    # This is the most reliable way if label is set at deploy time
+    labels = release.get("labels", {})
+    if labels and isinstance(labels, dict):
+        app_group = labels.get("sbkube.io/app-group")
+
+    # Method 2 (Priority 2): Check State DB (deployment history)
+    if not app_group and release_name in state_db_mapping:
+        app_group = state_db_mapping[release_name]
+
+    # Method 3 (Priority 3): Extract from release name pattern
+    if not app_group:
+        app_group = extract_app_group_from_name(release_name)
+
+    # Method 4 (Priority 4): Try namespace pattern (least reliable)
+    if not app_group and namespace != "default":
+        app_group = extract_app_group_from_name(namespace)
+
+    return app_group or None
+
+
 def filter_by_app_group(
     grouped_data: dict[str, Any],
     app_group: str,
@@ -1,26 +1,92 @@
 """Cluster status collector.
 
 This module provides functionality to collect comprehensive Kubernetes cluster
-status information including nodes, namespaces, and Helm releases.
+status information including nodes, namespaces, pods, and Helm releases.
+
+Sources are collected concurrently (each is one or two kubectl/helm calls
+against the API server), and the per-source timing is returned with the data.
 """
 
 import json
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from rich.console import Console
 
+from sbkube.utils.logger import logger
+from sbkube.utils.perf import bind_span_context
+
 # Constants
 KUBECTL_TIMEOUT_SECONDS = 30
 HELM_TIMEOUT_SECONDS = 30
 
-from sbkube.utils.logger import logger
+# API list paths (kubectl get --raw), so list responses keep their resourceVersion
+API_LIST_PATHS = {
+    "nodes": "/api/v1/nodes",
+    "pods": "/api/v1/pods",
+    "helm_releases": "/api/v1/secrets?labelSelector=owner%3Dhelm",
+}
 
 # Use logger's console so it respects --format (quiet in non-human modes)
 console = logger.console
 
 
+def parse_node(item: dict[str, Any]) -> dict[str, Any]:
+    """Convert a Node object (kubectl JSON) into a status row."""
+    metadata = item.get("metadata", {})
+    status = "Unknown"
+    for condition in item.get("status", {}).get("conditions", []):
+        if condition.get("type") == "Ready":
+            status = "Ready" if condition.get("status") == "True" else "NotReady"
+            break
+
+    # Node roles from labels
+    roles = [
+        key.replace("node-role.kubernetes.io/", "")
+        for key in metadata.get("labels", {})
+        if key.startswith("node-role.kubernetes.io/")
+    ]
+
+    return {
+        "name": metadata.get("name", "unknown"),
+        "status": status,
+        "roles": roles if roles else ["<none>"],
+        "version": item.get("status", {})
+        .get("nodeInfo", {})
+        .get("kubeletVersion", "unknown"),
+    }
+
+
+def parse_pod(item: dict[str, Any]) -> dict[str, Any]:
+    """Convert a Pod object (kubectl JSON) into a health check row."""
+    metadata = item.get("metadata", {})
+    status = item.get("status", {})
+    container_statuses = status.get("containerStatuses", [])
+    owners = metadata.get("ownerReferences", [])
+
+    return {
+        "name": metadata.get("name", "unknown"),
+        "namespace": metadata.get("namespace", "default"),
+        "phase": status.get("phase", "Unknown"),
+        "ready_containers": sum(
+            1 for container in container_statuses if container.get("ready")
+        ),
+        "total_containers": len(item.get("spec", {}).get("containers", []))
+        or len(container_statuses),
+        "restart_count": sum(
+            container.get("restartCount", 0) for container in container_statuses
+        ),
+        "conditions": [
+            {key: condition[key] for key in ("type", "status", "reason") if key in condition}
+            for condition in status.get("conditions", [])
+        ],
+        "owner": f"{owners[0].get('kind')}/{owners[0].get('name')}" if owners else None,
+    }
+
+
 class ClusterStatusCollector:
     """Collects Kubernetes cluster status information.
 
@@ -41,6 +107,8 @@ class ClusterStatusCollector:
         self.context = context
         self._kubectl_base_cmd = self._build_kubectl_cmd()
         self._helm_base_cmd = self._build_helm_cmd()
+        # resourceVersion of the lists behind the last collect_all() (watch 시작점)
+        self.resource_versions: dict[str, str] = {}
 
     def _build_kubectl_cmd(self) -> list[str]:
         """Build base kubectl command with kubeconfig and context."""
@@ -112,49 +180,84 @@ class ClusterStatusCollector:
             check=True,
         )
 
-    def collect_all(self) -> dict[str, Any]:
-        """Collect all cluster status information.
+    def list_objects(self, kind: str) -> tuple[list[dict[str, Any]], str]:
+        """List raw API objects of ``kind`` (a key of API_LIST_PATHS).
 
         Returns:
-            Dictionary containing cluster_info, nodes, namespaces, and helm_releases
+            (items, resourceVersion of the list)
+
+        Raises:
+            subprocess.CalledProcessError: if command fails
+            subprocess.TimeoutExpired: if command times out
 
         """
-        result: dict[str, Any] = {}
+        result = self._run_kubectl(["get", "--raw", API_LIST_PATHS[kind]])
+        data = json.loads(result.stdout)
+        return data.get("items") or [], data.get("metadata", {}).get("resourceVersion", "")
 
-        # Collect cluster info (non-blocking on failure)
-        try:
-            result["cluster_info"] = self._collect_cluster_info()
-        except Exception as e:
-            console.print(
-                f"[yellow]Warning: Failed to collect cluster info: {e}[/yellow]"
-            )
-            result["cluster_info"] = {"error": str(e)}
+    def _sources(self) -> dict[str, tuple[Any, Any, str]]:
+        """Collected sources: key → (collector, fallback value, label)."""
+        return {
+            "cluster_info": (self._collect_cluster_info, None, "cluster info"),
+            "nodes": (self._collect_nodes, [], "nodes"),
+            "namespaces": (self._collect_namespaces, [], "namespaces"),
+            "pods": (self._collect_pods, [], "pods"),
+            "helm_releases": (self._collect_helm_releases, [], "Helm releases"),
+        }
 
-        # Collect nodes (non-blocking on failure)
-        try:
-            result["nodes"] = self._collect_nodes()
-        except Exception as e:
-            console.print(f"[yellow]Warning: Failed to collect nodes: {e}[/yellow]")
-            result["nodes"] = []
+    def collect_all(self, sections: list[str] | None = None) -> dict[str, Any]:
+        """Collect all cluster status information concurrently.
 
-        # Collect namespaces (non-blocking on failure)
-        try:
-            result["namespaces"] = self._collect_namespaces()
-        except Exception as e:
-            console.print(
-                f"[yellow]Warning: Failed to collect namespaces: {e}[/yellow]"
-            )
-            result["namespaces"] = []
+        A failing source does not block the others: it is reported as a
+        warning and replaced by an empty value.
 
-        # Collect Helm releases (non-blocking on failure)
-        try:
-            result["helm_releases"] = self._collect_helm_releases()
-        except Exception as e:
-            console.print(
-                f"[yellow]Warning: Failed to collect Helm releases: {e}[/yellow]"
-            )
-            result["helm_releases"] = []
+        Args:
+            sections: Collect only these sources (e.g. stale cache sections);
+                None collects everything
+
+        Returns:
+            Dictionary containing cluster_info, nodes, namespaces, pods,
+            helm_releases and collection (per-source timing in seconds)
 
+        """
+        sources = self._sources()
+        if sections is not None:
+            sources = {key: source for key, source in sources.items() if key in sections}
+        self.resource_versions = {}
+        started = time.perf_counter()
+
+        def timed(collect: Any) -> tuple[Any, Exception | None, float]:
+            start = time.perf_counter()
+            try:
+                return collect(), None, time.perf_counter() - start
+            except Exception as e:
+                return None, e, time.perf_counter() - start
+
+        with ThreadPoolExecutor(
+            max_workers=max(len(sources), 1), thread_name_prefix="cluster-status"
+        ) as executor:
+            futures = {
+                key: executor.submit(bind_span_context(timed), collect)
+                for key, (collect, _, _) in sources.items()
+            }
+
+        result: dict[str, Any] = {}
+        timings: dict[str, dict[str, Any]] = {}
+        for key, future in futures.items():
+            _, fallback, label = sources[key]
+            value, error, duration = future.result()
+            timings[key] = {"duration_seconds": round(duration, 3)}
+            if error is None:
+                result[key] = value
+                continue
+            console.print(f"[yellow]Warning: Failed to collect {label}: {error}[/yellow]")
+            result[key] = {"error": str(error)} if fallback is None else fallback
+            timings[key]["error"] = str(error)
+
+        result["collection"] = {
+            "total_seconds": round(time.perf_counter() - started, 3),
+            "sources": timings,
+        }
         return result
 
     def _collect_cluster_info(self) -> dict[str, Any]:
@@ -202,47 +305,9 @@ class ClusterStatusCollector:
             List of node information dictionaries
 
         """
-        result = self._run_kubectl(["get", "nodes", "-o", "json"])
-        data = json.loads(result.stdout)
+        items, self.resource_versions["nodes"] = self.list_objects("nodes")
 
-        nodes = []
-        for item in data.get("items", []):
-            node_name = item["metadata"]["name"]
-            status = "Unknown"
-            roles = []
-
-            # Parse node status
-            for condition in item.get("status", {}).get("conditions", []):
-                if condition.get("type") == "Ready":
-                    status = (
-                        "Ready" if condition.get("status") == "True" else "NotReady"
-                    )
-                    break
-
-            # Parse node roles from labels
-            labels = item["metadata"].get("labels", {})
-            for key in labels:
-                if key.startswith("node-role.kubernetes.io/"):
-                    role = key.replace("node-role.kubernetes.io/", "")
-                    roles.append(role)
-
-            # Get node version
-            version = (
-                item.get("status", {})
-                .get("nodeInfo", {})
-                .get("kubeletVersion", "unknown")
-            )
-
-            nodes.append(
-                {
-                    "name": node_name,
-                    "status": status,
-                    "roles": roles if roles else ["<none>"],
-                    "version": version,
-                }
-            )
-
-        return nodes
+        return [parse_node(item) for item in items]
 
     def _collect_namespaces(self) -> list[str]:
         """Collect namespace list.
@@ -261,6 +326,18 @@ class ClusterStatusCollector:
 
         return sorted(namespaces)
 
+    def _collect_pods(self) -> list[dict[str, Any]]:
+        """Collect pod status from all namespaces (health check details).
+
+        Returns:
+            List of pod information dictionaries (phase, container readiness,
+            restarts, conditions and owning workload)
+
+        """
+        items, self.resource_versions["pods"] = self.list_objects("pods")
+
+        return [parse_pod(item) for item in items]
+
     def _collect_helm_releases(self) -> list[dict[str, Any]]:
         """Collect Helm release information from all namespaces.
 
@@ -0,0 +1,396 @@
+"""Incremental cluster status for ``sbkube status --watch``.
+
+Instead of re-collecting the whole cluster snapshot on every tick, the watch
+mode follows Kubernetes API watch streams (``kubectl get --raw ...?watch=1``):
+
+- nodes
+- pods (all namespaces)
+- Helm release secrets (``owner=helm``), decoded into release rows
+
+Each stream starts at the resourceVersion of a list, so nothing that changes
+between the list and the watch is lost. Nodes and pods start from the lists
+behind the ``collect_all()`` snapshot the model was seeded with; Helm release
+secrets (the snapshot comes from ``helm list``) are listed once. A stream that
+ends is resumed from the last seen resourceVersion; only an expired
+resourceVersion (410 Gone) causes a relist, whose differences are reported.
+
+Events update an in-memory :class:`ClusterWatchModel`; only rows whose
+displayed status actually changed are reported back as :class:`RowChange`.
+"""
+
+import base64
+import gzip
+import json
+import queue
+import subprocess
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from sbkube.utils.cluster_status import (
+    API_LIST_PATHS,
+    ClusterStatusCollector,
+    parse_node,
+    parse_pod,
+)
+from sbkube.utils.logger import logger
+
+WATCH_KINDS = ("nodes", "pods", "helm_releases")
+RELIST_BACKOFF_SECONDS = (1, 2, 5, 10, 30)
+
+# Helm이 release secret에 붙이는 내부 label (사용자 label과 구분)
+_HELM_SECRET_LABELS = {"name", "owner", "status", "version", "modifiedAt", "createdAt"}
+
+
+@dataclass
+class RowChange:
+    """One displayed row that was added, removed or changed."""
+
+    kind: str
+    key: tuple[str, ...]
+    before: dict[str, Any] | None
+    after: dict[str, Any] | None
+
+    @property
+    def action(self) -> str:
+        if self.before is None:
+            return "added"
+        if self.after is None:
+            return "removed"
+        return "changed"
+
+
+def iter_json_objects(chunks: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Decode concatenated (possibly pretty-printed) JSON objects from a stream."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            buffer = buffer.lstrip()
+            if not buffer:
+                break
+            try:
+                obj, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                break  # 아직 객체가 끝나지 않음
+            buffer = buffer[end:]
+            if isinstance(obj, dict):
+                yield obj
+
+
+def decode_helm_release(secret: dict[str, Any]) -> dict[str, Any] | None:
+    """Convert a Helm release secret into a release row (None if undecodable).
+
+    The ``release`` data field is base64 (Kubernetes) of base64 (Helm) of a
+    gzipped release JSON.
+    """
+    metadata = secret.get("metadata", {})
+    labels = metadata.get("labels", {})
+    row: dict[str, Any] = {
+        "name": labels.get("name", "unknown"),
+        "namespace": metadata.get("namespace", "unknown"),
+        "status": labels.get("status", "unknown"),
+        "chart": "unknown",
+        "app_version": "unknown",
+        "revision": int(labels.get("version", 0) or 0),
+    }
+
+    encoded = secret.get("data", {}).get("release")
+    if encoded:
+        try:
+            payload = base64.b64decode(base64.b64decode(encoded))
+            if payload[:2] == b"\x1f\x8b":
+                payload = gzip.decompress(payload)
+            release = json.loads(payload)
+            chart = release.get("chart", {}).get("metadata", {})
+            row["chart"] = f"{chart.get('name', 'unknown')}-{chart.get('version', '')}"
+            row["app_version"] = chart.get("appVersion", "unknown")
+            row["status"] = release.get("info", {}).get("status", row["status"])
+        except Exception as e:  # noqa: BLE001 - keep label-only row
+            logger.verbose(f"Failed to decode Helm release secret: {e}")
+
+    user_labels = {k: v for k, v in labels.items() if k not in _HELM_SECRET_LABELS}
+    if user_labels:
+        row["labels"] = user_labels
+    return row
+
+
+def row_status(kind: str, row: dict[str, Any]) -> str:
+    """Displayed status of a row; rows are reported only when this changes."""
+    if kind == "nodes":
+        return f"{row.get('status')} {row.get('version')}"
+    if kind == "pods":
+        return (
+            f"{row.get('phase')} {row.get('ready_containers', 0)}/"
+            f"{row.get('total_containers', 0)} restarts={row.get('restart_count', 0)}"
+        )
+    return f"{row.get('status')} rev {row.get('revision')} {row.get('chart')}"
+
+
+class ClusterWatchModel:
+    """In-memory cluster status updated from watch events."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.nodes: dict[tuple[str, ...], dict[str, Any]] = {}
+        self.pods: dict[tuple[str, ...], dict[str, Any]] = {}
+        # (namespace, name) → {revision: row}; 표시되는 것은 최신 revision
+        self._release_revisions: dict[tuple[str, ...], dict[int, dict[str, Any]]] = {}
+        self.base: dict[str, Any] = {}
+
+    @classmethod
+    def from_snapshot(cls, data: Any) -> "ClusterWatchModel":
+        """Build a model from a collect_all()/cache snapshot."""
+        model = cls()
+        if not isinstance(data, dict):
+            return model
+        model.base = {
+            key: value
+            for key, value in data.items()
+            if key not in ("nodes", "pods", "helm_releases")
+        }
+        model.replace("nodes", data.get("nodes") or [])
+        model.replace("pods", data.get("pods") or [])
+        model.replace("helm_releases", data.get("helm_releases") or [])
+        return model
+
+    @staticmethod
+    def _key(kind: str, row: dict[str, Any]) -> tuple[str, ...]:
+        if kind == "nodes":
+            return (row.get("name", "unknown"),)
+        return (row.get("namespace", "unknown"), row.get("name", "unknown"))
+
+    def _rows(self, kind: str) -> dict[tuple[str, ...], dict[str, Any]]:
+        if kind == "nodes":
+            return self.nodes
+        if kind == "pods":
+            return self.pods
+        return {
+            key: revisions[max(revisions)]
+            for key, revisions in self._release_revisions.items()
+            if revisions
+        }
+
+    def replace(self, kind: str, rows: list[dict[str, Any]]) -> list[RowChange]:
+        """Replace all rows of ``kind`` (initial list or relist) and diff them."""
+        with self._lock:
+            before = dict(self._rows(kind))
+            if kind == "helm_releases":
+                self._release_revisions = {}
+                for row in rows:
+                    key = self._key(kind, row)
+                    revision = int(row.get("revision", 0) or 0)
+                    self._release_revisions.setdefault(key, {})[revision] = row
+            else:
+                target = self.nodes if kind == "nodes" else self.pods
+                target.clear()
+                target.update({self._key(kind, row): row for row in rows})
+            after = self._rows(kind)
+
+        changes = []
+        for key in sorted(set(before) | set(after)):
+            old, new = before.get(key), after.get(key)
+            if old is None or new is None or row_status(kind, old) != row_status(kind, new):
+                changes.append(RowChange(kind, key, old, new))
+        return changes
+
+    def apply(self, kind: str, event_type: str, obj: dict[str, Any]) -> RowChange | None:
+        """Apply one watch event; returns the change if a displayed row changed."""
+        if kind == "helm_releases":
+            row = decode_helm_release(obj)
+        elif kind == "nodes":
+            row = parse_node(obj)
+        else:
+            row = parse_pod(obj)
+        if row is None:
+            return None
+        key = self._key(kind, row)
+        deleted = event_type == "DELETED"
+
+        with self._lock:
+            if kind == "helm_releases":
+                revisions = self._release_revisions.setdefault(key, {})
+                old = revisions[max(revisions)] if revisions else None
+                revision = int(row.get("revision", 0) or 0)
+                if deleted:
+                    revisions.pop(revision, None)
+                else:
+                    revisions[revision] = row
+                new = revisions[max(revisions)] if revisions else None
+                if not revisions:
+                    del self._release_revisions[key]
+            else:
+                rows = self.nodes if kind == "nodes" else self.pods
+                old = rows.get(key)
+                if deleted:
+                    rows.pop(key, None)
+                    new = None
+                else:
+                    rows[key] = new = row
+
+        if old is None and new is None:
+            return None
+        if old is not None and new is not None and row_status(kind, old) == row_status(
+            kind, new
+        ):
+            return None
+        return RowChange(kind, key, old, new)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current status in collect_all() format (for the status cache)."""
+        with self._lock:
+            return {
+                **self.base,
+                "nodes": list(self.nodes.values()),
+                "pods": list(self.pods.values()),
+                "helm_releases": list(self._rows("helm_releases").values()),
+            }
+
+
+class ClusterWatcher:
+    """Follows API watch streams and feeds events into a model.
+
+    One daemon thread per kind runs ``(list →) watch from resourceVersion →
+    resume``; the caller drains accumulated changes with :meth:`poll`.
+    """
+
+    def __init__(
+        self,
+        collector: ClusterStatusCollector,
+        model: ClusterWatchModel,
+        kinds: tuple[str, ...] = WATCH_KINDS,
+        resource_versions: dict[str, str] | None = None,
+    ) -> None:
+        """ClusterWatcher 초기화.
+
+        Args:
+            collector: kubectl 기본 명령(kubeconfig/context)을 제공하는 collector
+            model: 이벤트를 반영할 모델
+            kinds: 감시할 리소스 종류
+            resource_versions: model의 seed 데이터에 해당하는 list의
+                resourceVersion (kind별). 있는 kind는 다시 list하지 않고
+                그 지점부터 watch
+
+        """
+        self.collector = collector
+        self.model = model
+        self.kinds = kinds
+        self.resource_versions = dict(resource_versions or {})
+        self._events: queue.Queue = queue.Queue()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._processes: dict[str, subprocess.Popen] = {}
+        self._lock = threading.Lock()
+
+    def _list(self, kind: str) -> tuple[list[dict[str, Any]], str]:
+        items, resource_version = self.collector.list_objects(kind)
+        if kind == "nodes":
+            rows = [parse_node(item) for item in items]
+        elif kind == "pods":
+            rows = [parse_pod(item) for item in items]
+        else:
+            rows = [row for row in map(decode_helm_release, items) if row is not None]
+        return rows, resource_version
+
+    def _watch_cmd(self, kind: str, resource_version: str) -> list[str]:
+        path = API_LIST_PATHS[kind]
+        separator = "&" if "?" in path else "?"
+        query = f"watch=1&allowWatchBookmarks=true&resourceVersion={resource_version}"
+        return self.collector._kubectl_base_cmd + ["get", "--raw", path + separator + query]
+
+    def _spawn(self, kind: str, cmd: list[str]) -> subprocess.Popen | None:
+        """Start a watch process and register it (None if stop() was called)."""
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        with self._lock:
+            # stop()은 플래그를 먼저 세우고 락 안에서 프로세스를 수집하므로,
+            # 여기서 플래그가 보이지 않으면 stop()이 이 프로세스를 종료함
+            if self._stop.is_set():
+                process.terminate()
+                process.wait()
+                return None
+            self._processes[kind] = process
+        return process
+
+    def _follow(self, kind: str) -> None:
+        resource_version = self.resource_versions.get(kind)
+        attempt = 0
+        while not self._stop.is_set():
+            try:
+                if not resource_version:
+                    rows, resource_version = self._list(kind)
+                    self._events.put(("relist", kind, rows))
+                process = self._spawn(kind, self._watch_cmd(kind, resource_version))
+                if process is None:
+                    return
+                received = False
+                for event in iter_json_objects(iter(process.stdout.readline, "")):
+                    if self._stop.is_set():
+                        break
+                    obj = event.get("object")
+                    if not isinstance(obj, dict):
+                        continue
+                    if event.get("type") == "ERROR":
+                        # 410 Gone: resourceVersion 만료 → relist
+                        logger.verbose(f"Watch stream for {kind} expired: {obj.get('message')}")
+                        resource_version = None
+                        break
+                    received = True
+                    attempt = 0
+                    # BOOKMARK 이벤트도 resourceVersion만 전달
+                    resource_version = (
+                        obj.get("metadata", {}).get("resourceVersion") or resource_version
+                    )
+                    if event.get("type") in ("ADDED", "MODIFIED", "DELETED"):
+                        self._events.put(("event", kind, event["type"], obj))
+                if process.poll() is None:
+                    process.terminate()
+                if process.wait() != 0 and not received:
+                    # watch를 시작하지 못함 (예: HTTP 410) → relist
+                    resource_version = None
+            except Exception as e:  # noqa: BLE001 - retried with backoff
+                logger.verbose(f"Watch stream for {kind} failed: {e}")
+            backoff = RELIST_BACKOFF_SECONDS[min(attempt, len(RELIST_BACKOFF_SECONDS) - 1)]
+            attempt += 1
+            self._stop.wait(backoff)
+
+    def start(self) -> None:
+        """Start one watch thread per kind."""
+        for kind in self.kinds:
+            thread = threading.Thread(
+                target=self._follow, args=(kind,), name=f"sbkube-watch-{kind}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def poll(self) -> list[RowChange]:
+        """Apply queued list/watch results to the model and return row changes."""
+        changes: list[RowChange] = []
+        while True:
+            try:
+                item = self._events.get_nowait()
+            except queue.Empty:
+                return changes
+            if item[0] == "relist":
+                changes.extend(self.model.replace(item[1], item[2]))
+            else:
+                change = self.model.apply(item[1], item[2], item[3])
+                if change is not None:
+                    changes.append(change)
+
+    def stop(self) -> None:
+        """Stop watch threads and terminate kubectl processes."""
+        self._stop.set()
+        with self._lock:
+            processes = list(self._processes.values())
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        for thread in self._threads:
+            thread.join(timeout=2)
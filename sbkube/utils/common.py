@@ -1,5 +1,6 @@
 import shlex
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
 
 import click
@@ -156,10 +157,22 @@ def run_command(
     env: dict[str, str] | None = None,
     cwd: str | Path | None = None,
     timeout: int | None = None,
+    on_stdout_line: Callable[[str], None] | None = None,
+    on_stderr_line: Callable[[str], None] | None = None,
+    stdout_file: str | Path | None = None,
     **kwargs,
 ) -> tuple[int, str, str]:
     """명령어를 실행하고 결과를 반환합니다.
 
+    :func:`sbkube.utils.async_runner.run_async`의 동기 facade로, 타임아웃 시
+    자식 프로세스 종료와 perf 기록을 공유합니다. subprocess.run 전용 인자
+    (``**kwargs``)가 주어지면 subprocess.run으로 직접 실행합니다.
+
+    ``on_stdout_line``/``on_stderr_line``/``stdout_file`` 중 하나라도 주어지면
+    :func:`sbkube.utils.async_runner.stream_async`로 실행합니다. 출력은 줄 단위로
+    콜백에 전달되고 메모리에는 마지막 줄들만 남으므로, 반환되는 stdout/stderr는
+    출력의 끝부분입니다 (stdout_file 지정 시 stdout은 빈 문자열).
+
     Args:
         cmd: 실행할 명령어 (리스트 또는 문자열)
         capture_output: 출력을 캡처할지 여부
@@ -168,27 +181,66 @@ def run_command(
         env: 환경 변수
         cwd: 작업 디렉토리
         timeout: 명령어 타임아웃
-        **kwargs: subprocess.run에 전달할 추가 인자
+        on_stdout_line: stdout 줄마다 호출할 콜백
+        on_stderr_line: stderr 줄마다 호출할 콜백
+        stdout_file: stdout을 기록할 파일 (메모리에 보관하지 않음)
+        **kwargs: 추가 인자 (input은 async runner로, 나머지는 subprocess.run으로 전달)
 
     Returns:
         Tuple[int, str, str]: (return_code, stdout, stderr)
 
     """
+    from sbkube.utils.async_runner import run_async, run_sync, stream_async
+
     # 문자열인 경우 shlex로 분할
     if isinstance(cmd, str):
         cmd = shlex.split(cmd)
 
+    input_data = kwargs.pop("input", None)
+    streaming = on_stdout_line or on_stderr_line or stdout_file is not None
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=capture_output,
-            text=text,
-            check=check,
-            env=env,
-            cwd=cwd,
-            timeout=timeout,
-            **kwargs,
-        )
+        if streaming:
+            result = run_sync(
+                stream_async(
+                    cmd,
+                    on_stdout=on_stdout_line,
+                    on_stderr=on_stderr_line,
+                    stdout_file=stdout_file,
+                    timeout=timeout,
+                    env=env,
+                    cwd=cwd,
+                    input=input_data,
+                )
+            )
+            if check and result.returncode != 0:
+                raise subprocess.CalledProcessError(
+                    result.returncode, cmd, result.stdout, result.stderr
+                )
+        elif kwargs:
+            result = subprocess.run(
+                cmd,
+                capture_output=capture_output,
+                text=text,
+                check=check,
+                env=env,
+                cwd=cwd,
+                timeout=timeout,
+                input=input_data,
+                **kwargs,
+            )
+        else:
+            result = run_sync(
+                run_async(
+                    cmd,
+                    check=check,
+                    capture_output=capture_output,
+                    text=text,
+                    timeout=timeout,
+                    env=env,
+                    cwd=cwd,
+                    input=input_data,
+                )
+            )
 
         return (result.returncode, result.stdout or "", result.stderr or "")
 
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+from sbkube.models.deployment_state import DeploymentStatusInfo, app_config_dir_name
 from sbkube.state.database import DeploymentDatabase, DeploymentStatus
 
 
@@ -56,38 +57,84 @@ class DeploymentChecker:
         self.namespace = namespace
         self.db = DeploymentDatabase()
 
-    def _find_by_directory_name(self, dir_name: str):
-        """Find deployment by matching directory name (last component of path).
+    def _lookup_statuses(
+        self, deps: list[str], namespace: str | None = None
+    ) -> tuple[dict[str, DeploymentStatusInfo], Exception | None]:
+        """Look up the latest deployment status of each dependency.
 
-        This is a fallback method for backward compatibility when exact path
-        matching fails.
+        Each stage resolves all still-unresolved deps in one query:
+        namespace-specific (if namespace given) → any namespace by full path →
+        directory name only (backward compatibility for moved projects).
 
         Args:
-            dir_name: Directory name to search for (e.g., "a000_infra_network")
+            deps: App-group directory names
+            namespace: Kubernetes namespace (optional)
 
         Returns:
-            DeploymentDetail or None
+            tuple: (dep → status info for deps with a record, database error or None)
 
         """
-        with self.db.get_session() as session:
-            from sbkube.models.deployment_state import Deployment
-
-            # Find all deployments for current cluster
-            deployments = (
-                session.query(Deployment)
-                .filter_by(cluster=self.cluster)
-                .order_by(Deployment.timestamp.desc())
-                .all()
+        paths = {dep: str((self.base_dir / dep).resolve()) for dep in deps}
+        found: dict[str, DeploymentStatusInfo] = {}
+        error: Exception | None = None
+
+        def resolve_by_path(ns: str | None) -> None:
+            pending = {paths[dep]: dep for dep in deps if dep not in found}
+            if not pending:
+                return
+            statuses = self.db.get_latest_statuses(
+                cluster=self.cluster,
+                app_config_dirs=list(pending),
+                namespace=ns,
             )
+            for path, info in statuses.items():
+                found[pending[path]] = info
 
-            # Match by directory name (last component of app_config_dir path)
-            for deployment in deployments:
-                if deployment.app_config_dir:
-                    stored_dir_name = Path(deployment.app_config_dir).name
-                    if stored_dir_name == dir_name:
-                        return self.db.get_deployment(deployment.deployment_id)
+        try:
+            if namespace:
+                resolve_by_path(namespace)
+            resolve_by_path(None)
+        except Exception as e:
+            error = e
 
-            return None
+        pending_names: dict[str, list[str]] = {}
+        for dep in deps:
+            if dep not in found:
+                pending_names.setdefault(app_config_dir_name(dep), []).append(dep)
+        if pending_names:
+            from sbkube.utils.logger import get_logger
+
+            get_logger().debug(
+                f"No deployment found with full path, trying with dir name: "
+                f"{', '.join(pending_names)}"
+            )
+            try:
+                statuses = self.db.get_latest_statuses_by_dir_name(
+                    cluster=self.cluster, dir_names=list(pending_names)
+                )
+            except Exception as e:
+                error = error or e
+            else:
+                for name, info in statuses.items():
+                    for dep in pending_names[name]:
+                        found[dep] = info
+
+        return found, error
+
+    @staticmethod
+    def _describe_status(
+        info: DeploymentStatusInfo | None, error: Exception | None
+    ) -> tuple[bool, str]:
+        if info is None:
+            if error is not None:
+                return False, f"database error: {error}"
+            return False, "never deployed"
+
+        if info.status != DeploymentStatus.SUCCESS:
+            return False, f"last status: {info.status.value}"
+
+        # Successfully deployed - include namespace in message
+        return True, f"deployed at {info.timestamp} in namespace '{info.namespace}'"
 
     def check_app_group_deployed(
         self, app_config_dir: str, namespace: str | None = None
@@ -108,87 +155,15 @@ class DeploymentChecker:
                 - status_message: Human-readable status description with namespace info
 
         """
-        # Resolve full path to app-group directory
-        app_dir_path = str((self.base_dir / app_config_dir).resolve())
-
-        # Try namespace-specific query first (if namespace provided)
-        if namespace:
-            try:
-                latest = self.db.get_latest_deployment(
-                    cluster=self.cluster,
-                    namespace=namespace,
-                    app_config_dir=app_dir_path,
-                )
-                if latest:
-                    if latest.status != DeploymentStatus.SUCCESS:
-                        return False, f"last status: {latest.status.value}"
-                    return (
-                        True,
-                        f"deployed at {latest.timestamp} in namespace '{namespace}'",
-                    )
-            except Exception as e:
-                return False, f"database error: {e}"
-
-        # Fallback: Search across all namespaces (namespace auto-detection)
-        try:
-            latest = self.db.get_latest_deployment_any_namespace(
-                cluster=self.cluster,
-                app_config_dir=app_dir_path,
-            )
-        except Exception as e:
-            # Try with directory name only (backward compatibility)
-            try:
-                from sbkube.utils.logger import get_logger
-
-                logger = get_logger()
-                logger.debug(
-                    f"Failed to find deployment with full path, trying with dir name: {app_config_dir}"
-                )
-
-                # Try to match by directory name (last component of path)
-                latest = self._find_by_directory_name(app_config_dir)
-                if latest:
-                    if latest.status != DeploymentStatus.SUCCESS:
-                        return False, f"last status: {latest.status.value}"
-                    deployed_ns = latest.namespace
-                    return (
-                        True,
-                        f"deployed at {latest.timestamp} in namespace '{deployed_ns}'",
-                    )
-            except Exception:
-                pass
-
-            return False, f"database error: {e}"
-
-        # No deployment record found
-        if not latest:
-            # Try with directory name only (backward compatibility)
-            try:
-                from sbkube.utils.logger import get_logger
-
-                logger = get_logger()
-                logger.debug(
-                    f"No deployment found with full path, trying with dir name: {app_config_dir}"
-                )
-
-                latest = self._find_by_directory_name(app_config_dir)
-            except Exception:
-                pass
-
-            if not latest:
-                return False, "never deployed"
-
-        # Check deployment status
-        if latest.status != DeploymentStatus.SUCCESS:
-            return False, f"last status: {latest.status.value}"
-
-        # Successfully deployed - include namespace in message
-        deployed_ns = latest.namespace
-        return True, f"deployed at {latest.timestamp} in namespace '{deployed_ns}'"
+        found, error = self._lookup_statuses([app_config_dir], namespace)
+        return self._describe_status(found.get(app_config_dir), error)
 
     def check_dependencies(self, deps: list[str], namespace: str | None = None) -> dict:
         """Check deployment status of multiple dependencies.
 
+        All dependencies are resolved together with status-only queries,
+        so the number of queries does not grow with the number of deps.
+
         Args:
             deps: List of app-group directory names
             namespace: Kubernetes namespace (overrides instance namespace)
@@ -203,8 +178,9 @@ class DeploymentChecker:
         details = {}
         missing = []
 
+        found, error = self._lookup_statuses(deps, namespace) if deps else ({}, None)
         for dep in deps:
-            is_deployed, msg = self.check_app_group_deployed(dep, namespace)
+            is_deployed, msg = self._describe_status(found.get(dep), error)
             details[dep] = (is_deployed, msg)
             if not is_deployed:
                 missing.append(dep)
@@ -232,19 +208,20 @@ class DeploymentChecker:
         ns = namespace or self.namespace or "default"
 
         try:
-            latest = self.db.get_latest_deployment(
+            statuses = self.db.get_latest_statuses(
                 cluster=self.cluster,
+                app_config_dirs=[app_dir_path],
                 namespace=ns,
-                app_config_dir=app_dir_path,
             )
         except Exception:
             return None
 
+        latest = statuses.get(app_dir_path)
         if not latest:
             return None
 
         return {
-            "cluster": latest.cluster,
+            "cluster": self.cluster,
             "namespace": latest.namespace,
             "app_config_dir": latest.app_config_dir,
             "status": latest.status.value,
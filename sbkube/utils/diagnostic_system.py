@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
@@ -91,7 +92,11 @@ class DiagnosticEngine:
     async def run_all_checks(
         self, show_progress: bool = True
     ) -> list[DiagnosticResult]:
-        """모든 진단 체크 실행."""
+        """모든 진단 체크를 동시에 실행.
+
+        외부 명령은 async_runner를 통해 실행되므로 체크들이 서로를 기다리지
+        않습니다. 결과는 등록 순서를 유지합니다.
+        """
         self.results.clear()
 
         if show_progress:
@@ -103,16 +108,19 @@ class DiagnosticEngine:
             ) as progress:
                 task = progress.add_task("진단 실행 중...", total=len(self.checks))
 
-                for check in self.checks:
-                    progress.update(task, description=f"검사 중: {check.description}")
+                async def run_check(check: DiagnosticCheck) -> DiagnosticResult:
                     result = await check.run()
-                    self.results.append(result)
+                    progress.update(task, description=f"완료: {check.description}")
                     progress.advance(task)
+                    return result
+
+                results = await asyncio.gather(
+                    *(run_check(check) for check in self.checks)
+                )
         else:
-            for check in self.checks:
-                result = await check.run()
-                self.results.append(result)
+            results = await asyncio.gather(*(check.run() for check in self.checks))
 
+        self.results.extend(results)
         return self.results
 
     def get_summary(self) -> dict[str, Any]:
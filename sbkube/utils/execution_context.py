@@ -0,0 +1,253 @@
+"""Execution Context for SBKube.
+
+`apply`는 앱마다 prepare/build/deploy 명령어를 `click.Context.invoke`로 호출합니다.
+각 명령어가 sbkube.yaml, sources 파일, 상위 sbkube.yaml(최대 5단계)을 매번
+다시 읽고 검증하지 않도록, 한 번의 실행 동안 파싱/병합/검증 결과를 공유합니다.
+
+캐시는 파일의 (mtime, size)를 키에 포함하므로 실행 도중 파일이 바뀌면 다시 읽습니다.
+
+Usage:
+    from sbkube.utils.execution_context import ExecutionContext
+
+    exec_ctx = ExecutionContext.from_click(ctx)
+    raw_data = exec_ctx.load_raw(config_file_path)
+    config = exec_ctx.get_sbkube_config(config_file_path, config_data)
+"""
+
+import copy
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import click
+
+from sbkube.models.config_model import SBKubeConfig
+from sbkube.models.sources_model import SourceScheme
+from sbkube.state.desired_state import DesiredStateStore
+from sbkube.utils.file_loader import load_config_file
+from sbkube.utils.namespace_registry import NamespaceRegistry
+from sbkube.utils.perf import perf_timer
+
+# 상위 디렉토리 sbkube.yaml 탐색 깊이 (기존 명령어들의 parent walk와 동일)
+PARENT_SEARCH_DEPTH = 5
+
+
+def _file_key(path: Path) -> tuple[Path, int, int]:
+    resolved = path.resolve()
+    stat = resolved.stat()
+    return (resolved, stat.st_mtime_ns, stat.st_size)
+
+
+def _stable_key(data: Any) -> str:
+    return json.dumps(data, sort_keys=True, default=str)
+
+
+class ExecutionContext:
+    """한 번의 명령 실행 동안 공유되는 설정 캐시.
+
+    - load_raw: 설정 파일 파싱 결과 캐시
+    - find_parent_configs: 상위 sbkube.yaml 탐색 결과 캐시
+    - get_sbkube_config / get_sources: pydantic 검증 결과 캐시
+    - namespaces: 클러스터 namespace 목록 (NamespaceRegistry)
+    - desired_state: 배포별 desired state digest 기록 및 --skip-unchanged 조회 (DesiredStateStore)
+
+    반환되는 raw dict는 복사본이므로 호출자가 수정해도 캐시에 영향이 없습니다.
+    모델 객체는 공유되므로 읽기 전용으로 사용해야 합니다.
+    """
+
+    CTX_KEY = "execution_context"
+
+    def __init__(self) -> None:
+        """ExecutionContext 초기화."""
+        self._lock = threading.RLock()
+        self._raw: dict[Path, tuple[tuple[Path, int, int], dict[str, Any]]] = {}
+        self._parents: dict[Path, list[Path]] = {}
+        self._configs: dict[tuple, SBKubeConfig] = {}
+        self._sources: dict[tuple, SourceScheme] = {}
+        self.namespaces = NamespaceRegistry()
+        self.desired_state = DesiredStateStore()
+        self.loads = 0
+        self.hits = 0
+
+    @classmethod
+    def from_click(cls, ctx: click.Context) -> "ExecutionContext":
+        """Click context에서 ExecutionContext를 가져오거나 새로 생성.
+
+        Args:
+            ctx: Click context (ctx.obj가 dict여야 함)
+
+        Returns:
+            ctx.obj에 저장된 ExecutionContext
+
+        """
+        obj = ctx.ensure_object(dict)
+        exec_ctx = obj.get(cls.CTX_KEY)
+        if exec_ctx is None:
+            exec_ctx = cls()
+            obj[cls.CTX_KEY] = exec_ctx
+        return exec_ctx
+
+    def load_raw(self, path: str | Path) -> dict[str, Any]:
+        """설정 파일을 로드 (같은 파일은 한 번만 파싱).
+
+        Args:
+            path: 설정 파일 경로
+
+        Returns:
+            파싱된 데이터의 복사본
+
+        Raises:
+            ConfigFileNotFoundError: 파일이 없는 경우
+            FileOperationError: 파싱에 실패한 경우
+
+        """
+        path = Path(path)
+        try:
+            key = _file_key(path)
+        except OSError:
+            # 존재하지 않는 파일: load_config_file이 적절한 예외를 발생시킴
+            return load_config_file(path)
+
+        with self._lock:
+            cached = self._raw.get(key[0])
+            if cached and cached[0] == key:
+                self.hits += 1
+                return copy.deepcopy(cached[1])
+
+        with perf_timer("stage.config_load", file=path.name):
+            data = load_config_file(path)
+
+        with self._lock:
+            self._raw[key[0]] = (key, data)
+            self.loads += 1
+        return copy.deepcopy(data)
+
+    def find_parent_configs(self, start_dir: Path) -> list[Path]:
+        """start_dir 상위의 sbkube.yaml 목록 (가까운 순서).
+
+        Args:
+            start_dir: 탐색을 시작할 디렉토리 (자신은 제외)
+
+        Returns:
+            상위 sbkube.yaml 경로 리스트 (가까운 것부터)
+
+        """
+        start_dir = Path(start_dir)
+        with self._lock:
+            cached = self._parents.get(start_dir)
+        if cached is not None:
+            return list(cached)
+
+        parent_configs = []
+        current_dir = start_dir
+        for _ in range(PARENT_SEARCH_DEPTH):
+            parent_dir = current_dir.parent
+            if parent_dir == current_dir:
+                break
+            parent_config = parent_dir / "sbkube.yaml"
+            if parent_config.exists():
+                parent_configs.append(parent_config)
+            current_dir = parent_dir
+
+        with self._lock:
+            self._parents[start_dir] = parent_configs
+        return list(parent_configs)
+
+    def load_parent_settings(self, start_dir: Path) -> list[dict[str, Any]]:
+        """상위 통합 sbkube.yaml들의 settings (먼 것 → 가까운 것 순서).
+
+        파싱에 실패하거나 통합 포맷이 아닌 파일은 건너뜁니다.
+
+        Args:
+            start_dir: 탐색을 시작할 디렉토리
+
+        Returns:
+            settings dict 리스트 (root 방향부터)
+
+        """
+        settings_list = []
+        for parent_config in reversed(self.find_parent_configs(start_dir)):
+            try:
+                parent_data = self.load_raw(parent_config)
+            except Exception:
+                continue
+            if parent_data and parent_data.get("apiVersion", "").startswith("sbkube/"):
+                settings_list.append(parent_data.get("settings", {}) or {})
+        return settings_list
+
+    def resolve_namespace(self, config_file_path: Path, raw_data: dict[str, Any]) -> str:
+        """상위 sbkube.yaml에서 상속한 namespace를 해석.
+
+        Args:
+            config_file_path: 현재 설정 파일 경로
+            raw_data: 현재 설정 파일 데이터
+
+        Returns:
+            최종 namespace (상위 → 현재 순으로 override, 기본값 "default")
+
+        """
+        merged_namespace = "default"
+        for parent_settings in self.load_parent_settings(config_file_path.parent):
+            parent_ns = parent_settings.get("namespace")
+            if parent_ns:
+                merged_namespace = parent_ns
+
+        current_namespace = (raw_data.get("settings", {}) or {}).get("namespace")
+        if current_namespace:
+            merged_namespace = current_namespace
+        return merged_namespace
+
+    def get_sbkube_config(
+        self, config_file_path: Path, config_data: dict[str, Any]
+    ) -> SBKubeConfig:
+        """SBKubeConfig 검증 결과 캐시.
+
+        Args:
+            config_file_path: 설정 파일 경로 (캐시 키)
+            config_data: SBKubeConfig 생성 데이터
+
+        Returns:
+            검증된 SBKubeConfig (공유 객체, 읽기 전용)
+
+        Raises:
+            pydantic.ValidationError: 검증 실패 시
+
+        """
+        key = (Path(config_file_path).resolve(), _stable_key(config_data))
+        with self._lock:
+            cached = self._configs.get(key)
+        if cached is not None:
+            return cached
+
+        config = SBKubeConfig(**config_data)
+        with self._lock:
+            self._configs[key] = config
+        return config
+
+    def get_sources(
+        self, sources_file_path: Path, settings_data: dict[str, Any]
+    ) -> SourceScheme:
+        """SourceScheme 검증 결과 캐시.
+
+        Args:
+            sources_file_path: sources 파일 경로 (캐시 키)
+            settings_data: SourceScheme 생성 데이터 (병합 완료된 settings)
+
+        Returns:
+            검증된 SourceScheme (공유 객체, 읽기 전용)
+
+        Raises:
+            pydantic.ValidationError: 검증 실패 시
+
+        """
+        key = (Path(sources_file_path).resolve(), _stable_key(settings_data))
+        with self._lock:
+            cached = self._sources.get(key)
+        if cached is not None:
+            return cached
+
+        sources = SourceScheme(**settings_data)
+        with self._lock:
+            self._sources[key] = sources
+        return sources
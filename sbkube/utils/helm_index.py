@@ -0,0 +1,146 @@
+"""Reader for Helm's local repository index cache.
+
+`helm repo add/update` stores each repository index as
+``<repository cache>/<repo>-index.yaml``. ``helm search repo`` just reads that
+file again on every call, so asking it once per release costs one helm process
+(and one full index parse) per chart. :class:`HelmIndex` parses each index at
+most once per run and answers every version lookup from memory.
+
+Usage:
+    index = HelmIndex()
+    latest = index.latest_version("grafana", "grafana")
+    repo = index.find_repo("ingress-nginx", ["bitnami", "ingress-nginx"])
+"""
+
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+import yaml
+
+from sbkube.utils.logger import logger
+from sbkube.utils.version_compare import sort_versions
+
+# PyYAML C 확장이 있으면 사용 (대형 index 파싱 속도 차이가 큼)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# `--refresh-index` 사용 시 이보다 오래된 index는 helm repo update 대상
+DEFAULT_INDEX_MAX_AGE_SECONDS = 24 * 3600
+
+
+def helm_repository_cache_dir() -> Path:
+    """Helm repository cache directory (same resolution order as helm).
+
+    ``$HELM_REPOSITORY_CACHE`` → ``$XDG_CACHE_HOME/helm/repository`` →
+    platform default (``~/Library/Caches`` on macOS, ``~/.cache`` elsewhere).
+    """
+    if env_dir := os.environ.get("HELM_REPOSITORY_CACHE"):
+        return Path(env_dir).expanduser()
+    if xdg_cache := os.environ.get("XDG_CACHE_HOME"):
+        return Path(xdg_cache).expanduser() / "helm" / "repository"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "helm" / "repository"
+    return Path.home() / ".cache" / "helm" / "repository"
+
+
+class HelmIndex:
+    """In-memory chart → versions map built from cached repository indexes.
+
+    Indexes are parsed lazily, once per repository; versions are sorted
+    newest first. Like ``helm search repo`` (without ``--devel``), the latest
+    version ignores pre-releases.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        """HelmIndex 초기화.
+
+        Args:
+            cache_dir: Helm repository cache 경로 (None이면 helm 기본 경로)
+
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else helm_repository_cache_dir()
+        # repo → chart → versions (newest first); index가 없으면 None
+        self._repos: dict[str, dict[str, list[str]] | None] = {}
+        self._lock = threading.Lock()
+
+    def index_file(self, repo_name: str) -> Path:
+        """Cached index path of a repository."""
+        return self.cache_dir / f"{repo_name}-index.yaml"
+
+    def index_age(self, repo_name: str) -> float | None:
+        """Seconds since the repository index was downloaded (None if missing)."""
+        try:
+            return time.time() - self.index_file(repo_name).stat().st_mtime
+        except OSError:
+            return None
+
+    def stale_repos(
+        self, repo_names: Iterable[str], max_age: float = DEFAULT_INDEX_MAX_AGE_SECONDS
+    ) -> list[str]:
+        """Repositories whose index is missing or older than ``max_age``."""
+        stale = []
+        for repo_name in repo_names:
+            age = self.index_age(repo_name)
+            if age is None or age > max_age:
+                stale.append(repo_name)
+        return stale
+
+    def invalidate(self, repo_names: Iterable[str] | None = None) -> None:
+        """Forget parsed indexes (e.g. after `helm repo update`)."""
+        with self._lock:
+            if repo_names is None:
+                self._repos.clear()
+            else:
+                for repo_name in repo_names:
+                    self._repos.pop(repo_name, None)
+
+    def _charts(self, repo_name: str) -> dict[str, list[str]] | None:
+        with self._lock:
+            if repo_name in self._repos:
+                return self._repos[repo_name]
+
+            charts: dict[str, list[str]] | None = None
+            index_file = self.index_file(repo_name)
+            try:
+                with index_file.open("r", encoding="utf-8") as f:
+                    data = yaml.load(f, Loader=_YamlLoader)  # noqa: S506 - safe loader
+                entries = data.get("entries") if isinstance(data, dict) else None
+                charts = {
+                    name: sort_versions(
+                        [str(e["version"]) for e in versions if e and e.get("version")]
+                    )
+                    for name, versions in (entries or {}).items()
+                    if isinstance(versions, list)
+                }
+            except FileNotFoundError:
+                logger.verbose(f"Helm index not found for repo '{repo_name}': {index_file}")
+            except (OSError, yaml.YAMLError, AttributeError, TypeError) as e:
+                logger.warning(f"Failed to read Helm index for repo '{repo_name}': {e}")
+
+            self._repos[repo_name] = charts
+            return charts
+
+    def has_repo(self, repo_name: str) -> bool:
+        """Whether a cached index exists (and parses) for the repository."""
+        return self._charts(repo_name) is not None
+
+    def versions(self, repo_name: str, chart_name: str) -> list[str]:
+        """All versions of a chart, newest first (empty if unknown)."""
+        charts = self._charts(repo_name) or {}
+        return list(charts.get(chart_name, []))
+
+    def latest_version(self, repo_name: str, chart_name: str) -> str | None:
+        """Latest stable version of a chart (None if the chart is unknown)."""
+        versions = self.versions(repo_name, chart_name)
+        stable = sort_versions(versions, include_prerelease=False)
+        return stable[0] if stable else None
+
+    def find_repo(self, chart_name: str, repo_names: Iterable[str]) -> str | None:
+        """First repository (in the given order) that provides ``chart_name``."""
+        for repo_name in repo_names:
+            if chart_name in (self._charts(repo_name) or {}):
+                return repo_name
+        return None
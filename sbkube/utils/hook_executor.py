@@ -7,7 +7,7 @@ import os
 import shlex
 import subprocess
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from sbkube.exceptions import SbkubeError
 from sbkube.utils.cluster_config import apply_cluster_config_to_command
@@ -15,8 +15,8 @@ from sbkube.utils.common import run_command
 from sbkube.utils.logger import logger
 from sbkube.utils.security import is_exec_allowed
 
-# Use logger's console so it respects --format (quiet in non-human modes)
-console = logger.console
+if TYPE_CHECKING:
+    from rich.console import Console
 
 HookType = Literal[
     "pre_prepare",
@@ -53,6 +53,7 @@ class HookExecutor:
         kubeconfig: str | None = None,
         context: str | None = None,
         namespace: str | None = None,
+        console: "Console | None" = None,
     ) -> None:
         """HookExecutor 초기화.
 
@@ -66,6 +67,8 @@ class HookExecutor:
             kubeconfig: kubeconfig 파일 경로 (manifests 배포용)
             context: kubectl context (manifests 배포용)
             namespace: 기본 namespace (manifests 배포용)
+            console: 훅 출력용 콘솔 (예: 병렬 apply의 앱별 버퍼).
+                None이면 logger의 콘솔 (--format을 따름)
 
         Example:
             # redis_dir/config.yaml이 있는 경우
@@ -85,6 +88,7 @@ class HookExecutor:
         self.kubeconfig = kubeconfig
         self.context = context
         self.namespace = namespace
+        self.console = console or logger.console
 
     def execute_command_hooks(
         self,
@@ -110,7 +114,7 @@ class HookExecutor:
         if not commands:
             return True
 
-        console.print(
+        self.console.print(
             f"[cyan]🪝 Executing {hook_phase}-hook for command '{command_name}'...[/cyan]"
         )
 
@@ -118,7 +122,7 @@ class HookExecutor:
             if not self._execute_single_command(cmd, hook_phase):
                 return False
 
-        console.print(f"[green]✅ {hook_phase}-hook completed successfully[/green]")
+        self.console.print(f"[green]✅ {hook_phase}-hook completed successfully[/green]")
         return True
 
     def execute_app_hook(
@@ -147,7 +151,7 @@ class HookExecutor:
         if not commands:
             return True
 
-        console.print(
+        self.console.print(
             f"[cyan]🪝 Executing {hook_type} hook for app '{app_name}'...[/cyan]"
         )
 
@@ -161,7 +165,7 @@ class HookExecutor:
             if not self._execute_single_command(cmd, hook_type, hook_env):
                 return False
 
-        console.print(
+        self.console.print(
             f"[green]✅ {hook_type} hook for '{app_name}' completed successfully[/green]"
         )
         return True
@@ -184,18 +188,18 @@ class HookExecutor:
 
         """
         if self.dry_run:
-            console.print(
+            self.console.print(
                 f"[yellow]🔍 [DRY-RUN] Would execute hook: {command}[/yellow]"
             )
             return True
 
         if not is_exec_allowed():
-            console.print(
+            self.console.print(
                 "[red]❌ Hook execution disabled (SBKUBE_ALLOW_EXEC=false)[/red]"
             )
             return False
 
-        console.print(f"  ▶ Running: [dim]{command}[/dim]")
+        self.console.print(f"  ▶ Running: [dim]{command}[/dim]")
 
         try:
             # 환경변수 병합
@@ -216,26 +220,26 @@ class HookExecutor:
             )
 
             if result.returncode != 0:
-                console.print(f"[red]❌ Hook command failed: {command}[/red]")
-                console.print(f"[red]   Exit code: {result.returncode}[/red]")
+                self.console.print(f"[red]❌ Hook command failed: {command}[/red]")
+                self.console.print(f"[red]   Exit code: {result.returncode}[/red]")
                 if result.stderr:
-                    console.print(f"[red]   Error: {result.stderr.strip()}[/red]")
+                    self.console.print(f"[red]   Error: {result.stderr.strip()}[/red]")
                 return False
 
             if result.stdout:
                 for line in result.stdout.strip().split("\n"):
-                    console.print(f"    {line}")
+                    self.console.print(f"    {line}")
 
             return True
 
         except subprocess.TimeoutExpired:
-            console.print(
+            self.console.print(
                 f"[red]❌ Hook command timed out (>{self.timeout}s): {command}[/red]"
             )
             return False
 
         except Exception as e:
-            console.print(f"[red]❌ Hook execution error: {e}[/red]")
+            self.console.print(f"[red]❌ Hook execution error: {e}[/red]")
             return False
 
     def execute_app_hook_with_manifests(
@@ -277,7 +281,7 @@ class HookExecutor:
         if manifests_hook_type in app_hooks:
             manifests = app_hooks.get(manifests_hook_type, [])
             if manifests:
-                console.print(
+                self.console.print(
                     f"[cyan]🪝 Deploying {manifests_hook_type} manifests for app '{app_name}'...[/cyan]"
                 )
                 success = self._deploy_manifests(
@@ -288,7 +292,7 @@ class HookExecutor:
                 if not success:
                     return False
 
-                console.print(
+                self.console.print(
                     f"[green]✅ {manifests_hook_type} manifests deployed for '{app_name}'[/green]"
                 )
 
@@ -323,7 +327,7 @@ class HookExecutor:
                 yaml_path = self.work_dir / yaml_file
 
             if not yaml_path.exists():
-                console.print(f"[red]❌ Manifest file not found: {yaml_path}[/red]")
+                self.console.print(f"[red]❌ Manifest file not found: {yaml_path}[/red]")
                 return False
 
             # kubectl apply 명령어 구성
@@ -339,22 +343,22 @@ class HookExecutor:
             # Apply cluster configuration (kubeconfig, context)
             cmd = apply_cluster_config_to_command(cmd, self.kubeconfig, self.context)
 
-            console.print(f"  Applying manifest: {yaml_file}")
+            self.console.print(f"  Applying manifest: {yaml_file}")
 
             # 명령어 실행
             return_code, stdout, stderr = run_command(cmd)
 
             if return_code != 0:
-                console.print(f"[red]❌ Failed to apply manifest: {yaml_file}[/red]")
+                self.console.print(f"[red]❌ Failed to apply manifest: {yaml_file}[/red]")
                 if stderr:
-                    console.print(f"[red]   Error: {stderr.strip()}[/red]")
+                    self.console.print(f"[red]   Error: {stderr.strip()}[/red]")
                 return False
 
             # 성공 메시지 출력
             if stdout:
                 for line in stdout.strip().split("\n"):
                     if line.strip():
-                        console.print(f"    {line}")
+                        self.console.print(f"    {line}")
 
         return True
 
@@ -384,7 +388,7 @@ class HookExecutor:
         if not tasks:
             return True
 
-        console.print(
+        self.console.print(
             f"[cyan]🪝 Executing {len(tasks)} {hook_type} tasks for app '{app_name}'...[/cyan]"
         )
 
@@ -430,7 +434,7 @@ class HookExecutor:
             # Task 성공적으로 완료
             completed_tasks.add(task_name)
 
-        console.print(
+        self.console.print(
             f"[green]✅ All {hook_type} tasks completed for '{app_name}'[/green]"
         )
         return True
@@ -455,7 +459,7 @@ class HookExecutor:
         task_type = task.get("type")
         task_name = task.get("name", "unnamed")
 
-        console.print(f"  ▶ Task: [bold]{task_name}[/bold] (type: {task_type})")
+        self.console.print(f"  ▶ Task: [bold]{task_name}[/bold] (type: {task_type})")
 
         if task_type == "manifests":
             return self._execute_manifests_task(app_name, task, context)
@@ -463,7 +467,7 @@ class HookExecutor:
             return self._execute_inline_task(app_name, task, context)
         if task_type == "command":
             return self._execute_command_task(app_name, task, context)
-        console.print(f"[red]❌ Unknown task type: {task_type}[/red]")
+        self.console.print(f"[red]❌ Unknown task type: {task_type}[/red]")
         return False
 
     def _execute_manifests_task(
@@ -489,7 +493,7 @@ class HookExecutor:
         validation = task.get("validation")
 
         if not files:
-            console.print("[yellow]⚠️  No files specified in manifests task[/yellow]")
+            self.console.print("[yellow]⚠️  No files specified in manifests task[/yellow]")
             return True
 
         # Phase 1의 _deploy_manifests 재사용
@@ -501,7 +505,7 @@ class HookExecutor:
 
         # Phase 3에서 validation 처리 예정
         if validation and success:
-            console.print(f"    [dim](validation: {validation})[/dim]")
+            self.console.print(f"    [dim](validation: {validation})[/dim]")
 
         return success
 
@@ -531,12 +535,12 @@ class HookExecutor:
 
         content = task.get("content")
         if not content:
-            console.print("[red]❌ No content specified in inline task[/red]")
+            self.console.print("[red]❌ No content specified in inline task[/red]")
             return False
 
         if self.dry_run:
-            console.print("[yellow]🔍 [DRY-RUN] Would apply inline content[/yellow]")
-            console.print(
+            self.console.print("[yellow]🔍 [DRY-RUN] Would apply inline content[/yellow]")
+            self.console.print(
                 f"    [dim]{yaml.dump(content, default_flow_style=False)}[/dim]"
             )
             return True
@@ -564,25 +568,25 @@ class HookExecutor:
             # Apply cluster configuration
             cmd = apply_cluster_config_to_command(cmd, self.kubeconfig, self.context)
 
-            console.print("    Applying inline content...")
+            self.console.print("    Applying inline content...")
 
             return_code, stdout, stderr = run_command(cmd)
 
             if return_code != 0:
-                console.print("[red]❌ Failed to apply inline content[/red]")
+                self.console.print("[red]❌ Failed to apply inline content[/red]")
                 if stderr:
-                    console.print(f"[red]   Error: {stderr.strip()}[/red]")
+                    self.console.print(f"[red]   Error: {stderr.strip()}[/red]")
                 return False
 
             if stdout:
                 for line in stdout.strip().split("\n"):
                     if line.strip():
-                        console.print(f"    {line}")
+                        self.console.print(f"    {line}")
 
             return True
 
         except Exception as e:
-            console.print(f"[red]❌ Inline task error: {e}[/red]")
+            self.console.print(f"[red]❌ Inline task error: {e}[/red]")
             return False
 
         finally:
@@ -614,7 +618,7 @@ class HookExecutor:
         on_failure = task.get("on_failure", "fail")
 
         if not command:
-            console.print("[red]❌ No command specified in command task[/red]")
+            self.console.print("[red]❌ No command specified in command task[/red]")
             return False
 
         # Retry 설정
@@ -633,7 +637,7 @@ class HookExecutor:
         # Retry 로직
         for attempt in range(1, max_attempts + 1):
             if max_attempts > 1:
-                console.print(f"    Attempt {attempt}/{max_attempts}...")
+                self.console.print(f"    Attempt {attempt}/{max_attempts}...")
 
             success = self._execute_single_command(command, "command", hook_env)
 
@@ -643,21 +647,21 @@ class HookExecutor:
             # 실패 처리
             if attempt < max_attempts:
                 if delay > 0:
-                    console.print(f"    [yellow]Retrying in {delay}s...[/yellow]")
+                    self.console.print(f"    [yellow]Retrying in {delay}s...[/yellow]")
                     time.sleep(delay)
             # 최종 실패
             elif on_failure == "warn":
-                console.print(
+                self.console.print(
                     "[yellow]⚠️  Command failed but on_failure=warn, continuing...[/yellow]"
                 )
                 return True
             elif on_failure == "ignore":
-                console.print(
+                self.console.print(
                     "[dim]ℹ️  Command failed but on_failure=ignore, skipping...[/dim]"
                 )
                 return True
             else:  # fail
-                console.print(
+                self.console.print(
                     f"[red]❌ Command failed after {max_attempts} attempts[/red]"
                 )
                 return False
@@ -689,7 +693,7 @@ class HookExecutor:
         if not validation:
             return True
 
-        console.print("  [cyan]🔍 Validating task result...[/cyan]")
+        self.console.print("  [cyan]🔍 Validating task result...[/cyan]")
 
         kind = validation.get("kind")
         name = validation.get("name")
@@ -703,13 +707,13 @@ class HookExecutor:
         conditions = validation.get("conditions")
 
         if not kind:
-            console.print(
+            self.console.print(
                 "[yellow]⚠️  No kind specified in validation, skipping...[/yellow]"
             )
             return True
 
         if self.dry_run:
-            console.print(f"[yellow]🔍 [DRY-RUN] Would validate {kind}[/yellow]")
+            self.console.print(f"[yellow]🔍 [DRY-RUN] Would validate {kind}[/yellow]")
             return True
 
         # kubectl get 명령어 구성
@@ -746,30 +750,30 @@ class HookExecutor:
                 wait_cmd, self.kubeconfig, self.context
             )
 
-            console.print(
+            self.console.print(
                 f"    Waiting for {kind} to be ready (timeout: {timeout}s)..."
             )
 
             return_code, stdout, stderr = run_command(wait_cmd)
             if return_code != 0:
-                console.print(
+                self.console.print(
                     f"[red]❌ Validation failed: {kind} not ready within {timeout}s[/red]"
                 )
                 if stderr:
-                    console.print(f"[red]   Error: {stderr.strip()}[/red]")
+                    self.console.print(f"[red]   Error: {stderr.strip()}[/red]")
                 return False
 
-            console.print(f"[green]✅ Validation passed: {kind} is ready[/green]")
+            self.console.print(f"[green]✅ Validation passed: {kind} is ready[/green]")
             return True
         # 단순 존재 확인
         return_code, _stdout, stderr = run_command(cmd)
         if return_code != 0:
-            console.print(f"[red]❌ Validation failed: {kind} not found[/red]")
+            self.console.print(f"[red]❌ Validation failed: {kind} not found[/red]")
             if stderr:
-                console.print(f"[red]   Error: {stderr.strip()}[/red]")
+                self.console.print(f"[red]   Error: {stderr.strip()}[/red]")
             return False
 
-        console.print(f"[green]✅ Validation passed: {kind} exists[/green]")
+        self.console.print(f"[green]✅ Validation passed: {kind} exists[/green]")
         return True
 
     def _check_task_dependencies(
@@ -800,7 +804,7 @@ class HookExecutor:
         if depends_on:
             for dep_task_name in depends_on:
                 if dep_task_name not in completed_tasks:
-                    console.print(
+                    self.console.print(
                         f"[red]❌ Dependency not satisfied: task '{dep_task_name}' must complete first[/red]"
                     )
                     return False
@@ -808,7 +812,7 @@ class HookExecutor:
         # wait_for 검증
         wait_for = dependency.get("wait_for")
         if wait_for:
-            console.print("  [cyan]⏳ Waiting for external resources...[/cyan]")
+            self.console.print("  [cyan]⏳ Waiting for external resources...[/cyan]")
 
             for wait_config in wait_for:
                 kind = wait_config.get("kind")
@@ -823,13 +827,13 @@ class HookExecutor:
                 )
 
                 if not kind:
-                    console.print(
+                    self.console.print(
                         "[yellow]⚠️  No kind specified in wait_for, skipping...[/yellow]"
                     )
                     continue
 
                 if self.dry_run:
-                    console.print(
+                    self.console.print(
                         f"[yellow]🔍 [DRY-RUN] Would wait for {kind}[/yellow]"
                     )
                     continue
@@ -854,20 +858,20 @@ class HookExecutor:
                     wait_cmd, self.kubeconfig, self.context
                 )
 
-                console.print(
+                self.console.print(
                     f"    Waiting for {kind} to satisfy condition '{condition}' (timeout: {timeout}s)..."
                 )
 
                 return_code, _stdout, stderr = run_command(wait_cmd)
                 if return_code != 0:
-                    console.print(
+                    self.console.print(
                         f"[red]❌ wait_for failed: {kind} condition '{condition}' not met within {timeout}s[/red]"
                     )
                     if stderr:
-                        console.print(f"[red]   Error: {stderr.strip()}[/red]")
+                        self.console.print(f"[red]   Error: {stderr.strip()}[/red]")
                     return False
 
-                console.print(
+                self.console.print(
                     f"[green]✅ {kind} condition '{condition}' satisfied[/green]"
                 )
 
@@ -902,36 +906,36 @@ class HookExecutor:
 
         # manual은 현재 자동 실행 안 함 (나중에 사용자 확인 추가 가능)
         if on_failure == "manual":
-            console.print(
+            self.console.print(
                 "[yellow]⚠️  Rollback policy is 'manual', skipping automatic rollback[/yellow]"
             )
             return True
         if on_failure == "never":
             return True
 
-        console.print(
+        self.console.print(
             f"[yellow]🔄 Executing rollback for task '{task.get('name')}'...[/yellow]"
         )
 
         # Rollback manifests 적용
         rollback_manifests = rollback.get("manifests", [])
         if rollback_manifests:
-            console.print("  Applying rollback manifests...")
+            self.console.print("  Applying rollback manifests...")
             namespace = (
                 context.get("namespace") if context else None
             ) or self.namespace
             if not self._deploy_manifests(app_name, rollback_manifests, namespace):
-                console.print("[red]❌ Rollback manifests failed[/red]")
+                self.console.print("[red]❌ Rollback manifests failed[/red]")
                 return False
 
         # Rollback commands 실행
         rollback_commands = rollback.get("commands", [])
         if rollback_commands:
-            console.print("  Executing rollback commands...")
+            self.console.print("  Executing rollback commands...")
             for cmd in rollback_commands:
                 if not self._execute_single_command(cmd, "rollback", self.env):
-                    console.print(f"[red]❌ Rollback command failed: {cmd}[/red]")
+                    self.console.print(f"[red]❌ Rollback command failed: {cmd}[/red]")
                     return False
 
-        console.print("[green]✅ Rollback completed[/green]")
+        self.console.print("[green]✅ Rollback completed[/green]")
         return True
@@ -13,6 +13,8 @@ from sbkube.utils.hook_executor import HookExecutor
 from sbkube.utils.output_manager import OutputManager
 
 if TYPE_CHECKING:
+    from rich.console import Console
+
     from sbkube.models.config_model import AppConfig, SBKubeConfig
 
 
@@ -23,6 +25,7 @@ def create_hook_executor(
     kubeconfig: str | None = None,
     context: str | None = None,
     namespace: str | None = None,
+    console: "Console | None" = None,
 ) -> HookExecutor:
     """Create a HookExecutor instance with common parameters.
 
@@ -33,6 +36,7 @@ def create_hook_executor(
         kubeconfig: Path to kubeconfig file
         context: Kubernetes context name
         namespace: Default namespace for kubectl commands
+        console: Console for hook output (None: logger console)
 
     Returns:
         Configured HookExecutor instance
@@ -45,6 +49,7 @@ def create_hook_executor(
         kubeconfig=kubeconfig,
         context=context,
         namespace=namespace,
+        console=console,
     )
 
 
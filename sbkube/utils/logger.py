@@ -4,11 +4,19 @@ sbkube 전체에서 사용할 수 있는 통합 로깅 시스템
 verbose, debug, info, warning, error 레벨 지원
 """
 
+import contextlib
+import contextvars
+from collections.abc import Iterator
 from enum import IntEnum
 
 import click
 from rich.console import Console
 
+# use_console()로 바꾼 현재 스레드/태스크의 출력 콘솔
+_console_override: contextvars.ContextVar[Console | None] = contextvars.ContextVar(
+    "sbkube_logger_console", default=None
+)
+
 
 class LogLevel(IntEnum):
     """로그 레벨 정의."""
@@ -24,10 +32,32 @@ class SbkubeLogger:
     """sbkube 통합 로거 클래스."""
 
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        self._console = console or Console()
         self._level = LogLevel.WARNING
         self._format_type = "human"
 
+    @property
+    def console(self) -> Console:
+        """출력 콘솔 (use_console() 안에서는 그 콘솔)."""
+        return _console_override.get() or self._console
+
+    @console.setter
+    def console(self, console: Console) -> None:
+        self._console = console
+
+    @contextlib.contextmanager
+    def use_console(self, console: Console) -> Iterator[None]:
+        """현재 스레드/태스크의 로그 출력을 console로 보냄.
+
+        병렬 apply처럼 여러 앱이 동시에 실행될 때, 공용 헬퍼가 logger로 쓰는
+        출력도 앱별 버퍼에 모이도록 합니다.
+        """
+        token = _console_override.set(console)
+        try:
+            yield
+        finally:
+            _console_override.reset(token)
+
     def set_level(self, level: LogLevel) -> None:
         """로그 레벨 설정."""
         self._level = level
@@ -39,7 +69,7 @@ class SbkubeLogger:
     def set_format(self, format_type: str) -> None:
         """출력 포맷 설정. non-human 모드에서는 Console 출력을 억제."""
         self._format_type = format_type
-        self.console.quiet = format_type != "human"
+        self._console.quiet = format_type != "human"
 
     def debug(self, message: str, **kwargs) -> None:
         """디버그 메시지 출력."""
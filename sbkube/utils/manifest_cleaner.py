@@ -8,12 +8,20 @@ Typical use case: Remove metadata.managedFields and other server-side fields
 from rendered Helm charts before deployment to avoid API server rejection.
 """
 
+import shutil
+from pathlib import Path
 from typing import Any
 
 import yaml
 
 from sbkube.utils.logger import logger
 
+_DUMP_OPTIONS: dict[str, Any] = {
+    "default_flow_style": False,
+    "allow_unicode": True,
+    "sort_keys": False,
+}
+
 
 def clean_manifest_metadata(manifest_content: str) -> str:
     """Clean Kubernetes manifest by removing server-managed metadata fields.
@@ -74,12 +82,7 @@ def clean_manifest_metadata(manifest_content: str) -> str:
             return manifest_content
 
         # Use safe_dump_all for multi-document support
-        return yaml.safe_dump_all(
-            cleaned_docs,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=False,
-        )
+        return yaml.safe_dump_all(cleaned_docs, **_DUMP_OPTIONS)
 
     except yaml.YAMLError as e:
         logger.warning(f"Failed to parse manifest as YAML, returning original: {e}")
@@ -125,6 +128,40 @@ def _clean_metadata_dict(resource: dict[str, Any]) -> None:
                     _clean_metadata_dict(item)
 
 
+def clean_manifest_stream(input_path: str | Path, output_path: str | Path) -> None:
+    """Clean a (large) manifest file document by document.
+
+    Same result as ``clean_manifest_metadata`` on the file content, but only
+    one document is held in memory at a time. If the input is not valid YAML
+    or contains no mapping documents, it is copied unchanged.
+
+    Args:
+        input_path: Path to input manifest file (e.g. raw ``helm template`` output)
+        output_path: Path to output file (must differ from input_path)
+
+    """
+    written = 0
+    try:
+        with (
+            open(input_path, encoding="utf-8") as src,
+            open(output_path, "w", encoding="utf-8") as dst,
+        ):
+            for doc in yaml.safe_load_all(src):
+                if not isinstance(doc, dict):
+                    continue
+                _clean_metadata_dict(doc)
+                if written:
+                    dst.write("---\n")
+                yaml.safe_dump(doc, dst, **_DUMP_OPTIONS)
+                written += 1
+    except yaml.YAMLError as e:
+        logger.warning(f"Failed to parse manifest as YAML, returning original: {e}")
+        written = 0
+
+    if not written:
+        shutil.copyfile(input_path, output_path)
+
+
 def clean_manifest_file(input_path: str, output_path: str | None = None) -> None:
     """Clean a manifest file by removing server-managed metadata fields.
 
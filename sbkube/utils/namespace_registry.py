@@ -0,0 +1,282 @@
+"""Per-run registry of cluster namespaces.
+
+Helm 앱 배포 전 namespace 확인(`kubectl get namespace <ns>`)과 validator의 같은
+확인이 앱마다 반복되지 않도록, 클러스터별로 `kubectl get namespaces -o json`을
+한 번 실행해 namespace 목록을 기억하고, 이후 생성한 namespace를 반영합니다.
+
+목록 조회가 실패하면(예: cluster-wide list 권한 없음) namespace별 조회로 대체하고
+결과를 캐시합니다. 생성은 namespace별 lock으로 직렬화하므로, 같은 namespace를
+사용하는 병렬 앱이 동시에 `kubectl create namespace`를 실행하지 않습니다.
+
+Usage:
+    registry = NamespaceRegistry()
+    if not registry.exists("data", kubeconfig=kubeconfig, context=context):
+        created, error = registry.create("data", kubeconfig=kubeconfig, context=context)
+"""
+
+import asyncio
+import json
+import subprocess
+import threading
+from collections.abc import Callable
+
+from sbkube.utils.cluster_config import apply_cluster_config_to_command
+from sbkube.utils.logger import logger
+
+# (kubeconfig, context)
+ClusterKey = tuple[str | None, str | None]
+# run_command 형태의 동기 명령 실행 함수: (cmd, **kwargs) -> (rc, stdout, stderr)
+Runner = Callable[..., tuple[int, str, str]]
+
+# namespace 목록 조회 타임아웃 (초)
+LIST_TIMEOUT_SECONDS = 30
+
+
+def _parse_namespace_list(stdout: str) -> set[str] | None:
+    try:
+        data = json.loads(stdout)
+        return {item["metadata"]["name"] for item in data.get("items", [])}
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _already_exists(stderr: str) -> bool:
+    return "AlreadyExists" in stderr or "already exists" in stderr
+
+
+class NamespaceRegistry:
+    """클러스터별 namespace 존재 여부 캐시 (한 번의 실행 동안 공유)."""
+
+    def __init__(
+        self,
+        runner: Runner | None = None,
+        list_all: bool = True,
+    ) -> None:
+        """NamespaceRegistry 초기화.
+
+        Args:
+            runner: 동기 명령 실행 함수 (기본: sbkube.utils.common.run_command)
+            list_all: False면 목록 조회 없이 namespace별로 조회 (앱 하나만
+                배포하는 경우처럼 조회할 namespace가 하나뿐일 때)
+
+        """
+        self._runner = runner
+        self._list_all = list_all
+        self._lock = threading.Lock()
+        self._cluster_locks: dict[ClusterKey, threading.Lock] = {}
+        self._create_locks: dict[tuple[ClusterKey, str], threading.Lock] = {}
+        # 클러스터 → namespace 목록 (목록 조회 실패 시 None)
+        self._namespaces: dict[ClusterKey, set[str] | None] = {}
+        # 목록 조회 실패 시 namespace별 조회 결과
+        self._probed: dict[ClusterKey, dict[str, bool]] = {}
+        self._loading: dict[ClusterKey, asyncio.Task] = {}
+
+    def _run(
+        self, cmd: list[str], runner: Runner | None = None, **kwargs
+    ) -> tuple[int, str, str]:
+        runner = runner or self._runner
+        if runner is None:
+            from sbkube.utils.common import run_command as runner
+        return runner(cmd, **kwargs)
+
+    def _lock_for(self, locks: dict, key) -> threading.Lock:
+        with self._lock:
+            lock = locks.get(key)
+            if lock is None:
+                lock = locks[key] = threading.Lock()
+            return lock
+
+    @staticmethod
+    def _command(args: list[str], cluster: ClusterKey) -> list[str]:
+        kubeconfig, context = cluster
+        return apply_cluster_config_to_command(["kubectl", *args], kubeconfig, context)
+
+    def _store_list(self, cluster: ClusterKey, names: set[str] | None) -> set[str] | None:
+        if names is None and self._list_all:
+            logger.verbose("Namespace 목록 조회 실패, namespace별 조회로 대체합니다")
+        with self._lock:
+            self._namespaces.setdefault(cluster, names)
+            return self._namespaces[cluster]
+
+    def _cached(self, namespace: str, cluster: ClusterKey) -> bool | None:
+        """캐시된 존재 여부 (목록/조회 결과가 없으면 None)."""
+        with self._lock:
+            if cluster not in self._namespaces:
+                return None
+            names = self._namespaces[cluster]
+            if names is not None:
+                return namespace in names
+            return self._probed.get(cluster, {}).get(namespace)
+
+    def _store_probe(self, namespace: str, cluster: ClusterKey, found: bool) -> None:
+        with self._lock:
+            self._probed.setdefault(cluster, {})[namespace] = found
+
+    def _load(self, cluster: ClusterKey, runner: Runner | None) -> None:
+        with self._lock_for(self._cluster_locks, cluster):
+            with self._lock:
+                if cluster in self._namespaces:
+                    return
+            if not self._list_all:
+                self._store_list(cluster, None)
+                return
+            return_code, stdout, _ = self._run(
+                self._command(["get", "namespaces", "-o", "json"], cluster),
+                runner,
+                timeout=LIST_TIMEOUT_SECONDS,
+            )
+            self._store_list(
+                cluster, _parse_namespace_list(stdout) if return_code == 0 else None
+            )
+
+    def exists(
+        self,
+        namespace: str,
+        kubeconfig: str | None = None,
+        context: str | None = None,
+        runner: Runner | None = None,
+    ) -> bool:
+        """Namespace 존재 여부.
+
+        Args:
+            namespace: namespace 이름
+            kubeconfig: kubeconfig 파일 경로
+            context: kubectl context 이름
+            runner: 이번 호출에 사용할 명령 실행 함수 (기본: 생성 시 지정한 runner)
+
+        Returns:
+            존재하면 True
+
+        """
+        cluster = (kubeconfig, context)
+        self._load(cluster, runner)
+        found = self._cached(namespace, cluster)
+        if found is not None:
+            return found
+
+        return_code, _, _ = self._run(
+            self._command(["get", "namespace", namespace], cluster), runner
+        )
+        self._store_probe(namespace, cluster, return_code == 0)
+        return return_code == 0
+
+    async def exists_async(
+        self,
+        namespace: str,
+        kubeconfig: str | None = None,
+        context: str | None = None,
+    ) -> bool:
+        """exists()의 async 버전 (validator용, 동시 호출 시 목록 조회는 한 번).
+
+        Args:
+            namespace: namespace 이름
+            kubeconfig: kubeconfig 파일 경로
+            context: kubectl context 이름
+
+        Returns:
+            존재하면 True
+
+        """
+        from sbkube.utils.async_runner import run_async
+
+        cluster = (kubeconfig, context)
+        if self._cached(namespace, cluster) is None:
+            loop = asyncio.get_running_loop()
+            with self._lock:
+                task = self._loading.get(cluster)
+                if task is None or task.get_loop() is not loop:
+                    task = loop.create_task(self._list_async(cluster))
+                    self._loading[cluster] = task
+            await asyncio.shield(task)
+
+        found = self._cached(namespace, cluster)
+        if found is not None:
+            return found
+
+        try:
+            result = await run_async(
+                self._command(["get", "namespace", namespace], cluster),
+                check=False,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            found = result.returncode == 0
+        except (OSError, subprocess.TimeoutExpired):
+            found = False
+        self._store_probe(namespace, cluster, found)
+        return found
+
+    async def _list_async(self, cluster: ClusterKey) -> None:
+        from sbkube.utils.async_runner import run_async
+
+        with self._lock:
+            if cluster in self._namespaces:
+                return
+        if not self._list_all:
+            self._store_list(cluster, None)
+            return
+        try:
+            result = await run_async(
+                self._command(["get", "namespaces", "-o", "json"], cluster),
+                check=False,
+                capture_output=True,
+                text=True,
+                timeout=LIST_TIMEOUT_SECONDS,
+            )
+            names = (
+                _parse_namespace_list(result.stdout) if result.returncode == 0 else None
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            names = None
+        self._store_list(cluster, names)
+
+    def create(
+        self,
+        namespace: str,
+        kubeconfig: str | None = None,
+        context: str | None = None,
+        runner: Runner | None = None,
+    ) -> tuple[bool, str]:
+        """Namespace 생성 (이미 있거나 다른 앱이 먼저 만들었으면 그대로 성공).
+
+        Args:
+            namespace: namespace 이름
+            kubeconfig: kubeconfig 파일 경로
+            context: kubectl context 이름
+            runner: 이번 호출에 사용할 명령 실행 함수 (기본: 생성 시 지정한 runner)
+
+        Returns:
+            (성공 여부, 실패 시 stderr)
+
+        """
+        cluster = (kubeconfig, context)
+        with self._lock_for(self._create_locks, (cluster, namespace)):
+            if self.exists(
+                namespace, kubeconfig=kubeconfig, context=context, runner=runner
+            ):
+                return True, ""
+
+            return_code, _, stderr = self._run(
+                self._command(["create", "namespace", namespace], cluster), runner
+            )
+            if return_code != 0 and not _already_exists(stderr):
+                return False, stderr
+
+            self.mark_created(namespace, kubeconfig=kubeconfig, context=context)
+            return True, ""
+
+    def mark_created(
+        self,
+        namespace: str,
+        kubeconfig: str | None = None,
+        context: str | None = None,
+    ) -> None:
+        """다른 경로(helm --create-namespace 등)로 생성된 namespace 반영."""
+        cluster = (kubeconfig, context)
+        with self._lock:
+            names = self._namespaces.get(cluster)
+            if names is not None:
+                names.add(namespace)
+            else:
+                self._probed.setdefault(cluster, {})[namespace] = True
@@ -4,10 +4,12 @@
 human/llm/json/yaml 포맷 간 일관된 인터페이스를 제공합니다.
 """
 
+import io
 import re
 from typing import Any
 
 from rich.console import Console
+from rich.text import Text
 
 from sbkube.utils.logger import LogLevel, logger
 from sbkube.utils.output_formatter import OutputFormatter
@@ -493,6 +495,51 @@ class OutputManager:
         )
         self.formatter.print_output(result)
 
+    def create_buffer(self) -> "OutputManager":
+        """앱 단위 출력 버퍼용 OutputManager 생성.
+
+        병렬 실행 중인 앱의 출력이 뒤섞이지 않도록, human 모드에서는
+        메모리 Console에 기록하고 flush_buffer()에서 한 번에 출력합니다.
+
+        Returns:
+            같은 포맷의 버퍼 OutputManager
+
+        """
+        buffered = OutputManager(format_type=self.format_type)
+        if self.format_type == "human":
+            buffered.console = Console(
+                file=io.StringIO(),
+                force_terminal=self.console.is_terminal,
+                color_system=self.console.color_system,
+                width=self.console.width,
+            )
+        return buffered
+
+    def flush_buffer(self, buffered: "OutputManager") -> None:
+        """create_buffer()로 만든 버퍼의 내용을 현재 출력으로 병합.
+
+        Args:
+            buffered: 병합할 버퍼 OutputManager
+
+        """
+        if self.format_type == "human":
+            file = buffered.console.file
+            text = file.getvalue() if isinstance(file, io.StringIO) else ""
+            if text:
+                self.console.print(Text.from_ansi(text.rstrip("\n")), soft_wrap=True)
+                file.seek(0)
+                file.truncate()
+            return
+
+        self.events.extend(buffered.events)
+        self.deployments.extend(buffered.deployments)
+        for message in buffered.error_messages:
+            if message not in self.error_messages:
+                self.error_messages.append(message)
+        buffered.events = []
+        buffered.deployments = []
+        buffered.error_messages = []
+
     def get_console(self) -> Console:
         """Rich Console 객체 반환 (고급 기능용).
 
@@ -3,19 +3,29 @@
 Enabled via environment variable SBKUBE_PERF=1.
 Records durations for subprocess calls and explicit timers,
 and writes JSONL events under tmp/perf/.
+
+Events form a span tree (workspace → phase → app group → app → stage →
+subprocess). The current span is tracked with a ContextVar, so work handed
+to a thread pool via ``bind_span_context`` stays attached to its parent.
+Besides the JSONL log, flush() writes a Chrome Trace Event file
+(``*.trace.json``, opens in Perfetto / chrome://tracing) and a folded-stack
+file (``*.folded``, input for flamegraph.pl / speedscope).
 """
 
 from __future__ import annotations
 
 import atexit
+import contextvars
+import itertools
 import json
 import os
+import threading
 import time
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterable
-
+from typing import Any
 
 _TRUTHY = {"1", "true", "yes", "on"}
 
@@ -51,14 +61,39 @@ def _cmd_to_tool(cmd: Any) -> str:
     return text.split()[0]
 
 
+# 현재 실행 중인 span ID (스레드/컨텍스트별)
+_current_span: contextvars.ContextVar[int | None] = contextvars.ContextVar(
+    "sbkube_perf_span", default=None
+)
+_span_ids = itertools.count(1)
+
+
+def _span_label(name: str, tags: dict[str, Any]) -> str:
+    """Folded-stack frame label: name plus the most specific identifying tag."""
+    for key in ("app", "app_group", "phase", "workspace", "tool"):
+        value = tags.get(key)
+        if value:
+            return f"{name}[{value}]"
+    return name
+
+
 @dataclass
 class PerfEvent:
-    """Single performance event."""
+    """Single performance event.
+
+    ``start_offset`` is seconds since recording was enabled (monotonic), which
+    is what the trace exporters use; ``timestamp`` stays wall-clock end time.
+    """
 
     name: str
     duration_seconds: float
     timestamp: float
     tags: dict[str, Any] = field(default_factory=dict)
+    span_id: int = 0
+    parent_id: int | None = None
+    thread_id: int = 0
+    thread_name: str = ""
+    start_offset: float = 0.0
 
 
 class PerfRecorder:
@@ -72,6 +107,7 @@ class PerfRecorder:
         self._process_start: float | None = None
         self._subprocess_patched = False
         self._atexit_registered = False
+        self._lock = threading.Lock()
 
     def enable(self, output_format: str | None = None, log_dir: Path | None = None) -> None:
         """Enable perf recording and register subprocess wrapper."""
@@ -98,16 +134,153 @@ class PerfRecorder:
             self._atexit_registered = True
 
     def record(self, name: str, duration_seconds: float, **tags: Any) -> None:
-        """Record a performance event."""
+        """Record a performance event ending now, as a child of the current span."""
         if not self.enabled:
             return
+        end = time.perf_counter()
+        self._append(
+            name,
+            start=end - duration_seconds,
+            end=end,
+            span_id=next(_span_ids),
+            parent_id=_current_span.get(),
+            tags=tags,
+        )
+
+    def _append(
+        self,
+        name: str,
+        *,
+        start: float,
+        end: float,
+        span_id: int,
+        parent_id: int | None,
+        tags: dict[str, Any],
+    ) -> None:
+        thread = threading.current_thread()
+        origin = self._process_start if self._process_start is not None else start
         event = PerfEvent(
             name=name,
-            duration_seconds=duration_seconds,
+            duration_seconds=end - start,
             timestamp=time.time(),
             tags=tags,
+            span_id=span_id,
+            parent_id=parent_id,
+            thread_id=threading.get_ident(),
+            thread_name=thread.name,
+            start_offset=start - origin,
         )
-        self.events.append(event)
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, **tags: Any) -> Iterator[None]:
+        """Open a nested span; events recorded inside become its children."""
+        if not self.enabled:
+            yield
+            return
+
+        span_id = next(_span_ids)
+        parent_id = _current_span.get()
+        token = _current_span.set(span_id)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            _current_span.reset(token)
+            self._append(
+                name,
+                start=start,
+                end=end,
+                span_id=span_id,
+                parent_id=parent_id,
+                tags=tags,
+            )
+
+    def subtree(self, span_id: int) -> list[PerfEvent]:
+        """Events of span ``span_id`` and all of its descendants."""
+        with self._lock:
+            events = list(self.events)
+        members = {span_id}
+        result: list[PerfEvent] = []
+        # 부모 span은 자식보다 늦게 끝나므로(나중에 기록) 역순으로 한 번 훑으면 됨
+        for event in reversed(events):
+            if event.span_id in members or event.parent_id in members:
+                members.add(event.span_id)
+                result.append(event)
+        result.reverse()
+        return result
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Export events in Chrome Trace Event format (complete "X" events)."""
+        pid = os.getpid()
+        trace_events: list[dict[str, Any]] = []
+        thread_names: dict[int, str] = {}
+
+        for event in sorted(self.events, key=lambda e: e.start_offset):
+            thread_names.setdefault(event.thread_id, event.thread_name)
+            args = dict(event.tags)
+            args["span_id"] = event.span_id
+            if event.parent_id is not None:
+                args["parent_id"] = event.parent_id
+            trace_events.append(
+                {
+                    "name": _span_label(event.name, event.tags),
+                    "cat": event.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": round(event.start_offset * 1_000_000, 3),
+                    "dur": round(event.duration_seconds * 1_000_000, 3),
+                    "pid": pid,
+                    "tid": event.thread_id,
+                    "args": args,
+                }
+            )
+
+        for tid, thread_name in thread_names.items():
+            trace_events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": thread_name},
+                }
+            )
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def to_folded_stacks(self) -> list[str]:
+        """Export events as folded stacks (``a;b;c <self time in µs>``).
+
+        Self time is the span duration minus its direct children, so the
+        flamegraph width of a frame matches its wall-clock duration. Children
+        running concurrently on worker threads can exceed the parent; self time
+        is clamped at zero in that case.
+        """
+        by_id = {event.span_id: event for event in self.events}
+        child_time: dict[int, float] = {}
+        for event in self.events:
+            if event.parent_id is not None and event.parent_id in by_id:
+                child_time[event.parent_id] = (
+                    child_time.get(event.parent_id, 0.0) + event.duration_seconds
+                )
+
+        folded: dict[str, int] = {}
+        for event in self.events:
+            frames = [_span_label(event.name, event.tags)]
+            parent_id = event.parent_id
+            while parent_id is not None and parent_id in by_id:
+                parent = by_id[parent_id]
+                frames.append(_span_label(parent.name, parent.tags))
+                parent_id = parent.parent_id
+            stack = ";".join(reversed(frames))
+            self_time = max(
+                event.duration_seconds - child_time.get(event.span_id, 0.0), 0.0
+            )
+            folded[stack] = folded.get(stack, 0) + int(self_time * 1_000_000)
+
+        return [f"{stack} {micros}" for stack, micros in sorted(folded.items())]
 
     def _patch_subprocess_run(self) -> None:
         if self._subprocess_patched:
@@ -209,8 +382,20 @@ class PerfRecorder:
                             "duration_seconds": event.duration_seconds,
                             "timestamp": event.timestamp,
                             "tags": event.tags,
+                            "span_id": event.span_id,
+                            "parent_id": event.parent_id,
+                            "thread_id": event.thread_id,
+                            "thread_name": event.thread_name,
+                            "start_offset": event.start_offset,
                         }
                         fp.write(json.dumps(payload, ensure_ascii=False) + "\n")
+                self.trace_path.write_text(
+                    json.dumps(self.to_chrome_trace(), ensure_ascii=False, default=str),
+                    encoding="utf-8",
+                )
+                self.folded_path.write_text(
+                    "\n".join(self.to_folded_stacks()) + "\n", encoding="utf-8"
+                )
             except Exception:
                 # Ignore file write errors
                 pass
@@ -256,6 +441,22 @@ class PerfRecorder:
 
         if self.log_path:
             logger.info(f"Raw perf log: {self.log_path}")
+            logger.info(f"Chrome trace (Perfetto): {self.trace_path}")
+            logger.info(f"Folded stacks (flamegraph): {self.folded_path}")
+
+    @property
+    def trace_path(self) -> Path | None:
+        """Chrome Trace Event JSON path next to the JSONL log."""
+        if self.log_path is None:
+            return None
+        return self.log_path.with_suffix(".trace.json")
+
+    @property
+    def folded_path(self) -> Path | None:
+        """Folded-stack path next to the JSONL log."""
+        if self.log_path is None:
+            return None
+        return self.log_path.with_suffix(".folded")
 
 
 _perf_recorder = PerfRecorder()
@@ -269,14 +470,37 @@ def enable_from_env(output_format: str | None = None) -> None:
 
 @contextmanager
 def perf_timer(name: str, **tags: Any) -> Iterable[None]:
-    """Context manager for timing code blocks."""
-    if not _perf_recorder.enabled:
-        yield
-        return
+    """Context manager for timing code blocks.
 
-    start = time.perf_counter()
-    try:
+    The block is recorded as a span: timers and subprocess calls made inside
+    it are nested under it in the trace exports.
+    """
+    with _perf_recorder.span(name, **tags):
         yield
-    finally:
-        duration = time.perf_counter() - start
-        _perf_recorder.record(name, duration, **tags)
+
+
+def get_perf_recorder() -> PerfRecorder:
+    """Process-wide perf recorder."""
+    return _perf_recorder
+
+
+def current_span_id() -> int | None:
+    """ID of the innermost open span in this context (None outside spans)."""
+    return _current_span.get()
+
+
+def bind_span_context[T](fn: Callable[..., T]) -> Callable[..., T]:
+    """Bind ``fn`` to the caller's current span for execution on another thread.
+
+    ThreadPoolExecutor workers do not inherit ContextVars, so spans opened in a
+    worker would otherwise become roots. Use as
+    ``executor.submit(bind_span_context(fn), *args)``.
+    """
+    if not _perf_recorder.enabled:
+        return fn
+    ctx = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> T:
+        return ctx.copy().run(fn, *args, **kwargs)
+
+    return run
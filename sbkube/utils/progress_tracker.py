@@ -11,11 +11,28 @@ from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
     Progress,
+    ProgressColumn,
     SpinnerColumn,
+    Task,
     TaskID,
     TextColumn,
     TimeElapsedColumn,
 )
+from rich.text import Text
+
+# 상태 줄(helm 출력 등) 최대 표시 길이
+STATUS_MAX_WIDTH = 60
+
+
+class StatusColumn(ProgressColumn):
+    """태스크의 최근 상태 줄 (``status`` 필드, 없으면 빈 칸)."""
+
+    def render(self, task: Task) -> Text:
+        """상태 줄을 한 줄로 잘라 표시."""
+        status = str(task.fields.get("status", ""))
+        if len(status) > STATUS_MAX_WIDTH:
+            status = status[: STATUS_MAX_WIDTH - 1] + "…"
+        return Text(status, style="dim", no_wrap=True)
 
 
 class ProgressTracker:
@@ -48,6 +65,7 @@ class ProgressTracker:
             MofNCompleteColumn(),
             TextColumn("•"),
             TimeElapsedColumn(),
+            StatusColumn(),
             console=self.console,
             disable=self.disable,
         )
@@ -118,6 +136,16 @@ class ProgressTracker:
 
         self.progress.update(task_id, **update_kwargs)
 
+    def set_status(self, task_id: TaskID | None, status: str) -> None:
+        """태스크 옆에 표시할 상태 줄 갱신 (예: 실행 중인 helm의 최근 출력).
+
+        Args:
+            task_id: 업데이트할 task ID
+            status: 표시할 한 줄 (빈 문자열이면 지움)
+
+        """
+        self.update(task_id, status=status.strip())
+
     def console_print(self, *args: Any, **kwargs: Any) -> None:
         """Progress 외부에서 console.print() 호출.
 
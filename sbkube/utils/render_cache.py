@@ -0,0 +1,139 @@
+"""Render cache for `sbkube template`.
+
+입력이 바뀌지 않은 Helm 앱은 `helm template`과 metadata 정리를 다시 실행하지 않고
+기존 `rendered/<app>.yaml`을 재사용합니다.
+
+Cache key 구성:
+    - 차트 트리 digest (build/ 또는 charts/ 디렉토리 내용)
+    - helm 명령 인자 (--values 파일은 경로 대신 내용 digest, 임시 cluster global values 포함)
+    - 앱 설정 (set_values, labels, annotations 등)
+    - cleanup_metadata 설정, helm 버전, sbkube 버전
+
+Cache 기록은 `rendered/.render-cache/<app>.json`에 저장하며, 렌더링 결과 파일의
+digest도 함께 기록해 결과 파일이 수정/삭제되면 다시 렌더링합니다.
+(`kubectl apply -f rendered/`가 읽지 않도록 하위 디렉토리에 둡니다.)
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from sbkube import __version__
+from sbkube.utils.chart_cache import compute_tree_digest
+from sbkube.utils.common import run_command
+
+CACHE_DIR_NAME = ".render-cache"
+CACHE_FORMAT_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def get_helm_version() -> str:
+    """helm 클라이언트 버전 (프로세스당 한 번만 조회)."""
+    return_code, stdout, _ = run_command(["helm", "version", "--short"], timeout=10)
+    return stdout.strip() if return_code == 0 else "unknown"
+
+
+def _file_digest(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as fp:
+        for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    return f"sha256:{hasher.hexdigest()}"
+
+
+def helm_input_args(command: list[str], chart_path: Path) -> list[str]:
+    """helm 명령 인자에서 경로를 내용 digest로 치환.
+
+    차트 경로는 차트 트리 digest로, --values 파일은 파일 digest로 바꿔
+    임시 파일 경로나 작업 디렉토리 위치와 무관한 입력 목록을 만듭니다.
+
+    Args:
+        command: helm 명령 (HelmCommandResult.command)
+        chart_path: 차트 디렉토리
+
+    Returns:
+        정규화된 명령 인자 목록
+
+    """
+    chart_arg = str(chart_path)
+    args: list[str] = []
+    previous = ""
+    for arg in command:
+        if arg == chart_arg:
+            args.append(f"chart:{compute_tree_digest(chart_path)[0]}")
+        elif previous in ("--values", "-f") and Path(arg).is_file():
+            args.append(f"values:{_file_digest(Path(arg))}")
+        else:
+            args.append(arg)
+        previous = arg
+    return args
+
+
+def compute_render_key(
+    command: list[str],
+    chart_path: Path,
+    app_config: dict[str, Any],
+    cleanup_metadata: bool,
+) -> str:
+    """helm template 입력으로 render cache key 계산.
+
+    Args:
+        command: helm template 명령 (HelmCommandResult.command)
+        chart_path: 렌더링할 차트 디렉토리
+        app_config: 앱 설정 (labels/annotations/set_values 포함)
+        cleanup_metadata: metadata 정리 여부
+
+    Returns:
+        sha256 cache key
+
+    """
+    payload = {
+        "version": CACHE_FORMAT_VERSION,
+        "sbkube": __version__,
+        "helm": get_helm_version(),
+        "command": helm_input_args(command, chart_path),
+        "app": app_config,
+        "cleanup_metadata": cleanup_metadata,
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class RenderCache:
+    """Per-app render cache records under `<rendered_dir>/.render-cache/`."""
+
+    def __init__(self, rendered_dir: Path) -> None:
+        """RenderCache 초기화.
+
+        Args:
+            rendered_dir: 렌더링 결과 디렉토리
+
+        """
+        self.cache_dir = rendered_dir / CACHE_DIR_NAME
+
+    def _record_path(self, app_name: str) -> Path:
+        return self.cache_dir / f"{app_name}.json"
+
+    def is_fresh(self, app_name: str, key: str, output_file: Path) -> bool:
+        """output_file이 같은 key로 렌더링되었고 그 뒤 변경되지 않았는지 확인."""
+        try:
+            record = json.loads(self._record_path(app_name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if record.get("key") != key or not output_file.is_file():
+            return False
+        return record.get("output_digest") == _file_digest(output_file)
+
+    def record(self, app_name: str, key: str, output_file: Path) -> None:
+        """렌더링 결과를 cache에 기록."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._record_path(app_name).write_text(
+            json.dumps({"key": key, "output_digest": _file_digest(output_file)}),
+            encoding="utf-8",
+        )
+
+    def invalidate(self, app_name: str) -> None:
+        """앱의 cache 기록 삭제."""
+        self._record_path(app_name).unlink(missing_ok=True)
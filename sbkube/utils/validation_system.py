@@ -1,3 +1,4 @@
+import asyncio
 import json
 from abc import abstractmethod
 from dataclasses import dataclass, field
@@ -17,6 +18,7 @@ from sbkube.utils.diagnostic_system import (
     DiagnosticResult,
 )
 from sbkube.utils.logger import logger
+from sbkube.utils.namespace_registry import NamespaceRegistry
 
 
 class ValidationMode(Enum):
@@ -49,6 +51,10 @@ class ValidationContext:
     environment: str | None = None
     profile: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    # validator들이 공유하는 namespace 목록 (kubectl get namespaces 한 번)
+    namespaces: NamespaceRegistry = field(
+        default_factory=NamespaceRegistry, repr=False, compare=False
+    )
 
 
 @dataclass
@@ -353,45 +359,26 @@ class ValidationEngine(DiagnosticEngine):
             ) as progress:
                 task = progress.add_task("검증 실행 중...", total=len(self.validators))
 
-                for validator in self.validators:
-                    progress.update(
-                        task, description=f"검증 중: {validator.description}"
-                    )
-                    try:
-                        result = await validator.run_validation(context)
-                        self.current_report.add_result(result)
-                    except Exception as e:
-                        # 검증 실행 오류 처리
-                        error_result = ValidationResult(
-                            check_name=validator.name,
-                            category=validator.category,
-                            level=DiagnosticLevel.ERROR,
-                            severity=ValidationSeverity.HIGH,
-                            message=f"검증 실행 실패: {e!s}",
-                            details=f"검증기 '{validator.description}' 실행 중 오류가 발생했습니다.",
-                            risk_level="high",
-                        )
-                        self.current_report.add_result(error_result)
-                        logger.error(f"검증기 {validator.name} 실행 실패: {e}")
-
+                async def run_validator(validator: ValidationCheck) -> ValidationResult:
+                    result = await self._run_validator(validator, context)
+                    progress.update(task, description=f"완료: {validator.description}")
                     progress.advance(task)
+                    return result
+
+                results = await asyncio.gather(
+                    *(run_validator(validator) for validator in self.validators)
+                )
         else:
-            for validator in self.validators:
-                try:
-                    result = await validator.run_validation(context)
-                    self.current_report.add_result(result)
-                except Exception as e:
-                    error_result = ValidationResult(
-                        check_name=validator.name,
-                        category=validator.category,
-                        level=DiagnosticLevel.ERROR,
-                        severity=ValidationSeverity.HIGH,
-                        message=f"검증 실행 실패: {e!s}",
-                        details=f"검증기 '{validator.description}' 실행 중 오류가 발생했습니다.",
-                        risk_level="high",
-                    )
-                    self.current_report.add_result(error_result)
-                    logger.error(f"검증기 {validator.name} 실행 실패: {e}")
+            results = await asyncio.gather(
+                *(
+                    self._run_validator(validator, context)
+                    for validator in self.validators
+                )
+            )
+
+        # 검증기는 동시에 실행되지만 보고서는 등록 순서 유지
+        for result in results:
+            self.current_report.add_result(result)
 
         self.current_report.end_time = datetime.now()
 
@@ -403,6 +390,24 @@ class ValidationEngine(DiagnosticEngine):
 
         return self.current_report
 
+    async def _run_validator(
+        self, validator: ValidationCheck, context: ValidationContext
+    ) -> ValidationResult:
+        """검증기 하나 실행 (실행 오류는 HIGH 심각도 결과로 변환)."""
+        try:
+            return await validator.run_validation(context)
+        except Exception as e:
+            logger.error(f"검증기 {validator.name} 실행 실패: {e}")
+            return ValidationResult(
+                check_name=validator.name,
+                category=validator.category,
+                level=DiagnosticLevel.ERROR,
+                severity=ValidationSeverity.HIGH,
+                message=f"검증 실행 실패: {e!s}",
+                details=f"검증기 '{validator.description}' 실행 중 오류가 발생했습니다.",
+                risk_level="high",
+            )
+
     def _validation_to_diagnostic_result(
         self, validation_result: ValidationResult
     ) -> DiagnosticResult:
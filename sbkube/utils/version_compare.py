@@ -163,3 +163,26 @@ def get_latest_version(versions: list[str]) -> str | None:
     # Sort by parsed version and return the original string
     valid_versions.sort(key=lambda x: x[0], reverse=True)
     return valid_versions[0][1]
+
+
+def sort_versions(versions: list[str], include_prerelease: bool = True) -> list[str]:
+    """Sort version strings from newest to oldest.
+
+    Args:
+        versions: List of version strings
+        include_prerelease: Keep pre-release versions (e.g. "2.0.0-rc.1")
+
+    Returns:
+        Valid version strings sorted newest first (invalid ones are dropped)
+    """
+    valid_versions = []
+    for ver_str in versions:
+        try:
+            parsed = parse(ver_str)
+        except InvalidVersion:
+            continue
+        if include_prerelease or not parsed.is_prerelease:
+            valid_versions.append((parsed, ver_str))
+
+    valid_versions.sort(key=lambda x: x[0], reverse=True)
+    return [ver_str for _, ver_str in valid_versions]
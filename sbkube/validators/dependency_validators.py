@@ -14,6 +14,7 @@ from urllib.parse import urlparse
 import requests
 import yaml
 
+from sbkube.utils.async_runner import run_async
 from sbkube.utils.diagnostic_system import DiagnosticLevel
 from sbkube.utils.logger import logger
 from sbkube.utils.validation_system import (
@@ -108,7 +109,7 @@ class HelmChartValidator(ValidationCheck):
     async def _check_helm_installation(self) -> str | None:
         """Helm 설치 상태 확인."""
         try:
-            result = subprocess.run(
+            result = await run_async(
                 ["helm", "version", "--short"],
                 check=False,
                 capture_output=True,
@@ -414,7 +415,7 @@ class HelmChartValidator(ValidationCheck):
             # 임시 네임스페이스 사용
             cmd.extend(["--namespace", "validation-test"])
 
-            result = subprocess.run(
+            result = await run_async(
                 cmd, check=False, capture_output=True, text=True, timeout=30
             )
 
@@ -508,7 +509,7 @@ class HelmChartValidator(ValidationCheck):
             if version:
                 cmd.extend(["--version", version])
 
-            result = subprocess.run(
+            result = await run_async(
                 cmd, check=False, capture_output=True, text=True, timeout=15
             )
 
@@ -751,7 +752,7 @@ class ValuesCompatibilityValidator(ValidationCheck):
                 "validation-test",
             ]
 
-            result = subprocess.run(
+            result = await run_async(
                 cmd, check=False, capture_output=True, text=True, timeout=30
             )
 
@@ -995,7 +996,7 @@ class DependencyResolutionValidator(ValidationCheck):
                     shutil.copy2(original_chart_yaml, temp_chart_yaml)
 
                     # helm dependency update 실행
-                    result = subprocess.run(
+                    result = await run_async(
                         ["helm", "dependency", "update", str(temp_chart_path)],
                         check=False,
                         capture_output=True,
@@ -11,6 +11,7 @@ from pathlib import Path
 import requests
 import yaml
 
+from sbkube.utils.async_runner import run_async
 from sbkube.utils.diagnostic_system import DiagnosticLevel
 from sbkube.utils.logger import logger
 from sbkube.utils.validation_system import (
@@ -86,7 +87,7 @@ class ClusterResourceValidator(ValidationCheck):
 
         try:
             # 노드 목록 및 상태 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "nodes", "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -191,7 +192,7 @@ class ClusterResourceValidator(ValidationCheck):
                 namespace = config.get("namespace", "default")
 
                 # 리소스 쿼터 확인
-                result = subprocess.run(
+                result = await run_async(
                     ["kubectl", "get", "resourcequota", "-n", namespace, "-o", "json"],
                     check=False,
                     capture_output=True,
@@ -242,7 +243,7 @@ class ClusterResourceValidator(ValidationCheck):
         warnings = []
 
         try:
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "storageclass", "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -336,7 +337,7 @@ class NamespacePermissionValidator(ValidationCheck):
             namespace = await self._get_target_namespace(context)
 
             # 네임스페이스 존재성 및 접근성 확인
-            ns_issues = await self._check_namespace_access(namespace)
+            ns_issues = await self._check_namespace_access(namespace, context)
             issues.extend(ns_issues)
 
             # 필수 권한 확인
@@ -393,23 +394,17 @@ class NamespacePermissionValidator(ValidationCheck):
 
         return "default"
 
-    async def _check_namespace_access(self, namespace: str) -> list[str]:
+    async def _check_namespace_access(
+        self, namespace: str, context: ValidationContext
+    ) -> list[str]:
         """네임스페이스 접근성 확인."""
         issues = []
 
         try:
-            # 네임스페이스 존재 확인
-            result = subprocess.run(
-                ["kubectl", "get", "namespace", namespace],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if result.returncode != 0:
+            # 네임스페이스 존재 확인 (실행 단위 namespace 목록 공유)
+            if not await context.namespaces.exists_async(namespace):
                 # 네임스페이스가 없는 경우 생성 권한 확인
-                create_result = subprocess.run(
+                create_result = await run_async(
                     ["kubectl", "auth", "can-i", "create", "namespaces"],
                     check=False,
                     capture_output=True,
@@ -429,7 +424,7 @@ class NamespacePermissionValidator(ValidationCheck):
                     pass
 
             # 네임스페이스 내 리소스 목록 권한 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "pods", "-n", namespace, "--no-headers"],
                 check=False,
                 capture_output=True,
@@ -468,7 +463,7 @@ class NamespacePermissionValidator(ValidationCheck):
 
         for action, resource in required_permissions:
             try:
-                result = subprocess.run(
+                result = await run_async(
                     ["kubectl", "auth", "can-i", action, resource, "-n", namespace],
                     check=False,
                     capture_output=True,
@@ -493,7 +488,7 @@ class NamespacePermissionValidator(ValidationCheck):
         warnings = []
 
         try:
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "serviceaccount", "-n", namespace, "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -617,7 +612,7 @@ class NetworkPolicyValidator(ValidationCheck):
         try:
             namespace = await self._get_target_namespace(context)
 
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "networkpolicy", "-n", namespace, "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -660,7 +655,7 @@ class NetworkPolicyValidator(ValidationCheck):
 
         try:
             # Ingress 컨트롤러 확인
-            result = subprocess.run(
+            result = await run_async(
                 [
                     "kubectl",
                     "get",
@@ -793,7 +788,7 @@ class SecurityContextValidator(ValidationCheck):
 
         try:
             # RBAC가 활성화되어 있는지 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "auth", "can-i", "create", "clusterroles"],
                 check=False,
                 capture_output=True,
@@ -804,7 +799,7 @@ class SecurityContextValidator(ValidationCheck):
             # 클러스터 수준 권한이 없어도 정상 (일반적인 상황)
 
             # 현재 사용자의 권한 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "auth", "can-i", "--list"],
                 check=False,
                 capture_output=True,
@@ -836,7 +831,7 @@ class SecurityContextValidator(ValidationCheck):
             namespace = await self._get_target_namespace(context)
 
             # 네임스페이스 레이블 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "namespace", namespace, "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -880,7 +875,7 @@ class SecurityContextValidator(ValidationCheck):
 
         try:
             # Pod Security Policy 확인 (deprecated이지만 여전히 사용될 수 있음)
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "podsecuritypolicy", "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -898,7 +893,7 @@ class SecurityContextValidator(ValidationCheck):
                     )
 
             # Security Context Constraints 확인 (OpenShift)
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "securitycontextconstraints", "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -12,6 +12,7 @@ from typing import Any
 
 import yaml
 
+from sbkube.utils.async_runner import run_async
 from sbkube.utils.diagnostic_system import DiagnosticLevel
 from sbkube.utils.logger import logger
 from sbkube.utils.validation_system import (
@@ -160,18 +161,10 @@ class DeploymentSimulator(ValidationCheck):
                 namespace = config.get("namespace", "default")
 
                 if namespace != "default":
-                    # 네임스페이스 존재 확인
-                    result = subprocess.run(
-                        ["kubectl", "get", "namespace", namespace],
-                        check=False,
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                    )
-
-                    if result.returncode != 0:
+                    # 네임스페이스 존재 확인 (실행 단위 namespace 목록 공유)
+                    if not await context.namespaces.exists_async(namespace):
                         # 네임스페이스가 없는 경우 생성 가능한지 확인
-                        create_result = subprocess.run(
+                        create_result = await run_async(
                             [
                                 "kubectl",
                                 "create",
@@ -264,7 +257,7 @@ class DeploymentSimulator(ValidationCheck):
             namespace = await self._get_namespace(context)
             cmd.extend(["--namespace", namespace])
 
-            result_proc = subprocess.run(
+            result_proc = await run_async(
                 cmd, check=False, capture_output=True, text=True, timeout=60
             )
 
@@ -392,7 +385,7 @@ class DeploymentSimulator(ValidationCheck):
                 temp_file.flush()
 
                 # kubectl apply --dry-run 실행
-                result = subprocess.run(
+                result = await run_async(
                     [
                         "kubectl",
                         "apply",
@@ -595,7 +588,7 @@ class RiskAssessmentValidator(ValidationCheck):
             namespace = await self._get_namespace(context)
 
             # Ingress 리소스 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "ingress", "-n", namespace, "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -614,7 +607,7 @@ class RiskAssessmentValidator(ValidationCheck):
                     score += len(ingresses) * 10
 
             # LoadBalancer 서비스 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "service", "-n", namespace, "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -653,7 +646,7 @@ class RiskAssessmentValidator(ValidationCheck):
             namespace = await self._get_namespace(context)
 
             # PVC 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "pvc", "-n", namespace, "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -707,7 +700,7 @@ class RiskAssessmentValidator(ValidationCheck):
             namespace = await self._get_namespace(context)
 
             # ServiceAccount 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "serviceaccount", "-n", namespace, "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -734,7 +727,7 @@ class RiskAssessmentValidator(ValidationCheck):
                     score += custom_sa_count * 5
 
             # Role/RoleBinding 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "role,rolebinding", "-n", namespace, "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -895,7 +888,7 @@ class RollbackPlanValidator(ValidationCheck):
             # 현재 Helm 릴리스 확인
             namespace = await self._get_namespace(context)
 
-            result = subprocess.run(
+            result = await run_async(
                 ["helm", "list", "-n", namespace, "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -918,7 +911,7 @@ class RollbackPlanValidator(ValidationCheck):
                 # 각 릴리스의 히스토리 확인
                 for release in releases:
                     release_name = release.get("name")
-                    history_result = subprocess.run(
+                    history_result = await run_async(
                         [
                             "helm",
                             "history",
@@ -958,7 +951,7 @@ class RollbackPlanValidator(ValidationCheck):
 
         try:
             # Velero 백업 도구 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "deployment", "velero", "-n", "velero"],
                 check=False,
                 capture_output=True,
@@ -971,7 +964,7 @@ class RollbackPlanValidator(ValidationCheck):
                 plan["backup_possible"] = True
 
             # etcd 백업 가능성 (클러스터 관리자 권한 필요)
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "nodes", "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -1006,7 +999,7 @@ class RollbackPlanValidator(ValidationCheck):
             namespace = await self._get_namespace(context)
 
             # PVC 및 PV 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "pvc", "-n", namespace, "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -1163,7 +1156,7 @@ class ImpactAnalysisValidator(ValidationCheck):
             namespace = await self._get_namespace(context)
 
             # 네임스페이스의 기존 워크로드 확인
-            result = subprocess.run(
+            result = await run_async(
                 [
                     "kubectl",
                     "get",
@@ -1213,7 +1206,7 @@ class ImpactAnalysisValidator(ValidationCheck):
             namespace = await self._get_namespace(context)
 
             for resource_type in ["deployments", "services", "configmaps", "secrets"]:
-                result = subprocess.run(
+                result = await run_async(
                     ["kubectl", "get", resource_type, "-n", namespace, "-o", "json"],
                     check=False,
                     capture_output=True,
@@ -1252,7 +1245,7 @@ class ImpactAnalysisValidator(ValidationCheck):
             namespace = await self._get_namespace(context)
 
             # 기존 서비스의 포트 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "get", "services", "-n", namespace, "-o", "json"],
                 check=False,
                 capture_output=True,
@@ -1302,7 +1295,7 @@ class ImpactAnalysisValidator(ValidationCheck):
 
         try:
             # 노드 리소스 사용량 확인
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "top", "nodes", "--no-headers"],
                 check=False,
                 capture_output=True,
@@ -1346,7 +1339,7 @@ class ImpactAnalysisValidator(ValidationCheck):
 
             # 네임스페이스별 리소스 사용량
             namespace = await self._get_namespace(context)
-            result = subprocess.run(
+            result = await run_async(
                 ["kubectl", "top", "pods", "-n", namespace, "--no-headers"],
                 check=False,
                 capture_output=True,
@@ -8,6 +8,7 @@ import subprocess
 from typing import Any
 
 from sbkube.models.config_model import HelmApp, SBKubeConfig
+from sbkube.utils.async_runner import run_async, run_sync
 from sbkube.utils.diagnostic_system import DiagnosticLevel
 from sbkube.utils.logger import logger
 from sbkube.utils.validation_system import (
@@ -74,7 +75,7 @@ class StorageValidator(ValidationCheck):
             )
 
         # 클러스터 PV 조회
-        cluster_pvs = self._get_cluster_pvs()
+        cluster_pvs = await self._get_cluster_pvs()
 
         if cluster_pvs is None:
             # kubectl 실행 실패 (클러스터 접근 불가)
@@ -180,7 +181,7 @@ class StorageValidator(ValidationCheck):
         # This will be enhanced in future versions
         return None
 
-    def _is_no_provisioner(self, storage_class: str) -> bool:
+    async def _is_no_provisioner(self, storage_class: str) -> bool:
         """StorageClass가 no-provisioner인지 확인.
 
         Args:
@@ -195,13 +196,7 @@ class StorageValidator(ValidationCheck):
             if self.kubeconfig:
                 cmd.extend(["--kubeconfig", self.kubeconfig])
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=10,
-            )
+            result = await run_async(cmd, check=True, timeout=10)
             sc_data = json.loads(result.stdout)
 
             provisioner = sc_data.get("provisioner", "")
@@ -219,7 +214,7 @@ class StorageValidator(ValidationCheck):
             logger.debug(f"StorageClass 조회 오류: {e}")
             return False
 
-    def _get_cluster_pvs(self) -> list[dict] | None:
+    async def _get_cluster_pvs(self) -> list[dict] | None:
         """클러스터의 모든 PV 조회.
 
         Returns:
@@ -231,13 +226,7 @@ class StorageValidator(ValidationCheck):
             if self.kubeconfig:
                 cmd.extend(["--kubeconfig", self.kubeconfig])
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=10,
-            )
+            result = await run_async(cmd, check=True, timeout=10)
             pv_list = json.loads(result.stdout)
 
             return pv_list.get("items", [])
@@ -406,7 +395,7 @@ class StorageValidatorLegacy:
         if not required_pvs:
             return {"all_exist": True, "missing": [], "existing": []}
 
-        cluster_pvs = self._validator._get_cluster_pvs()
+        cluster_pvs = run_sync(self._validator._get_cluster_pvs())
 
         if cluster_pvs is None:
             # 클러스터 접근 실패 시 경고만 하고 통과
@@ -138,3 +138,20 @@ class TestApplyIntegration:
         """Placeholder for future integration tests."""
         # Integration tests will be added when cluster is available
         pytest.skip("Integration tests require Kubernetes cluster")
+
+
+class TestApplyIsolation:
+    """--isolation outside workspace mode."""
+
+    def test_process_isolation_warns_outside_workspace_mode(self) -> None:
+        from unittest.mock import MagicMock
+
+        from sbkube.commands.apply import _warn_isolation_ignored
+        from sbkube.utils.output_manager import OutputManager
+
+        output = MagicMock(spec=OutputManager)
+        _warn_isolation_ignored(output, "thread")
+        output.print_warning.assert_not_called()
+
+        _warn_isolation_ignored(output, "process")
+        assert "workspace (phases) mode" in output.print_warning.call_args.args[0]
@@ -1,12 +1,13 @@
 """Tests for cluster status command."""
 
 import json
+import time
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import yaml
 
-from sbkube.utils.cluster_cache import ClusterCache
+from sbkube.utils.cluster_cache import DEFAULT_SECTION_TTL_SECONDS, ClusterCache
 from sbkube.utils.cluster_status import ClusterStatusCollector
 
 
@@ -58,14 +59,16 @@ class TestClusterCache:
         # Should be valid immediately
         assert cache.is_valid()
 
-        # Manually expire cache by modifying timestamp
+        # Manually expire cache by modifying section timestamps
         data = cache.load()
-        old_time = datetime.now(UTC) - timedelta(seconds=400)
-        data["timestamp"] = old_time.isoformat()
+        old_time = (datetime.now(UTC) - timedelta(seconds=400)).isoformat()
+        data["timestamp"] = old_time
+        for section in data["sections"].values():
+            section["timestamp"] = old_time
 
         # Write back expired data
         with cache.cache_file.open("w") as f:
-            yaml.safe_dump(data, f)
+            json.dump(data, f)
 
         # Should be invalid now
         assert not cache.is_valid()
@@ -77,7 +80,7 @@ class TestClusterCache:
 
         # Should use "unknown" as cluster name
         assert "unknown" in cache.cache_file.name
-        assert cache.cache_file.name == "default_unknown.yaml"
+        assert cache.cache_file.name == "default_unknown.json"
 
     def test_cache_age_and_remaining_ttl(self, tmp_path) -> None:
         """Test cache age and remaining TTL calculations."""
@@ -276,6 +279,78 @@ class TestClusterStatusCollector:
             assert "namespaces" in result
             assert "helm_releases" in result
             assert result["helm_releases"] == []  # Empty due to failure
+            timings = result["collection"]["sources"]
+            assert "error" in timings["helm_releases"]
+            assert "error" not in timings["nodes"]
+
+    def test_collect_all_runs_sources_concurrently(self) -> None:
+        """Sources are collected in parallel, not one after another."""
+        collector = ClusterStatusCollector(kubeconfig=None, context=None)
+
+        def slow(value):
+            def collect():
+                time.sleep(0.3)
+                return value
+
+            return collect
+
+        with (
+            patch.object(collector, "_collect_cluster_info", slow({})),
+            patch.object(collector, "_collect_nodes", slow([])),
+            patch.object(collector, "_collect_namespaces", slow([])),
+            patch.object(collector, "_collect_pods", slow([])),
+            patch.object(collector, "_collect_helm_releases", slow([])),
+        ):
+            start = time.perf_counter()
+            result = collector.collect_all()
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        assert set(result["collection"]["sources"]) == {
+            "cluster_info",
+            "nodes",
+            "namespaces",
+            "pods",
+            "helm_releases",
+        }
+        assert result["collection"]["sources"]["nodes"]["duration_seconds"] >= 0.3
+
+    def test_collect_pods(self) -> None:
+        """Test pod collection for health check details."""
+        pods_response = {
+            "items": [
+                {
+                    "metadata": {
+                        "name": "redis-0",
+                        "namespace": "data",
+                        "ownerReferences": [{"kind": "StatefulSet", "name": "redis"}],
+                    },
+                    "spec": {"containers": [{"name": "redis"}, {"name": "metrics"}]},
+                    "status": {
+                        "phase": "Running",
+                        "containerStatuses": [
+                            {"ready": True, "restartCount": 2},
+                            {"ready": False, "restartCount": 1},
+                        ],
+                        "conditions": [
+                            {"type": "Ready", "status": "False", "reason": "NotReady"}
+                        ],
+                    },
+                }
+            ]
+        }
+        collector = ClusterStatusCollector(kubeconfig=None, context=None)
+
+        with patch.object(collector, "_run_kubectl") as mock_kubectl:
+            mock_kubectl.return_value = MagicMock(stdout=json.dumps(pods_response))
+            (pod,) = collector._collect_pods()
+
+        assert pod["namespace"] == "data"
+        assert pod["ready_containers"] == 1
+        assert pod["total_containers"] == 2
+        assert pod["restart_count"] == 3
+        assert pod["owner"] == "StatefulSet/redis"
+        assert pod["conditions"][0]["reason"] == "NotReady"
 
 
 class TestClusterCommand:
@@ -286,13 +361,15 @@ class TestClusterCommand:
         cache_dir = tmp_path / ".sbkube" / "cluster_status"
         cache = ClusterCache(cache_dir, context="my-context", cluster="my-cluster")
 
-        expected_filename = "my-context_my-cluster.yaml"
+        expected_filename = "my-context_my-cluster.json"
         assert cache.cache_file.name == expected_filename
 
-    def test_yaml_format_readability(self, tmp_path) -> None:
-        """Test that cache YAML is human-readable."""
+    def test_json_format(self, tmp_path) -> None:
+        """Test that cache is stored as JSON with per-section metadata."""
         cache_dir = tmp_path / ".sbkube" / "cluster_status"
-        cache = ClusterCache(cache_dir, context="default", cluster="test")
+        cache = ClusterCache(
+            cache_dir, context="default", cluster="test", section_ttls={"nodes": 900}
+        )
 
         test_data = {
             "cluster_info": {"api_server": "https://127.0.0.1:6443"},
@@ -302,14 +379,11 @@ class TestClusterCommand:
         }
         cache.save(test_data)
 
-        # Read raw YAML
-        with cache.cache_file.open("r") as f:
-            content = f.read()
+        content = json.loads(cache.cache_file.read_text())
 
-        # Should be readable YAML (not flow style)
-        assert "cluster_info:" in content
-        assert "nodes:" in content
-        assert "api_server: https://127.0.0.1:6443" in content
+        assert content["cluster_info"] == {"api_server": "https://127.0.0.1:6443"}
+        assert content["sections"]["nodes"]["ttl_seconds"] == 900
+        assert content["sections"]["namespaces"]["ttl_seconds"] == 300
 
     def test_atomic_write(self, tmp_path) -> None:
         """Test atomic write (temp file + rename)."""
@@ -325,8 +399,101 @@ class TestClusterCommand:
         cache.save(test_data)
 
         # Temp file should not exist after save
-        temp_file = cache.cache_file.with_suffix(".tmp")
-        assert not temp_file.exists()
+        assert not list(cache_dir.glob("*.tmp"))
 
         # Only final file should exist
         assert cache.cache_file.exists()
+
+    def test_legacy_yaml_cache_removed_on_save(self, tmp_path) -> None:
+        """Test that the pre-JSON YAML cache file is cleaned up."""
+        cache_dir = tmp_path / ".sbkube" / "cluster_status"
+        cache_dir.mkdir(parents=True)
+        legacy = cache_dir / "default_test.yaml"
+        legacy.write_text(yaml.safe_dump({"nodes": []}))
+        cache = ClusterCache(cache_dir, context="default", cluster="test")
+
+        cache.save({"nodes": []})
+
+        assert not legacy.exists()
+
+
+class TestClusterCacheSections:
+    """Per-section TTL and stale-while-revalidate tests."""
+
+    @staticmethod
+    def _age_section(cache: ClusterCache, section: str, seconds: int) -> None:
+        data = cache.load()
+        data["sections"][section]["timestamp"] = (
+            datetime.now(UTC) - timedelta(seconds=seconds)
+        ).isoformat()
+        cache.cache_file.write_text(json.dumps(data))
+
+    def test_stale_sections(self, tmp_path) -> None:
+        cache = ClusterCache(
+            tmp_path, context="default", cluster="test", section_ttls=DEFAULT_SECTION_TTL_SECONDS
+        )
+        cache.save({"nodes": [], "pods": [], "helm_releases": []})
+        self._age_section(cache, "nodes", 100)
+        self._age_section(cache, "pods", 100)
+
+        assert cache.stale_sections() == ["pods"]
+        assert not cache.is_valid()
+        assert cache.is_valid(allow_stale=True)
+
+    def test_too_old_section_is_not_servable(self, tmp_path) -> None:
+        cache = ClusterCache(tmp_path, context="default", cluster="test", section_ttls={"pods": 60})
+        cache.save({"nodes": [], "pods": []})
+        self._age_section(cache, "pods", 7200)
+
+        assert not cache.is_valid(allow_stale=True)
+
+    def test_update_replaces_only_given_sections(self, tmp_path) -> None:
+        cache = ClusterCache(tmp_path, context="default", cluster="test", section_ttls={"pods": 60})
+        cache.save(
+            {
+                "nodes": [{"name": "n1"}],
+                "pods": [],
+                "collection": {"total_seconds": 2.0, "sources": {"nodes": {}, "pods": {}}},
+            }
+        )
+        self._age_section(cache, "pods", 100)
+
+        cache.update(
+            {
+                "pods": [{"name": "p1"}],
+                "collection": {
+                    "total_seconds": 0.5,
+                    "sources": {"pods": {"duration_seconds": 0.5}},
+                },
+            }
+        )
+
+        data = cache.load()
+        assert data["nodes"] == [{"name": "n1"}]
+        assert data["pods"] == [{"name": "p1"}]
+        assert data["collection"]["sources"]["pods"] == {"duration_seconds": 0.5}
+        assert "nodes" in data["collection"]["sources"]
+        assert cache.stale_sections() == []
+
+    def test_refresh_lock_is_exclusive(self, tmp_path) -> None:
+        cache = ClusterCache(tmp_path, context="default", cluster="test")
+        other = ClusterCache(tmp_path, context="default", cluster="test")
+
+        with cache.refresh_lock() as first:
+            # flock은 open file description 단위이므로 같은 프로세스에서도 충돌
+            with other.refresh_lock() as second:
+                assert first is True
+                assert second is False
+
+    def test_collect_selected_sections_only(self) -> None:
+        collector = ClusterStatusCollector(kubeconfig=None, context=None)
+
+        with (
+            patch.object(collector, "_collect_pods", return_value=[]) as pods,
+            patch.object(collector, "_collect_nodes") as nodes,
+        ):
+            result = collector.collect_all(sections=["pods"])
+
+        pods.assert_called_once()
+        nodes.assert_not_called()
+        assert set(result) == {"pods", "collection"}
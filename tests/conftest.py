@@ -227,6 +227,11 @@ def setup_test_environment(
     base_dir, app_dir, charts_dir, repos_dir, monkeypatch
 ) -> None:
     """각 테스트 실행 전후로 환경을 설정하고 정리합니다."""
+    from sbkube.commands.prepare import helm_repo_memo
+
+    helm_repo_memo.reset()
+    # 전역 chart cache(~/.sbkube/cache)를 건드리지 않도록 테스트별 디렉토리 사용
+    monkeypatch.setenv("SBKUBE_CACHE_DIR", str(base_dir.parent / f"{base_dir.name}-cache"))
     monkeypatch.setattr(Path, "cwd", lambda: base_dir)
     monkeypatch.setattr(
         "sbkube.utils.common.get_absolute_path",
@@ -0,0 +1,96 @@
+"""Test CLI startup cost (lazy command loading)."""
+
+import json
+import subprocess
+import sys
+
+import click
+import pytest
+
+from sbkube.cli import SbkubeGroup, main
+
+# `import sbkube.cli` CPU 시간 상한 (초). 현재 ~0.1s, 모든 명령어를 import하면 ~1s.
+# wall-clock(-X importtime)은 병렬 테스트 부하에 흔들리므로 process CPU 시간으로 측정
+IMPORT_BUDGET_SECONDS = 0.5
+
+HEAVY_MODULES = ("sqlalchemy", "git", "jinja2", "jsonschema", "requests")
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+
+
+def test_import_time_budget() -> None:
+    """`import sbkube.cli` stays under a fixed import-time budget."""
+    code = (
+        "import time\n"
+        "start = time.process_time()\n"
+        "import sbkube.cli\n"
+        "print(time.process_time() - start)\n"
+    )
+    # 가장 빠른 측정값 사용 (디스크 캐시 등 일시적 요인 제거)
+    elapsed = min(float(_run_python(code).stdout.strip()) for _ in range(3))
+
+    assert elapsed < IMPORT_BUDGET_SECONDS, (
+        f"import sbkube.cli took {elapsed:.3f}s CPU; "
+        "check `python -X importtime -c 'import sbkube.cli'` for new eager imports"
+    )
+
+
+@pytest.mark.parametrize("argv", [["version"], ["--help"]])
+def test_version_and_help_skip_heavy_dependencies(argv: list[str]) -> None:
+    """`sbkube version` / `sbkube --help` do not import heavy dependencies."""
+    code = (
+        "import sys\n"
+        "from sbkube.cli import main\n"
+        f"try:\n    main({argv!r})\nexcept SystemExit:\n    pass\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = _run_python(code)
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_shell_completion_skips_heavy_dependencies() -> None:
+    """Completing subcommand names does not import command modules."""
+    code = (
+        "import json, sys\n"
+        "from click.shell_completion import ShellComplete\n"
+        "from sbkube.cli import main\n"
+        "items = ShellComplete(main, {}, 'sbkube', '_SBKUBE_COMPLETE')"
+        ".get_completions([], '')\n"
+        "print(json.dumps([item.value for item in items if item.type == 'plain']))\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    lines = _run_python(code).stdout.strip().splitlines()
+
+    assert lines[-1] == "[]"
+    assert set(SbkubeGroup.LAZY_COMMANDS) <= set(json.loads(lines[-2]))
+
+
+def test_shell_completion_uses_static_summaries() -> None:
+    """Lazy subcommands complete with their --help summary."""
+    ctx = click.Context(SbkubeGroup(name="sbkube"))
+    items = {item.value: item.help for item in ctx.command.shell_complete(ctx, "de")}
+
+    assert items == {
+        "delete": SbkubeGroup.LAZY_COMMANDS["delete"][1],
+        "deploy": SbkubeGroup.LAZY_COMMANDS["deploy"][1],
+    }
+
+
+@pytest.mark.parametrize("name", sorted(SbkubeGroup.LAZY_COMMANDS))
+def test_lazy_help_summary_matches_command(name: str) -> None:
+    """Static --help summaries match each command's docstring."""
+    ctx = click.Context(main)
+    command = main.get_command(ctx, name)
+
+    assert command is not None
+    assert command.name == name
+    assert command.get_short_help_str(limit=100) == SbkubeGroup.LAZY_COMMANDS[name][1]
@@ -722,6 +722,158 @@ class TestApplyProgressTracking:
         assert result.exit_code == 0
 
 
+class TestApplyParallelApps:
+    """Test --parallel-apps scheduling within a single app group."""
+
+    @pytest.fixture
+    def dag_config(self, base_dir, app_dir):
+        """Create unified config with a small depends_on graph."""
+        app = {
+            "type": "helm",
+            "enabled": True,
+            "namespace": "default",
+            "chart": "grafana/loki",
+            "version": "6.0.0",
+        }
+        sbkube_file = base_dir / "sbkube.yaml"
+        sbkube_file.write_text(
+            yaml.dump(
+                {
+                    "apiVersion": "sbkube/v1",
+                    "metadata": {"name": "test-config"},
+                    "settings": {
+                        "namespace": "default",
+                        "helm_repos": {"grafana": "https://grafana.github.io/helm-charts"},
+                    },
+                    "apps": {
+                        "db": app,
+                        "api": {**app, "depends_on": ["db"]},
+                        "metrics": app,
+                    },
+                }
+            )
+        )
+
+        return base_dir, app_dir
+
+    @patch("sbkube.commands.prepare.cmd")
+    @patch("sbkube.commands.build.cmd")
+    @patch("sbkube.commands.deploy.cmd")
+    def test_parallel_apps_deploys_all(
+        self, mock_deploy, mock_build, mock_prepare, dag_config
+    ):
+        """All apps are deployed when --parallel-apps is set."""
+        base_dir, _ = dag_config
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cmd,
+            ["-f", str(base_dir / "sbkube.yaml"), "--parallel-apps", "--no-progress"],
+            obj={"format": "human"},
+        )
+
+        assert result.exit_code == 0
+        assert "api deployed successfully" in result.output
+        deployed = sorted(c.kwargs["app_name"] for c in mock_deploy.call_args_list)
+        assert deployed == ["api", "db", "metrics"]
+
+    @patch("sbkube.commands.prepare.cmd")
+    @patch("sbkube.commands.build.cmd")
+    @patch("sbkube.commands.deploy.cmd")
+    def test_parallel_apps_failure_skips_dependents(
+        self, mock_deploy, mock_build, mock_prepare, dag_config
+    ):
+        """A failed app skips its dependents but independent apps still deploy."""
+        base_dir, _ = dag_config
+
+        def deploy_side_effect(*args, **kwargs):
+            if kwargs["app_name"] == "db":
+                msg = "helm upgrade failed"
+                raise RuntimeError(msg)
+
+        mock_deploy.side_effect = deploy_side_effect
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cmd,
+            ["-f", str(base_dir / "sbkube.yaml"), "--parallel-apps", "--no-progress"],
+            obj={"format": "human"},
+        )
+
+        assert result.exit_code != 0
+        deployed = sorted(c.kwargs["app_name"] for c in mock_deploy.call_args_list)
+        assert deployed == ["db", "metrics"]
+        assert "dependency 'db' failed" in result.output
+
+
+    @patch("sbkube.commands.prepare.cmd")
+    @patch("sbkube.commands.build.cmd")
+    @patch("sbkube.commands.deploy.cmd")
+    def test_parallel_apps_buffer_logger_output(
+        self, mock_deploy, mock_build, mock_prepare, dag_config
+    ):
+        """Output of shared helpers (logger) lands in the app's own block."""
+        from sbkube.utils.logger import logger
+
+        base_dir, _ = dag_config
+
+        def deploy_side_effect(*args, **kwargs):
+            logger.console.print(f"helper output of {kwargs['app_name']}")
+
+        mock_deploy.side_effect = deploy_side_effect
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cmd,
+            ["-f", str(base_dir / "sbkube.yaml"), "--parallel-apps", "--no-progress"],
+            obj={"format": "human"},
+        )
+
+        assert result.exit_code == 0
+        for name in ("db", "api", "metrics"):
+            header = result.output.index(f"{name} (helm)")
+            helper = result.output.index(f"helper output of {name}")
+            done = result.output.index(f"{name} deployed successfully")
+            assert header < helper < done
+
+
+    @patch("sbkube.commands.prepare.cmd")
+    @patch("sbkube.commands.build.cmd")
+    @patch("sbkube.commands.deploy.cmd")
+    def test_parallel_apps_live_output_per_app(
+        self, mock_deploy, mock_build, mock_prepare, dag_config
+    ):
+        """Each deploy stage gets its own live_output callback."""
+        import click
+
+        base_dir, _ = dag_config
+        status_lines: list[str] = []
+
+        def deploy_side_effect(*args, **kwargs):
+            live_output = click.get_current_context().obj["live_output"]
+            live_output(f"STATUS: deployed {kwargs['app_name']}")
+
+        mock_deploy.side_effect = deploy_side_effect
+
+        with patch(
+            "sbkube.commands.apply.ProgressTracker.set_status",
+            lambda self, task_id, status: status_lines.append(status),
+        ):
+            result = CliRunner().invoke(
+                cmd,
+                ["-f", str(base_dir / "sbkube.yaml"), "--parallel-apps"],
+                obj={"format": "human"},
+            )
+
+        assert result.exit_code == 0, result.output
+        assert sorted(line for line in status_lines if line) == [
+            "api: STATUS: deployed api",
+            "db: STATUS: deployed db",
+            "metrics: STATUS: deployed metrics",
+        ]
+        assert status_lines[-1] == ""
+
+
 class TestInheritedSettingsExtraction:
     """Test hierarchical settings extraction, merge, and chain building."""
 
@@ -0,0 +1,153 @@
+"""Unit tests for build.py - incremental build.
+
+Tests verify:
+- Unchanged charts are skipped using the build manifest
+- Only changed files are re-copied
+- Overrides never write through hardlinks into the source chart
+- Removes and override changes invalidate the fingerprint
+- Edited or deleted build output files are rebuilt
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from sbkube.commands.build import build_helm_app
+from sbkube.models.config_model import HelmApp
+from sbkube.utils.build_manifest import BuildManifest
+from sbkube.utils.output_manager import OutputManager
+
+
+def _setup(tmp_path: Path) -> tuple[Path, Path, Path, Path]:
+    charts_dir = tmp_path / "charts"
+    source = charts_dir / "bitnami" / "nginx-15.0.0"
+    (source / "templates").mkdir(parents=True)
+    (source / "Chart.yaml").write_text("name: nginx\nversion: 15.0.0")
+    (source / "values.yaml").write_text("replicaCount: 1")
+    (source / "templates" / "deployment.yaml").write_text("kind: Deployment")
+    (source / "templates" / "tests").mkdir()
+    (source / "templates" / "tests" / "test.yaml").write_text("kind: Pod")
+
+    app_config_dir = tmp_path / "config"
+    (app_config_dir / "overrides" / "nginx").mkdir(parents=True)
+    build_dir = tmp_path / "build"
+    build_dir.mkdir()
+    return charts_dir, source, app_config_dir, build_dir
+
+
+def _build(app: HelmApp, charts_dir: Path, app_config_dir: Path, build_dir: Path, **kwargs) -> MagicMock:
+    output = MagicMock(spec=OutputManager)
+    assert build_helm_app(
+        app_name="nginx",
+        app=app,
+        base_dir=app_config_dir.parent,
+        charts_dir=charts_dir,
+        build_dir=build_dir,
+        app_config_dir=app_config_dir,
+        output=output,
+        **kwargs,
+    )
+    return output
+
+
+def _printed(output: MagicMock) -> str:
+    return "\n".join(str(call) for call in output.print.call_args_list)
+
+
+class TestIncrementalBuild:
+    """Test build manifest based skipping and partial sync."""
+
+    def test_second_build_is_skipped(self, tmp_path: Path) -> None:
+        charts_dir, _, app_config_dir, build_dir = _setup(tmp_path)
+        app = HelmApp(type="helm", chart="bitnami/nginx", version="15.0.0")
+
+        _build(app, charts_dir, app_config_dir, build_dir)
+        assert BuildManifest.path_for(build_dir, "nginx").exists()
+        assert not (build_dir / "nginx" / ".nginx.build.json").exists()
+
+        output = _build(app, charts_dir, app_config_dir, build_dir)
+
+        assert "up to date" in _printed(output)
+
+    def test_only_changed_files_are_recopied(self, tmp_path: Path) -> None:
+        charts_dir, source, app_config_dir, build_dir = _setup(tmp_path)
+        app = HelmApp(type="helm", chart="bitnami/nginx", version="15.0.0")
+        _build(app, charts_dir, app_config_dir, build_dir)
+
+        built_chart = build_dir / "nginx" / "Chart.yaml"
+        chart_inode = built_chart.stat().st_ino
+        (source / "values.yaml").unlink()
+        (source / "values.yaml").write_text("replicaCount: 3")
+        (source / "templates" / "deployment.yaml").unlink()
+
+        output = _build(app, charts_dir, app_config_dir, build_dir)
+
+        assert "Files updated: 1, removed: 1" in _printed(output)
+        assert built_chart.stat().st_ino == chart_inode
+        assert (build_dir / "nginx" / "values.yaml").read_text() == "replicaCount: 3"
+        assert not (build_dir / "nginx" / "templates" / "deployment.yaml").exists()
+
+    def test_override_does_not_modify_source_chart(self, tmp_path: Path) -> None:
+        charts_dir, source, app_config_dir, build_dir = _setup(tmp_path)
+        app = HelmApp(type="helm", chart="bitnami/nginx", version="15.0.0")
+        _build(app, charts_dir, app_config_dir, build_dir)
+
+        (app_config_dir / "overrides" / "nginx" / "values.yaml").write_text("replicaCount: 5")
+        app = HelmApp(
+            type="helm", chart="bitnami/nginx", version="15.0.0", overrides=["values.yaml"]
+        )
+        _build(app, charts_dir, app_config_dir, build_dir)
+
+        assert (build_dir / "nginx" / "values.yaml").read_text() == "replicaCount: 5"
+        assert (source / "values.yaml").read_text() == "replicaCount: 1"
+
+    def test_adding_removes_invalidates_build(self, tmp_path: Path) -> None:
+        charts_dir, _, app_config_dir, build_dir = _setup(tmp_path)
+        app = HelmApp(type="helm", chart="bitnami/nginx", version="15.0.0")
+        _build(app, charts_dir, app_config_dir, build_dir)
+
+        app = HelmApp(
+            type="helm", chart="bitnami/nginx", version="15.0.0", removes=["templates/tests"]
+        )
+        _build(app, charts_dir, app_config_dir, build_dir)
+
+        assert not (build_dir / "nginx" / "templates" / "tests").exists()
+        assert (build_dir / "nginx" / "templates" / "deployment.yaml").exists()
+
+    def test_edited_build_file_is_rebuilt(self, tmp_path: Path) -> None:
+        charts_dir, source, app_config_dir, build_dir = _setup(tmp_path)
+        app = HelmApp(
+            type="helm", chart="bitnami/nginx", version="15.0.0", overrides=["values.yaml"]
+        )
+        (app_config_dir / "overrides" / "nginx" / "values.yaml").write_text("replicaCount: 5")
+        _build(app, charts_dir, app_config_dir, build_dir)
+
+        (build_dir / "nginx" / "values.yaml").write_text("replicaCount: 99")
+        output = _build(app, charts_dir, app_config_dir, build_dir)
+
+        assert "up to date" not in _printed(output)
+        assert (build_dir / "nginx" / "values.yaml").read_text() == "replicaCount: 5"
+
+    def test_deleted_build_file_is_rebuilt(self, tmp_path: Path) -> None:
+        charts_dir, _, app_config_dir, build_dir = _setup(tmp_path)
+        app = HelmApp(type="helm", chart="bitnami/nginx", version="15.0.0")
+        _build(app, charts_dir, app_config_dir, build_dir)
+
+        (build_dir / "nginx" / "templates" / "deployment.yaml").unlink()
+        output = _build(app, charts_dir, app_config_dir, build_dir)
+
+        assert "up to date" not in _printed(output)
+        assert (build_dir / "nginx" / "templates" / "deployment.yaml").exists()
+
+        output = _build(app, charts_dir, app_config_dir, build_dir)
+        assert "up to date" in _printed(output)
+
+    def test_non_incremental_build_copies_without_manifest(self, tmp_path: Path) -> None:
+        charts_dir, source, app_config_dir, build_dir = _setup(tmp_path)
+        app = HelmApp(type="helm", chart="bitnami/nginx", version="15.0.0")
+        _build(app, charts_dir, app_config_dir, build_dir)
+
+        _build(app, charts_dir, app_config_dir, build_dir, incremental=False)
+
+        assert not BuildManifest.path_for(build_dir, "nginx").exists()
+        assert not os.path.samefile(source / "Chart.yaml", build_dir / "nginx" / "Chart.yaml")
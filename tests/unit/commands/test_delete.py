@@ -20,10 +20,15 @@ from click.testing import CliRunner
 from sbkube.commands.delete import cmd
 
 
+def _releases(*names: str, namespace: str = "default") -> list[dict]:
+    """`helm list -A -o json` 결과 형태의 release 목록."""
+    return [{"name": name, "namespace": namespace} for name in names]
+
+
 class TestDeleteHelmAppBasic:
     """Test basic Helm app deletion."""
 
-    @patch("sbkube.commands.delete.get_installed_charts")
+    @patch("sbkube.commands.delete.get_all_helm_releases")
     @patch("sbkube.commands.delete.run_command")
     @patch("sbkube.commands.delete.check_helm_installed_or_exit")
     @patch("sbkube.commands.delete.find_sources_file")
@@ -32,7 +37,7 @@ class TestDeleteHelmAppBasic:
         mock_find_sources,
         mock_check_helm,
         mock_run_command,
-        mock_get_charts,
+        mock_get_releases,
         tmp_path: Path,
     ) -> None:
         """Test successful Helm app deletion with positional TARGET."""
@@ -54,7 +59,7 @@ apps:
         )
 
         mock_find_sources.return_value = None
-        mock_get_charts.return_value = ["my-nginx"]
+        mock_get_releases.return_value = _releases("my-nginx")
         mock_run_command.return_value = (0, "release uninstalled", "")
 
         runner = CliRunner()
@@ -64,7 +69,7 @@ apps:
         assert "삭제 완료" in result.output
         mock_run_command.assert_called_once()
 
-    @patch("sbkube.commands.delete.get_installed_charts")
+    @patch("sbkube.commands.delete.get_all_helm_releases")
     @patch("sbkube.commands.delete.run_command")
     @patch("sbkube.commands.delete.check_helm_installed_or_exit")
     @patch("sbkube.commands.delete.find_sources_file")
@@ -73,7 +78,7 @@ apps:
         mock_find_sources,
         mock_check_helm,
         mock_run_command,
-        mock_get_charts,
+        mock_get_releases,
         tmp_path: Path,
     ) -> None:
         """Test successful Helm app deletion."""
@@ -98,7 +103,7 @@ apps:
         mock_find_sources.return_value = None
 
         # Mock helm list showing release exists
-        mock_get_charts.return_value = ["my-nginx"]
+        mock_get_releases.return_value = _releases("my-nginx")
 
         # Mock helm uninstall success
         mock_run_command.return_value = (0, "release uninstalled", "")
@@ -124,14 +129,14 @@ apps:
         assert "--namespace" in call_args
         assert "default" in call_args
 
-    @patch("sbkube.commands.delete.get_installed_charts")
+    @patch("sbkube.commands.delete.get_all_helm_releases")
     @patch("sbkube.commands.delete.check_helm_installed_or_exit")
     @patch("sbkube.commands.delete.find_sources_file")
     def test_delete_helm_app_not_installed(
         self,
         mock_find_sources,
         mock_check_helm,
-        mock_get_charts,
+        mock_get_releases,
         tmp_path: Path,
     ) -> None:
         """Test skip when Helm release not installed."""
@@ -153,7 +158,7 @@ apps:
 
         mock_find_sources.return_value = None
         # Release not installed
-        mock_get_charts.return_value = []
+        mock_get_releases.return_value = []
 
         # Act
         runner = CliRunner()
@@ -223,14 +228,16 @@ apps:
         # Assert
         assert result.exit_code == 0
         assert "삭제 요청 성공" in result.output
-        # kubectl delete called twice (for each manifest in reverse order)
-        assert mock_run_command.call_count == 2
+        # 모든 manifest를 역순으로 하나의 kubectl delete에 모아서 삭제
+        mock_run_command.assert_called_once()
 
-        # Verify kubectl delete commands
-        first_call = mock_run_command.call_args_list[0][0][0]
-        assert first_call[0] == "kubectl"
-        assert first_call[1] == "delete"
-        assert "-f" in first_call
+        kubectl_cmd = mock_run_command.call_args[0][0]
+        assert kubectl_cmd[:2] == ["kubectl", "delete"]
+        assert [
+            Path(kubectl_cmd[i + 1]).name
+            for i, arg in enumerate(kubectl_cmd)
+            if arg == "-f"
+        ] == ["service.yaml", "deployment.yaml"]
 
     @patch("sbkube.commands.delete.check_kubectl_installed_or_exit")
     @patch("sbkube.commands.delete.find_sources_file")
@@ -276,7 +283,7 @@ apps:
 class TestDeleteDryRun:
     """Test dry-run mode."""
 
-    @patch("sbkube.commands.delete.get_installed_charts")
+    @patch("sbkube.commands.delete.get_all_helm_releases")
     @patch("sbkube.commands.delete.run_command")
     @patch("sbkube.commands.delete.check_helm_installed_or_exit")
     @patch("sbkube.commands.delete.find_sources_file")
@@ -285,7 +292,7 @@ class TestDeleteDryRun:
         mock_find_sources,
         mock_check_helm,
         mock_run_command,
-        mock_get_charts,
+        mock_get_releases,
         tmp_path: Path,
     ) -> None:
         """Test Helm app deletion in dry-run mode."""
@@ -306,7 +313,7 @@ apps:
         )
 
         mock_find_sources.return_value = None
-        mock_get_charts.return_value = ["nginx"]
+        mock_get_releases.return_value = _releases("nginx")
         mock_run_command.return_value = (0, "dry-run output", "")
 
         # Act
@@ -378,14 +385,14 @@ apps:
 class TestDeleteSkipNotFound:
     """Test --skip-not-found option."""
 
-    @patch("sbkube.commands.delete.get_installed_charts")
+    @patch("sbkube.commands.delete.get_all_helm_releases")
     @patch("sbkube.commands.delete.check_helm_installed_or_exit")
     @patch("sbkube.commands.delete.find_sources_file")
     def test_delete_helm_skip_not_found(
         self,
         mock_find_sources,
         mock_check_helm,
-        mock_get_charts,
+        mock_get_releases,
         tmp_path: Path,
     ) -> None:
         """Test skip when release not found with --skip-not-found."""
@@ -406,7 +413,7 @@ apps:
         )
 
         mock_find_sources.return_value = None
-        mock_get_charts.return_value = []  # Not installed
+        mock_get_releases.return_value = []  # Not installed
 
         # Act
         runner = CliRunner()
@@ -479,7 +486,7 @@ apps:
 class TestDeleteTargetApp:
     """Test specific app targeting."""
 
-    @patch("sbkube.commands.delete.get_installed_charts")
+    @patch("sbkube.commands.delete.get_all_helm_releases")
     @patch("sbkube.commands.delete.run_command")
     @patch("sbkube.commands.delete.check_helm_installed_or_exit")
     @patch("sbkube.commands.delete.find_sources_file")
@@ -488,7 +495,7 @@ class TestDeleteTargetApp:
         mock_find_sources,
         mock_check_helm,
         mock_run_command,
-        mock_get_charts,
+        mock_get_releases,
         tmp_path: Path,
     ) -> None:
         """Test deleting only specific app."""
@@ -512,7 +519,7 @@ apps:
         )
 
         mock_find_sources.return_value = None
-        mock_get_charts.return_value = ["nginx", "redis"]
+        mock_get_releases.return_value = _releases("nginx", "redis")
         mock_run_command.return_value = (0, "uninstalled", "")
 
         # Act - delete only nginx
@@ -576,7 +583,7 @@ apps:
 class TestDeleteNamespaceHandling:
     """Test namespace resolution."""
 
-    @patch("sbkube.commands.delete.get_installed_charts")
+    @patch("sbkube.commands.delete.get_all_helm_releases")
     @patch("sbkube.commands.delete.run_command")
     @patch("sbkube.commands.delete.check_helm_installed_or_exit")
     @patch("sbkube.commands.delete.find_sources_file")
@@ -585,7 +592,7 @@ class TestDeleteNamespaceHandling:
         mock_find_sources,
         mock_check_helm,
         mock_run_command,
-        mock_get_charts,
+        mock_get_releases,
         tmp_path: Path,
     ) -> None:
         """Test app-level namespace has priority."""
@@ -607,7 +614,7 @@ apps:
         )
 
         mock_find_sources.return_value = None
-        mock_get_charts.return_value = ["nginx"]
+        mock_get_releases.return_value = _releases("nginx", namespace="app-ns")
         mock_run_command.return_value = (0, "uninstalled", "")
 
         # Act
@@ -654,7 +661,7 @@ class TestDeleteErrors:
         assert result.exit_code != 0
         assert "찾을 수 없습니다" in result.output
 
-    @patch("sbkube.commands.delete.get_installed_charts")
+    @patch("sbkube.commands.delete.get_all_helm_releases")
     @patch("sbkube.commands.delete.run_command")
     @patch("sbkube.commands.delete.check_helm_installed_or_exit")
     @patch("sbkube.commands.delete.find_sources_file")
@@ -663,7 +670,7 @@ class TestDeleteErrors:
         mock_find_sources,
         mock_check_helm,
         mock_run_command,
-        mock_get_charts,
+        mock_get_releases,
         tmp_path: Path,
     ) -> None:
         """Test handling of helm uninstall failure."""
@@ -684,7 +691,7 @@ apps:
         )
 
         mock_find_sources.return_value = None
-        mock_get_charts.return_value = ["nginx"]
+        mock_get_releases.return_value = _releases("nginx")
         # Mock helm uninstall failure
         mock_run_command.return_value = (1, "", "Error: uninstall failed")
 
@@ -752,7 +759,7 @@ apps:
 class TestDeleteMultipleApps:
     """Test deleting multiple apps."""
 
-    @patch("sbkube.commands.delete.get_installed_charts")
+    @patch("sbkube.commands.delete.get_all_helm_releases")
     @patch("sbkube.commands.delete.run_command")
     @patch("sbkube.commands.delete.check_helm_installed_or_exit")
     @patch("sbkube.commands.delete.check_kubectl_installed_or_exit")
@@ -763,7 +770,7 @@ class TestDeleteMultipleApps:
         mock_check_kubectl,
         mock_check_helm,
         mock_run_command,
-        mock_get_charts,
+        mock_get_releases,
         tmp_path: Path,
     ) -> None:
         """Test deleting multiple Helm and YAML apps."""
@@ -795,7 +802,7 @@ apps:
         )
 
         mock_find_sources.return_value = None
-        mock_get_charts.return_value = ["nginx", "redis"]
+        mock_get_releases.return_value = _releases("nginx", "redis")
         mock_run_command.return_value = (0, "success", "")
 
         # Act
@@ -845,3 +852,131 @@ apps: {}
         # Assert
         assert result.exit_code == 0
         assert "처리할 앱 없음" in result.output
+
+
+class TestDeleteTeardownOrder:
+    """Test reverse-dependency teardown and the single release snapshot."""
+
+    CONFIG = """
+namespace: default
+apps:
+  db:
+    type: helm
+    chart: bitnami/postgresql
+  api:
+    type: helm
+    chart: my/api
+    depends_on: [db]
+  web:
+    type: helm
+    chart: my/web
+    depends_on: [api]
+"""
+
+    @patch("sbkube.commands.delete.get_all_helm_releases")
+    @patch("sbkube.commands.delete.run_command")
+    @patch("sbkube.commands.delete.check_helm_installed_or_exit")
+    @patch("sbkube.commands.delete.find_sources_file")
+    def test_dependents_are_deleted_first(
+        self,
+        mock_find_sources,
+        mock_check_helm,
+        mock_run_command,
+        mock_get_releases,
+        tmp_path: Path,
+    ) -> None:
+        """Apps are uninstalled after every app that depends on them."""
+        (tmp_path / "config.yaml").write_text(self.CONFIG)
+        mock_find_sources.return_value = None
+        mock_get_releases.return_value = _releases("db", "api", "web")
+        mock_run_command.return_value = (0, "uninstalled", "")
+
+        result = CliRunner().invoke(cmd, [str(tmp_path)], obj={"namespace": None})
+
+        assert result.exit_code == 0
+        uninstalled = [call[0][0][2] for call in mock_run_command.call_args_list]
+        assert uninstalled == ["web", "api", "db"]
+        # 존재 여부는 helm list -A 한 번으로 확인
+        mock_get_releases.assert_called_once()
+
+    @patch("sbkube.commands.delete.get_all_helm_releases")
+    @patch("sbkube.commands.delete.run_command")
+    @patch("sbkube.commands.delete.check_helm_installed_or_exit")
+    @patch("sbkube.commands.delete.find_sources_file")
+    def test_failed_dependent_keeps_dependencies(
+        self,
+        mock_find_sources,
+        mock_check_helm,
+        mock_run_command,
+        mock_get_releases,
+        tmp_path: Path,
+    ) -> None:
+        """If a dependent cannot be deleted, its dependencies are left alone."""
+        (tmp_path / "config.yaml").write_text(self.CONFIG)
+        mock_find_sources.return_value = None
+        mock_get_releases.return_value = _releases("db", "api", "web")
+        mock_run_command.return_value = (1, "", "Error: uninstall failed")
+
+        result = CliRunner().invoke(cmd, [str(tmp_path)], obj={"namespace": None})
+
+        assert result.exit_code == 0
+        mock_run_command.assert_called_once()
+        assert mock_run_command.call_args[0][0][2] == "web"
+        assert "2개 앱 건너뜀" in result.output
+        assert "1개 앱 삭제 실패" in result.output
+
+    @patch("sbkube.commands.delete.get_installed_charts")
+    @patch("sbkube.commands.delete.get_all_helm_releases")
+    @patch("sbkube.commands.delete.run_command")
+    @patch("sbkube.commands.delete.check_helm_installed_or_exit")
+    @patch("sbkube.commands.delete.find_sources_file")
+    def test_release_in_other_namespace_is_not_installed(
+        self,
+        mock_find_sources,
+        mock_check_helm,
+        mock_run_command,
+        mock_get_releases,
+        mock_get_charts,
+        tmp_path: Path,
+    ) -> None:
+        """The snapshot is matched by (namespace, release name)."""
+        (tmp_path / "config.yaml").write_text(self.CONFIG)
+        mock_find_sources.return_value = None
+        mock_get_releases.return_value = _releases("db", "api") + _releases(
+            "web", namespace="other"
+        )
+        mock_run_command.return_value = (0, "uninstalled", "")
+
+        result = CliRunner().invoke(cmd, [str(tmp_path)], obj={"namespace": None})
+
+        assert result.exit_code == 0
+        uninstalled = [call[0][0][2] for call in mock_run_command.call_args_list]
+        assert uninstalled == ["api", "db"]
+        mock_get_charts.assert_not_called()
+
+    @patch("sbkube.commands.delete.get_installed_charts")
+    @patch("sbkube.commands.delete.get_all_helm_releases")
+    @patch("sbkube.commands.delete.run_command")
+    @patch("sbkube.commands.delete.check_helm_installed_or_exit")
+    @patch("sbkube.commands.delete.find_sources_file")
+    def test_snapshot_failure_falls_back_to_namespace_lookup(
+        self,
+        mock_find_sources,
+        mock_check_helm,
+        mock_run_command,
+        mock_get_releases,
+        mock_get_charts,
+        tmp_path: Path,
+    ) -> None:
+        """Without cluster-wide list access, releases are checked per namespace."""
+        (tmp_path / "config.yaml").write_text(self.CONFIG)
+        mock_find_sources.return_value = None
+        mock_get_releases.side_effect = RuntimeError("forbidden")
+        mock_get_charts.return_value = {"db": {}, "api": {}, "web": {}}
+        mock_run_command.return_value = (0, "uninstalled", "")
+
+        result = CliRunner().invoke(cmd, [str(tmp_path)], obj={"namespace": None})
+
+        assert result.exit_code == 0
+        assert mock_get_charts.call_count == 3
+        assert mock_run_command.call_count == 3
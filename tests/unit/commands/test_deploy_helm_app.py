@@ -336,3 +336,40 @@ class TestDeployHelmAppValues:
                 break
         assert helm_cmd is not None
         assert "--set" in helm_cmd
+
+
+class TestDeployHelmAppLiveOutput:
+    """Test streaming of helm output while the release is installed."""
+
+    @patch("sbkube.commands.deploy.run_command")
+    def test_helm_lines_forwarded_to_live_output(
+        self, mock_run_command, tmp_path: Path
+    ) -> None:
+        """Test helm output lines reach live_output as they are produced."""
+        build_dir = tmp_path / "build"
+        (build_dir / "nginx").mkdir(parents=True)
+        (build_dir / "nginx" / "Chart.yaml").write_text("name: nginx\nversion: 1.0.0")
+
+        def fake_run(cmd, on_stdout_line=None, on_stderr_line=None, **kwargs):
+            if "helm" not in cmd:
+                return 0, "", ""
+            on_stderr_line("wait.go:48: checking 3 resources for changes")
+            on_stdout_line("REVISION: 4")
+            return 0, "", ""
+
+        mock_run_command.side_effect = fake_run
+        lines: list[str] = []
+
+        result = deploy_helm_app(
+            app_name="nginx",
+            app=HelmApp(type="helm", chart="bitnami/nginx", namespace="default"),
+            base_dir=tmp_path,
+            charts_dir=tmp_path / "charts",
+            build_dir=build_dir,
+            app_config_dir=tmp_path / "config",
+            output=MagicMock(spec=OutputManager),
+            live_output=lines.append,
+        )
+
+        assert result is True
+        assert lines == ["wait.go:48: checking 3 resources for changes", "REVISION: 4"]
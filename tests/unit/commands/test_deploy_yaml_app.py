@@ -274,3 +274,150 @@ class TestDeployYamlAppErrors:
         # Assert
         assert result is False
         output.print_error.assert_called()
+
+
+class TestDeployYamlAppBatchApply:
+    """Test batched `kubectl apply -f -` mode."""
+
+    def _write_manifests(self, app_config_dir: Path) -> None:
+        app_config_dir.mkdir(exist_ok=True)
+        (app_config_dir / "deployment.yaml").write_text(
+            "apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: web\n"
+        )
+        (app_config_dir / "service.yaml").write_text(
+            "apiVersion: v1\nkind: Service\nmetadata:\n  name: web\n---\n"
+            "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: web-config\n"
+        )
+
+    @patch("sbkube.commands.deploy.run_command")
+    def test_single_kubectl_call_with_stdin(self, mock_run_command, tmp_path: Path) -> None:
+        """All manifests are applied as one multi-document stream."""
+        app_config_dir = tmp_path / "app_001_web"
+        self._write_manifests(app_config_dir)
+        app = YamlApp(
+            type="yaml",
+            manifests=["deployment.yaml", "service.yaml"],
+            namespace="default",
+            batch_apply=True,
+            server_side=True,
+        )
+        mock_run_command.return_value = (0, "", "")
+
+        result = deploy_yaml_app(
+            app_name="web",
+            app=app,
+            base_dir=tmp_path,
+            app_config_dir=app_config_dir,
+            output=MagicMock(spec=OutputManager),
+        )
+
+        assert result is True
+        assert mock_run_command.call_count == 1
+        cmd = mock_run_command.call_args.args[0]
+        assert cmd[:4] == ["kubectl", "apply", "-f", "-"]
+        assert "--server-side" in cmd
+        stream = mock_run_command.call_args.kwargs["input"]
+        assert stream.count("kind: ") == 3
+        assert stream.count("app.kubernetes.io/managed-by: sbkube") == 3
+
+    @patch("sbkube.commands.deploy.run_command")
+    def test_dry_run_drops_server_side(self, mock_run_command, tmp_path: Path) -> None:
+        """--dry-run=client cannot be combined with --server-side."""
+        app_config_dir = tmp_path / "app_001_web"
+        self._write_manifests(app_config_dir)
+        app = YamlApp(
+            type="yaml", manifests=["deployment.yaml"], batch_apply=True, server_side=True
+        )
+        mock_run_command.return_value = (0, "", "")
+
+        assert deploy_yaml_app(
+            app_name="web",
+            app=app,
+            base_dir=tmp_path,
+            app_config_dir=app_config_dir,
+            output=MagicMock(spec=OutputManager),
+            dry_run=True,
+        )
+
+        cmd = mock_run_command.call_args.args[0]
+        assert "--dry-run=client" in cmd
+        assert "--server-side" not in cmd
+
+    @patch("sbkube.commands.deploy.run_command")
+    def test_per_resource_results_are_recorded(
+        self, mock_run_command, tmp_path: Path
+    ) -> None:
+        """kubectl output is parsed back and each resource is stored with the deploy."""
+        from sbkube.models.deployment_state import ResourceAction
+        from sbkube.state.desired_state import DesiredStateStore
+
+        app_config_dir = tmp_path / "app_001_web"
+        self._write_manifests(app_config_dir)
+        app = YamlApp(
+            type="yaml", manifests=["deployment.yaml", "service.yaml"], batch_apply=True
+        )
+        mock_run_command.return_value = (
+            0,
+            "deployment.apps/web created\nservice/web configured\nconfigmap/web-config unchanged\n",
+            "",
+        )
+        store = DesiredStateStore(tmp_path / "state.db")
+
+        assert deploy_yaml_app(
+            app_name="web",
+            app=app,
+            base_dir=tmp_path,
+            app_config_dir=app_config_dir,
+            output=MagicMock(spec=OutputManager),
+            context="prod",
+            desired_state=store,
+        )
+
+        [deployment] = store.db.list_deployments(limit=10)
+        detail = store.db.get_deployment(deployment.deployment_id)
+        recorded = [(r.kind, r.name, r.action, r.source_file) for r in detail.resources]
+        assert recorded == [
+            ("Deployment", "web", ResourceAction.CREATE, "deployment.yaml"),
+            ("Service", "web", ResourceAction.UPDATE, "service.yaml"),
+            ("ConfigMap", "web-config", ResourceAction.APPLY, "service.yaml"),
+        ]
+
+    @patch("sbkube.commands.deploy.run_command")
+    def test_dry_run_records_no_resources(self, mock_run_command, tmp_path: Path) -> None:
+        from sbkube.state.desired_state import DesiredStateStore
+
+        app_config_dir = tmp_path / "app_001_web"
+        self._write_manifests(app_config_dir)
+        app = YamlApp(type="yaml", manifests=["deployment.yaml"], batch_apply=True)
+        mock_run_command.return_value = (0, "deployment.apps/web created (dry run)", "")
+        store = DesiredStateStore(tmp_path / "state.db")
+
+        assert deploy_yaml_app(
+            app_name="web",
+            app=app,
+            base_dir=tmp_path,
+            app_config_dir=app_config_dir,
+            output=MagicMock(spec=OutputManager),
+            context="prod",
+            dry_run=True,
+            desired_state=store,
+        )
+
+        assert store.db.list_deployments(limit=10) == []
+
+    @patch("sbkube.commands.deploy.run_command")
+    def test_batch_failure(self, mock_run_command, tmp_path: Path) -> None:
+        app_config_dir = tmp_path / "app_001_web"
+        self._write_manifests(app_config_dir)
+        app = YamlApp(type="yaml", manifests=["deployment.yaml"], batch_apply=True)
+        mock_run_command.return_value = (1, "", "error: unable to recognize")
+        output = MagicMock(spec=OutputManager)
+
+        assert not deploy_yaml_app(
+            app_name="web",
+            app=app,
+            base_dir=tmp_path,
+            app_config_dir=app_config_dir,
+            output=output,
+        )
+        output.print_error.assert_called()
@@ -1,5 +1,6 @@
 """Tests for history command."""
 
+import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -374,6 +375,58 @@ class TestHistoryCommandAdvanced:
         assert result.exit_code != 0
 
 
+class TestHistoryCommandCompact:
+    """Test history --compact."""
+
+    @patch("sbkube.commands.history.DeploymentDatabase")
+    def test_history_compact_on_real_database(
+        self,
+        mock_db_class,
+        runner,
+        tmp_path,
+    ) -> None:
+        """Test compaction report on an actual (empty) state database."""
+        from sbkube.state.database import DeploymentDatabase
+
+        mock_db_class.return_value = DeploymentDatabase(tmp_path / "deployments.db")
+
+        result = runner.invoke(
+            main, ["--format", "json", "history", "--compact", "--keep", "3"]
+        )
+
+        assert result.exit_code == 0
+        payload = json.loads(result.output)
+        assert payload["summary"]["view"] == "compact"
+        assert payload["summary"]["keep_per_group"] == 3
+        assert payload["summary"]["deployments_deleted"] == 0
+        assert "bytes_reclaimed" in payload["summary"]
+
+    @patch("sbkube.commands.history.StateCompactor")
+    @patch("sbkube.commands.history.DeploymentDatabase")
+    def test_history_compact_options(
+        self,
+        mock_db_class,
+        mock_compactor_class,
+        runner,
+    ) -> None:
+        """Test --keep/--compress are passed to the compactor."""
+        from sbkube.state.compaction import CompactionReport
+
+        mock_compactor_class.return_value.run.return_value = CompactionReport(
+            deployments_deleted=4, bytes_before=4096, bytes_after=1024
+        )
+
+        result = runner.invoke(
+            main, ["history", "--compact", "--keep", "2", "--compress"]
+        )
+
+        assert result.exit_code == 0
+        mock_compactor_class.assert_called_once_with(
+            mock_db_class.return_value, keep_per_group=2, compress=True
+        )
+        assert "3.0 KiB reclaimed" in result.output
+
+
 class TestHistoryCommandErrors:
     """Test history command error handling."""
 
@@ -0,0 +1,239 @@
+"""Unit tests for prepare.py - batched Helm repository refresh.
+
+Tests verify:
+- Required repos are deduplicated across apps
+- Missing repos are added, existing ones refreshed in one `helm repo update`
+- Repos refreshed once are not refreshed again in the same process
+- apply's per-app prepare calls refresh every app's repos in the first call
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import yaml
+from click.testing import CliRunner
+
+from sbkube.cli import main
+from sbkube.commands.prepare import (
+    collect_required_helm_repos,
+    helm_repo_memo,
+    prepare_helm_app,
+    refresh_helm_repos,
+)
+from sbkube.models.config_model import HelmApp, SBKubeConfig
+from sbkube.utils.output_manager import OutputManager
+
+BITNAMI = "https://charts.bitnami.com/bitnami"
+GRAFANA = "https://grafana.github.io/helm-charts"
+
+
+def _repo_list(**repos: str) -> str:
+    return json.dumps([{"name": name, "url": url} for name, url in repos.items()])
+
+
+class TestCollectRequiredHelmRepos:
+    """Test repo collection across apps."""
+
+    def test_deduplicates_and_skips_non_helm_repos(self) -> None:
+        """Shared repos appear once; local/OCI/undefined repos are skipped."""
+        config = SBKubeConfig(
+            namespace="default",
+            apps={
+                "redis": {"type": "helm", "chart": "bitnami/redis"},
+                "nginx": {"type": "helm", "chart": "bitnami/nginx"},
+                "loki": {"type": "helm", "chart": "grafana/loki"},
+                "local": {"type": "helm", "chart": "./charts/local"},
+                "oci": {"type": "helm", "chart": "myoci/app"},
+                "unknown": {"type": "helm", "chart": "unknown/app"},
+                "off": {"type": "helm", "chart": "other/app", "enabled": False},
+            },
+        )
+
+        repos = collect_required_helm_repos(
+            config,
+            list(config.apps),
+            helm_sources={"bitnami": BITNAMI, "grafana": {"url": GRAFANA}, "other": BITNAMI},
+            oci_sources={"myoci": "oci://registry.example.com"},
+        )
+
+        assert repos == {"bitnami": BITNAMI, "grafana": GRAFANA}
+
+
+class TestRefreshHelmRepos:
+    """Test batched helm repo add/update."""
+
+    @patch("sbkube.commands.prepare.run_command")
+    def test_single_batched_update(self, mock_run_command) -> None:
+        """Existing repos are refreshed with one `helm repo update` call."""
+        mock_run_command.side_effect = [
+            (0, _repo_list(bitnami=BITNAMI, grafana=GRAFANA), ""),
+            (0, "", ""),
+        ]
+        output = MagicMock(spec=OutputManager)
+
+        ok, failed = refresh_helm_repos(
+            {"bitnami": BITNAMI, "grafana": GRAFANA}, output
+        )
+
+        assert ok is True
+        assert failed == []
+        update_cmd = mock_run_command.call_args_list[1].args[0]
+        assert update_cmd == ["helm", "repo", "update", "bitnami", "grafana"]
+        assert helm_repo_memo.is_refreshed("bitnami", BITNAMI)
+
+    @patch("sbkube.commands.prepare.run_command")
+    def test_missing_repo_added_without_update(self, mock_run_command) -> None:
+        """Newly added repos are not updated again (add fetches the index)."""
+        mock_run_command.side_effect = [
+            (1, "", "Error: no repositories to show"),
+            (0, "", ""),
+        ]
+        output = MagicMock(spec=OutputManager)
+
+        ok, _ = refresh_helm_repos({"bitnami": BITNAMI}, output)
+
+        assert ok is True
+        commands = [c.args[0] for c in mock_run_command.call_args_list]
+        assert commands[1] == ["helm", "repo", "add", "bitnami", BITNAMI]
+        assert not any("update" in cmd for cmd in commands)
+
+    @patch("sbkube.commands.prepare.run_command")
+    def test_memo_skips_second_refresh(self, mock_run_command) -> None:
+        """Repos refreshed earlier in the process are skipped."""
+        helm_repo_memo.mark_refreshed("bitnami", BITNAMI)
+        output = MagicMock(spec=OutputManager)
+
+        ok, failed = refresh_helm_repos({"bitnami": BITNAMI}, output)
+
+        assert (ok, failed) == (True, [])
+        mock_run_command.assert_not_called()
+
+    @patch("sbkube.commands.prepare.run_command")
+    def test_given_local_repos_skip_repo_list(self, mock_run_command) -> None:
+        """A repo list from preflight is reused instead of listing again."""
+        mock_run_command.return_value = (0, "", "")
+        output = MagicMock(spec=OutputManager)
+
+        ok, _ = refresh_helm_repos(
+            {"bitnami": BITNAMI}, output, local_repos={"bitnami": BITNAMI}
+        )
+
+        assert ok is True
+        commands = [c.args[0] for c in mock_run_command.call_args_list]
+        assert commands == [["helm", "repo", "update", "bitnami"]]
+
+    @patch("sbkube.commands.prepare.run_command")
+    def test_update_failure_reported(self, mock_run_command) -> None:
+        """A failed batch update reports the repos and does not memoize them."""
+        mock_run_command.side_effect = [
+            (0, _repo_list(bitnami=BITNAMI), ""),
+            (1, "", "network error"),
+        ]
+        output = MagicMock(spec=OutputManager)
+
+        ok, failed = refresh_helm_repos({"bitnami": BITNAMI}, output)
+
+        assert ok is False
+        assert failed == ["bitnami"]
+        assert not helm_repo_memo.is_refreshed("bitnami", BITNAMI)
+
+
+class TestPrepareHelmAppUsesMemo:
+    """prepare_helm_app skips repo add/update for refreshed repos."""
+
+    @patch("sbkube.commands.prepare.run_command")
+    def test_only_pull_when_repo_refreshed(
+        self, mock_run_command, tmp_path: Path
+    ) -> None:
+        """Only `helm pull` runs when the repo was refreshed in this run."""
+        helm_repo_memo.mark_refreshed("bitnami", BITNAMI)
+        charts_dir = tmp_path / "charts"
+
+        def run_side_effect(cmd, **kwargs):
+            if "pull" in cmd:
+                temp_dir = Path(cmd[cmd.index("--untardir") + 1])
+                (temp_dir / "nginx").mkdir(parents=True)
+                (temp_dir / "nginx" / "Chart.yaml").write_text("name: nginx")
+            return (0, "", "")
+
+        mock_run_command.side_effect = run_side_effect
+
+        result = prepare_helm_app(
+            app_name="nginx",
+            app=HelmApp(type="helm", chart="bitnami/nginx", version="15.0.0"),
+            base_dir=tmp_path,
+            charts_dir=charts_dir,
+            sources_file=tmp_path / "sources.yaml",
+            output=MagicMock(spec=OutputManager),
+            helm_repos={"bitnami": BITNAMI},
+            oci_registries={},
+        )
+
+        assert result is True
+        commands = [c.args[0] for c in mock_run_command.call_args_list]
+        assert len(commands) == 1
+        assert commands[0][:2] == ["helm", "pull"]
+
+
+class TestPrepareCommandBatchesRepos:
+    """apply-style per-app prepare calls share one batched refresh."""
+
+    @patch("sbkube.commands.prepare.resolve_cluster_config")
+    @patch("sbkube.commands.prepare.check_helm_installed_or_exit")
+    @patch("sbkube.commands.prepare.run_command")
+    def test_first_app_refreshes_all_repos(
+        self, mock_run_command, mock_helm_check, mock_resolve_cluster, tmp_path: Path
+    ) -> None:
+        """Repos of every app are listed once and updated in one call."""
+        config_dir = tmp_path / "app_100"
+        config_dir.mkdir()
+        (tmp_path / "sources.yaml").write_text(
+            yaml.dump({"helm_repos": {"bitnami": BITNAMI, "grafana": GRAFANA}})
+        )
+        config_file = config_dir / "config.yaml"
+        config_file.write_text(
+            yaml.dump(
+                {
+                    "namespace": "default",
+                    "apps": {
+                        "redis": {"type": "helm", "chart": "bitnami/redis"},
+                        "loki": {"type": "helm", "chart": "grafana/loki"},
+                    },
+                }
+            )
+        )
+        mock_resolve_cluster.return_value = (None, None)
+
+        def run_side_effect(cmd, **kwargs):
+            if cmd[:3] == ["helm", "repo", "list"]:
+                return (0, _repo_list(bitnami=BITNAMI, grafana=GRAFANA), "")
+            if "pull" in cmd:
+                chart = cmd[2].split("/")[1]
+                temp_dir = Path(cmd[cmd.index("--untardir") + 1])
+                (temp_dir / chart).mkdir(parents=True)
+                (temp_dir / chart / "Chart.yaml").write_text(f"name: {chart}")
+            return (0, "", "")
+
+        mock_run_command.side_effect = run_side_effect
+        obj = {"helm_repo_apps": {str(config_file.resolve()): ["redis", "loki"]}}
+
+        for app in ("redis", "loki"):
+            result = CliRunner().invoke(
+                main, ["prepare", str(config_dir), "--app", app], obj=obj
+            )
+            assert result.exit_code == 0, result.output
+
+        repo_commands = [
+            c.args[0][:4]
+            for c in mock_run_command.call_args_list
+            if c.args[0][:2] == ["helm", "repo"]
+        ]
+        assert repo_commands == [
+            ["helm", "repo", "list", "-o"],
+            ["helm", "repo", "update", "bitnami"],
+        ]
+        update_cmd = next(
+            c.args[0] for c in mock_run_command.call_args_list if "update" in c.args[0]
+        )
+        assert update_cmd == ["helm", "repo", "update", "bitnami", "grafana"]
@@ -1,5 +1,6 @@
 """Tests for status command."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -1103,3 +1104,201 @@ cluster: test-cluster
         # Verify it tried to sleep (watch loop started)
         mock_sleep.assert_called_once()
         assert "Stopped watching" in result.output or "watch" in result.output.lower()
+
+
+class TestStatusStaleWhileRevalidate:
+    """Test per-section cache refresh."""
+
+    @patch("subprocess.Popen")
+    @patch("sbkube.commands.status._display_status")
+    @patch("sbkube.commands.status._collect_and_cache")
+    @patch("sbkube.commands.status.ClusterStatusCollector")
+    @patch("sbkube.commands.status.ClusterCache")
+    def test_stale_sections_refreshed_in_background(
+        self,
+        mock_cache_class,
+        mock_collector_class,
+        mock_collect,
+        mock_display,
+        mock_popen,
+        runner,
+        tmp_path,
+    ) -> None:
+        """Stale sections are served from cache and refreshed by a child process."""
+        (tmp_path / "sources.yaml").write_text(
+            "kubeconfig: /fake/kubeconfig\nkubeconfig_context: test-context\n"
+        )
+        mock_cache = MagicMock()
+        mock_cache.is_valid.return_value = True
+        mock_cache.stale_sections.return_value = ["helm_releases", "pods"]
+        mock_cache.get_age_seconds.return_value = 600
+        mock_cache_class.return_value = mock_cache
+
+        result = runner.invoke(main, ["status", "--base-dir", str(tmp_path)])
+
+        assert result.exit_code == 0
+        mock_collect.assert_not_called()
+        mock_display.assert_called_once()
+        args = mock_popen.call_args[0][0]
+        assert args[args.index("--revalidate") + 1] == "helm_releases,pods"
+
+    @patch("sbkube.commands.status.ClusterStatusCollector")
+    def test_revalidate_updates_only_stale_sections(
+        self, mock_collector_class, runner, tmp_path
+    ) -> None:
+        """--revalidate keeps fresh sections and previous values of failed sources."""
+        from sbkube.utils.cluster_cache import DEFAULT_SECTION_TTL_SECONDS, ClusterCache
+
+        (tmp_path / "sources.yaml").write_text(
+            "kubeconfig: /fake/kubeconfig\nkubeconfig_context: ctx\ncluster: c1\n"
+        )
+        cache = ClusterCache(
+            tmp_path / ".sbkube" / "cluster_status",
+            context="ctx",
+            cluster="c1",
+            section_ttls=DEFAULT_SECTION_TTL_SECONDS,
+        )
+        cache.save({"nodes": [{"name": "n1"}], "pods": [], "helm_releases": [{"name": "old"}]})
+        data = cache.load()
+        for section in ("pods", "helm_releases"):
+            data["sections"][section]["timestamp"] = "2000-01-01T00:00:00+00:00"
+        cache.cache_file.write_text(json.dumps(data))
+
+        mock_collector_class.return_value.collect_all.return_value = {
+            "pods": [{"name": "p1"}],
+            "helm_releases": [],
+            "collection": {
+                "total_seconds": 0.1,
+                "sources": {
+                    "pods": {"duration_seconds": 0.1},
+                    "helm_releases": {"duration_seconds": 0.1, "error": "boom"},
+                },
+            },
+        }
+
+        result = runner.invoke(
+            main,
+            ["status", "--base-dir", str(tmp_path), "--revalidate", "pods,helm_releases"],
+        )
+
+        assert result.exit_code == 0
+        mock_collector_class.return_value.collect_all.assert_called_once_with(
+            sections=["pods", "helm_releases"]
+        )
+        refreshed = cache.load()
+        assert refreshed["pods"] == [{"name": "p1"}]
+        assert refreshed["helm_releases"] == [{"name": "old"}]
+        assert refreshed["nodes"] == [{"name": "n1"}]
+        assert cache.stale_sections() == ["helm_releases"]
+
+
+class TestStatusWatchChanges:
+    """Test --watch change stream filtering and seeding."""
+
+    @staticmethod
+    def _model():
+        from sbkube.utils.cluster_watch import ClusterWatchModel
+
+        return ClusterWatchModel.from_snapshot(
+            {
+                "nodes": [{"name": "n1", "status": "Ready", "version": "v1.29"}],
+                "pods": [
+                    {"name": "redis-0", "namespace": "data", "phase": "Running",
+                     "ready_containers": 1, "total_containers": 1},
+                    {"name": "web-0", "namespace": "web", "phase": "Running",
+                     "ready_containers": 1, "total_containers": 1},
+                ],
+                "helm_releases": [
+                    {"name": "redis", "namespace": "data", "status": "deployed",
+                     "revision": 1, "chart": "redis-1.0.0",
+                     "labels": {"sbkube.io/app-group": "app_100_data"}},
+                    {"name": "web", "namespace": "web", "status": "deployed",
+                     "revision": 1, "chart": "web-1.0.0"},
+                ],
+            }
+        )
+
+    @staticmethod
+    def _printed(changes, model, **options) -> list[str]:
+        from sbkube.commands.status import _print_watch_changes
+
+        output = MagicMock()
+        _print_watch_changes(changes, model, output, **options)
+        return [c.args[0] for c in output.print.call_args_list]
+
+    @staticmethod
+    def _changes():
+        from sbkube.utils.cluster_watch import RowChange
+
+        pod = {"name": "web-0", "namespace": "web", "phase": "Running",
+               "ready_containers": 1, "total_containers": 1}
+        return [
+            RowChange("nodes", ("n1",), {"name": "n1", "status": "Ready", "version": "v1.29"},
+                      {"name": "n1", "status": "NotReady", "version": "v1.29"}),
+            RowChange("pods", ("data", "redis-0"), None,
+                      {"name": "redis-0", "namespace": "data", "phase": "Running",
+                       "ready_containers": 1, "total_containers": 1}),
+            RowChange("pods", ("web", "web-0"), pod,
+                      {**pod, "ready_containers": 0}),
+            RowChange("helm_releases", ("web", "web"),
+                      {"name": "web", "namespace": "web", "status": "deployed",
+                       "revision": 1, "chart": "web-1.0.0"},
+                      {"name": "web", "namespace": "web", "status": "deployed",
+                       "revision": 2, "chart": "web-1.1.0"}),
+        ]
+
+    def test_unfiltered_shows_all_changes(self) -> None:
+        lines = self._printed(self._changes(), self._model())
+
+        assert len(lines) == 5
+        assert "Nodes 1/1 Ready" in lines[-1]
+
+    def test_app_group_limits_to_group_releases_and_namespaces(self) -> None:
+        lines = self._printed(self._changes(), self._model(), app_group="app_100_data")
+
+        assert len(lines) == 2
+        assert "pod data/redis-0" in lines[0]
+        assert "Pods 1 " in lines[1]
+        assert "Releases 1/1" in lines[1]
+        assert "Nodes" not in lines[1]
+
+    def test_managed_hides_unmanaged_releases(self) -> None:
+        lines = self._printed(self._changes(), self._model(), managed=True)
+
+        assert not any("release web" in line or "web-0" in line for line in lines)
+
+    def test_unhealthy_shows_changes_touching_unhealthy_rows(self) -> None:
+        lines = self._printed(self._changes(), self._model(), unhealthy=True)
+
+        assert len(lines) == 3
+        assert "node n1" in lines[0]
+        assert "pod web/web-0" in lines[1]
+
+    def test_nothing_printed_when_all_filtered(self) -> None:
+        assert self._printed(self._changes()[3:], self._model(), unhealthy=True) == []
+
+    @patch("sbkube.commands.status.ClusterWatcher")
+    @patch("sbkube.commands.status._display_status")
+    @patch("sbkube.commands.status._collect_and_cache")
+    @patch("time.sleep", side_effect=KeyboardInterrupt)
+    def test_watch_is_seeded_from_collected_snapshot(
+        self, _sleep, mock_collect, _display, mock_watcher_class
+    ) -> None:
+        from sbkube.commands.status import _watch_status
+
+        mock_collect.return_value = {
+            "nodes": [{"name": "n1", "status": "Ready", "version": "v1.29"}],
+            "pods": [],
+            "helm_releases": [],
+        }
+        collector = MagicMock()
+        collector.resource_versions = {"nodes": "7", "pods": "9"}
+        mock_watcher_class.return_value.poll.return_value = []
+
+        with pytest.raises(SystemExit):
+            _watch_status(collector, MagicMock(), MagicMock(), base_path=None)
+
+        (_, model), kwargs = mock_watcher_class.call_args
+        assert kwargs["resource_versions"] == {"nodes": "7", "pods": "9"}
+        assert [n["name"] for n in model.snapshot()["nodes"]] == ["n1"]
+        collector.collect_all.assert_not_called()
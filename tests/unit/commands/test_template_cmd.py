@@ -7,6 +7,7 @@ import yaml
 from click.testing import CliRunner
 
 from sbkube.cli import main
+from tests.unit.conftest import stdout_file_run
 
 
 @pytest.fixture
@@ -99,8 +100,7 @@ spec:
 """)
 
         # Mock successful helm template command
-        mock_run_command.return_value = (
-            0,
+        mock_run_command.side_effect = stdout_file_run(
             """
 apiVersion: apps/v1
 kind: Deployment
@@ -108,8 +108,7 @@ metadata:
   name: nginx
 spec:
   replicas: 1
-""",
-            "",
+"""
         )
 
         # Run template
@@ -16,6 +16,7 @@ from unittest.mock import MagicMock, patch
 from sbkube.commands.template import template_helm_app
 from sbkube.models.config_model import HelmApp
 from sbkube.utils.output_manager import OutputManager
+from tests.unit.conftest import stdout_file_run
 
 
 class TestTemplateHelmAppBasic:
@@ -49,7 +50,7 @@ class TestTemplateHelmAppBasic:
 kind: Deployment
 metadata:
   name: nginx"""
-        mock_run_command.return_value = (0, helm_output, "")
+        mock_run_command.side_effect = stdout_file_run(helm_output)
         output = MagicMock(spec=OutputManager)
 
         # Act
@@ -106,7 +107,7 @@ metadata:
         )
 
         helm_output = "apiVersion: apps/v1\nkind: Deployment"
-        mock_run_command.return_value = (0, helm_output, "")
+        mock_run_command.side_effect = stdout_file_run(helm_output)
         output = MagicMock(spec=OutputManager)
 
         # Act
@@ -150,7 +151,7 @@ metadata:
         )
 
         helm_output = "apiVersion: apps/v1\nkind: Deployment"
-        mock_run_command.return_value = (0, helm_output, "")
+        mock_run_command.side_effect = stdout_file_run(helm_output)
         output = MagicMock(spec=OutputManager)
 
         # Act
@@ -199,7 +200,7 @@ class TestTemplateHelmAppValues:
         )
 
         helm_output = "apiVersion: apps/v1"
-        mock_run_command.return_value = (0, helm_output, "")
+        mock_run_command.side_effect = stdout_file_run(helm_output)
         output = MagicMock(spec=OutputManager)
 
         # Act
@@ -242,7 +243,7 @@ class TestTemplateHelmAppValues:
         )
 
         helm_output = "apiVersion: apps/v1"
-        mock_run_command.return_value = (0, helm_output, "")
+        mock_run_command.side_effect = stdout_file_run(helm_output)
         output = MagicMock(spec=OutputManager)
 
         # Act
@@ -291,7 +292,7 @@ class TestTemplateHelmAppValues:
         }
 
         helm_output = "apiVersion: apps/v1"
-        mock_run_command.return_value = (0, helm_output, "")
+        mock_run_command.side_effect = stdout_file_run(helm_output)
         output = MagicMock(spec=OutputManager)
 
         # Act
@@ -341,7 +342,7 @@ class TestTemplateHelmAppValues:
         )
 
         helm_output = "apiVersion: apps/v1"
-        mock_run_command.return_value = (0, helm_output, "")
+        mock_run_command.side_effect = stdout_file_run(helm_output)
         output = MagicMock(spec=OutputManager)
 
         # Act
@@ -510,7 +511,7 @@ class TestTemplateHelmAppNamespace:
         )
 
         helm_output = "apiVersion: apps/v1"
-        mock_run_command.return_value = (0, helm_output, "")
+        mock_run_command.side_effect = stdout_file_run(helm_output)
         output = MagicMock(spec=OutputManager)
 
         # Act
@@ -555,7 +556,7 @@ class TestTemplateHelmAppNamespace:
         )
 
         helm_output = "apiVersion: apps/v1"
-        mock_run_command.return_value = (0, helm_output, "")
+        mock_run_command.side_effect = stdout_file_run(helm_output)
         output = MagicMock(spec=OutputManager)
 
         # Act
@@ -0,0 +1,109 @@
+"""Unit tests for template.py - render cache.
+
+Tests verify:
+- Unchanged inputs reuse rendered/<app>.yaml without running helm template
+- Changes to values files, set_values or the chart invalidate the cache
+- Edited rendered output and use_cache=False force a re-render
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sbkube.commands.template import template_helm_app
+from sbkube.models.config_model import HelmApp
+from sbkube.utils.output_manager import OutputManager
+from tests.unit.conftest import stdout_file_run
+
+HELM_OUTPUT = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: nginx\n"
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> dict[str, Path]:
+    build_dir = tmp_path / "build"
+    (build_dir / "nginx").mkdir(parents=True, exist_ok=True)
+    (build_dir / "nginx" / "Chart.yaml").write_text("name: nginx\nversion: 1.0.0")
+    app_config_dir = tmp_path / "config"
+    app_config_dir.mkdir(exist_ok=True)
+    (app_config_dir / "values.yaml").write_text("replicaCount: 1")
+    rendered_dir = tmp_path / "rendered"
+    rendered_dir.mkdir(exist_ok=True)
+    return {
+        "tmp": tmp_path,
+        "build": build_dir,
+        "config": app_config_dir,
+        "rendered": rendered_dir,
+    }
+
+
+def _render(ws: dict[str, Path], app: HelmApp, **kwargs) -> MagicMock:
+    output = MagicMock(spec=OutputManager)
+    assert template_helm_app(
+        app_name="nginx",
+        app=app,
+        base_dir=ws["tmp"],
+        charts_dir=ws["tmp"] / "charts",
+        build_dir=ws["build"],
+        app_config_dir=ws["config"],
+        rendered_dir=ws["rendered"],
+        output=output,
+        **kwargs,
+    )
+    return output
+
+
+def _helm_template_calls(mock_run_command: MagicMock) -> int:
+    return sum(1 for c in mock_run_command.call_args_list if "template" in c.args[0])
+
+
+@patch("sbkube.utils.render_cache.get_helm_version", return_value="v3.16.0")
+@patch("sbkube.commands.template.run_command", side_effect=stdout_file_run(HELM_OUTPUT))
+class TestRenderCache:
+    """Test render cache hits and invalidation."""
+
+    def test_unchanged_inputs_are_cached(self, mock_run_command, _helm, workspace) -> None:
+        app = HelmApp(type="helm", chart="bitnami/nginx", values=["values.yaml"])
+
+        _render(workspace, app)
+        output = _render(workspace, app)
+
+        assert _helm_template_calls(mock_run_command) == 1
+        assert "cached" in str(output.print_success.call_args)
+        assert (workspace["rendered"] / "nginx.yaml").read_text() == HELM_OUTPUT
+
+    def test_values_file_change_invalidates(self, mock_run_command, _helm, workspace) -> None:
+        app = HelmApp(type="helm", chart="bitnami/nginx", values=["values.yaml"])
+        _render(workspace, app)
+
+        (workspace["config"] / "values.yaml").write_text("replicaCount: 2")
+        _render(workspace, app)
+
+        assert _helm_template_calls(mock_run_command) == 2
+
+    def test_set_values_and_chart_change_invalidate(self, mock_run_command, _helm, workspace) -> None:
+        _render(workspace, HelmApp(type="helm", chart="bitnami/nginx"))
+        _render(workspace, HelmApp(type="helm", chart="bitnami/nginx", set_values={"a": "1"}))
+        (workspace["build"] / "nginx" / "values.yaml").write_text("x: 1")
+        _render(workspace, HelmApp(type="helm", chart="bitnami/nginx", set_values={"a": "1"}))
+
+        assert _helm_template_calls(mock_run_command) == 3
+
+    def test_cluster_global_values_change_invalidates(self, mock_run_command, _helm, workspace) -> None:
+        app = HelmApp(type="helm", chart="bitnami/nginx")
+        _render(workspace, app, cluster_global_values={"global": {"env": "dev"}})
+        _render(workspace, app, cluster_global_values={"global": {"env": "dev"}})
+        _render(workspace, app, cluster_global_values={"global": {"env": "prd"}})
+
+        assert _helm_template_calls(mock_run_command) == 2
+
+    def test_edited_output_or_no_cache_rerenders(self, mock_run_command, _helm, workspace) -> None:
+        app = HelmApp(type="helm", chart="bitnami/nginx")
+        _render(workspace, app)
+
+        (workspace["rendered"] / "nginx.yaml").write_text("edited")
+        _render(workspace, app)
+        _render(workspace, app, use_cache=False)
+
+        assert _helm_template_calls(mock_run_command) == 3
+        assert (workspace["rendered"] / "nginx.yaml").read_text() == HELM_OUTPUT
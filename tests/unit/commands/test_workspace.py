@@ -4,8 +4,9 @@ Note: These tests use the unified sbkube.yaml format (v0.10.0+).
 The legacy sbkube.yaml format is no longer supported.
 """
 
+import time
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import click
 import pytest
@@ -738,8 +739,24 @@ class TestWorkspaceParallelExecution:
         # All phases should be in results
         assert len(cmd.phase_results) == 3
 
-    def test_parallel_level_calculation(self, tmp_path: Path) -> None:
-        """병렬 레벨 계산 테스트."""
+    def _run_with_timeline(
+        self, cmd: WorkspaceDeployCommand
+    ) -> dict[str, tuple[float, float]]:
+        """Phase별 (시작, 종료) 시각을 기록하며 실행."""
+        timeline: dict[str, tuple[float, float]] = {}
+
+        def fake_deploy_phase(phase_name, phase_config, workspace):
+            start = time.perf_counter()
+            time.sleep(0.05)
+            timeline[phase_name] = (start, time.perf_counter())
+            return (True, [])
+
+        with patch.object(cmd, "_deploy_phase", side_effect=fake_deploy_phase):
+            assert cmd.execute() is True
+        return timeline
+
+    def test_parallel_phases_wait_for_dependencies(self, tmp_path: Path) -> None:
+        """의존 Phase가 끝난 뒤 시작하고, 서로 독립인 Phase는 동시에 실행."""
         # p1 -> p2, p3 (p2 and p3 can run in parallel)
         phases = {
             "p1": {
@@ -764,20 +781,15 @@ class TestWorkspaceParallelExecution:
             dry_run=True,
             skip_validation=True,
             parallel=True,
+            max_workers=4,
         )
+        timeline = self._run_with_timeline(cmd)
 
-        # Load workspace
-        workspace = cmd._load_and_validate_workspace()
-        phase_order = workspace.get_phase_order()
-
-        # Calculate levels
-        levels = cmd._calculate_parallel_levels(workspace, phase_order)
-
-        # Level 0: p1 (no dependencies)
-        # Level 1: p2, p3 (both depend only on p1)
-        assert len(levels) == 2
-        assert levels[0] == ["p1"]
-        assert set(levels[1]) == {"p2", "p3"}
+        assert timeline["p2"][0] >= timeline["p1"][1]
+        assert timeline["p3"][0] >= timeline["p1"][1]
+        # p2, p3 overlap
+        assert timeline["p2"][0] < timeline["p3"][1]
+        assert timeline["p3"][0] < timeline["p2"][1]
 
     def test_parallel_cli_options(self, tmp_path: Path) -> None:
         """Workspace deploy --parallel CLI 옵션 테스트."""
@@ -800,8 +812,8 @@ class TestWorkspaceParallelExecution:
         assert result.exit_code == 0
         assert "PARALLEL MODE" in result.output
 
-    def test_complex_dependency_levels(self, tmp_path: Path) -> None:
-        """복잡한 의존성 레벨 계산 테스트."""
+    def test_diamond_dependencies(self, tmp_path: Path) -> None:
+        """Diamond 의존성: 합류 Phase는 두 브랜치가 모두 끝난 뒤 시작."""
         # Diamond dependency pattern:
         # p1 -> p2, p3
         # p2, p3 -> p4
@@ -834,18 +846,11 @@ class TestWorkspaceParallelExecution:
             skip_validation=True,
             parallel=True,
         )
+        timeline = self._run_with_timeline(cmd)
 
-        workspace = cmd._load_and_validate_workspace()
-        phase_order = workspace.get_phase_order()
-        levels = cmd._calculate_parallel_levels(workspace, phase_order)
-
-        # Level 0: p1
-        # Level 1: p2, p3 (can run in parallel)
-        # Level 2: p4 (depends on both p2 and p3)
-        assert len(levels) == 3
-        assert levels[0] == ["p1"]
-        assert set(levels[1]) == {"p2", "p3"}
-        assert levels[2] == ["p4"]
+        assert timeline["p2"][0] >= timeline["p1"][1]
+        assert timeline["p3"][0] >= timeline["p1"][1]
+        assert timeline["p4"][0] >= max(timeline["p2"][1], timeline["p3"][1])
 
     def test_sequential_vs_parallel_results_consistency(self, tmp_path: Path) -> None:
         """순차 vs 병렬 결과 일관성 테스트."""
@@ -886,3 +891,143 @@ class TestWorkspaceParallelExecution:
 
         # Both should have same phases in results
         assert set(cmd_seq.phase_results.keys()) == set(cmd_par.phase_results.keys())
+
+    def test_ready_queue_has_no_level_barrier(self, tmp_path: Path) -> None:
+        """느린 Phase가 다른 브랜치의 후속 Phase를 막지 않음."""
+        phases = {
+            "slow": {"description": "Slow", "source": "slow/sbkube.yaml"},
+            "fast": {"description": "Fast", "source": "fast/sbkube.yaml"},
+            "after-fast": {
+                "description": "Depends on fast only",
+                "source": "after/sbkube.yaml",
+                "depends_on": ["fast"],
+            },
+        }
+        workspace_file = self._create_workspace_file(tmp_path, phases)
+        cmd = WorkspaceDeployCommand(
+            workspace_file=str(workspace_file),
+            dry_run=True,
+            skip_validation=True,
+            parallel=True,
+            max_workers=4,
+        )
+        timeline: dict[str, tuple[float, float]] = {}
+
+        def fake_deploy_phase(phase_name, phase_config, workspace):
+            start = time.perf_counter()
+            time.sleep(0.3 if phase_name == "slow" else 0.01)
+            timeline[phase_name] = (start, time.perf_counter())
+            return (True, [])
+
+        with patch.object(cmd, "_deploy_phase", side_effect=fake_deploy_phase):
+            assert cmd.execute() is True
+
+        assert timeline["after-fast"][0] < timeline["slow"][1]
+
+    def test_stop_on_failure_does_not_start_new_phases(self, tmp_path: Path) -> None:
+        """on_failure=stop 이면 실패 후 새 Phase를 시작하지 않음."""
+        phases = {
+            "p1": {"description": "First", "source": "p1/sbkube.yaml"},
+            "p2": {"description": "Second", "source": "p2/sbkube.yaml"},
+        }
+        workspace_file = self._create_workspace_file(tmp_path, phases)
+        cmd = WorkspaceDeployCommand(
+            workspace_file=str(workspace_file),
+            dry_run=True,
+            skip_validation=True,
+            parallel=True,
+            max_workers=1,
+        )
+
+        with patch.object(cmd, "_deploy_phase", return_value=(False, [])):
+            assert cmd.execute() is False
+
+        assert list(cmd.phase_results) == ["p1"]
+
+    def test_continue_on_failure_runs_dependent_phases(self, tmp_path: Path) -> None:
+        """on_failure=continue Phase가 실패해도 후속 Phase는 실행 (순차 모드와 동일)."""
+        phases = {
+            "p1": {"description": "First", "source": "p1/sbkube.yaml", "on_failure": "continue"},
+            "p2": {"description": "Second", "source": "p2/sbkube.yaml", "depends_on": ["p1"]},
+        }
+        workspace_file = self._create_workspace_file(tmp_path, phases)
+        cmd = WorkspaceDeployCommand(
+            workspace_file=str(workspace_file),
+            dry_run=True,
+            skip_validation=True,
+            parallel=True,
+        )
+
+        def fake_deploy_phase(phase_name, phase_config, workspace):
+            return (phase_name != "p1", [])
+
+        with patch.object(cmd, "_deploy_phase", side_effect=fake_deploy_phase):
+            assert cmd.execute() is False
+
+        assert cmd.phase_results["p1"]["success"] is False
+        assert cmd.phase_results["p2"]["success"] is True
+
+    def test_app_groups_follow_app_group_deps(self, tmp_path: Path) -> None:
+        """App group은 자신의 app_group_deps가 끝나는 즉시 시작."""
+        cmd = WorkspaceDeployCommand(
+            workspace_file=str(self._create_workspace_file(tmp_path)),
+            max_workers=4,
+        )
+        finished: list[str] = []
+
+        def fake_deploy(app_group, base_dir, source_path, inherited_settings):
+            time.sleep(0.2 if app_group == "slow" else 0.01)
+            finished.append(app_group)
+            return True
+
+        with patch.object(cmd, "_deploy_single_app_group", side_effect=fake_deploy):
+            success, completed = cmd._deploy_app_groups_parallel(
+                ["slow", "db", "api"],
+                tmp_path,
+                tmp_path / "sbkube.yaml",
+                dependencies={"api": ["db"]},
+            )
+
+        assert success is True
+        assert completed == 3
+        assert finished == ["db", "api", "slow"]
+
+    def test_process_isolation_uses_worker_pool(self, tmp_path: Path) -> None:
+        """isolation=process 이면 app group을 worker pool에서 실행."""
+        cmd = WorkspaceDeployCommand(
+            workspace_file=str(self._create_workspace_file(tmp_path)),
+            isolation="process",
+        )
+        pool = MagicMock()
+        pool.apply.return_value.success = True
+
+        with (
+            patch.object(cmd, "_get_process_pool", return_value=pool),
+            patch("sbkube.commands.apply.ApplyCommand") as apply_cls,
+        ):
+            assert cmd._deploy_single_app_group(
+                "app_100", tmp_path, tmp_path / "sources.yaml", {"kubeconfig": "k"}
+            )
+
+        apply_cls.assert_not_called()
+        job = pool.apply.call_args.args[0]
+        assert job.app_group == "app_100"
+        assert job.source == "sources.yaml"
+        assert job.inherited_settings == {"kubeconfig": "k"}
+
+    def test_nested_deployer_shares_slots_and_pool(self, tmp_path: Path) -> None:
+        """Nested workspace는 부모의 슬롯/pool을 공유하고 pool을 닫지 않음."""
+        workspace_file = str(self._create_workspace_file(tmp_path))
+        parent = WorkspaceDeployCommand(workspace_file=workspace_file, isolation="process")
+        pool = MagicMock()
+        nested = WorkspaceDeployCommand(
+            workspace_file=workspace_file,
+            isolation="process",
+            worker_slots=parent._worker_slots,
+            process_pool=pool,
+        )
+
+        assert nested._worker_slots is parent._worker_slots
+        assert nested._get_process_pool() is pool
+        nested._close_process_pool()
+        pool.close.assert_not_called()
@@ -0,0 +1,19 @@
+"""Shared helpers for unit tests."""
+
+from pathlib import Path
+
+
+def stdout_file_run(stdout: str, stderr: str = "", return_code: int = 0):
+    """run_command mock side_effect that honours ``stdout_file``.
+
+    With ``stdout_file`` the real run_command writes stdout to the file and
+    returns an empty stdout; without it stdout is returned as usual.
+    """
+
+    def run(cmd, *args, stdout_file=None, **kwargs) -> tuple[int, str, str]:
+        if stdout_file is None:
+            return return_code, stdout, stderr
+        Path(stdout_file).write_text(stdout, encoding="utf-8")
+        return return_code, "", stderr
+
+    return run
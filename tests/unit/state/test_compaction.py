@@ -0,0 +1,148 @@
+"""Tests for deployment state retention and compaction.
+
+Tests verify:
+- Only the newest N deployments per app group are kept
+- Identical snapshots are stored once in state_blobs and still read back
+- Large snapshots are compressed when requested
+- VACUUM reclaims space and the report reflects it
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+from sbkube.models.deployment_state import (
+    AppDeploymentCreate,
+    Deployment,
+    DeploymentCreate,
+    HelmReleaseInfo,
+    ResourceAction,
+    ResourceInfo,
+    StateBlob,
+)
+from sbkube.state.compaction import StateCompactor
+from sbkube.state.database import DeploymentDatabase
+
+MANIFEST = {
+    "apiVersion": "v1",
+    "kind": "ConfigMap",
+    "metadata": {"name": "app-config"},
+    "data": {"payload": "x" * 8000},
+}
+
+
+def _record(db: DeploymentDatabase, index: int, app_config_dir: str, minutes: int) -> None:
+    deployment = db.create_deployment(
+        DeploymentCreate(
+            deployment_id=f"dep-{index:03d}",
+            cluster="prod",
+            namespace="default",
+            app_config_dir=app_config_dir,
+            config_file_path="config.yaml",
+            command="deploy",
+            config_snapshot={"apps": {}},
+        )
+    )
+    with db.get_session() as session:
+        session.execute(
+            update(Deployment)
+            .where(Deployment.id == deployment.id)
+            .values(timestamp=datetime(2025, 1, 1, tzinfo=UTC) + timedelta(minutes=minutes))
+        )
+    app = db.add_app_deployment(
+        deployment.id,
+        AppDeploymentCreate(app_name="web", app_type="yaml", app_config={}),
+    )
+    db.add_deployed_resource(
+        app.id,
+        ResourceInfo(
+            api_version="v1",
+            kind="ConfigMap",
+            name="app-config",
+            namespace="default",
+            action=ResourceAction.UPDATE,
+            previous_state=MANIFEST,
+            current_state=MANIFEST,
+        ),
+    )
+    db.add_helm_release(
+        app.id,
+        HelmReleaseInfo(
+            release_name=f"web-{index}",
+            namespace="default",
+            chart="bitnami/nginx",
+            revision=1,
+            values={"replicaCount": 2},
+            status="deployed",
+        ),
+    )
+
+
+@pytest.fixture
+def db(tmp_path) -> DeploymentDatabase:
+    database = DeploymentDatabase(tmp_path / "deployments.db")
+    for i in range(12):
+        _record(database, i, "/work/a000_infra", minutes=i)
+    for i in range(12, 15):
+        _record(database, i, "/work/a100_data", minutes=i)
+    return database
+
+
+def _deployment_ids(db: DeploymentDatabase) -> set[str]:
+    with db.get_session() as session:
+        return set(session.scalars(select(Deployment.deployment_id)))
+
+
+class TestStateCompactor:
+    """Test retention, dedup and vacuum."""
+
+    def test_keeps_newest_per_app_group(self, db: DeploymentDatabase) -> None:
+        report = StateCompactor(db, keep_per_group=5).run(vacuum=False)
+
+        assert report.deployments_deleted == 7
+        assert _deployment_ids(db) == {f"dep-{i:03d}" for i in range(7, 15)}
+
+    def test_snapshots_are_deduplicated_and_readable(self, db: DeploymentDatabase) -> None:
+        report = StateCompactor(db, keep_per_group=None).run(vacuum=False)
+
+        # 15 x (previous, current, values) snapshots share two distinct blobs
+        assert report.snapshots_compacted == 45
+        assert report.blobs_created == 2
+        detail = db.get_deployment("dep-003")
+        assert detail.resources[0].previous_state == MANIFEST
+        assert detail.resources[0].current_state == MANIFEST
+        assert detail.helm_releases[0].values == {"replicaCount": 2}
+
+    def test_compress_large_snapshots(self, db: DeploymentDatabase) -> None:
+        StateCompactor(db, keep_per_group=None).run(vacuum=False)
+
+        report = StateCompactor(db, keep_per_group=None, compress=True).run(vacuum=False)
+
+        assert report.blobs_compressed == 1
+        with db.get_session() as session:
+            encodings = set(session.scalars(select(StateBlob.encoding)))
+        # zstd on Python 3.14+, zlib fallback otherwise; small values stay plain JSON
+        assert encodings in ({"json", "zstd"}, {"json", "zlib"})
+        assert db.get_deployment("dep-010").resources[0].current_state == MANIFEST
+
+    def test_orphan_blobs_removed_and_space_reclaimed(
+        self, db: DeploymentDatabase
+    ) -> None:
+        StateCompactor(db, keep_per_group=None).run(vacuum=False)
+
+        report = StateCompactor(db, keep_per_group=0).run()
+
+        assert _deployment_ids(db) == set()
+        assert report.blobs_deleted == 2
+        with db.get_session() as session:
+            assert session.scalar(select(func.count()).select_from(StateBlob)) == 0
+        assert report.bytes_after < report.bytes_before
+        assert report.to_dict()["bytes_reclaimed"] == report.bytes_reclaimed
+
+
+def test_cleanup_old_deployments_applies_per_app_limit(db: DeploymentDatabase) -> None:
+    deleted = db.cleanup_old_deployments(days_to_keep=100_000, max_deployments_per_app=2)
+
+    assert deleted == 11
+    assert _deployment_ids(db) == {"dep-010", "dep-011", "dep-013", "dep-014"}
@@ -0,0 +1,218 @@
+"""Query-count tests for DeploymentDatabase read paths.
+
+Tests verify:
+- get_deployment eager-loads apps, resources and Helm releases (no N+1)
+- list_deployments aggregates app status counts in SQL
+- Dependency status lookups resolve many app-groups in one query
+- Query budgets hold on a database with 10k deployments
+"""
+
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from sbkube.models.deployment_state import (
+    AppDeployment,
+    DeployedResource,
+    Deployment,
+    DeploymentStatus,
+    HelmRelease,
+)
+from sbkube.state.database import DeploymentDatabase
+
+DEPLOYMENT_COUNT = 10_000
+APPS_PER_DEPLOYMENT = 3
+RESOURCES_PER_APP = 2
+
+
+@contextmanager
+def count_queries(db: DeploymentDatabase):
+    """Count SQL statements executed on the engine (PRAGMAs excluded)."""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args) -> None:
+        if not statement.lstrip().upper().startswith("PRAGMA"):
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(scope="module")
+def large_db(tmp_path_factory) -> DeploymentDatabase:
+    """DeploymentDatabase filled with 10k deployments (3 apps, 2 resources each)."""
+    db = DeploymentDatabase(tmp_path_factory.mktemp("state") / "deployments.db")
+    base_time = datetime(2025, 1, 1, tzinfo=UTC)
+    statuses = [
+        DeploymentStatus.SUCCESS.value,
+        DeploymentStatus.FAILED.value,
+        DeploymentStatus.SUCCESS.value,
+    ]
+
+    deployments, apps, resources, releases = [], [], [], []
+    for i in range(1, DEPLOYMENT_COUNT + 1):
+        deployments.append(
+            {
+                "id": i,
+                "deployment_id": f"dep-{i:05d}",
+                "timestamp": base_time + timedelta(minutes=i),
+                "cluster": "prod" if i % 2 else "dev",
+                "namespace": "default",
+                "app_config_dir": f"/work/app_{i % 20:03d}_group",
+                "config_file_path": "config.yaml",
+                "command": "deploy",
+                "status": DeploymentStatus.SUCCESS.value,
+                "config_snapshot": {"apps": {}},
+            }
+        )
+        for j in range(APPS_PER_DEPLOYMENT):
+            app_id = (i - 1) * APPS_PER_DEPLOYMENT + j + 1
+            apps.append(
+                {
+                    "id": app_id,
+                    "deployment_id": i,
+                    "app_name": f"app-{j}",
+                    "app_type": "helm",
+                    "app_group": f"app_{i % 20:03d}_group",
+                    "status": statuses[j],
+                    "app_config": {"chart": "bitnami/nginx"},
+                }
+            )
+            for k in range(RESOURCES_PER_APP):
+                resources.append(
+                    {
+                        "app_deployment_id": app_id,
+                        "api_version": "v1",
+                        "kind": "ConfigMap",
+                        "name": f"cm-{k}",
+                        "namespace": "default",
+                        "action": "create",
+                        "current_state": {"data": {"k": str(k)}},
+                    }
+                )
+            releases.append(
+                {
+                    "app_deployment_id": app_id,
+                    "release_name": f"rel-{app_id}",
+                    "namespace": "default",
+                    "chart": "bitnami/nginx",
+                    "revision": 1,
+                    "values": {"replicaCount": j},
+                    "status": "deployed",
+                }
+            )
+
+    with db.engine.begin() as conn:
+        conn.execute(insert(Deployment), deployments)
+        conn.execute(insert(AppDeployment), apps)
+        conn.execute(insert(DeployedResource), resources)
+        conn.execute(insert(HelmRelease), releases)
+    return db
+
+
+class TestQueryBudget:
+    """Each read path runs a fixed number of queries regardless of history size."""
+
+    def test_get_deployment(self, large_db: DeploymentDatabase) -> None:
+        with count_queries(large_db) as statements:
+            detail = large_db.get_deployment("dep-05000")
+
+        assert detail is not None
+        assert len(detail.apps) == APPS_PER_DEPLOYMENT
+        assert len(detail.resources) == APPS_PER_DEPLOYMENT * RESOURCES_PER_APP
+        assert [r.values for r in detail.helm_releases] == [
+            {"replicaCount": j} for j in range(APPS_PER_DEPLOYMENT)
+        ]
+        # deployment + app_deployments + resources + helm_releases
+        assert len(statements) <= 4
+
+    def test_list_deployments_counts_in_sql(self, large_db: DeploymentDatabase) -> None:
+        with count_queries(large_db) as statements:
+            summaries = large_db.list_deployments(limit=500)
+
+        assert len(summaries) == 500
+        assert summaries[0].deployment_id == f"dep-{DEPLOYMENT_COUNT:05d}"
+        assert all(s.app_count == 3 for s in summaries)
+        assert all(s.success_count == 2 and s.failed_count == 1 for s in summaries)
+        assert len(statements) == 1
+
+    def test_list_deployments_app_group_filter_is_distinct(
+        self, large_db: DeploymentDatabase
+    ) -> None:
+        with count_queries(large_db) as statements:
+            summaries = large_db.list_deployments(app_group="app_007_group", limit=1000)
+
+        assert len(summaries) == DEPLOYMENT_COUNT // 20
+        assert len({s.deployment_id for s in summaries}) == len(summaries)
+        assert len(statements) == 1
+
+    def test_get_latest_deployment(self, large_db: DeploymentDatabase) -> None:
+        with count_queries(large_db) as statements:
+            detail = large_db.get_latest_deployment_any_namespace(
+                "prod", "/work/app_003_group"
+            )
+
+        assert detail is not None
+        assert detail.deployment_id == "dep-09983"
+        assert len(statements) <= 4
+
+    def test_values_diff(self, large_db: DeploymentDatabase) -> None:
+        with count_queries(large_db) as statements:
+            diff = large_db.get_deployment_values_diff("dep-00001", "dep-00002")
+
+        assert diff is not None
+        assert len(statements) <= 8
+
+    def test_latest_statuses_single_query(self, large_db: DeploymentDatabase) -> None:
+        dirs = [f"/work/app_{n:03d}_group" for n in range(20)] + ["/work/missing"]
+
+        with count_queries(large_db) as statements:
+            statuses = large_db.get_latest_statuses("prod", dirs)
+
+        # prod deployments are odd ids only, so even-numbered groups never appear
+        assert set(statuses) == {d for n, d in enumerate(dirs[:20]) if n % 2}
+        latest = statuses["/work/app_003_group"]
+        assert latest.status == DeploymentStatus.SUCCESS
+        assert latest.namespace == "default"
+        assert latest.timestamp == datetime(2025, 1, 1) + timedelta(minutes=9983)
+        assert len(statements) == 1
+
+    def test_latest_statuses_by_dir_name(self, large_db: DeploymentDatabase) -> None:
+        with count_queries(large_db) as statements:
+            statuses = large_db.get_latest_statuses_by_dir_name(
+                "prod", ["app_003_group", "app_005_group"], namespace="default"
+            )
+
+        assert statuses["app_003_group"].app_config_dir == "/work/app_003_group"
+        assert statuses["app_005_group"].timestamp == datetime(2025, 1, 1) + timedelta(
+            minutes=9985
+        )
+        assert len(statements) == 1
+
+
+def test_app_config_dir_name_is_backfilled(tmp_path) -> None:
+    """Databases created before app_config_dir_name get the column on open."""
+    db_path = tmp_path / "deployments.db"
+    db = DeploymentDatabase(db_path)
+    with db.engine.begin() as conn:
+        conn.execute(text("DROP INDEX idx_deployment_cluster_config_dir_name"))
+        conn.execute(text("ALTER TABLE deployments DROP COLUMN app_config_dir_name"))
+        conn.execute(
+            text(
+                "INSERT INTO deployments (deployment_id, timestamp, cluster, namespace, "
+                "app_config_dir, config_file_path, command, status, config_snapshot) "
+                "VALUES ('old', '2025-01-01 00:00:00', 'prod', 'infra', "
+                "'/old/location/a000_infra', 'config.yaml', 'deploy', 'success', '{}')"
+            )
+        )
+
+    statuses = DeploymentDatabase(db_path).get_latest_statuses_by_dir_name(
+        "prod", ["a000_infra"]
+    )
+
+    assert statuses["a000_infra"].namespace == "infra"
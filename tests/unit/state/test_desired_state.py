@@ -0,0 +1,235 @@
+"""Tests for desired-state digests and `deploy --skip-unchanged`."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sbkube.commands.deploy import deploy_helm_app, deploy_yaml_app
+from sbkube.models.config_model import HelmApp, YamlApp
+from sbkube.state.desired_state import (
+    AppDesiredState,
+    DesiredStateStore,
+    compute_yaml_digest,
+    parse_helm_revision,
+)
+from sbkube.utils.output_manager import OutputManager
+
+HELM_OUTPUT = "Release \"nginx\" has been upgraded.\nSTATUS: deployed\nREVISION: {}\n"
+
+
+@pytest.fixture(autouse=True)
+def _helm_version():
+    with patch("sbkube.utils.render_cache.get_helm_version", return_value="v3.15.0"):
+        yield
+
+
+def _release(revision: int, status: str = "deployed") -> list[dict]:
+    return [
+        {"name": "nginx", "namespace": "web", "status": status, "revision": str(revision)}
+    ]
+
+
+def _state(tmp_path: Path, digest: str = "sha256:a", app_type: str = "helm") -> AppDesiredState:
+    return AppDesiredState(
+        app_name="nginx",
+        app_type=app_type,
+        app_config_dir=tmp_path / "app_100_web",
+        digest=digest,
+        namespace="web",
+        context="prod",
+        release_name="nginx",
+    )
+
+
+class TestDigests:
+    """digest 계산."""
+
+    def test_yaml_digest_tracks_content_and_flags(self) -> None:
+        docs = [("deploy.yaml", "kind: Deployment\n")]
+        cmd = ["kubectl", "apply", "-f", "-", "--namespace", "web"]
+
+        assert compute_yaml_digest(docs, cmd) == compute_yaml_digest(list(docs), list(cmd))
+        assert compute_yaml_digest(docs, cmd) != compute_yaml_digest(
+            [("deploy.yaml", "kind: Service\n")], cmd
+        )
+        assert compute_yaml_digest(docs, cmd) != compute_yaml_digest(
+            docs, [*cmd, "--server-side"]
+        )
+
+    def test_parse_helm_revision(self) -> None:
+        assert parse_helm_revision(HELM_OUTPUT.format(7)) == 7
+        assert parse_helm_revision("no revision here") is None
+
+
+class TestDesiredStateStore:
+    """마지막 성공 배포 digest 비교."""
+
+    @patch("sbkube.utils.helm_util.get_all_helm_releases")
+    def test_unchanged_after_successful_record(self, mock_releases, tmp_path: Path) -> None:
+        mock_releases.return_value = _release(3)
+        DesiredStateStore(tmp_path / "state.db").record(
+            _state(tmp_path), success=True, duration=12.5, helm_revision=3
+        )
+
+        store = DesiredStateStore(tmp_path / "state.db")
+        assert store.is_unchanged(_state(tmp_path))
+        assert not store.is_unchanged(_state(tmp_path, digest="sha256:b"))
+        assert store.skipped == ["nginx"]
+        assert store.time_saved == pytest.approx(12.5)
+        mock_releases.assert_called_once()
+
+    @patch("sbkube.utils.helm_util.get_all_helm_releases")
+    def test_live_revision_mismatch_forces_deploy(self, mock_releases, tmp_path: Path) -> None:
+        DesiredStateStore(tmp_path / "state.db").record(
+            _state(tmp_path), success=True, duration=1.0, helm_revision=3
+        )
+
+        mock_releases.return_value = _release(4)  # 수동 helm upgrade
+        assert not DesiredStateStore(tmp_path / "state.db").is_unchanged(_state(tmp_path))
+
+        mock_releases.return_value = _release(3, status="failed")
+        assert not DesiredStateStore(tmp_path / "state.db").is_unchanged(_state(tmp_path))
+
+    def test_failed_attempt_hides_older_success(self, tmp_path: Path) -> None:
+        state = _state(tmp_path, app_type="yaml")
+        DesiredStateStore(tmp_path / "state.db").record(state, success=True, duration=1.0)
+        DesiredStateStore(tmp_path / "state.db").record(state, success=False, duration=1.0)
+
+        assert not DesiredStateStore(tmp_path / "state.db").is_unchanged(state)
+
+    def test_apps_of_a_run_share_one_deployment(self, tmp_path: Path) -> None:
+        store = DesiredStateStore(tmp_path / "state.db")
+        store.register_app_group(
+            tmp_path / "app_100_web", tmp_path / "app_100_web" / "sbkube.yaml", {"apps": {}}
+        )
+        first = _state(tmp_path, app_type="yaml")
+        second = _state(tmp_path, app_type="yaml")
+        second.app_name = "redis"
+        store.record(first, success=True, duration=1.0)
+        store.record(second, success=False, duration=1.0, error_message="boom")
+
+        deployments = store.db.list_deployments(limit=10)
+        assert len(deployments) == 1
+        assert deployments[0].status == "partially_failed"
+        assert set(store.db.get_latest_app_metadata("prod", str(first.app_config_dir))) == {
+            "nginx"
+        }
+
+
+class TestSkipUnchangedDeploy:
+    """deploy_helm_app / deploy_yaml_app 연동."""
+
+    def _deploy_helm(
+        self, tmp_path: Path, store: DesiredStateStore, skip_unchanged: bool = True
+    ) -> bool:
+        build_dir = tmp_path / "build"
+        (build_dir / "nginx").mkdir(parents=True, exist_ok=True)
+        (build_dir / "nginx" / "Chart.yaml").write_text("name: nginx\nversion: 1.0.0")
+        return deploy_helm_app(
+            app_name="nginx",
+            app=HelmApp(type="helm", chart="bitnami/nginx", namespace="web", create_namespace=True),
+            base_dir=tmp_path,
+            charts_dir=tmp_path / "charts",
+            build_dir=build_dir,
+            app_config_dir=tmp_path / "app_100_web",
+            output=MagicMock(spec=OutputManager),
+            context="prod",
+            desired_state=store,
+            skip_unchanged=skip_unchanged,
+        )
+
+    @patch("sbkube.utils.helm_util.get_all_helm_releases")
+    @patch("sbkube.commands.deploy.run_command")
+    def test_helm_app_skipped_when_unchanged(
+        self, mock_run, mock_releases, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = (0, HELM_OUTPUT.format(1), "")
+        mock_releases.return_value = _release(1)
+
+        # --skip-unchanged 없이 배포해도 digest는 기록됨
+        assert self._deploy_helm(
+            tmp_path, DesiredStateStore(tmp_path / "state.db"), skip_unchanged=False
+        )
+        assert mock_run.call_count == 1
+
+        store = DesiredStateStore(tmp_path / "state.db")
+        assert self._deploy_helm(tmp_path, store)
+        assert mock_run.call_count == 1
+        assert store.skipped == ["nginx"]
+
+        # 차트 변경 → 다시 배포
+        (tmp_path / "build" / "nginx" / "values.yaml").write_text("replicas: 2\n")
+        store = DesiredStateStore(tmp_path / "state.db")
+        assert self._deploy_helm(tmp_path, store)
+        assert mock_run.call_count == 2
+        assert store.skipped == []
+
+    @patch("sbkube.utils.common.run_command")
+    @patch("sbkube.commands.deploy.run_command")
+    def test_yaml_app_skipped_when_unchanged(
+        self, mock_run, mock_live_run, tmp_path: Path
+    ) -> None:
+        app_dir = tmp_path / "app_100_web"
+        app_dir.mkdir()
+        manifest = app_dir / "deploy.yaml"
+        manifest.write_text("apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: web\n")
+        mock_run.return_value = (0, "configmap/web configured", "")
+        mock_live_run.return_value = (0, "configmap/web\n", "")
+
+        def deploy(store: DesiredStateStore, skip_unchanged: bool = True) -> bool:
+            return deploy_yaml_app(
+                app_name="web",
+                app=YamlApp(type="yaml", manifests=["deploy.yaml"], namespace="web"),
+                base_dir=tmp_path,
+                app_config_dir=app_dir,
+                output=MagicMock(spec=OutputManager),
+                context="prod",
+                desired_state=store,
+                skip_unchanged=skip_unchanged,
+            )
+
+        assert deploy(DesiredStateStore(tmp_path / "state.db"), skip_unchanged=False)
+        assert deploy(DesiredStateStore(tmp_path / "state.db"))
+        assert mock_run.call_count == 1
+        live_cmd = mock_live_run.call_args.args[0]
+        assert live_cmd[:3] == ["kubectl", "get", "configmap/web"]
+        assert live_cmd[live_cmd.index("--namespace") + 1] == "web"
+
+        manifest.write_text("apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: web2\n")
+        assert deploy(DesiredStateStore(tmp_path / "state.db"))
+        assert mock_run.call_count == 2
+
+    @patch("sbkube.utils.common.run_command")
+    @patch("sbkube.commands.deploy.run_command")
+    def test_yaml_app_redeployed_when_resources_deleted(
+        self, mock_run, mock_live_run, tmp_path: Path
+    ) -> None:
+        app_dir = tmp_path / "app_100_web"
+        app_dir.mkdir()
+        (app_dir / "deploy.yaml").write_text(
+            "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: web\n  namespace: other\n"
+        )
+        mock_run.return_value = (0, "configmap/web created", "")
+        # sbkube delete 등으로 리소스가 사라짐
+        mock_live_run.return_value = (0, "", "")
+
+        def deploy(store: DesiredStateStore) -> bool:
+            return deploy_yaml_app(
+                app_name="web",
+                app=YamlApp(type="yaml", manifests=["deploy.yaml"], namespace="web"),
+                base_dir=tmp_path,
+                app_config_dir=app_dir,
+                output=MagicMock(spec=OutputManager),
+                desired_state=store,
+                skip_unchanged=True,
+            )
+
+        assert deploy(DesiredStateStore(tmp_path / "state.db"))
+        store = DesiredStateStore(tmp_path / "state.db")
+        assert deploy(store)
+
+        assert mock_run.call_count == 2
+        assert store.skipped == []
+        live_cmd = mock_live_run.call_args.args[0]
+        assert live_cmd[live_cmd.index("--namespace") + 1] == "other"
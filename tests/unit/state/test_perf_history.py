@@ -0,0 +1,213 @@
+"""Tests for persistent perf history and regression detection.
+
+Tests verify:
+- Span trees are aggregated into per-app stage/tool samples
+- Samples round-trip through the state database, limited to the last N runs
+- p50/p95 and regression flags for prepare/deploy stages
+- Pruning a deployment keeps its perf samples
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from sbkube.models.deployment_state import DeploymentCreate, PerfSampleInfo
+from sbkube.state.database import DeploymentDatabase
+from sbkube.state.perf_history import (
+    analyze_perf_history,
+    collect_samples,
+    record_perf_run,
+)
+from sbkube.utils import perf
+from sbkube.utils.perf import PerfRecorder
+
+
+@pytest.fixture
+def db(tmp_path) -> DeploymentDatabase:
+    return DeploymentDatabase(tmp_path / "deployments.db")
+
+
+@pytest.fixture
+def recorder(monkeypatch, tmp_path) -> PerfRecorder:
+    rec = PerfRecorder()
+    monkeypatch.setattr(rec, "_patch_subprocess_run", lambda: None)
+    monkeypatch.setattr(perf, "_perf_recorder", rec)
+    rec.enable(output_format="json", log_dir=tmp_path / "perf")
+    return rec
+
+
+def _sample(run: int, app: str, stage: str, seconds: float) -> PerfSampleInfo:
+    return PerfSampleInfo(
+        run_id=f"run-{run}",
+        timestamp=datetime(2025, 1, 1, tzinfo=UTC),
+        app_config_dir="/work/app_000",
+        app_name=app,
+        category="stage",
+        name=stage,
+        duration_seconds=seconds,
+    )
+
+
+class TestCollectSamples:
+    """Span tree → sample 집계 테스트."""
+
+    def test_stage_and_tool_samples_per_app(self, recorder) -> None:
+        with perf.perf_timer("apply.run", app_group="app_000"):
+            root = perf.current_span_id()
+            with perf.perf_timer("app", app="redis"):
+                with perf.perf_timer("stage.deploy", app="redis"):
+                    recorder.record("subprocess", 0.25, tool="helm")
+                    recorder.record("subprocess", 0.25, tool="helm")
+
+        samples = collect_samples(recorder.subtree(root), root)
+        by_key = {(s["app_name"], s["category"], s["name"]): s for s in samples}
+
+        assert by_key[("redis", "tool", "helm")]["calls"] == 2
+        assert by_key[("redis", "tool", "helm")]["duration_seconds"] == pytest.approx(0.5)
+        assert ("redis", "stage", "deploy") in by_key
+        assert (None, "run", "total") in by_key
+
+    def test_record_perf_run_stores_samples(self, recorder, db) -> None:
+        with record_perf_run("/work/app_000", db_path=db.db_path):
+            with perf.perf_timer("stage.prepare", app="redis"):
+                pass
+
+        samples = db.get_perf_samples()
+        assert {(s.app_name, s.name) for s in samples} == {
+            ("redis", "prepare"),
+            (None, "total"),
+        }
+
+    def test_record_perf_run_disabled_for_dry_run(self, recorder, db) -> None:
+        with record_perf_run("/work/app_000", enabled=False, db_path=db.db_path):
+            pass
+
+        assert db.get_perf_samples() == []
+
+
+class TestPerfSampleStorage:
+    """DeploymentDatabase perf sample 저장/조회 테스트."""
+
+    def _store(self, db: DeploymentDatabase, run: int, app_config_dir: str) -> None:
+        db.add_perf_samples(
+            run_id=f"run-{run}",
+            command="apply",
+            app_config_dir=app_config_dir,
+            samples=[
+                {
+                    "app_name": "redis",
+                    "category": "stage",
+                    "name": "deploy",
+                    "duration_seconds": float(run),
+                    "calls": 1,
+                }
+            ],
+        )
+
+    def test_last_runs_oldest_first(self, db) -> None:
+        for run in range(5):
+            self._store(db, run, "/work/app_000")
+
+        samples = db.get_perf_samples(last_runs=3)
+
+        assert [s.run_id for s in samples] == ["run-2", "run-3", "run-4"]
+
+    def test_filter_by_app_group_name(self, db) -> None:
+        self._store(db, 1, "/work/app_000")
+        self._store(db, 2, "/other/app_100")
+
+        samples = db.get_perf_samples(app_group="app_100")
+
+        assert [s.run_id for s in samples] == ["run-2"]
+
+    def test_app_group_duration_estimates(self, db) -> None:
+        for run, seconds in enumerate([10.0, 30.0, 20.0]):
+            db.add_perf_samples(
+                run_id=f"run-{run}",
+                command="apply",
+                app_config_dir="/work/app_000",
+                samples=[
+                    {
+                        "app_name": None,
+                        "category": "run",
+                        "name": "total",
+                        "duration_seconds": seconds,
+                        "calls": 1,
+                    }
+                ],
+            )
+
+        estimates = db.get_app_group_duration_estimates(["app_000", "app_100"])
+
+        assert estimates == {"app_000": 20.0}
+
+    def test_linked_deployment_survives_prune(self, db) -> None:
+        started_at = datetime(2000, 1, 1)
+        db.create_deployment(
+            DeploymentCreate(
+                deployment_id="dep-001",
+                cluster="prod",
+                namespace="default",
+                app_config_dir="/work/app_000",
+                config_file_path="config.yaml",
+                command="apply",
+                config_snapshot={"apps": {}},
+            )
+        )
+        db.add_perf_samples(
+            run_id="run-1",
+            command="apply",
+            app_config_dir="/work/app_000",
+            samples=[
+                {
+                    "app_name": None,
+                    "category": "run",
+                    "name": "total",
+                    "duration_seconds": 1.0,
+                    "calls": 1,
+                }
+            ],
+            started_at=started_at,
+        )
+
+        assert db.prune_deployments(keep_per_group=0) == 1
+        assert len(db.get_perf_samples()) == 1
+
+
+class TestAnalyzePerfHistory:
+    """p50/p95 및 regression 판정 테스트."""
+
+    def test_percentiles(self) -> None:
+        samples = [_sample(i, "redis", "build", float(i)) for i in range(1, 11)]
+
+        (stat,) = analyze_perf_history(samples)
+
+        assert stat.runs == 10
+        assert stat.p50 == pytest.approx(5.5)
+        assert stat.p95 == pytest.approx(9.55)
+        assert stat.latest == 10.0
+
+    def test_flags_deploy_regression(self) -> None:
+        durations = [1.0, 1.0, 1.1, 0.9, 1.0, 2.0, 2.1, 1.9]
+        samples = [_sample(i, "redis", "deploy", d) for i, d in enumerate(durations)]
+
+        (stat,) = analyze_perf_history(samples, threshold=0.2)
+
+        assert stat.regressed
+        assert stat.change == pytest.approx(1.0)
+
+    def test_build_stage_not_flagged(self) -> None:
+        durations = [1.0, 1.0, 1.0, 3.0, 3.0, 3.0]
+        samples = [_sample(i, "redis", "build", d) for i, d in enumerate(durations)]
+
+        (stat,) = analyze_perf_history(samples)
+
+        assert not stat.regressed
+
+    def test_insufficient_history_has_no_baseline(self) -> None:
+        samples = [_sample(i, "redis", "deploy", 1.0) for i in range(2)]
+
+        (stat,) = analyze_perf_history(samples)
+
+        assert stat.baseline_p50 is None
+        assert not stat.regressed
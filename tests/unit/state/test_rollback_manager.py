@@ -0,0 +1,231 @@
+"""Tests for the rollback planner and parallel RollbackManager execution."""
+
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from sbkube.exceptions import RollbackError
+from sbkube.models.deployment_state import (
+    DeploymentDetail,
+    DeploymentStatus,
+    ResourceAction,
+    ResourceInfo,
+    RollbackRequest,
+)
+from sbkube.state.rollback import RollbackManager, plan_rollback
+
+
+def _app(name: str, app_type: str = "yaml", depends_on: list[str] | None = None) -> dict:
+    return {
+        "id": name,
+        "name": name,
+        "type": app_type,
+        "config": {"depends_on": depends_on} if depends_on else {},
+        "rollback_info": {},
+    }
+
+
+def _deployment(apps: list[dict], resources: list[ResourceInfo] | None = None) -> DeploymentDetail:
+    return DeploymentDetail(
+        deployment_id="dep-1",
+        timestamp=datetime(2026, 1, 1),
+        cluster="prod",
+        namespace="default",
+        app_config_dir="/apps",
+        status=DeploymentStatus.SUCCESS,
+        config_snapshot={},
+        apps=apps,
+        resources=resources or [],
+    )
+
+
+# db ← api ← web, metrics 독립
+STACK = [
+    _app("db"),
+    _app("api", depends_on=["db"]),
+    _app("web", depends_on=["api"]),
+    _app("metrics"),
+]
+
+
+class TestPlanRollback:
+    """롤백 순서 계획."""
+
+    def test_dependents_roll_back_first(self) -> None:
+        plan = plan_rollback(_deployment(STACK))
+
+        assert plan.dependencies == {
+            "db": ["api", "web"],
+            "api": ["web"],
+            "web": [],
+            "metrics": [],
+        }
+        assert plan.waves == [["web", "metrics"], ["api"], ["db"]]
+
+    def test_order_follows_apps_not_rolled_back(self) -> None:
+        plan = plan_rollback(_deployment(STACK), ["db", "web"])
+
+        assert plan.app_names == ["db", "web"]
+        assert plan.dependencies == {"db": ["web"], "web": []}
+
+    def test_depends_on_from_config_snapshot(self) -> None:
+        deployment = _deployment([_app("db"), _app("api")])
+        deployment.config_snapshot = {"apps": {"api": {"depends_on": ["db"]}}}
+
+        assert plan_rollback(deployment).waves == [["api"], ["db"]]
+
+
+class TestExecuteRollback:
+    """병렬 실행, 실패 처리, 앱별 소요 시간."""
+
+    @pytest.fixture
+    def manager(self, tmp_path: Path) -> RollbackManager:
+        return RollbackManager(db_path=tmp_path / "state.db", max_workers=4)
+
+    def test_parallel_reverse_dependency_order(self, manager: RollbackManager) -> None:
+        spans: dict[str, tuple[float, float]] = {}
+        lock = threading.Lock()
+
+        def fake_rollback_app(app, deployment):
+            started = time.perf_counter()
+            time.sleep(0.2)
+            with lock:
+                spans[app["name"]] = (started, time.perf_counter())
+            return {"app": app["name"], "type": "yaml", "success": True, "actions": []}
+
+        with patch.object(manager, "_rollback_app", side_effect=fake_rollback_app):
+            results = manager._execute_rollback(
+                _deployment(STACK), None, RollbackRequest(deployment_id="dep-1")
+            )
+
+        assert results["success"]
+        assert spans["web"][1] <= spans["api"][0]
+        assert spans["api"][1] <= spans["db"][0]
+        # 독립 앱은 web과 동시에 실행
+        assert spans["metrics"][0] < spans["web"][1]
+        assert results["duration_seconds"] < 0.75
+        assert all(r["duration_seconds"] >= 0.2 for r in results["rollbacks"])
+
+    def test_failure_stops_and_raises(self, manager: RollbackManager) -> None:
+        calls: list[str] = []
+
+        def fake_rollback_app(app, deployment):
+            calls.append(app["name"])
+            if app["name"] == "web":
+                raise RollbackError("helm rollback failed")
+            return {"app": app["name"], "type": "yaml", "success": True, "actions": []}
+
+        with (
+            patch.object(manager, "_rollback_app", side_effect=fake_rollback_app),
+            pytest.raises(RollbackError, match="web"),
+        ):
+            manager._execute_rollback(
+                _deployment(STACK), None, RollbackRequest(deployment_id="dep-1")
+            )
+
+        assert "api" not in calls
+        assert "db" not in calls
+
+    def test_force_continues_after_failure(self, manager: RollbackManager) -> None:
+        def fake_rollback_app(app, deployment):
+            if app["name"] == "web":
+                raise RollbackError("helm rollback failed")
+            return {"app": app["name"], "type": "yaml", "success": True, "actions": []}
+
+        with patch.object(manager, "_rollback_app", side_effect=fake_rollback_app):
+            results = manager._execute_rollback(
+                _deployment(STACK),
+                None,
+                RollbackRequest(deployment_id="dep-1", force=True),
+            )
+
+        assert not results["success"]
+        assert [e["app"] for e in results["errors"]] == ["web"]
+        assert {r["app"] for r in results["rollbacks"]} == {"api", "db", "metrics"}
+
+
+class TestBatchedResources:
+    """앱 리소스는 kubectl 호출 한 번(삭제는 namespace별 한 번)으로 처리."""
+
+    def test_restore_and_delete_batched(self, tmp_path: Path) -> None:
+        def resource(name: str, action: ResourceAction, namespace: str = "web") -> ResourceInfo:
+            return ResourceInfo(
+                api_version="apps/v1" if name.startswith("deploy") else "v1",
+                kind="Deployment" if name.startswith("deploy") else "ConfigMap",
+                name=name,
+                namespace=namespace,
+                action=action,
+                previous_state=(
+                    {"kind": "ConfigMap", "metadata": {"name": name}}
+                    if action != ResourceAction.CREATE
+                    else None
+                ),
+                source_file="web/manifests.yaml",
+            )
+
+        deployment = _deployment(
+            [_app("web")],
+            [
+                resource("cm-a", ResourceAction.UPDATE),
+                resource("cm-b", ResourceAction.DELETE),
+                resource("deploy-new", ResourceAction.CREATE),
+                resource("cm-new", ResourceAction.CREATE, namespace="jobs"),
+            ],
+        )
+        manager = RollbackManager(db_path=tmp_path / "state.db")
+
+        with patch("sbkube.state.rollback.run_command", return_value=(0, "", "")) as run:
+            result = manager._rollback_app(deployment.apps[0], deployment)
+
+        assert result["success"]
+        assert [action["type"] for action in result["actions"]] == [
+            "restore",
+            "recreate",
+            "delete",
+            "delete",
+        ]
+        assert set(result["step_durations"]) == {"restore", "delete"}
+
+        apply_call, *delete_calls = run.call_args_list
+        assert apply_call.args[0] == ["kubectl", "apply", "-f", "-"]
+        restored = list(yaml.safe_load_all(apply_call.kwargs["input"]))
+        assert [doc["metadata"]["name"] for doc in restored] == ["cm-a", "cm-b"]
+        assert [c.args[0] for c in delete_calls] == [
+            [
+                "kubectl",
+                "delete",
+                "deployment.v1.apps/deploy-new",
+                "--ignore-not-found",
+                "-n",
+                "web",
+            ],
+            ["kubectl", "delete", "configmap/cm-new", "--ignore-not-found", "-n", "jobs"],
+        ]
+
+    def test_failed_apply_marks_resources(self, tmp_path: Path) -> None:
+        deployment = _deployment(
+            [_app("web")],
+            [
+                ResourceInfo(
+                    api_version="v1",
+                    kind="ConfigMap",
+                    name="cm-a",
+                    action=ResourceAction.UPDATE,
+                    previous_state={"kind": "ConfigMap", "metadata": {"name": "cm-a"}},
+                    source_file="web/cm.yaml",
+                )
+            ],
+        )
+        manager = RollbackManager(db_path=tmp_path / "state.db")
+
+        with patch("sbkube.state.rollback.run_command", return_value=(1, "", "forbidden")):
+            result = manager._rollback_app(deployment.apps[0], deployment)
+
+        assert not result["success"]
+        assert result["actions"][0]["type"] == "error"
+        assert "forbidden" in result["actions"][0]["error"]
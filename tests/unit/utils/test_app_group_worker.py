@@ -0,0 +1,117 @@
+"""Tests for process-isolated app group applies (workspace --isolation process)."""
+
+import queue
+from unittest.mock import patch
+
+from sbkube.state.perf_history import deferred_perf_runs, store_perf_runs
+from sbkube.utils.app_group_worker import (
+    AppGroupJob,
+    AppGroupProcessPool,
+    run_app_group_job,
+)
+from sbkube.utils.output_manager import OutputManager
+
+
+def _drain(events: queue.Queue) -> list[dict]:
+    drained = []
+    while not events.empty():
+        drained.append(events.get_nowait())
+    return drained
+
+
+class TestRunAppGroupJob:
+    """Worker 측 app group 실행 테스트 (in-process)."""
+
+    def test_streams_output_and_reports_success(self, tmp_path) -> None:
+        events: queue.Queue = queue.Queue()
+        job = AppGroupJob(base_dir=str(tmp_path), app_group="app_100", source="sources.yaml")
+
+        with patch("sbkube.commands.apply.ApplyCommand") as apply_cls:
+
+            def execute() -> bool:
+                print("deploying redis")
+                print("done", end="")
+                return True
+
+            apply_cls.return_value.execute.side_effect = execute
+            report = run_app_group_job(job, events)
+
+        assert report.success
+        assert report.error is None
+        kinds = [(e["event"], e.get("line")) for e in _drain(events)]
+        assert kinds == [
+            ("started", None),
+            ("output", "deploying redis"),
+            ("output", "done"),
+            ("finished", None),
+        ]
+        assert apply_cls.call_args.kwargs["app_config_dir"] == "app_100"
+
+    def test_exception_reported_as_failure(self, tmp_path) -> None:
+        events: queue.Queue = queue.Queue()
+        job = AppGroupJob(base_dir=str(tmp_path), app_group="app_100", source="sources.yaml")
+
+        with patch("sbkube.commands.apply.ApplyCommand") as apply_cls:
+            apply_cls.return_value.execute.side_effect = RuntimeError("helm missing")
+            report = run_app_group_job(job, events)
+
+        assert not report.success
+        assert report.error == "helm missing"
+        assert _drain(events)[-1]["success"] is False
+
+
+class TestDeferredPerfRuns:
+    """Worker perf history 수집 후 부모에서 일괄 저장."""
+
+    def test_runs_collected_then_stored_in_one_call(self, tmp_path) -> None:
+        from sbkube.state import perf_history
+        from sbkube.state.database import DeploymentDatabase
+
+        db_path = tmp_path / "deployments.db"
+        with deferred_perf_runs() as runs:
+            for group in ("app_100", "app_200"):
+                perf_history._store_run(
+                    [
+                        {
+                            "app_name": None,
+                            "category": "run",
+                            "name": "total",
+                            "duration_seconds": 1.0,
+                            "calls": 1,
+                        }
+                    ],
+                    app_config_dir=f"/work/{group}",
+                    command="apply",
+                    started_at=None,
+                    db_path=db_path,
+                )
+
+        db = DeploymentDatabase(db_path)
+        assert len(runs) == 2
+        assert db.get_perf_samples() == []
+
+        store_perf_runs(runs, db_path=db_path)
+
+        assert {s.app_config_dir for s in db.get_perf_samples()} == {
+            "/work/app_100",
+            "/work/app_200",
+        }
+
+
+class TestAppGroupProcessPool:
+    """실제 spawn worker 프로세스 테스트."""
+
+    def test_failed_app_group_in_worker(self, tmp_path) -> None:
+        output = OutputManager(format_type="json")
+        job = AppGroupJob(
+            base_dir=str(tmp_path), app_group="missing", source="sources.yaml"
+        )
+
+        with AppGroupProcessPool(max_workers=1, output=output) as pool:
+            report = pool.apply(job)
+            pool.print_report(["missing"])
+
+        assert not report.success
+        assert report.pid is not None
+        messages = [e for e in output.events if e.get("app_group") == "missing"]
+        assert messages
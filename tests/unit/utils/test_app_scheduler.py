@@ -0,0 +1,174 @@
+"""Tests for AppScheduler (depends_on DAG scheduling)."""
+
+import threading
+import time
+
+import pytest
+
+from sbkube.utils.app_scheduler import AppScheduler, AppTaskStatus
+
+
+class TestAppSchedulerInit:
+    """AppScheduler 초기화 테스트."""
+
+    def test_invalid_max_workers(self) -> None:
+        """max_workers < 1 이면 ValueError."""
+        with pytest.raises(ValueError, match="max_workers"):
+            AppScheduler({"a": []}, max_workers=0)
+
+    def test_cycle_detected(self) -> None:
+        """순환 의존성 감지."""
+        with pytest.raises(ValueError, match="Circular dependency"):
+            AppScheduler({"a": ["b"], "b": ["a"], "c": []})
+
+    def test_unknown_dependency_ignored(self) -> None:
+        """스케줄 대상이 아닌 의존성은 충족된 것으로 간주."""
+        scheduler = AppScheduler({"a": ["disabled-app"]})
+        result = scheduler.run(lambda name: None)
+
+        assert result.succeeded == ["a"]
+
+
+class TestAppSchedulerRun:
+    """AppScheduler 실행 테스트."""
+
+    def test_dependencies_respected(self) -> None:
+        """선행 앱이 끝난 뒤에만 후속 앱 시작."""
+        finished: list[str] = []
+        lock = threading.Lock()
+        violations: list[str] = []
+        deps = {"db": [], "cache": [], "api": ["db", "cache"], "web": ["api"]}
+
+        def task(name: str) -> None:
+            with lock:
+                for dep in deps[name]:
+                    if dep not in finished:
+                        violations.append(f"{name} started before {dep}")
+            time.sleep(0.01)
+            with lock:
+                finished.append(name)
+
+        result = AppScheduler(deps, max_workers=4).run(task)
+
+        assert violations == []
+        assert result.success
+        assert result.completion_order[-2:] == ["api", "web"]
+
+    def test_independent_apps_run_concurrently(self) -> None:
+        """독립 앱은 동시에 실행되며 max_workers를 넘지 않음."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def task(name: str) -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        deps = {f"app{i}": [] for i in range(6)}
+        result = AppScheduler(deps, max_workers=3).run(task)
+
+        assert result.success
+        assert peak == 3
+
+    def test_failure_skips_only_dependents(self) -> None:
+        """실패 앱의 (전이적) 후속 앱만 skip, 독립 브랜치는 계속."""
+        deps = {
+            "db": [],
+            "api": ["db"],
+            "web": ["api"],
+            "metrics": [],
+            "dashboard": ["metrics"],
+        }
+
+        def task(name: str) -> None:
+            if name == "db":
+                msg = "connection refused"
+                raise RuntimeError(msg)
+
+        completed: list[str] = []
+        result = AppScheduler(deps, max_workers=2).run(
+            task, on_complete=lambda r: completed.append(r.app_name)
+        )
+
+        assert not result.success
+        assert result.failed == ["db"]
+        assert sorted(result.skipped) == ["api", "web"]
+        assert result.results["web"].blocked_by == "db"
+        assert result.results["db"].error == "connection refused"
+        assert sorted(result.succeeded) == ["dashboard", "metrics"]
+        assert sorted(completed) == sorted(deps)
+
+    def test_release_on_failure_runs_dependents(self) -> None:
+        """release_on_failure 앱은 실패해도 후속 앱을 계속 실행."""
+        deps = {"a": [], "b": ["a"], "c": ["b"]}
+
+        result = AppScheduler(deps, release_on_failure=["a"]).run(
+            lambda name: name != "a"
+        )
+
+        assert result.failed == ["a"]
+        assert result.succeeded == ["b", "c"]
+        assert not result.success
+
+    def test_false_return_is_failure(self) -> None:
+        """task가 False를 반환하면 실패로 처리."""
+        result = AppScheduler({"a": [], "b": ["a"]}).run(lambda name: False)
+
+        assert result.results["a"].status == AppTaskStatus.FAILED
+        assert result.results["b"].status == AppTaskStatus.SKIPPED
+
+    def test_ready_apps_follow_given_order(self) -> None:
+        """max_workers=1 이면 order 우선순위대로 실행."""
+        started: list[str] = []
+        deps = {"c": [], "a": [], "b": ["a"]}
+
+        AppScheduler(deps, max_workers=1, order=["a", "b", "c"]).run(started.append)
+
+        assert started == ["a", "b", "c"]
+
+
+class TestAppSchedulerPriority:
+    """Critical path 우선순위 및 stop() 테스트."""
+
+    def test_critical_path_lengths(self) -> None:
+        """자신 + 가장 긴 후속 체인의 weight 합."""
+        scheduler = AppScheduler({"a": [], "b": ["a"], "c": ["a"], "d": ["c"]})
+
+        lengths = scheduler.critical_path_lengths({"a": 1.0, "b": 10.0, "c": 2.0})
+
+        assert lengths == {"a": 11.0, "b": 10.0, "c": 3.0, "d": 1.0}
+
+    def test_longest_remaining_path_starts_first(self) -> None:
+        """weights가 있으면 order보다 critical path가 우선."""
+        started: list[str] = []
+        deps = {"short": [], "long": [], "tail": ["long"]}
+        scheduler = AppScheduler(
+            deps,
+            max_workers=1,
+            order=["short", "long", "tail"],
+            weights={"short": 5.0, "long": 3.0, "tail": 4.0},
+        )
+
+        scheduler.run(started.append)
+
+        assert started == ["long", "short", "tail"]
+
+    def test_stop_skips_not_started(self) -> None:
+        """stop() 이후 새 앱은 시작하지 않고 SKIPPED 처리."""
+        deps = {"a": [], "b": [], "c": []}
+        scheduler = AppScheduler(deps, max_workers=1, order=["a", "b", "c"])
+
+        def on_complete(task_result) -> None:
+            if task_result.app_name == "a":
+                scheduler.stop("a")
+
+        result = scheduler.run(lambda name: None, on_complete=on_complete)
+
+        assert result.succeeded == ["a"]
+        assert result.skipped == ["b", "c"]
+        assert result.results["b"].blocked_by == "a"
@@ -0,0 +1,320 @@
+"""Tests for the asyncio command runner and concurrent check engines."""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from sbkube.utils.async_runner import (
+    MAX_LINE_BYTES,
+    AsyncCommandRunner,
+    SharedSlots,
+    command_cluster,
+    parse_tool_limits,
+    run_async,
+    stream_async,
+)
+from sbkube.utils.common import run_command
+from sbkube.utils.diagnostic_system import (
+    DiagnosticCheck,
+    DiagnosticEngine,
+    DiagnosticLevel,
+    DiagnosticResult,
+)
+
+SLEEP = ["sleep", "0.5"]
+
+
+class TestCommandCluster:
+    """클러스터 키 추출 테스트."""
+
+    def test_context_flag(self) -> None:
+        assert (
+            command_cluster(["kubectl", "--context", "prod", "get", "pods"])
+            == "--context=prod"
+        )
+
+    def test_kube_context_equals_form(self) -> None:
+        assert command_cluster(["helm", "list", "--kube-context=dev"]) == "--kube-context=dev"
+
+    def test_kubeconfig_env(self) -> None:
+        assert (
+            command_cluster(["kubectl", "get", "ns"], env={"KUBECONFIG": "/k"})
+            == "KUBECONFIG=/k"
+        )
+
+    def test_other_tools_have_no_cluster(self) -> None:
+        assert command_cluster(["git", "clone", "--context", "x"]) is None
+
+
+class TestRunAsync:
+    """run_async 동작 테스트."""
+
+    def test_returns_completed_process(self) -> None:
+        result = asyncio.run(run_async([sys.executable, "-c", "print('hi')"]))
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == "hi"
+
+    def test_input_and_check(self) -> None:
+        script = "import sys; sys.stdout.write(sys.stdin.read()); sys.exit(3)"
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            asyncio.run(run_async([sys.executable, "-c", script], input="abc", check=True))
+
+        assert exc_info.value.returncode == 3
+        assert exc_info.value.stdout == "abc"
+
+    def test_timeout_raises_timeout_expired(self) -> None:
+        start = time.perf_counter()
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(
+                run_async([sys.executable, "-c", "import time; time.sleep(5)"], timeout=0.2)
+            )
+
+        assert time.perf_counter() - start < 3
+
+    def test_missing_binary(self) -> None:
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(run_async(["sbkube-no-such-binary"]))
+
+    def test_tool_semaphore_bounds_concurrency(self) -> None:
+        runner = AsyncCommandRunner(tool_limits={"sleep": 1})
+
+        async def main() -> float:
+            start = time.perf_counter()
+            await asyncio.gather(*(runner.run(SLEEP) for _ in range(3)))
+            return time.perf_counter() - start
+
+        assert asyncio.run(main()) >= 1.4
+
+    def test_limits_are_shared_across_threads_and_loops(self) -> None:
+        """Threads running their own event loops share one tool limit."""
+        runner = AsyncCommandRunner(tool_limits={"sleep": 1})
+        threads = [
+            threading.Thread(target=asyncio.run, args=(runner.run(SLEEP),))
+            for _ in range(3)
+        ]
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert time.perf_counter() - start >= 1.4
+
+    def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        slots = SharedSlots(1)
+
+        async def main() -> None:
+            await slots.acquire()
+            waiter = asyncio.create_task(slots.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            slots.release()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            await asyncio.wait_for(slots.acquire(), timeout=1)
+
+        asyncio.run(main())
+
+    def test_unbounded_tools_run_concurrently(self) -> None:
+        runner = AsyncCommandRunner(default_tool_limit=8)
+
+        async def main() -> float:
+            start = time.perf_counter()
+            await asyncio.gather(*(runner.run(SLEEP) for _ in range(3)))
+            return time.perf_counter() - start
+
+        assert asyncio.run(main()) < 1.4
+
+
+class TestToolLimits:
+    """동시 실행 상한 설정 테스트."""
+
+    def test_parse_tool_limits(self) -> None:
+        assert parse_tool_limits("helm=8, kubectl=16,") == {"helm": 8, "kubectl": 16}
+        with pytest.raises(ValueError, match="helm=0"):
+            parse_tool_limits("helm=0")
+
+    def test_from_env_pins_limits(self) -> None:
+        runner = AsyncCommandRunner.from_env(
+            {"SBKUBE_TOOL_LIMITS": "helm=2", "SBKUBE_CLUSTER_LIMIT": "3"}
+        )
+        runner.ensure_capacity(16)
+
+        assert runner.tool_limits["helm"] == 2
+        assert runner.tool_limits["kubectl"] == 16
+        assert runner.cluster_limit == 3
+
+    def test_ensure_capacity_grows_existing_slots(self) -> None:
+        runner = AsyncCommandRunner(tool_limits={"sleep": 1})
+        runner.tool_limits["helm"] = 1
+        slots = runner._semaphore("tool:helm")
+
+        async def main() -> None:
+            await slots.acquire()
+            waiter = asyncio.create_task(slots.acquire())
+            await asyncio.sleep(0)
+            runner.ensure_capacity(2)
+            await asyncio.wait_for(waiter, timeout=1)
+
+        asyncio.run(main())
+        assert slots.limit == 2
+        assert runner.tool_limits["sleep"] == 1
+
+
+class TestStreamAsync:
+    """stream_async 동작 테스트."""
+
+    def test_callbacks_and_bounded_tail(self) -> None:
+        script = (
+            "import sys\n"
+            "for i in range(1000):\n"
+            "    print(f'out{i}'); print(f'err{i}', file=sys.stderr)\n"
+            "sys.exit(2)"
+        )
+        out_lines: list[str] = []
+        err_lines: list[str] = []
+
+        result = asyncio.run(
+            stream_async(
+                [sys.executable, "-c", script],
+                on_stdout=out_lines.append,
+                on_stderr=err_lines.append,
+                tail_lines=3,
+            )
+        )
+
+        assert result.returncode == 2
+        assert len(out_lines) == len(err_lines) == 1000
+        assert out_lines[:2] == ["out0", "out1"]
+        assert result.stdout == "out997\nout998\nout999"
+        assert result.stderr == "err997\nerr998\nerr999"
+
+    def test_stdout_file_and_input(self, tmp_path) -> None:
+        target = tmp_path / "rendered.yaml"
+        script = "import sys; sys.stdout.write(sys.stdin.read())"
+
+        result = asyncio.run(
+            stream_async(
+                [sys.executable, "-c", script], input="a: 1\n---\nb: 2", stdout_file=target
+            )
+        )
+
+        assert result.stdout == ""
+        assert target.read_text() == "a: 1\n---\nb: 2"
+
+    def test_overlong_line_is_split(self) -> None:
+        lines: list[str] = []
+        script = f"print('x' * {MAX_LINE_BYTES * 3})"
+
+        asyncio.run(stream_async([sys.executable, "-c", script], on_stdout=lines.append))
+
+        assert "".join(lines) == "x" * MAX_LINE_BYTES * 3
+        assert max(len(line) for line in lines) <= MAX_LINE_BYTES * 2
+
+    def test_timeout_kills_and_keeps_tail(self) -> None:
+        script = "import time; print('started', flush=True); time.sleep(5)"
+
+        start = time.perf_counter()
+        with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+            asyncio.run(stream_async([sys.executable, "-c", script], timeout=0.5))
+
+        assert time.perf_counter() - start < 3
+        assert exc_info.value.output == "started"
+
+
+class TestRunCommandFacade:
+    """run_command (sync facade) 테스트."""
+
+    def test_output_tuple(self) -> None:
+        assert run_command([sys.executable, "-c", "print('ok')"]) == (0, "ok\n", "")
+
+    def test_timeout(self) -> None:
+        code, _, stderr = run_command(
+            [sys.executable, "-c", "import time; time.sleep(5)"], timeout=0.2
+        )
+
+        assert code == -1
+        assert "Timeout expired" in stderr
+
+    def test_threaded_callers_share_default_limits(self, monkeypatch) -> None:
+        """run_command starts a new loop per call; the tool limit still applies."""
+        monkeypatch.setattr(
+            "sbkube.utils.async_runner._default_runner",
+            AsyncCommandRunner(tool_limits={"sleep": 1}),
+        )
+        threads = [threading.Thread(target=run_command, args=(SLEEP,)) for _ in range(3)]
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert time.perf_counter() - start >= 1.4
+
+    def test_input_with_subprocess_kwargs(self) -> None:
+        """input reaches subprocess.run when extra kwargs bypass the async runner."""
+        code, stdout, _ = run_command(
+            [sys.executable, "-c", "import sys; print(sys.stdin.read())"],
+            input="piped",
+            start_new_session=False,
+        )
+
+        assert (code, stdout) == (0, "piped\n")
+
+    def test_inside_running_loop(self) -> None:
+        async def main() -> tuple[int, str, str]:
+            return run_command([sys.executable, "-c", "print('nested')"])
+
+        assert asyncio.run(main())[1] == "nested\n"
+
+    def test_streaming_kwargs(self) -> None:
+        lines: list[str] = []
+        code, stdout, stderr = run_command(
+            [sys.executable, "-c", "import sys; print('a'); sys.exit('boom')"],
+            on_stdout_line=lines.append,
+        )
+
+        assert (code, stdout, stderr) == (1, "a", "boom")
+        assert lines == ["a"]
+
+    def test_streaming_timeout(self, tmp_path) -> None:
+        code, _, stderr = run_command(
+            [sys.executable, "-c", "import time; time.sleep(5)"],
+            timeout=0.2,
+            stdout_file=tmp_path / "out",
+        )
+
+        assert code == -1
+        assert "Timeout expired" in stderr
+
+
+class _SleepCheck(DiagnosticCheck):
+    def __init__(self, name: str) -> None:
+        super().__init__(name, name)
+
+    async def run(self) -> DiagnosticResult:
+        await asyncio.sleep(0.3)
+        return self.create_result(DiagnosticLevel.SUCCESS, self.name)
+
+
+class TestDiagnosticEngineConcurrency:
+    """DiagnosticEngine 동시 실행 테스트."""
+
+    def test_checks_run_concurrently_in_order(self) -> None:
+        engine = DiagnosticEngine()
+        for name in ("a", "b", "c"):
+            engine.register_check(_SleepCheck(name))
+
+        start = time.perf_counter()
+        results = asyncio.run(engine.run_all_checks(show_progress=False))
+
+        assert time.perf_counter() - start < 0.8
+        assert [r.message for r in results] == ["a", "b", "c"]
@@ -0,0 +1,213 @@
+"""Unit tests for the global content-addressed chart cache.
+
+Tests verify:
+- Stored charts are restored by reflink/copy without a network pull
+- Restored charts do not share inodes with the cache
+- Corrupted entries are detected by digest and evicted
+- Unchanged entries are validated by stat signature without re-hashing
+- LRU/size based pruning
+- prepare_helm_app uses the cache on a second app group
+"""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sbkube.commands.prepare import prepare_helm_app
+from sbkube.models.config_model import HelmApp
+from sbkube.utils.chart_cache import (
+    ChartCache,
+    compute_tree_digest,
+    get_chart_cache,
+    is_pinned_version,
+    parse_size,
+)
+from sbkube.utils.output_manager import OutputManager
+
+BITNAMI = "https://charts.bitnami.com/bitnami"
+
+
+def _make_chart(path: Path, name: str = "nginx", payload: str = "x") -> Path:
+    (path / "templates").mkdir(parents=True)
+    (path / "Chart.yaml").write_text(f"name: {name}\nversion: 15.0.0\n")
+    (path / "templates" / "deployment.yaml").write_text(payload)
+    return path
+
+
+class TestHelpers:
+    """Test size/version helpers."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("4096", 4096), ("1K", 1024), ("500M", 500 * 1024**2), ("2GiB", 2 * 1024**3)],
+    )
+    def test_parse_size(self, text: str, expected: int) -> None:
+        assert parse_size(text) == expected
+
+    def test_parse_size_invalid(self) -> None:
+        with pytest.raises(ValueError, match="Invalid size"):
+            parse_size("lots")
+
+    @pytest.mark.parametrize(
+        ("version", "pinned"),
+        [("1.2.3", True), ("v0.1.0-rc.1", True), (None, False), ("latest", False),
+         ("^1.2", False), (">=1.0", False), ("1.x", False)],
+    )
+    def test_is_pinned_version(self, version: str | None, pinned: bool) -> None:
+        assert is_pinned_version(version) is pinned
+
+    def test_cache_can_be_disabled(self, monkeypatch) -> None:
+        monkeypatch.setenv("SBKUBE_CHART_CACHE", "0")
+        assert get_chart_cache() is None
+
+
+class TestChartCache:
+    """Test store/lookup/materialize/prune."""
+
+    def test_store_and_materialize(self, tmp_path: Path) -> None:
+        cache = ChartCache(root=tmp_path / "cache")
+        source = _make_chart(tmp_path / "pulled" / "nginx")
+
+        stored = cache.store(BITNAMI, "nginx", "15.0.0", source)
+        entry = cache.lookup(BITNAMI, "nginx", "15.0.0")
+
+        assert stored is not None
+        assert entry is not None
+        assert entry.digest == compute_tree_digest(source)[0]
+        assert entry.file_count == 2
+
+        dest = tmp_path / "group-b" / "charts" / "bitnami" / "nginx-15.0.0"
+        stats = cache.materialize(entry, dest)
+
+        assert (dest / "Chart.yaml").read_text().startswith("name: nginx")
+        assert sum(stats.values()) == 2
+        assert "hardlink" not in stats
+
+    def test_in_place_edit_does_not_leak_into_cache(self, tmp_path: Path) -> None:
+        """Editing a materialized chart must not change the cache or other groups."""
+        cache = ChartCache(root=tmp_path / "cache")
+        source = _make_chart(tmp_path / "group-a" / "charts" / "nginx")
+        cache.store(BITNAMI, "nginx", "15.0.0", source)
+        entry = cache.lookup(BITNAMI, "nginx", "15.0.0")
+        dest_b = tmp_path / "group-b" / "charts" / "nginx"
+        dest_c = tmp_path / "group-c" / "charts" / "nginx"
+        cache.materialize(entry, dest_b)
+        cache.materialize(entry, dest_c)
+
+        cached_file = cache.root / entry.key / "chart" / "Chart.yaml"
+        assert not os.path.samefile(dest_b / "Chart.yaml", cached_file)
+        assert not os.path.samefile(source / "Chart.yaml", cached_file)
+
+        with (dest_b / "Chart.yaml").open("a") as fp:
+            fp.write("# local patch\n")
+        with (source / "Chart.yaml").open("a") as fp:
+            fp.write("# local patch\n")
+
+        assert "local patch" not in cached_file.read_text()
+        assert "local patch" not in (dest_c / "Chart.yaml").read_text()
+        assert cache.lookup(BITNAMI, "nginx", "15.0.0") is not None
+
+    def test_lookup_skips_digest_when_unchanged(self, tmp_path: Path) -> None:
+        cache = ChartCache(root=tmp_path / "cache")
+        cache.store(BITNAMI, "nginx", "15.0.0", _make_chart(tmp_path / "src"))
+
+        with patch("sbkube.utils.chart_cache.compute_tree_digest") as mock_digest:
+            assert cache.lookup(BITNAMI, "nginx", "15.0.0") is not None
+        mock_digest.assert_not_called()
+
+    def test_lookup_rehashes_entries_without_signature(self, tmp_path: Path) -> None:
+        """Entries written before stat signatures existed are verified once."""
+        cache = ChartCache(root=tmp_path / "cache")
+        entry = cache.store(BITNAMI, "nginx", "15.0.0", _make_chart(tmp_path / "src"))
+        entry.stat_signature = ""
+        cache._write_meta(cache.root / entry.key, entry)
+
+        assert cache.lookup(BITNAMI, "nginx", "15.0.0") is not None
+        assert cache._read_meta(cache.root / entry.key).stat_signature
+
+    def test_key_includes_repo_url(self, tmp_path: Path) -> None:
+        cache = ChartCache(root=tmp_path / "cache")
+        cache.store(BITNAMI, "nginx", "15.0.0", _make_chart(tmp_path / "src"))
+
+        assert cache.contains(BITNAMI + "/", "nginx", "15.0.0")
+        assert not cache.contains("https://mirror.example.com", "nginx", "15.0.0")
+        assert cache.lookup(BITNAMI, "nginx", "15.0.1") is None
+
+    def test_corrupted_entry_is_evicted(self, tmp_path: Path) -> None:
+        cache = ChartCache(root=tmp_path / "cache")
+        entry = cache.store(BITNAMI, "nginx", "15.0.0", _make_chart(tmp_path / "src"))
+        assert entry is not None
+
+        cached_file = cache.root / entry.key / "chart" / "templates" / "deployment.yaml"
+        cached_file.unlink()
+        cached_file.write_text("tampered")
+
+        assert cache.lookup(BITNAMI, "nginx", "15.0.0") is None
+        assert not (cache.root / entry.key).exists()
+
+    def test_prune_removes_least_recently_used(self, tmp_path: Path) -> None:
+        cache = ChartCache(root=tmp_path / "cache", max_bytes=0)
+        for i, version in enumerate(["1.0.0", "2.0.0", "3.0.0"]):
+            cache.store(BITNAMI, "nginx", version, _make_chart(tmp_path / version, payload="x" * 100))
+            entry_dir = cache.root / ChartCache.make_key(BITNAMI, "nginx", version)
+            entry = cache._read_meta(entry_dir)
+            entry.last_used_at = time.time() - 1000 + i
+            cache._write_meta(entry_dir, entry)
+
+        # Touch the oldest one so it becomes most recently used
+        assert cache.lookup(BITNAMI, "nginx", "1.0.0") is not None
+        per_entry = cache.list_entries()[0].size_bytes
+
+        removed = cache.prune(max_bytes=per_entry * 2)
+
+        assert [e.version for e in removed] == ["2.0.0"]
+        assert {e.version for e in cache.list_entries()} == {"1.0.0", "3.0.0"}
+
+    def test_prune_older_than(self, tmp_path: Path) -> None:
+        cache = ChartCache(root=tmp_path / "cache", max_bytes=0)
+        entry = cache.store(BITNAMI, "nginx", "1.0.0", _make_chart(tmp_path / "src"))
+        entry.last_used_at = time.time() - 10 * 86400
+        cache._write_meta(cache.root / entry.key, entry)
+
+        removed = cache.prune(older_than_seconds=86400)
+
+        assert len(removed) == 1
+        assert cache.list_entries() == []
+
+
+class TestPrepareHelmAppCache:
+    """Test prepare_helm_app integration with the chart cache."""
+
+    @patch("sbkube.commands.prepare.run_command")
+    def test_second_app_group_uses_cache(self, mock_run_command, tmp_path: Path) -> None:
+        """The same chart version is pulled once and then restored from cache."""
+        sources_file = tmp_path / "sources.yaml"
+        sources_file.write_text(f"helm_repos:\n  bitnami: {BITNAMI}\n")
+        app = HelmApp(type="helm", chart="bitnami/nginx", version="15.0.0")
+
+        def mock_run_side_effect(cmd, **kwargs):
+            if "pull" in cmd:
+                untardir = Path(cmd[cmd.index("--untardir") + 1])
+                _make_chart(untardir / "nginx")
+            return (0, "", "")
+
+        mock_run_command.side_effect = mock_run_side_effect
+
+        for group in ("group-a", "group-b"):
+            charts_dir = tmp_path / group / "charts"
+            charts_dir.mkdir(parents=True)
+            assert prepare_helm_app(
+                app_name="nginx",
+                app=app,
+                base_dir=tmp_path,
+                charts_dir=charts_dir,
+                sources_file=sources_file,
+                output=MagicMock(spec=OutputManager),
+            )
+            assert (charts_dir / "bitnami" / "nginx-15.0.0" / "Chart.yaml").exists()
+
+        pull_calls = [c for c in mock_run_command.call_args_list if "pull" in c.args[0]]
+        assert len(pull_calls) == 1
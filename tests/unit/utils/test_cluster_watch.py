@@ -0,0 +1,271 @@
+"""Tests for incremental cluster status (status --watch)."""
+
+import base64
+import gzip
+import io
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sbkube.utils import cluster_watch
+from sbkube.utils.cluster_watch import (
+    ClusterWatcher,
+    ClusterWatchModel,
+    decode_helm_release,
+    iter_json_objects,
+)
+
+
+def _pod(name: str, phase: str = "Running", ready: bool = True, restarts: int = 0) -> dict:
+    return {
+        "metadata": {"name": name, "namespace": "data"},
+        "spec": {"containers": [{"name": "main"}]},
+        "status": {
+            "phase": phase,
+            "containerStatuses": [{"ready": ready, "restartCount": restarts}],
+        },
+    }
+
+
+def _helm_secret(name: str, revision: int, status: str, chart_version: str) -> dict:
+    release = {
+        "name": name,
+        "info": {"status": status},
+        "chart": {"metadata": {"name": name, "version": chart_version, "appVersion": "7.2"}},
+    }
+    payload = base64.b64encode(gzip.compress(json.dumps(release).encode()))
+    return {
+        "metadata": {
+            "namespace": "data",
+            "labels": {
+                "name": name,
+                "owner": "helm",
+                "status": status,
+                "version": str(revision),
+                "sbkube.io/app-group": "app_100",
+            },
+        },
+        "data": {"release": base64.b64encode(payload).decode()},
+    }
+
+
+class TestIterJsonObjects:
+    """kubectl watch 출력 디코딩 테스트."""
+
+    def test_pretty_printed_objects_split_across_chunks(self) -> None:
+        text = json.dumps({"type": "ADDED"}, indent=2) + "\n" + json.dumps({"type": "DELETED"})
+        chunks = [text[i : i + 5] for i in range(0, len(text), 5)]
+
+        assert [e["type"] for e in iter_json_objects(chunks)] == ["ADDED", "DELETED"]
+
+
+class TestDecodeHelmRelease:
+    """Helm release secret 디코딩 테스트."""
+
+    def test_release_row(self) -> None:
+        row = decode_helm_release(_helm_secret("redis", 3, "deployed", "18.0.0"))
+
+        assert row["name"] == "redis"
+        assert row["revision"] == 3
+        assert row["chart"] == "redis-18.0.0"
+        assert row["app_version"] == "7.2"
+        assert row["labels"] == {"sbkube.io/app-group": "app_100"}
+
+    def test_undecodable_payload_keeps_label_fields(self) -> None:
+        secret = _helm_secret("redis", 1, "failed", "1.0.0")
+        secret["data"]["release"] = "not-base64!"
+
+        row = decode_helm_release(secret)
+
+        assert row["status"] == "failed"
+        assert row["chart"] == "unknown"
+
+
+class TestClusterWatchModel:
+    """이벤트 → 변경된 행 계산 테스트."""
+
+    def test_unchanged_display_is_not_reported(self) -> None:
+        model = ClusterWatchModel()
+        model.apply("pods", "ADDED", _pod("redis-0"))
+
+        # resourceVersion만 바뀐 MODIFIED 이벤트
+        assert model.apply("pods", "MODIFIED", _pod("redis-0")) is None
+
+        change = model.apply("pods", "MODIFIED", _pod("redis-0", ready=False, restarts=1))
+        assert change.action == "changed"
+        assert change.key == ("data", "redis-0")
+
+    def test_delete_reports_removed(self) -> None:
+        model = ClusterWatchModel()
+        model.apply("pods", "ADDED", _pod("redis-0"))
+
+        change = model.apply("pods", "DELETED", _pod("redis-0"))
+
+        assert change.action == "removed"
+        assert model.snapshot()["pods"] == []
+
+    def test_release_shows_latest_revision(self) -> None:
+        model = ClusterWatchModel()
+        model.apply("helm_releases", "ADDED", _helm_secret("redis", 1, "deployed", "1.0.0"))
+
+        change = model.apply(
+            "helm_releases", "ADDED", _helm_secret("redis", 2, "deployed", "2.0.0")
+        )
+        assert change.after["chart"] == "redis-2.0.0"
+
+        # 오래된 revision 정리는 표시에 영향 없음
+        assert (
+            model.apply(
+                "helm_releases", "DELETED", _helm_secret("redis", 1, "superseded", "1.0.0")
+            )
+            is None
+        )
+        (release,) = model.snapshot()["helm_releases"]
+        assert release["revision"] == 2
+
+    def test_replace_reports_only_differences(self) -> None:
+        model = ClusterWatchModel.from_snapshot(
+            {
+                "cluster_info": {"version": "v1.29"},
+                "nodes": [{"name": "n1", "status": "Ready", "version": "v1.29"}],
+            }
+        )
+
+        changes = model.replace(
+            "nodes",
+            [
+                {"name": "n1", "status": "Ready", "version": "v1.29"},
+                {"name": "n2", "status": "NotReady", "version": "v1.29"},
+            ],
+        )
+
+        assert [(c.key, c.action) for c in changes] == [(("n2",), "added")]
+        assert model.snapshot()["cluster_info"] == {"version": "v1.29"}
+
+
+class TestClusterWatcherPoll:
+    """Watcher queue → model 반영 테스트."""
+
+    def test_poll_applies_relist_and_events(self) -> None:
+        model = ClusterWatchModel()
+        watcher = ClusterWatcher(MagicMock(), model)
+        watcher._events.put(("relist", "pods", [{"name": "a", "namespace": "data"}]))
+        watcher._events.put(("event", "pods", "ADDED", _pod("b")))
+
+        changes = watcher.poll()
+
+        assert [c.key for c in changes] == [("data", "a"), ("data", "b")]
+        assert watcher.poll() == []
+
+
+class _FakeProcess:
+    """Popen stand-in that replays watch events and then exits."""
+
+    def __init__(self, events: list[dict], returncode: int = 0) -> None:
+        self.stdout = io.StringIO("".join(json.dumps(e) + "\n" for e in events))
+        self.returncode = returncode
+        self.terminated = False
+
+    def poll(self) -> int | None:
+        return None if self.stdout.tell() < len(self.stdout.getvalue()) else self.returncode
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+    def wait(self) -> int:
+        return self.returncode
+
+
+def _event(event_type: str, obj: dict, resource_version: str) -> dict:
+    obj = {**obj, "metadata": {**obj["metadata"], "resourceVersion": resource_version}}
+    return {"type": event_type, "object": obj}
+
+
+class TestClusterWatcherFollow:
+    """list → resourceVersion watch → resume 흐름 테스트."""
+
+    @pytest.fixture(autouse=True)
+    def _no_backoff(self, monkeypatch) -> None:
+        monkeypatch.setattr(cluster_watch, "RELIST_BACKOFF_SECONDS", (0,))
+
+    def _run(
+        self, processes: list[_FakeProcess], resource_versions: dict | None = None
+    ) -> tuple[ClusterWatcher, list[list[str]]]:
+        collector = MagicMock()
+        collector._kubectl_base_cmd = ["kubectl"]
+        collector.list_objects.return_value = ([_pod("listed")], "50")
+        watcher = ClusterWatcher(
+            collector, ClusterWatchModel(), kinds=("pods",), resource_versions=resource_versions
+        )
+        commands: list[list[str]] = []
+        remaining = list(processes)
+
+        def popen(cmd, **kwargs):
+            commands.append(cmd)
+            if not remaining:
+                watcher._stop.set()
+            return remaining.pop(0) if remaining else _FakeProcess([])
+
+        with patch("sbkube.utils.cluster_watch.subprocess.Popen", side_effect=popen):
+            watcher._follow("pods")
+        return watcher, commands
+
+    def test_seeded_kind_watches_from_snapshot_version(self) -> None:
+        watcher, commands = self._run(
+            [_FakeProcess([_event("ADDED", _pod("b"), "11")])],
+            resource_versions={"pods": "10"},
+        )
+
+        watcher.collector.list_objects.assert_not_called()
+        assert commands[0][:3] == ["kubectl", "get", "--raw"]
+        assert commands[0][3] == (
+            "/api/v1/pods?watch=1&allowWatchBookmarks=true&resourceVersion=10"
+        )
+        # 스트림이 끝나면 마지막 resourceVersion부터 이어서 watch
+        assert commands[1][3].endswith("resourceVersion=11")
+        assert [c.key for c in watcher.poll()] == [("data", "b")]
+
+    def test_unseeded_kind_lists_then_watches_from_list_version(self) -> None:
+        watcher, commands = self._run([])
+
+        watcher.collector.list_objects.assert_called_once_with("pods")
+        assert commands[0][3].endswith("resourceVersion=50")
+        assert [c.key for c in watcher.poll()] == [("data", "listed")]
+
+    def test_expired_version_relists(self) -> None:
+        gone = {"type": "ERROR", "object": {"kind": "Status", "code": 410}}
+        watcher, commands = self._run(
+            [_FakeProcess([gone])], resource_versions={"pods": "10"}
+        )
+
+        watcher.collector.list_objects.assert_called_once_with("pods")
+        assert commands[1][3].endswith("resourceVersion=50")
+
+    def test_process_spawned_after_stop_is_terminated(self) -> None:
+        watcher = ClusterWatcher(MagicMock(), ClusterWatchModel(), kinds=("pods",))
+        process = _FakeProcess([])
+
+        def popen(cmd, **kwargs):
+            # stop()이 Popen 도중에 호출된 경우
+            watcher.stop()
+            return process
+
+        with patch("sbkube.utils.cluster_watch.subprocess.Popen", side_effect=popen):
+            assert watcher._spawn("pods", ["kubectl"]) is None
+
+        assert process.terminated
+        assert watcher._processes == {}
+
+    def test_stop_terminates_registered_process(self) -> None:
+        watcher = ClusterWatcher(MagicMock(), ClusterWatchModel(), kinds=("pods",))
+        process = _FakeProcess([_event("ADDED", _pod("a"), "1")])
+
+        with patch("sbkube.utils.cluster_watch.subprocess.Popen", return_value=process):
+            assert watcher._spawn("pods", ["kubectl"]) is process
+        stopper = threading.Thread(target=watcher.stop)
+        stopper.start()
+        stopper.join()
+
+        assert process.terminated
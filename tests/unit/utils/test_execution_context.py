@@ -0,0 +1,100 @@
+"""Tests for ExecutionContext (shared config cache)."""
+
+import os
+from unittest.mock import patch
+
+import click
+import yaml
+
+from sbkube.utils.execution_context import ExecutionContext
+from sbkube.utils.file_loader import load_config_file
+
+
+def _write(path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.dump(data))
+
+
+class TestExecutionContext:
+    """ExecutionContext 테스트."""
+
+    def test_load_raw_parses_once(self, tmp_path) -> None:
+        """같은 파일은 한 번만 파싱."""
+        config_file = tmp_path / "sbkube.yaml"
+        _write(config_file, {"apiVersion": "sbkube/v1", "apps": {}})
+        exec_ctx = ExecutionContext()
+
+        with patch(
+            "sbkube.utils.execution_context.load_config_file",
+            wraps=load_config_file,
+        ) as mock_load:
+            first = exec_ctx.load_raw(config_file)
+            second = exec_ctx.load_raw(config_file)
+
+        assert mock_load.call_count == 1
+        assert first == second
+        assert exec_ctx.loads == 1
+        assert exec_ctx.hits == 1
+
+    def test_load_raw_returns_copy(self, tmp_path) -> None:
+        """반환값 수정이 캐시에 영향을 주지 않음."""
+        config_file = tmp_path / "sbkube.yaml"
+        _write(config_file, {"settings": {"namespace": "a"}})
+        exec_ctx = ExecutionContext()
+
+        exec_ctx.load_raw(config_file)["settings"]["namespace"] = "mutated"
+
+        assert exec_ctx.load_raw(config_file)["settings"]["namespace"] == "a"
+
+    def test_load_raw_reloads_modified_file(self, tmp_path) -> None:
+        """파일이 바뀌면 다시 파싱."""
+        config_file = tmp_path / "sbkube.yaml"
+        _write(config_file, {"settings": {"namespace": "a"}})
+        exec_ctx = ExecutionContext()
+        exec_ctx.load_raw(config_file)
+
+        _write(config_file, {"settings": {"namespace": "changed"}})
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert exec_ctx.load_raw(config_file)["settings"]["namespace"] == "changed"
+
+    def test_resolve_namespace_inherits_from_parent(self, tmp_path) -> None:
+        """상위 sbkube.yaml의 namespace 상속, 현재 설정이 우선."""
+        _write(
+            tmp_path / "sbkube.yaml",
+            {"apiVersion": "sbkube/v1", "settings": {"namespace": "parent-ns"}},
+        )
+        app_config = tmp_path / "group" / "sbkube.yaml"
+        _write(app_config, {"apiVersion": "sbkube/v1", "apps": {}})
+        exec_ctx = ExecutionContext()
+
+        assert exec_ctx.resolve_namespace(app_config, {}) == "parent-ns"
+        assert (
+            exec_ctx.resolve_namespace(app_config, {"settings": {"namespace": "own"}})
+            == "own"
+        )
+
+    def test_get_sbkube_config_cached(self, tmp_path) -> None:
+        """동일 데이터의 SBKubeConfig는 재검증하지 않음."""
+        config_data = {
+            "namespace": "default",
+            "apps": {"app1": {"type": "helm", "chart": "grafana/loki"}},
+        }
+        exec_ctx = ExecutionContext()
+
+        first = exec_ctx.get_sbkube_config(tmp_path / "sbkube.yaml", config_data)
+        second = exec_ctx.get_sbkube_config(tmp_path / "sbkube.yaml", dict(config_data))
+
+        assert first is second
+        assert "app1" in first.apps
+
+    def test_from_click_shares_instance(self) -> None:
+        """ctx.obj에 저장된 인스턴스를 재사용."""
+        ctx = click.Context(click.Command("apply"), obj={})
+        exec_ctx = ExecutionContext.from_click(ctx)
+
+        child = click.Context(click.Command("deploy"), parent=ctx)
+        child.obj = ctx.obj
+
+        assert ExecutionContext.from_click(child) is exec_ctx
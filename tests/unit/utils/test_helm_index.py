@@ -0,0 +1,110 @@
+"""Tests for the local Helm repository index reader."""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import yaml
+
+from sbkube.commands.check_updates import _check_sbkube_apps
+from sbkube.utils.helm_index import HelmIndex, helm_repository_cache_dir
+from sbkube.utils.version_compare import VersionComparison
+
+
+def _write_index(cache_dir, repo_name: str, entries: dict[str, list[str]]) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    index = {
+        "apiVersion": "v1",
+        "entries": {
+            chart: [{"name": chart, "version": version} for version in versions]
+            for chart, versions in entries.items()
+        },
+    }
+    (cache_dir / f"{repo_name}-index.yaml").write_text(yaml.safe_dump(index))
+
+
+class TestHelmRepositoryCacheDir:
+    """Helm cache 경로 결정 테스트."""
+
+    def test_env_override(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv("HELM_REPOSITORY_CACHE", str(tmp_path))
+        assert helm_repository_cache_dir() == tmp_path
+
+    def test_xdg_cache_home(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.delenv("HELM_REPOSITORY_CACHE", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert helm_repository_cache_dir() == tmp_path / "helm" / "repository"
+
+
+class TestHelmIndex:
+    """HelmIndex 조회 테스트."""
+
+    def test_versions_sorted_and_latest_stable(self, tmp_path) -> None:
+        _write_index(tmp_path, "grafana", {"grafana": ["6.9.0", "7.0.0-beta.1", "6.10.1"]})
+        index = HelmIndex(tmp_path)
+
+        assert index.versions("grafana", "grafana") == ["7.0.0-beta.1", "6.10.1", "6.9.0"]
+        assert index.latest_version("grafana", "grafana") == "6.10.1"
+        assert index.latest_version("grafana", "loki") is None
+
+    def test_index_parsed_once(self, tmp_path) -> None:
+        _write_index(tmp_path, "bitnami", {"redis": ["18.0.0"]})
+        index = HelmIndex(tmp_path)
+
+        with patch("sbkube.utils.helm_index.yaml.load", wraps=yaml.load) as load:
+            for _ in range(3):
+                index.latest_version("bitnami", "redis")
+            index.find_repo("redis", ["bitnami"])
+
+        assert load.call_count == 1
+
+    def test_find_repo_in_order(self, tmp_path) -> None:
+        _write_index(tmp_path, "a", {"nginx": ["1.0.0"]})
+        _write_index(tmp_path, "b", {"nginx": ["2.0.0"], "redis": ["1.0.0"]})
+        index = HelmIndex(tmp_path)
+
+        assert index.find_repo("nginx", ["missing", "a", "b"]) == "a"
+        assert index.find_repo("redis", ["a", "b"]) == "b"
+        assert index.find_repo("kafka", ["a", "b"]) is None
+        assert not index.has_repo("missing")
+
+    def test_stale_repos_and_invalidate(self, tmp_path) -> None:
+        _write_index(tmp_path, "fresh", {"x": ["1.0.0"]})
+        _write_index(tmp_path, "old", {"x": ["1.0.0"]})
+        old_mtime = time.time() - 2 * 24 * 3600
+        os.utime(tmp_path / "old-index.yaml", (old_mtime, old_mtime))
+        index = HelmIndex(tmp_path)
+
+        assert index.stale_repos(["fresh", "old", "missing"]) == ["old", "missing"]
+
+        index.latest_version("old", "x")
+        _write_index(tmp_path, "old", {"x": ["1.1.0"]})
+        index.invalidate(["old"])
+        assert index.latest_version("old", "x") == "1.1.0"
+
+
+class TestCheckUpdatesWithIndex:
+    """check-updates가 helm 호출 없이 index로 동작하는지 테스트."""
+
+    @patch("sbkube.commands.check_updates.get_all_helm_releases", return_value=[])
+    def test_sbkube_apps_checked_from_index(self, _releases, tmp_path) -> None:
+        _write_index(tmp_path, "grafana", {"grafana": ["6.0.0", "7.1.0"]})
+        apps = {
+            "grafana": MagicMock(
+                type="helm", chart="grafana/grafana", namespace="monitoring", version="6.0.0"
+            ),
+            "loki": MagicMock(
+                type="helm", chart="grafana/loki", namespace="monitoring", version="1.0.0"
+            ),
+        }
+
+        with patch("subprocess.run") as mock_run:
+            updates = _check_sbkube_apps(
+                apps, {}, None, None, MagicMock(), "json", index=HelmIndex(tmp_path)
+            )
+
+        mock_run.assert_not_called()
+        assert [(u.name, u.latest_version, u.comparison) for u in updates] == [
+            ("grafana", "7.1.0", VersionComparison.OUTDATED)
+        ]
+        assert updates[0].is_major
@@ -2,7 +2,11 @@
 
 import pytest
 
-from sbkube.utils.manifest_cleaner import clean_manifest_file, clean_manifest_metadata
+from sbkube.utils.manifest_cleaner import (
+    clean_manifest_file,
+    clean_manifest_metadata,
+    clean_manifest_stream,
+)
 
 
 class TestCleanManifestMetadata:
@@ -339,3 +343,28 @@ spec:
         """Test handling non-existent file."""
         with pytest.raises(FileNotFoundError):
             clean_manifest_file("/nonexistent/file.yaml")
+
+
+class TestCleanManifestStream:
+    """Test clean_manifest_stream function."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "---\napiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: a\n  uid: x\n"
+            "status: {}\n---\n# comment only\n---\nkind: List\nitems:\n"
+            "- metadata:\n    name: b\n    generation: 2\n---\njust-a-string\n",
+            "# Source: chart/templates/empty.yaml\n",
+            "kind: ConfigMap\nmetadata: [unclosed\n",
+        ],
+        ids=["multi-document", "no-documents", "invalid-yaml"],
+    )
+    def test_matches_clean_manifest_metadata(self, tmp_path, content):
+        """Test streaming result equals the in-memory cleaner."""
+        input_file = tmp_path / "raw.yaml"
+        output_file = tmp_path / "rendered.yaml"
+        input_file.write_text(content, encoding="utf-8")
+
+        clean_manifest_stream(input_file, output_file)
+
+        assert output_file.read_text(encoding="utf-8") == clean_manifest_metadata(content)
@@ -0,0 +1,151 @@
+"""Tests for the per-run namespace registry."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sbkube.utils.namespace_registry import NamespaceRegistry
+
+
+def _namespace_list(*names: str) -> str:
+    return json.dumps({"items": [{"metadata": {"name": name}} for name in names]})
+
+
+class FakeKubectl:
+    """run_command 대체: namespace 목록/조회/생성 호출을 기록."""
+
+    def __init__(self, namespaces: set[str], list_allowed: bool = True) -> None:
+        self.namespaces = set(namespaces)
+        self.list_allowed = list_allowed
+        self.calls: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, cmd: list[str], **kwargs) -> tuple[int, str, str]:
+        with self._lock:
+            self.calls.append(cmd)
+        verb, resource = cmd[1], cmd[2]
+        if verb == "get" and resource == "namespaces":
+            if not self.list_allowed:
+                return 1, "", "Error from server (Forbidden)"
+            return 0, _namespace_list(*sorted(self.namespaces)), ""
+        if verb == "get":
+            return (0, "", "") if cmd[3] in self.namespaces else (1, "", "NotFound")
+        if verb == "create":
+            time.sleep(0.01)  # 동시 생성 경쟁 구간
+            with self._lock:
+                if cmd[3] in self.namespaces:
+                    return 1, "", f'namespaces "{cmd[3]}" already exists'
+                self.namespaces.add(cmd[3])
+            return 0, f"namespace/{cmd[3]} created", ""
+        return 1, "", "unexpected"
+
+    def count(self, verb: str, resource: str) -> int:
+        return sum(1 for cmd in self.calls if cmd[1:3] == [verb, resource])
+
+
+class TestNamespaceRegistry:
+    """동기 API 테스트."""
+
+    def test_single_list_answers_every_namespace(self) -> None:
+        kubectl = FakeKubectl({"default", "data"})
+        registry = NamespaceRegistry(runner=kubectl)
+
+        assert registry.exists("data")
+        assert not registry.exists("web")
+        assert registry.exists("default")
+
+        assert kubectl.calls == [["kubectl", "get", "namespaces", "-o", "json"]]
+
+    def test_list_failure_falls_back_to_cached_probes(self) -> None:
+        kubectl = FakeKubectl({"data"}, list_allowed=False)
+        registry = NamespaceRegistry(runner=kubectl)
+
+        assert registry.exists("data")
+        assert registry.exists("data")
+        assert not registry.exists("web")
+
+        assert kubectl.count("get", "namespaces") == 1
+        assert kubectl.count("get", "namespace") == 2
+
+    def test_list_all_disabled_probes_only(self) -> None:
+        kubectl = FakeKubectl({"data"})
+        registry = NamespaceRegistry(runner=kubectl, list_all=False)
+
+        assert registry.exists("data")
+        assert kubectl.calls == [["kubectl", "get", "namespace", "data"]]
+
+    def test_concurrent_create_runs_kubectl_once(self) -> None:
+        kubectl = FakeKubectl({"default"})
+        registry = NamespaceRegistry(runner=kubectl)
+        results: list[tuple[bool, str]] = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.create("data")))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [(True, "")] * 6
+        assert kubectl.count("create", "namespace") == 1
+        assert kubectl.count("get", "namespaces") == 1
+        assert registry.exists("data")
+
+    def test_create_tolerates_already_exists(self) -> None:
+        kubectl = FakeKubectl({"default"})
+        registry = NamespaceRegistry(runner=kubectl)
+        registry.exists("data")  # 목록에 없음
+        kubectl.namespaces.add("data")  # 다른 경로로 생성됨
+
+        assert registry.create("data") == (True, "")
+        assert registry.exists("data")
+
+    def test_create_failure_reports_stderr(self) -> None:
+        runner = MagicMock(side_effect=[(1, "", "forbidden"), (1, "", "permission denied")])
+        registry = NamespaceRegistry(runner=runner, list_all=False)
+
+        assert registry.create("data") == (False, "permission denied")
+
+    def test_per_call_runner_and_cluster_key(self) -> None:
+        registry = NamespaceRegistry()
+        prod = FakeKubectl({"data"})
+        dev = FakeKubectl(set())
+
+        assert registry.exists("data", kubeconfig="/k", context="prod", runner=prod)
+        assert not registry.exists("data", kubeconfig="/k", context="dev", runner=dev)
+        assert prod.calls[0][-4:] == ["--kubeconfig", "/k", "--context", "prod"]
+
+    def test_mark_created(self) -> None:
+        kubectl = FakeKubectl({"default"})
+        registry = NamespaceRegistry(runner=kubectl)
+        registry.exists("default")
+
+        registry.mark_created("data")
+
+        assert registry.exists("data")
+        assert len(kubectl.calls) == 1
+
+
+class TestNamespaceRegistryAsync:
+    """validator용 async API 테스트."""
+
+    @patch("sbkube.utils.async_runner.run_async", new_callable=AsyncMock)
+    def test_concurrent_checks_share_one_list(self, mock_run: AsyncMock) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout=_namespace_list("data"))
+        registry = NamespaceRegistry()
+
+        async def check() -> list[bool]:
+            return await asyncio.gather(
+                registry.exists_async("data"),
+                registry.exists_async("web"),
+                registry.exists_async("data"),
+            )
+
+        assert asyncio.run(check()) == [True, False, True]
+        mock_run.assert_awaited_once()
+        # 동기 API도 같은 목록 사용
+        assert registry.exists("data", runner=MagicMock(side_effect=AssertionError))
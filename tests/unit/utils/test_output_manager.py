@@ -425,3 +425,33 @@ class TestOutputManager:
         assert "Explicit error only" in result
         assert "Auto-collected error 1" not in result
         assert "Auto-collected error 2" not in result
+
+    def test_buffer_flush_human_mode(self) -> None:
+        """Test buffered output is written to the parent console on flush."""
+        manager = OutputManager(format_type="human")
+        manager.console.file = StringIO()
+        buffered = manager.create_buffer()
+
+        buffered.print_success("app1 deployed")
+        assert manager.console.file.getvalue() == ""
+
+        manager.flush_buffer(buffered)
+        assert "app1 deployed" in manager.console.file.getvalue()
+
+    def test_buffer_flush_llm_mode(self) -> None:
+        """Test buffered events, deployments and errors are merged on flush."""
+        manager = OutputManager(format_type="llm")
+        manager.print_error("Shared error")
+        buffered = manager.create_buffer()
+
+        buffered.print("Deploying app1")
+        buffered.print_error("Shared error")
+        buffered.add_deployment(name="app1", namespace="default", status="deployed")
+        manager.flush_buffer(buffered)
+
+        assert manager.deployments == [
+            {"name": "app1", "namespace": "default", "status": "deployed"}
+        ]
+        assert manager.error_messages == ["Shared error"]
+        assert any(e.get("message") == "Deploying app1" for e in manager.events)
+        assert buffered.events == []
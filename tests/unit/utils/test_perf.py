@@ -0,0 +1,91 @@
+"""Tests for perf span tracing and trace exports."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sbkube.utils import perf
+from sbkube.utils.perf import PerfRecorder, bind_span_context
+
+
+@pytest.fixture
+def recorder(monkeypatch, tmp_path) -> PerfRecorder:
+    rec = PerfRecorder()
+    monkeypatch.setattr(rec, "_patch_subprocess_run", lambda: None)
+    monkeypatch.setattr(perf, "_perf_recorder", rec)
+    rec.enable(output_format="json", log_dir=tmp_path)
+    return rec
+
+
+def _by_name(rec: PerfRecorder) -> dict:
+    return {event.name: event for event in rec.events}
+
+
+class TestPerfSpans:
+    """Span 계층 테스트."""
+
+    def test_nested_spans_link_parent(self, recorder) -> None:
+        with perf.perf_timer("workspace.deploy", workspace="ws.yaml"):
+            with perf.perf_timer("app", app="redis"):
+                recorder.record("subprocess", 0.01, tool="helm")
+
+        events = _by_name(recorder)
+        assert events["workspace.deploy"].parent_id is None
+        assert events["app"].parent_id == events["workspace.deploy"].span_id
+        assert events["subprocess"].parent_id == events["app"].span_id
+
+    def test_bind_span_context_across_threads(self, recorder) -> None:
+        def work(name: str) -> None:
+            with perf.perf_timer("app", app=name):
+                pass
+
+        with perf.perf_timer("workspace.phase", phase="infra"):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(bind_span_context(work), ["a", "b"]))
+
+        phase = _by_name(recorder)["workspace.phase"]
+        apps = [e for e in recorder.events if e.name == "app"]
+        assert len(apps) == 2
+        assert all(e.parent_id == phase.span_id for e in apps)
+        assert all(e.thread_id != phase.thread_id for e in apps)
+
+    def test_disabled_records_nothing(self) -> None:
+        rec = PerfRecorder()
+        with rec.span("app", app="x"):
+            pass
+        assert rec.events == []
+
+
+class TestPerfExports:
+    """Chrome trace / folded stack export 테스트."""
+
+    def test_chrome_trace_events(self, recorder) -> None:
+        with perf.perf_timer("app", app="redis"):
+            pass
+
+        trace = recorder.to_chrome_trace()
+        complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        meta = [e for e in trace["traceEvents"] if e["ph"] == "M"]
+        assert complete[0]["name"] == "app[redis]"
+        assert complete[0]["dur"] >= 0
+        assert complete[0]["args"]["app"] == "redis"
+        assert meta[0]["args"]["name"]
+
+    def test_folded_stacks_use_self_time(self, recorder) -> None:
+        with perf.perf_timer("app", app="redis"):
+            recorder.record("subprocess", 0.5, tool="helm")
+
+        lines = dict(line.rsplit(" ", 1) for line in recorder.to_folded_stacks())
+        assert int(lines["app[redis];subprocess[helm]"]) == 500000
+        # 자식이 부모보다 길게 기록되어도 self time은 0 이상
+        assert int(lines["app[redis]"]) >= 0
+
+    def test_flush_writes_trace_files(self, recorder) -> None:
+        with perf.perf_timer("app", app="redis"):
+            pass
+
+        recorder.flush()
+
+        assert recorder.log_path.exists()
+        assert recorder.trace_path.exists()
+        assert "app[redis]" in recorder.folded_path.read_text()
@@ -9,6 +9,7 @@ from sbkube.utils.version_compare import (
     get_latest_version,
     get_version_diff,
     is_update_available,
+    sort_versions,
 )
 
 
@@ -142,6 +143,20 @@ class TestGetLatestVersion:
         assert latest == "2.0.0"
 
 
+class TestSortVersions:
+    """Test sort_versions function."""
+
+    def test_newest_first_drops_invalid(self):
+        """Test semantic ordering (not lexical) and invalid entries dropped."""
+        versions = ["1.9.0", "garbage", "1.10.0", "2.0.0-rc.1", "1.2.3"]
+        assert sort_versions(versions) == ["2.0.0-rc.1", "1.10.0", "1.9.0", "1.2.3"]
+
+    def test_exclude_prerelease(self):
+        """Test pre-release versions can be excluded."""
+        versions = ["2.0.0-rc.1", "1.10.0"]
+        assert sort_versions(versions, include_prerelease=False) == ["1.10.0"]
+
+
 class TestVersionFormats:
     """Test various version formats."""
 
@@ -4,7 +4,7 @@ import asyncio
 import subprocess
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import yaml
@@ -80,7 +80,7 @@ class TestHelmChartValidator:
         assert validator.description == "Helm 차트 구조 및 템플릿 유효성 검증"
         assert validator.category == "dependencies"
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_not_installed(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -97,7 +97,7 @@ class TestHelmChartValidator:
         assert "Helm이 설치되지 않아" in result.message
         assert result.fix_command == "curl https://raw.githubusercontent.com/helm/helm/main/scripts/get-helm-3 | bash"
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_v2_warning(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -116,7 +116,7 @@ class TestHelmChartValidator:
         assert result.severity == ValidationSeverity.CRITICAL
         assert "Helm v2" in result.details or "Helm v3" in result.details
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_no_helm_apps(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -137,7 +137,7 @@ class TestHelmChartValidator:
         assert result.severity == ValidationSeverity.INFO
         assert "Helm 차트를 사용하는 앱이 없습니다" in result.message
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_missing_path(
         self,
         mock_run: MagicMock,
@@ -165,7 +165,7 @@ class TestHelmChartValidator:
         assert result.severity == ValidationSeverity.HIGH
         assert "Helm 차트 문제가 발견되었습니다" in result.message
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_command_nonzero_exit(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -180,7 +180,7 @@ class TestHelmChartValidator:
         assert result.level == DiagnosticLevel.ERROR
         assert result.severity == ValidationSeverity.CRITICAL
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_version_check_timeout(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -195,7 +195,7 @@ class TestHelmChartValidator:
         assert result.level == DiagnosticLevel.ERROR
         assert result.severity == ValidationSeverity.CRITICAL
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_generic_exception(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -210,7 +210,7 @@ class TestHelmChartValidator:
         assert result.level == DiagnosticLevel.ERROR
         assert result.severity == ValidationSeverity.CRITICAL
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_validation_with_warnings(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -251,7 +251,7 @@ class TestHelmChartValidator:
         # 검증 (성공 또는 경고)
         assert result.level in [DiagnosticLevel.SUCCESS, DiagnosticLevel.WARNING, DiagnosticLevel.ERROR]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_success_case(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -316,7 +316,7 @@ spec:
         # 검증 (성공)
         assert result.level in [DiagnosticLevel.SUCCESS, DiagnosticLevel.WARNING, DiagnosticLevel.INFO]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_with_subcharts(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -371,7 +371,7 @@ spec:
         # 검증
         assert result.level in [DiagnosticLevel.SUCCESS, DiagnosticLevel.WARNING, DiagnosticLevel.ERROR, DiagnosticLevel.INFO]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_with_repo_field(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -403,7 +403,7 @@ spec:
         # 검증 (repo 필드 사용 시 저장소 접근성 확인 시도)
         assert result.level in [DiagnosticLevel.SUCCESS, DiagnosticLevel.WARNING, DiagnosticLevel.ERROR, DiagnosticLevel.INFO]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_missing_repo_field(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -433,7 +433,7 @@ spec:
         # 검증 (repo 없음 오류)
         assert result.level in [DiagnosticLevel.ERROR, DiagnosticLevel.WARNING, DiagnosticLevel.SUCCESS, DiagnosticLevel.INFO]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_empty_templates_dir(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -473,7 +473,7 @@ spec:
         # 검증 (빈 templates 디렉토리 경고 또는 에러)
         assert result.level in [DiagnosticLevel.SUCCESS, DiagnosticLevel.WARNING, DiagnosticLevel.ERROR, DiagnosticLevel.INFO]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_invalid_template_yaml(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -514,7 +514,7 @@ spec:
         # 검증 (잘못된 템플릿 YAML)
         assert result.level in [DiagnosticLevel.SUCCESS, DiagnosticLevel.WARNING, DiagnosticLevel.ERROR, DiagnosticLevel.INFO]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_yaml_not_dict(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -552,7 +552,7 @@ spec:
         assert result.level == DiagnosticLevel.ERROR
         assert result.severity == ValidationSeverity.HIGH
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_missing_name_field(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -594,7 +594,7 @@ spec:
         assert result.level == DiagnosticLevel.ERROR
         assert result.severity == ValidationSeverity.HIGH
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_missing_version_field(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -636,7 +636,7 @@ spec:
         assert result.level == DiagnosticLevel.ERROR
         assert result.severity == ValidationSeverity.HIGH
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_unsupported_api_version(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -678,7 +678,7 @@ spec:
         assert result.level == DiagnosticLevel.ERROR
         assert result.severity == ValidationSeverity.HIGH
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_helm_chart_no_templates_dir(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -987,7 +987,7 @@ class TestDependencyResolutionValidator:
         # 검증 (Chart.yaml이 없으므로 ERROR 또는 WARNING)
         assert result.level in [DiagnosticLevel.ERROR, DiagnosticLevel.WARNING, DiagnosticLevel.SUCCESS]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_dependency_build_success(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -1026,7 +1026,7 @@ class TestDependencyResolutionValidator:
         # 검증 (의존성 빌드 성공)
         assert result.level in [DiagnosticLevel.SUCCESS, DiagnosticLevel.WARNING, DiagnosticLevel.ERROR]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.dependency_validators.run_async", new_callable=AsyncMock)
     def test_dependency_build_failure(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -3,7 +3,7 @@
 import asyncio
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -42,7 +42,7 @@ class TestClusterResourceValidator:
         assert "가용성" in validator.description or "availability" in validator.description.lower()
         assert validator.category == "environment"
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.environment_validators.run_async", new_callable=AsyncMock)
     def test_kubectl_not_available(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -59,7 +59,7 @@ class TestClusterResourceValidator:
         assert result.level in [DiagnosticLevel.ERROR, DiagnosticLevel.WARNING]
         assert result.severity in [ValidationSeverity.HIGH, ValidationSeverity.MEDIUM]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.environment_validators.run_async", new_callable=AsyncMock)
     def test_sufficient_resources(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -103,7 +103,7 @@ class TestNamespacePermissionValidator:
         assert "권한" in validator.description or "permission" in validator.description.lower()
         assert validator.category == "environment"
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.environment_validators.run_async", new_callable=AsyncMock)
     def test_namespace_not_accessible(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -120,7 +120,7 @@ class TestNamespacePermissionValidator:
         assert result.level in [DiagnosticLevel.ERROR, DiagnosticLevel.WARNING]
         assert result.severity in [ValidationSeverity.HIGH, ValidationSeverity.CRITICAL, ValidationSeverity.MEDIUM]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.environment_validators.run_async", new_callable=AsyncMock)
     def test_sufficient_permissions(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -148,7 +148,7 @@ class TestNetworkPolicyValidator:
         assert "네트워크" in validator.description or "network" in validator.description.lower()
         assert validator.category == "environment"
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.environment_validators.run_async", new_callable=AsyncMock)
     def test_no_network_policies(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -165,7 +165,7 @@ class TestNetworkPolicyValidator:
         # 검증 (정책 없음 시 INFO 또는 WARNING)
         assert result.level in [DiagnosticLevel.INFO, DiagnosticLevel.WARNING, DiagnosticLevel.SUCCESS, DiagnosticLevel.ERROR]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.environment_validators.run_async", new_callable=AsyncMock)
     def test_network_policy_check_failure(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -192,7 +192,7 @@ class TestSecurityContextValidator:
         assert "보안" in validator.description or "security" in validator.description.lower()
         assert validator.category == "environment"
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.environment_validators.run_async", new_callable=AsyncMock)
     def test_pod_security_check(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -214,7 +214,7 @@ class TestSecurityContextValidator:
             DiagnosticLevel.ERROR,
         ]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.environment_validators.run_async", new_callable=AsyncMock)
     def test_security_check_failure(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
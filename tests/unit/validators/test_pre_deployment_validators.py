@@ -3,7 +3,7 @@
 import asyncio
 import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import yaml
@@ -58,7 +58,7 @@ class TestDeploymentSimulator:
         assert result.level == DiagnosticLevel.INFO
         assert result.severity == ValidationSeverity.INFO
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.pre_deployment_validators.run_async", new_callable=AsyncMock)
     def test_namespace_simulation_failure(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -90,7 +90,7 @@ class TestDeploymentSimulator:
         # 검증 (시뮬레이션 실패 시 ERROR)
         assert result.level in [DiagnosticLevel.ERROR, DiagnosticLevel.WARNING, DiagnosticLevel.INFO, DiagnosticLevel.SUCCESS]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.pre_deployment_validators.run_async", new_callable=AsyncMock)
     def test_helm_deployment_simulation_success(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -156,7 +156,7 @@ class TestDeploymentSimulator:
         assert result.level == DiagnosticLevel.ERROR
         assert result.severity == ValidationSeverity.CRITICAL
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.pre_deployment_validators.run_async", new_callable=AsyncMock)
     def test_yaml_type_deployment(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -197,7 +197,7 @@ class TestDeploymentSimulator:
             DiagnosticLevel.INFO,
         ]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.pre_deployment_validators.run_async", new_callable=AsyncMock)
     def test_helm_with_values_files(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -246,7 +246,7 @@ class TestDeploymentSimulator:
             DiagnosticLevel.INFO,
         ]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.pre_deployment_validators.run_async", new_callable=AsyncMock)
     def test_helm_template_rendering_failure(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -284,7 +284,7 @@ class TestDeploymentSimulator:
         assert result.level == DiagnosticLevel.ERROR
         assert result.severity == ValidationSeverity.CRITICAL
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.pre_deployment_validators.run_async", new_callable=AsyncMock)
     def test_helm_deployment_timeout(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -384,7 +384,7 @@ class TestRollbackPlanValidator:
         # 검증 (설정 파일 없음 시 ERROR 또는 WARNING)
         assert result.level in [DiagnosticLevel.ERROR, DiagnosticLevel.WARNING, DiagnosticLevel.INFO]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.pre_deployment_validators.run_async", new_callable=AsyncMock)
     def test_rollback_plan_creation(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
@@ -440,7 +440,7 @@ class TestImpactAnalysisValidator:
         # 검증 (설정 파일 없음 시 SUCCESS도 가능 - 영향 없음)
         assert result.level in [DiagnosticLevel.ERROR, DiagnosticLevel.WARNING, DiagnosticLevel.INFO, DiagnosticLevel.SUCCESS]
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.pre_deployment_validators.run_async", new_callable=AsyncMock)
     def test_impact_analysis_with_existing_resources(
         self, mock_run: MagicMock, mock_context: ValidationContext
     ) -> None:
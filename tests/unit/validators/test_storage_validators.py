@@ -46,15 +46,15 @@ class TestStorageValidator:
         assert result["missing"] == []
         assert result["existing"] == []
 
-    @patch("subprocess.run")
-    def test_no_provisioner_storage_class(self, mock_subprocess):
+    @patch("sbkube.validators.storage_validators.run_async")
+    def test_no_provisioner_storage_class(self, mock_run_async):
         """Test detection of no-provisioner StorageClass."""
         # Mock kubectl get storageclass
         sc_json = {
             "provisioner": "kubernetes.io/no-provisioner",
             "volumeBindingMode": "WaitForFirstConsumer",
         }
-        mock_subprocess.return_value = MagicMock(
+        mock_run_async.return_value = MagicMock(
             returncode=0,
             stdout=json.dumps(sc_json),
             stderr="",
@@ -64,8 +64,9 @@ class TestStorageValidator:
         validator = validator_legacy._validator
 
         # Check if no-provisioner detection works
-        is_no_prov = validator._is_no_provisioner("postgresql-hostpath")
+        is_no_prov = asyncio.run(validator._is_no_provisioner("postgresql-hostpath"))
         assert is_no_prov is True
+        assert mock_run_async.await_args.args[0][:3] == ["kubectl", "get", "storageclass"]
 
     def test_size_parsing(self):
         """Test storage size parsing."""
@@ -99,11 +100,11 @@ class TestStorageValidator:
         assert validator._size_sufficient("8Gi", "8G") is True  # 8Gi > 8G
         assert validator._size_sufficient("1Gi", "1G") is True  # 1Gi > 1G
 
-    @patch("subprocess.run")
-    def test_kubectl_failure(self, mock_subprocess):
+    @patch("sbkube.validators.storage_validators.run_async")
+    def test_kubectl_failure(self, mock_run_async):
         """Test handling of kubectl command failure."""
         # Mock kubectl failure
-        mock_subprocess.side_effect = Exception("kubectl not found")
+        mock_run_async.side_effect = Exception("kubectl not found")
 
         config = SBKubeConfig(
             namespace="database",
@@ -123,6 +124,34 @@ class TestStorageValidator:
         assert result["all_exist"] is True
         assert result["missing"] == []
 
+    @patch("sbkube.validators.storage_validators.run_async")
+    @patch("sbkube.validators.storage_validators.StorageValidator._extract_required_pvs")
+    def test_legacy_queries_pvs_through_async_runner(
+        self, mock_extract: MagicMock, mock_run_async: MagicMock
+    ) -> None:
+        """The sync path used by 'sbkube validate' awaits the shared runner."""
+        mock_extract.return_value = [
+            {"app": "db", "storage_class": "manual", "size": "8Gi"},
+            {"app": "cache", "storage_class": "manual", "size": "20Gi"},
+        ]
+        pv = {
+            "spec": {"storageClassName": "manual", "capacity": {"storage": "10Gi"}},
+            "status": {"phase": "Available"},
+        }
+        mock_run_async.return_value = MagicMock(
+            returncode=0, stdout=json.dumps({"items": [pv]}), stderr=""
+        )
+
+        result = StorageValidatorLegacy(kubeconfig="/k").check_required_pvs(
+            SBKubeConfig(namespace="default", apps={})
+        )
+
+        assert [pv["app"] for pv in result["existing"]] == ["db"]
+        assert [pv["app"] for pv in result["missing"]] == ["cache"]
+        assert mock_run_async.await_args.args[0] == [
+            "kubectl", "get", "pv", "-o", "json", "--kubeconfig", "/k",
+        ]
+
 
 @pytest.fixture
 def mock_context(tmp_path: Path) -> ValidationContext:
@@ -181,9 +210,9 @@ class TestStorageValidatorAsync:
         assert result.level == DiagnosticLevel.SUCCESS
         assert result.severity == ValidationSeverity.INFO
 
-    @patch("subprocess.run")
+    @patch("sbkube.validators.storage_validators.run_async")
     def test_kubectl_failure(
-        self, mock_subprocess: MagicMock, mock_context: ValidationContext
+        self, mock_run_async: MagicMock, mock_context: ValidationContext
     ) -> None:
         """Test handling when kubectl fails."""
         # Create config (doesn't matter what's in it)
@@ -199,8 +228,8 @@ class TestStorageValidatorAsync:
         )
         mock_context.config = config
 
-        # Mock subprocess to fail
-        mock_subprocess.side_effect = Exception("kubectl not found")
+        # Mock kubectl to fail
+        mock_run_async.side_effect = Exception("kubectl not found")
 
         validator = StorageValidator()
         result = asyncio.run(validator.run_validation(mock_context))
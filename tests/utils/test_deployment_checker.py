@@ -1,10 +1,12 @@
 """Tests for DeploymentChecker utility class."""
 
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from sbkube.models.deployment_state import DeploymentStatusInfo
 from sbkube.state.database import DeploymentStatus
 from sbkube.utils.deployment_checker import DeploymentChecker, get_current_cluster
 
@@ -93,40 +95,54 @@ class TestDeploymentChecker:
 
             assert checker.cluster == "default-cluster"
 
+    @staticmethod
+    def _status(
+        status: DeploymentStatus = DeploymentStatus.SUCCESS,
+        namespace: str = "test-namespace",
+        app_config_dir: str = "/path/to/app",
+    ) -> DeploymentStatusInfo:
+        return DeploymentStatusInfo(
+            app_config_dir=app_config_dir,
+            status=status,
+            timestamp=datetime(2025, 10, 30, 10, 0, 0),
+            namespace=namespace,
+        )
+
     def test_check_app_group_deployed_success(self, checker, mock_db, base_dir) -> None:
         """Test checking successfully deployed app-group."""
-        # Mock deployment detail
-        mock_deployment = MagicMock()
-        mock_deployment.status = DeploymentStatus.SUCCESS
-        mock_deployment.timestamp = "2025-10-30T10:00:00"
-        mock_deployment.namespace = "test-namespace"
-        mock_db.get_latest_deployment_any_namespace.return_value = mock_deployment
-
-        # Create app-group directory
         app_dir = base_dir / "a000_infra"
         app_dir.mkdir()
+        mock_db.get_latest_statuses.return_value = {
+            str(app_dir.resolve()): self._status()
+        }
 
         is_deployed, msg = checker.check_app_group_deployed("a000_infra")
 
         assert is_deployed is True
         assert "deployed at" in msg
         assert "test-namespace" in msg
-        mock_db.get_latest_deployment_any_namespace.assert_called_once()
+        mock_db.get_latest_statuses.assert_called_once()
+        assert mock_db.get_latest_statuses.call_args[1]["namespace"] is None
+        mock_db.get_latest_statuses_by_dir_name.assert_not_called()
 
     def test_check_app_group_deployed_never_deployed(self, checker, mock_db) -> None:
         """Test checking app-group that was never deployed."""
-        mock_db.get_latest_deployment_any_namespace.return_value = None
+        mock_db.get_latest_statuses.return_value = {}
+        mock_db.get_latest_statuses_by_dir_name.return_value = {}
 
         is_deployed, msg = checker.check_app_group_deployed("a000_infra")
 
         assert is_deployed is False
         assert msg == "never deployed"
 
-    def test_check_app_group_deployed_failed_status(self, checker, mock_db) -> None:
+    def test_check_app_group_deployed_failed_status(
+        self, checker, mock_db, base_dir
+    ) -> None:
         """Test checking app-group with failed deployment."""
-        mock_deployment = MagicMock()
-        mock_deployment.status = DeploymentStatus.FAILED
-        mock_db.get_latest_deployment_any_namespace.return_value = mock_deployment
+        path = str((base_dir / "a000_infra").resolve())
+        mock_db.get_latest_statuses.return_value = {
+            path: self._status(DeploymentStatus.FAILED)
+        }
 
         is_deployed, msg = checker.check_app_group_deployed("a000_infra")
 
@@ -135,42 +151,75 @@ class TestDeploymentChecker:
 
     def test_check_app_group_deployed_database_error(self, checker, mock_db) -> None:
         """Test handling database errors."""
-        mock_db.get_latest_deployment_any_namespace.side_effect = Exception(
-            "DB connection failed"
-        )
+        mock_db.get_latest_statuses.side_effect = Exception("DB connection failed")
+        mock_db.get_latest_statuses_by_dir_name.return_value = {}
 
         is_deployed, msg = checker.check_app_group_deployed("a000_infra")
 
         assert is_deployed is False
         assert "database error" in msg
 
-    def test_check_app_group_deployed_with_namespace_override(
+    def test_check_app_group_deployed_falls_back_to_dir_name(
         self, checker, mock_db
+    ) -> None:
+        """Records stored under another path are matched by directory name."""
+        mock_db.get_latest_statuses.return_value = {}
+        mock_db.get_latest_statuses_by_dir_name.return_value = {
+            "a000_infra": self._status(namespace="infra")
+        }
+
+        is_deployed, msg = checker.check_app_group_deployed("a000_infra")
+
+        assert is_deployed is True
+        assert "infra" in msg
+        call_args = mock_db.get_latest_statuses_by_dir_name.call_args
+        assert call_args[1]["dir_names"] == ["a000_infra"]
+
+    def test_check_app_group_deployed_with_namespace_override(
+        self, checker, mock_db, base_dir
     ) -> None:
         """Test checking with namespace override."""
-        mock_deployment = MagicMock()
-        mock_deployment.status = DeploymentStatus.SUCCESS
-        mock_deployment.timestamp = "2025-10-30T10:00:00"
-        mock_db.get_latest_deployment.return_value = mock_deployment
+        path = str((base_dir / "a000_infra").resolve())
+        mock_db.get_latest_statuses.return_value = {
+            path: self._status(namespace="custom-namespace")
+        }
 
         is_deployed, _msg = checker.check_app_group_deployed(
             "a000_infra", namespace="custom-namespace"
         )
 
         assert is_deployed is True
-        # Verify namespace override was used
-        call_args = mock_db.get_latest_deployment.call_args
+        # Verify namespace override was used, and no further lookup was needed
+        mock_db.get_latest_statuses.assert_called_once()
+        call_args = mock_db.get_latest_statuses.call_args
         assert call_args[1]["namespace"] == "custom-namespace"
 
-    def test_check_dependencies_all_deployed(self, checker, mock_db) -> None:
-        """Test checking dependencies when all are deployed."""
-        mock_deployment = MagicMock()
-        mock_deployment.status = DeploymentStatus.SUCCESS
-        mock_deployment.timestamp = "2025-10-30T10:00:00"
-        mock_deployment.namespace = "test-namespace"
-        mock_db.get_latest_deployment_any_namespace.return_value = mock_deployment
+    def test_check_app_group_deployed_namespace_miss_searches_all(
+        self, checker, mock_db, base_dir
+    ) -> None:
+        """A miss in the given namespace falls back to any namespace."""
+        path = str((base_dir / "a101_data_rdb").resolve())
+        mock_db.get_latest_statuses.side_effect = [
+            {},
+            {path: self._status(namespace="postgresql")},
+        ]
+
+        is_deployed, msg = checker.check_app_group_deployed(
+            "a101_data_rdb", namespace="default"
+        )
 
+        assert is_deployed is True
+        assert "postgresql" in msg
+        namespaces = [c[1]["namespace"] for c in mock_db.get_latest_statuses.call_args_list]
+        assert namespaces == ["default", None]
+
+    def test_check_dependencies_all_deployed(self, checker, mock_db, base_dir) -> None:
+        """Test checking dependencies when all are deployed."""
         deps = ["a000_infra", "a100_data"]
+        mock_db.get_latest_statuses.return_value = {
+            str((base_dir / dep).resolve()): self._status() for dep in deps
+        }
+
         result = checker.check_dependencies(deps)
 
         assert result["all_deployed"] is True
@@ -178,20 +227,17 @@ class TestDeploymentChecker:
         assert len(result["details"]) == 2
         assert result["details"]["a000_infra"][0] is True
         assert result["details"]["a100_data"][0] is True
+        # All deps resolved with a single status-only query
+        mock_db.get_latest_statuses.assert_called_once()
+        assert len(mock_db.get_latest_statuses.call_args[1]["app_config_dirs"]) == 2
+        mock_db.get_latest_deployment_any_namespace.assert_not_called()
 
-    def test_check_dependencies_some_missing(self, checker, mock_db) -> None:
+    def test_check_dependencies_some_missing(self, checker, mock_db, base_dir) -> None:
         """Test checking dependencies when some are missing."""
-
-        def mock_get_deployment(cluster, app_config_dir):
-            if "a100_data" in app_config_dir:
-                return None  # Not deployed
-            mock_dep = MagicMock()
-            mock_dep.status = DeploymentStatus.SUCCESS
-            mock_dep.timestamp = "2025-10-30T10:00:00"
-            mock_dep.namespace = "test-namespace"
-            return mock_dep
-
-        mock_db.get_latest_deployment_any_namespace.side_effect = mock_get_deployment
+        mock_db.get_latest_statuses.return_value = {
+            str((base_dir / "a000_infra").resolve()): self._status()
+        }
+        mock_db.get_latest_statuses_by_dir_name.return_value = {}
 
         deps = ["a000_infra", "a100_data"]
         result = checker.check_dependencies(deps)
@@ -201,6 +247,8 @@ class TestDeploymentChecker:
         assert len(result["details"]) == 2
         assert result["details"]["a000_infra"][0] is True
         assert result["details"]["a100_data"][0] is False
+        call_args = mock_db.get_latest_statuses_by_dir_name.call_args
+        assert call_args[1]["dir_names"] == ["a100_data"]
 
     def test_check_dependencies_empty_list(self, checker, mock_db) -> None:
         """Test checking empty dependency list."""
@@ -209,27 +257,26 @@ class TestDeploymentChecker:
         assert result["all_deployed"] is True
         assert result["missing"] == []
         assert result["details"] == {}
+        mock_db.get_latest_statuses.assert_not_called()
 
-    def test_get_deployment_info_success(self, checker, mock_db) -> None:
+    def test_get_deployment_info_success(self, checker, mock_db, base_dir) -> None:
         """Test getting deployment info."""
-        mock_deployment = MagicMock()
-        mock_deployment.cluster = "test-cluster"
-        mock_deployment.namespace = "test-namespace"
-        mock_deployment.app_config_dir = "/path/to/app"
-        mock_deployment.status = DeploymentStatus.SUCCESS
-        mock_deployment.timestamp = "2025-10-30T10:00:00"
-        mock_db.get_latest_deployment.return_value = mock_deployment
+        path = str((base_dir / "a000_infra").resolve())
+        mock_db.get_latest_statuses.return_value = {
+            path: self._status(app_config_dir=path)
+        }
 
         info = checker.get_deployment_info("a000_infra")
 
         assert info is not None
         assert info["cluster"] == "test-cluster"
         assert info["namespace"] == "test-namespace"
+        assert info["app_config_dir"] == path
         assert info["status"] == "success"
 
     def test_get_deployment_info_not_found(self, checker, mock_db) -> None:
         """Test getting deployment info when not found."""
-        mock_db.get_latest_deployment.return_value = None
+        mock_db.get_latest_statuses.return_value = {}
 
         info = checker.get_deployment_info("a000_infra")
 
@@ -237,69 +284,22 @@ class TestDeploymentChecker:
 
     def test_get_deployment_info_database_error(self, checker, mock_db) -> None:
         """Test handling database errors in get_deployment_info."""
-        mock_db.get_latest_deployment.side_effect = Exception("DB error")
+        mock_db.get_latest_statuses.side_effect = Exception("DB error")
 
         info = checker.get_deployment_info("a000_infra")
 
         assert info is None
 
-    def test_check_app_group_deployed_namespace_auto_detect(
-        self, checker, mock_db
+    def test_check_dependencies_different_namespaces(
+        self, checker, mock_db, base_dir
     ) -> None:
-        """Test automatic namespace detection when namespace not provided."""
-        # Mock deployment in different namespace
-        mock_deployment = MagicMock()
-        mock_deployment.status = DeploymentStatus.SUCCESS
-        mock_deployment.timestamp = "2025-10-30T15:00:00"
-        mock_deployment.namespace = "postgresql"  # Different namespace
-        mock_db.get_latest_deployment_any_namespace.return_value = mock_deployment
-
-        # Check without providing namespace (auto-detect)
-        is_deployed, msg = checker.check_app_group_deployed("a101_data_rdb")
-
-        assert is_deployed is True
-        assert "postgresql" in msg  # Should include namespace in message
-        assert "deployed at" in msg
-        mock_db.get_latest_deployment_any_namespace.assert_called_once()
-
-    def test_check_app_group_deployed_with_namespace_specific_query(
-        self, checker, mock_db
-    ) -> None:
-        """Test that providing namespace uses namespace-specific query."""
-        mock_deployment = MagicMock()
-        mock_deployment.status = DeploymentStatus.SUCCESS
-        mock_deployment.timestamp = "2025-10-30T15:00:00"
-        mock_db.get_latest_deployment.return_value = mock_deployment
-
-        # Check with specific namespace
-        is_deployed, _msg = checker.check_app_group_deployed(
-            "a101_data_rdb", namespace="postgresql"
-        )
-
-        assert is_deployed is True
-        # Should use get_latest_deployment (not any_namespace)
-        mock_db.get_latest_deployment.assert_called_once()
-        mock_db.get_latest_deployment_any_namespace.assert_not_called()
-
-    def test_check_dependencies_different_namespaces(self, checker, mock_db) -> None:
         """Test checking dependencies deployed in different namespaces."""
-
-        def mock_get_any_namespace(cluster, app_config_dir):
-            if "a000_infra" in app_config_dir:
-                mock_dep = MagicMock()
-                mock_dep.status = DeploymentStatus.SUCCESS
-                mock_dep.timestamp = "2025-10-30"
-                mock_dep.namespace = "infra"
-                return mock_dep
-            if "a101_data" in app_config_dir:
-                mock_dep = MagicMock()
-                mock_dep.status = DeploymentStatus.SUCCESS
-                mock_dep.timestamp = "2025-10-30"
-                mock_dep.namespace = "postgresql"
-                return mock_dep
-            return None
-
-        mock_db.get_latest_deployment_any_namespace.side_effect = mock_get_any_namespace
+        mock_db.get_latest_statuses.return_value = {
+            str((base_dir / "a000_infra").resolve()): self._status(namespace="infra"),
+            str((base_dir / "a101_data").resolve()): self._status(
+                namespace="postgresql"
+            ),
+        }
 
         deps = ["a000_infra", "a101_data"]
         result = checker.check_dependencies(deps, namespace=None)